@@ -0,0 +1,27 @@
+"""Store raw Lighthouse results compressed
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Complete Lighthouse result kept once as zstd/gzip compressed JSON;
+    # existing rows are converted by backfill_lighthouse_storage_task
+    op.add_column('pagespeed_analysis', sa.Column('raw_lighthouse_compressed', sa.LargeBinary(), nullable=True))
+    op.add_column('pagespeed_analysis', sa.Column('raw_lighthouse_encoding', sa.String(10), nullable=True))
+
+
+def downgrade():
+    op.drop_column('pagespeed_analysis', 'raw_lighthouse_encoding')
+    op.drop_column('pagespeed_analysis', 'raw_lighthouse_compressed')
@@ -0,0 +1,29 @@
+"""Add perceptual hashes to screenshots
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 64-bit pHash/dHash fingerprints used to find near-duplicate screenshots
+    # whose visual analysis can be reused
+    op.add_column('screenshots', sa.Column('perceptual_hash', sa.BigInteger(), nullable=True))
+    op.add_column('screenshots', sa.Column('difference_hash', sa.BigInteger(), nullable=True))
+    op.create_index(op.f('ix_screenshots_perceptual_hash'), 'screenshots', ['perceptual_hash'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_screenshots_perceptual_hash'), table_name='screenshots')
+    op.drop_column('screenshots', 'difference_hash')
+    op.drop_column('screenshots', 'perceptual_hash')
@@ -203,6 +203,30 @@ async def get_test_assessment_result(assessment_id: int):
             }
         }
 
+@router.get("/test/{assessment_id}/pagespeed/{strategy}/lighthouse")
+async def get_assessment_lighthouse_result(assessment_id: int, strategy: str):
+    """
+    Complete Lighthouse result for the detailed PageSpeed view, loaded on demand
+    """
+    from src.core.database import AsyncSessionLocal
+    from src.api.v1.pagespeed_helpers import get_raw_lighthouse_result
+    
+    if strategy not in ("mobile", "desktop"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Strategy must be 'mobile' or 'desktop'"
+        )
+    
+    async with AsyncSessionLocal() as session:
+        lighthouse_result = await get_raw_lighthouse_result(session, assessment_id, strategy)
+    
+    if lighthouse_result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No {strategy} Lighthouse result for assessment {assessment_id}"
+        )
+    return lighthouse_result
+
 @router.get("/config")
 async def get_assessment_config():
     """
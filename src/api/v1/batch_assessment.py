@@ -0,0 +1,128 @@
+"""
+PRP-002: Batch Assessment API Endpoints
+Submit many leads as one tracked job with bounded fan-out
+"""
+
+import csv
+import io
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+
+from src.assessment.batch import BatchJobTracker, create_leads_from_rows, submit_batch
+from src.assessment.utils import AssessmentError
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/batch-assessment", tags=["batch-assessment"])
+
+
+class BatchLeadRow(BaseModel):
+    url: str = Field(..., description="Website URL to assess")
+    company: Optional[str] = Field(None, description="Business name")
+    email: Optional[str] = Field(None, description="Contact email (generated if omitted)")
+    address: Optional[str] = Field(None, description="Street address")
+    city: Optional[str] = Field(None, description="City")
+    state: Optional[str] = Field(None, description="State abbreviation")
+
+
+class BatchSubmitRequest(BaseModel):
+    lead_ids: List[int] = Field(default_factory=list, description="Existing lead IDs to assess")
+    leads: List[BatchLeadRow] = Field(default_factory=list, description="New leads to create and assess")
+
+
+class BatchSubmitResponse(BaseModel):
+    batch_id: str = Field(..., description="Batch job ID for tracking")
+    total: int = Field(..., description="Number of leads in the batch")
+    max_concurrent: int = Field(..., description="Global limit on assessments in flight")
+    status: str = Field(..., description="Initial batch status")
+
+
+async def _submit(lead_ids: List[int], rows: List[Dict[str, Any]], source: str) -> BatchSubmitResponse:
+    total = len(lead_ids) + len(rows)
+    if total == 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Batch contains no leads")
+    if total > settings.MAX_LEADS_PER_BATCH_JOB:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch of {total} leads exceeds limit of {settings.MAX_LEADS_PER_BATCH_JOB}"
+        )
+
+    try:
+        all_ids = list(lead_ids)
+        if rows:
+            all_ids.extend(await create_leads_from_rows(rows))
+        batch_id = await run_in_threadpool(submit_batch, all_ids, source)
+    except AssessmentError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    except Exception as exc:
+        logger.error(f"Failed to submit batch assessment: {exc}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch submission failed: {str(exc)}"
+        )
+
+    return BatchSubmitResponse(
+        batch_id=batch_id,
+        total=len(all_ids),
+        max_concurrent=settings.MAX_CONCURRENT_ASSESSMENTS,
+        status="running"
+    )
+
+
+@router.post("/submit", response_model=BatchSubmitResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_batch_assessment(request: BatchSubmitRequest) -> BatchSubmitResponse:
+    """Submit existing lead IDs and/or new lead rows as one batch job"""
+    rows = [row.model_dump() for row in request.leads]
+    return await _submit(request.lead_ids, rows, source="api")
+
+
+@router.post("/submit-csv", response_model=BatchSubmitResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_batch_assessment_csv(file: UploadFile = File(...)) -> BatchSubmitResponse:
+    """
+    Submit a CSV of leads as one batch job.
+
+    Columns: url (required), company, email, address, city, state, or
+    lead_id to reference an existing lead.
+    """
+    content = (await file.read()).decode("utf-8-sig")
+    reader = csv.DictReader(io.StringIO(content))
+
+    lead_ids: List[int] = []
+    rows: List[Dict[str, Any]] = []
+    for line_number, row in enumerate(reader, start=2):
+        row = {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+        if row.get("lead_id"):
+            try:
+                lead_ids.append(int(row["lead_id"]))
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid lead_id on line {line_number}")
+        elif row.get("url"):
+            rows.append(row)
+        else:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Line {line_number} has neither url nor lead_id")
+
+    return await _submit(lead_ids, rows, source="csv")
+
+
+@router.get("/{batch_id}")
+async def get_batch_assessment_status(batch_id: str) -> Dict[str, Any]:
+    """Aggregated progress and throughput for a batch job"""
+    batch_status = await run_in_threadpool(BatchJobTracker().get_status, batch_id)
+    if batch_status is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Batch {batch_id} not found")
+    return batch_status
+
+
+@router.post("/{batch_id}/cancel")
+async def cancel_batch_assessment(batch_id: str) -> Dict[str, Any]:
+    """Drop the batch's pending leads; running assessments finish normally"""
+    tracker = BatchJobTracker()
+    if await run_in_threadpool(tracker.get_status, batch_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Batch {batch_id} not found")
+    dropped = await run_in_threadpool(tracker.cancel, batch_id)
+    return {"batch_id": batch_id, "status": "cancelled", "dropped": dropped}
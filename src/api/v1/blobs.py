@@ -0,0 +1,42 @@
+"""
+PRP-000: Blob Download Endpoint
+Serves blob store references (screenshots) to browsers
+"""
+
+import mimetypes
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, RedirectResponse
+
+from src.core.storage.blob_store import (
+    BLOB_SCHEME, BlobStoreError, LocalBlobStore, S3BlobStore, blob_key, get_blob_store, is_blob_ref
+)
+
+router = APIRouter(prefix="/blobs", tags=["blobs"])
+
+
+def blob_url(ref: str) -> str:
+    """Browser URL for a blob reference; other values are returned unchanged"""
+    return f"/api/v1/blobs/{ref[len(BLOB_SCHEME):]}" if is_blob_ref(ref) else ref
+
+
+@router.get("/{key:path}")
+async def get_blob(key: str):
+    """Stream a blob from local disk, or redirect to a presigned S3 URL"""
+    ref = BLOB_SCHEME + key
+    try:
+        blob_key(ref)
+    except BlobStoreError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    store = get_blob_store()
+    if isinstance(store, S3BlobStore):
+        return RedirectResponse(store.presigned_url(ref))
+    if isinstance(store, LocalBlobStore):
+        path = store.path_of(ref)
+        if not path.is_file():
+            raise HTTPException(status_code=404, detail="Blob not found")
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        # Content-addressed, so the bytes behind a key never change
+        return FileResponse(path, media_type=media_type, headers={"Cache-Control": "public, max-age=31536000, immutable"})
+    raise HTTPException(status_code=501, detail=f"Blob store {store.name} cannot serve downloads")
@@ -6,7 +6,7 @@ Helper functions to retrieve and format PageSpeed data from new database tables
 from typing import Dict, Any, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from src.models.pagespeed import (
     PageSpeedAnalysis, PageSpeedAudit, PageSpeedScreenshot,
@@ -138,13 +138,41 @@ def format_pagespeed_analysis(analysis: PageSpeedAnalysis) -> Dict[str, Any]:
         }
     }
     
-    # Add lighthouse result if needed (for backward compatibility)
-    if hasattr(analysis, 'raw_lighthouse_result') and analysis.raw_lighthouse_result:
-        formatted["lighthouse_result"] = analysis.raw_lighthouse_result
+    # The complete Lighthouse result is deferred and loaded on demand
+    # through get_raw_lighthouse_result()
     
     return formatted
 
 
+async def get_raw_lighthouse_result(db: AsyncSession, assessment_id: int, strategy: str) -> Optional[Dict[str, Any]]:
+    """
+    Rehydrate the complete Lighthouse result for the detailed view
+    
+    Args:
+        db: Database session
+        assessment_id: Assessment ID
+        strategy: 'mobile' or 'desktop'
+        
+    Returns:
+        Raw Lighthouse result, or None if no analysis is stored
+    """
+    result = await db.execute(
+        select(PageSpeedAnalysis)
+        .options(
+            undefer(PageSpeedAnalysis.raw_lighthouse_compressed),
+            undefer(PageSpeedAnalysis.raw_lighthouse_result)
+        )
+        .where(
+            PageSpeedAnalysis.assessment_id == assessment_id,
+            PageSpeedAnalysis.strategy == strategy
+        )
+        .order_by(PageSpeedAnalysis.created_at.desc())
+        .limit(1)
+    )
+    analysis = result.scalar_one_or_none()
+    return analysis.load_raw_lighthouse() if analysis else None
+
+
 def format_audits(audits: List[PageSpeedAudit]) -> Dict[str, Any]:
     """Format audit results for UI display"""
     formatted_audits = {}
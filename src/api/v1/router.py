@@ -5,7 +5,7 @@ Combines all v1 API endpoints for the LeadFactory application
 
 from fastapi import APIRouter
 
-from src.api.v1 import leads, assessments, campaigns, sales, assessments_orchestrator, simple_assessment, assessment_ui, async_assessment, minimal_assessment, complete_assessment
+from src.api.v1 import leads, assessments, campaigns, sales, assessments_orchestrator, simple_assessment, assessment_ui, async_assessment, minimal_assessment, complete_assessment, batch_assessment, blobs
 
 # Create the main API router
 api_router = APIRouter()
@@ -21,6 +21,8 @@ api_router.include_router(simple_assessment.router)  # Simple assessment for tes
 api_router.include_router(async_assessment.router)  # Async assessment endpoints
 api_router.include_router(minimal_assessment.router)  # Minimal assessment endpoints
 api_router.include_router(complete_assessment.router)  # Complete assessment endpoints
+api_router.include_router(batch_assessment.router)  # Batch assessment jobs
+api_router.include_router(blobs.router)  # Screenshot and other blob downloads
 
 # Health check for API v1
 @api_router.get("/health", tags=["health"])
@@ -37,7 +39,8 @@ async def api_health():
                 "/campaigns - Email campaign tracking and metrics",
                 "/sales - Revenue attribution and transaction management",
                 "/orchestrator - Assessment orchestrator task management (PRP-002)",
-                "/assessment - Interactive assessment UI with Google OAuth"
+                "/assessment - Interactive assessment UI with Google OAuth",
+                "/batch-assessment - Batch assessment jobs with bounded fan-out"
             ]
         }
     except Exception as e:
@@ -15,6 +15,7 @@ from sqlalchemy import select, text
 from src.core.database import SyncSessionLocal
 from src.models.lead import Lead, Assessment
 from src.models.screenshot import Screenshot
+from src.api.v1.blobs import blob_url
 from src.assessments.pagespeed import assess_pagespeed
 from src.assessments.security_analysis import assess_security_headers
 from src.assessments.semrush_integration import assess_semrush_domain
@@ -197,7 +198,8 @@ async def run_simple_assessment(request: AssessmentRequest):
         # 6. Visual Analysis
         try:
             logger.info(f"Running Visual Analysis for {url}")
-            # Process screenshots - upload to S3 instead of base64 URLs
+            # Screenshots are already in the blob store (and saved to the
+            # screenshots table by the capture); pass their references on
             desktop_url = None
             mobile_url = None
             
@@ -211,70 +213,12 @@ async def run_simple_assessment(request: AssessmentRequest):
                 elif isinstance(screenshot_result_data, dict) and 'screenshots' in screenshot_result_data and isinstance(screenshot_result_data['screenshots'], list):
                     screenshots_list = screenshot_result_data['screenshots']
 
-                # Import AWS S3 dependencies
-                import boto3
-                import uuid
-                from datetime import datetime
-                
-                # Initialize S3 client
-                s3_client = boto3.client('s3')
-                bucket_name = os.getenv('S3_BUCKET_NAME', 'your-bucket-name')
-                
                 for screenshot in screenshots_list:
                     device_type = screenshot.get("device_type")
-                    base64_data = screenshot.get("screenshot_url", "")
-                    
-                    if base64_data and "," in base64_data:
-                        # Extract base64 data after comma
-                        base64_string = base64_data.split(",")[1]
-                        import base64
-                        image_data = base64.b64decode(base64_string)
-                        
-                        # Generate S3 key with timestamp and assessment ID
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"screenshots/{assessment_id}/{device_type}_{timestamp}_{uuid.uuid4().hex[:8]}.png"
-                        
-                        # Upload to S3
-                        try:
-                            s3_client.put_object(
-                                Bucket=bucket_name,
-                                Key=filename,
-                                Body=image_data,
-                                ContentType='image/png',
-                                ACL='public-read'
-                            )
-                            
-                            # Generate S3 URL
-                            s3_url = f"https://{bucket_name}.s3.amazonaws.com/{filename}"
-                            
-                            if device_type == "desktop":
-                                desktop_url = s3_url
-                            elif device_type == "mobile":
-                                mobile_url = s3_url
-                                
-                            # Store screenshot record in database
-                            screenshot_record = Screenshot(
-                                assessment_id=assessment_id,
-                                screenshot_type=device_type,
-                                viewport_width=screenshot.get("viewport_width", 0),
-                                viewport_height=screenshot.get("viewport_height", 0),
-                                image_url=s3_url
-                            )
-                            db.add(screenshot_record)
-                            db.commit()
-                            
-                        except Exception as e:
-                            logger.error(f"Failed to upload screenshot to S3: {e}")
-                            # Fallback to storing error message
-                            screenshot_record = Screenshot(
-                                assessment_id=assessment_id,
-                                screenshot_type=device_type,
-                                viewport_width=screenshot.get("viewport_width", 0),
-                                viewport_height=screenshot.get("viewport_height", 0),
-                                image_url=f"Error: {str(e)}"
-                            )
-                            db.add(screenshot_record)
-                            db.commit()
+                    if device_type == "desktop":
+                        desktop_url = screenshot.get("screenshot_url") or None
+                    elif device_type == "mobile":
+                        mobile_url = screenshot.get("screenshot_url") or None
             
             logger.info(f"Found desktop URL: {desktop_url is not None}, mobile URL: {mobile_url is not None}")
             
@@ -416,7 +360,7 @@ async def run_simple_assessment(request: AssessmentRequest):
                         "screenshot_type": screenshot.screenshot_type.value if screenshot.screenshot_type else None,
                         "viewport_width": screenshot.viewport_width,
                         "viewport_height": screenshot.viewport_height,
-                        "image_url": screenshot.image_url,
+                        "image_url": blob_url(screenshot.image_url),
                         "viewport_type": "Desktop" if screenshot.viewport_width > 1000 else "Mobile"
                     })
                 
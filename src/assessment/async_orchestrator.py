@@ -17,8 +17,9 @@ from src.assessments.pagespeed import assess_pagespeed
 from src.assessments.security_analysis import assess_security_headers
 from src.assessments.semrush_integration import assess_semrush_domain
 from src.assessments.gbp_integration import assess_google_business_profile
-from src.assessments.screenshot_capture import capture_website_screenshots
+from src.assessments.screenshot_capture import capture_website_screenshots, screenshot_ref
 from src.assessments.visual_analysis import assess_visual_analysis
+from src.assessments.reachability import ReachabilityResult, precheck_site
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +27,16 @@ logger = get_logger(__name__)
 class AsyncAssessmentOrchestrator:
     """Manages async assessment execution without Celery"""
     
+    # Per-component timeouts (seconds)
+    COMPONENT_TIMEOUTS = {
+        "pagespeed": 45,
+        "security": 10,
+        "semrush": 20,
+        "gbp": 15,
+        "screenshots": 60,
+        "visual": 30
+    }
+    
     def __init__(self):
         self.running_assessments: Dict[str, Dict[str, Any]] = {}
     
@@ -61,8 +72,12 @@ class AsyncAssessmentOrchestrator:
                 else:
                     assessment = await db.get(Assessment, assessment_id)
                 
+                # Pre-flight: find dead sites before any paid component runs
+                self.running_assessments[task_id]["assessment_id"] = assessment_id
+                reachability = await precheck_site(lead.url)
+                
                 # Execute all assessment components concurrently
-                results = await self._run_all_assessments(lead, assessment, db)
+                results = await self._run_all_assessments(lead, assessment, db, task_id, reachability)
                 
                 # Update assessment with results
                 assessment.pagespeed_data = results.get("pagespeed")
@@ -75,19 +90,27 @@ class AsyncAssessmentOrchestrator:
                 # Calculate overall score
                 assessment.total_score = self._calculate_score(results)
                 
+                # Fail fast on dead sites, with the reason recorded on the assessment
+                status = "completed"
+                if reachability and not reachability.reachable:
+                    status = "unreachable"
+                    assessment.status = "failed"
+                    assessment.error_message = reachability.summary
+                
                 await db.commit()
                 await db.refresh(assessment)
                 
                 # Update task status
-                self.running_assessments[task_id]["status"] = "completed"
+                self.running_assessments[task_id]["status"] = status
                 self.running_assessments[task_id]["progress"] = 100
                 self.running_assessments[task_id]["assessment_id"] = assessment_id
                 
                 return {
                     "task_id": task_id,
                     "assessment_id": assessment_id,
-                    "status": "completed",
-                    "results": results
+                    "status": status,
+                    "results": results,
+                    "reachability": reachability.dict() if reachability else None
                 }
                 
         except Exception as e:
@@ -96,8 +119,9 @@ class AsyncAssessmentOrchestrator:
             self.running_assessments[task_id]["error"] = str(e)
             raise
     
-    async def _run_all_assessments(self, lead: Lead, assessment: Assessment, db: AsyncSession) -> Dict[str, Any]:
-        """Run all assessment components concurrently"""
+    async def _run_all_assessments(self, lead: Lead, assessment: Assessment, db: AsyncSession, task_id: Optional[str] = None,
+                                   reachability: Optional[ReachabilityResult] = None) -> Dict[str, Any]:
+        """Run all assessment components concurrently, handling each as it completes"""
         url = lead.url
         business_name = lead.company
         
@@ -106,54 +130,98 @@ class AsyncAssessmentOrchestrator:
         parsed_url = urlparse(url)
         domain = parsed_url.netloc or parsed_url.path
         
-        # Create tasks for all components
-        tasks = {
-            "pagespeed": self._run_with_timeout(assess_pagespeed(url), 45),
-            "security": self._run_with_timeout(assess_security_headers(url), 10),
-            "semrush": self._run_with_timeout(assess_semrush_domain(domain, lead.id, assessment.id), 20),
-            "gbp": self._run_with_timeout(assess_google_business_profile(business_name, lead.address, None, None, lead.id, assessment.id), 15),
-            "screenshots": self._run_with_timeout(capture_website_screenshots(url, lead.id, assessment.id), 60),
-        }
+        results: Dict[str, Any] = {}
         
-        # Run all tasks concurrently
-        results = {}
-        for name, task in tasks.items():
-            try:
-                result = await task
-                results[name] = result
-                logger.info(f"Component {name} completed successfully")
-                
-                # Update progress
-                completed = len(results)
-                total = len(tasks)
-                progress = int((completed / total) * 100)
-                # Find the task_id for this assessment
-                for tid, data in self.running_assessments.items():
-                    if data.get("assessment_id") == assessment.id:
-                        self.running_assessments[tid]["progress"] = progress
-                        break
-                    
-            except asyncio.TimeoutError:
-                logger.error(f"Component {name} timed out")
-                results[name] = None
-            except Exception as e:
-                logger.error(f"Component {name} failed: {str(e)}")
-                results[name] = None
-        
-        # Visual analysis depends on screenshots
-        if results.get("screenshots"):
-            try:
-                results["visual"] = await self._run_with_timeout(
-                    assess_visual_analysis(url, lead.id, assessment.id), 30
-                )
-            except Exception as e:
-                logger.error(f"Visual analysis failed: {str(e)}")
-                results["visual"] = None
+        # A dead site only gets the name-based GBP lookup
+        if reachability is None or reachability.reachable:
+            components = {
+                "pagespeed": assess_pagespeed(url),
+                "security": assess_security_headers(url),
+                "semrush": assess_semrush_domain(domain, lead.id, assessment.id),
+                "gbp": assess_google_business_profile(business_name, lead.address, None, None, lead.id, assessment.id),
+                "screenshots": capture_website_screenshots(url, lead.id, assessment.id),
+            }
+            skipped = []
         else:
-            results["visual"] = None
+            components = {
+                "gbp": assess_google_business_profile(business_name, lead.address, None, None, lead.id, assessment.id),
+            }
+            skipped = ["pagespeed", "security", "semrush", "screenshots", "visual"]
+            logger.warning(f"Skipping site components for lead {lead.id}: {reachability.summary}")
+        
+        # Visual analysis is scheduled later, once screenshots are available
+        total = len(self.COMPONENT_TIMEOUTS)
+        tracking = self.running_assessments.get(task_id) if task_id else None
+        pending: Dict[asyncio.Task, str] = {}
+        
+        for name in skipped:
+            results[name] = None
+            if tracking is not None:
+                tracking["components"][name] = "skipped"
+        
+        def start(name: str, coro) -> None:
+            if tracking is not None:
+                tracking["components"][name] = "running"
+            task = asyncio.create_task(self._run_with_timeout(coro, self.COMPONENT_TIMEOUTS[name]), name=name)
+            pending[task] = name
+        
+        for name, coro in components.items():
+            start(name, coro)
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = pending.pop(task)
+                    try:
+                        results[name] = task.result()
+                        logger.info(f"Component {name} completed successfully")
+                        component_status = "completed"
+                    except asyncio.TimeoutError:
+                        logger.error(f"Component {name} timed out")
+                        results[name] = None
+                        component_status = "timeout"
+                    except Exception as e:
+                        logger.error(f"Component {name} failed: {str(e)}")
+                        results[name] = None
+                        component_status = "failed"
+                    
+                    if tracking is not None:
+                        tracking["components"][name] = component_status
+                        tracking["progress"] = int((len(results) / total) * 100)
+                    
+                    # Visual analysis depends only on screenshots, so start it right away
+                    if name == "screenshots":
+                        visual_coro = self._visual_analysis_for(url, lead, assessment, results[name])
+                        if visual_coro is not None:
+                            start("visual", visual_coro)
+                        else:
+                            results["visual"] = None
+                            if tracking is not None:
+                                tracking["components"]["visual"] = "skipped"
+                                tracking["progress"] = int((len(results) / total) * 100)
+        finally:
+            # Wait for cancelled components to unwind so their cleanup (budget
+            # reservations, browser leases) finishes before we return
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
         return results
     
+    def _visual_analysis_for(self, url: str, lead: Lead, assessment: Assessment, screenshots: Any):
+        """Build the visual analysis coroutine from screenshot results, if usable"""
+        if not screenshots or not getattr(screenshots, "success", False):
+            return None
+        
+        desktop_url = screenshot_ref(screenshots.desktop_screenshot)
+        mobile_url = screenshot_ref(screenshots.mobile_screenshot)
+        if not desktop_url or not mobile_url:
+            return None
+        
+        return assess_visual_analysis(url, desktop_url, mobile_url, lead.id, assessment.id)
+    
     async def _run_with_timeout(self, coro, timeout_seconds: int):
         """Run a coroutine with timeout"""
         return await asyncio.wait_for(coro, timeout=timeout_seconds)
@@ -0,0 +1,375 @@
+"""
+PRP-002: Batch Assessment Jobs
+Bounded fan-out of many lead assessments tracked as a single job
+"""
+
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from src.core.cache import CacheKeys
+from src.core.celery_app import celery_app
+from src.core.config import settings
+from src.core.logging import get_logger
+from .utils import AssessmentError
+
+logger = get_logger(__name__)
+
+# Batch metadata outlives the run so results stay queryable for a week
+BATCH_TTL_SECONDS = 7 * 24 * 3600
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def _get_sync_redis() -> redis.Redis:
+    """Synchronous Redis client for Celery task context."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+class BatchJobTracker:
+    """
+    Redis-backed state for batch jobs.
+
+    Each batch has a hash of counters and a list of pending lead IDs.
+    Assessments in flight across all batches hold leases in a global ZSET
+    scored by expiry, capped at MAX_CONCURRENT_ASSESSMENTS. A lease whose
+    result never arrives (dead worker, lost callback) is reaped after
+    BATCH_ASSESSMENT_LEASE_SECONDS and counted as failed, so lost slots
+    cannot stall dispatch.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        self.redis = redis_client or _get_sync_redis()
+
+    def create(self, lead_ids: List[int], source: str = "api") -> str:
+        if not lead_ids:
+            raise AssessmentError("Batch must contain at least one lead")
+        if len(lead_ids) > settings.MAX_LEADS_PER_BATCH_JOB:
+            raise AssessmentError(
+                f"Batch of {len(lead_ids)} leads exceeds limit of {settings.MAX_LEADS_PER_BATCH_JOB}"
+            )
+
+        batch_id = f"batch-{uuid.uuid4().hex[:12]}"
+        job_key = CacheKeys.batch_job(batch_id)
+        pending_key = CacheKeys.batch_pending(batch_id)
+
+        pipe = self.redis.pipeline()
+        pipe.hset(job_key, mapping={
+            "batch_id": batch_id,
+            "status": "running",
+            "source": source,
+            "total": len(lead_ids),
+            "dispatched": 0,
+            "completed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "started_ts": time.time(),
+        })
+        pipe.rpush(pending_key, *lead_ids)
+        pipe.expire(job_key, BATCH_TTL_SECONDS)
+        pipe.expire(pending_key, BATCH_TTL_SECONDS)
+        pipe.sadd(CacheKeys.batch_active(), batch_id)
+        pipe.execute()
+
+        logger.info(f"Created batch {batch_id} with {len(lead_ids)} leads", batch_id=batch_id)
+        return batch_id
+
+    @staticmethod
+    def _lease(batch_id: str, lead_id: Any) -> str:
+        return f"{batch_id}:{lead_id}"
+
+    def claim_next(self, batch_id: str) -> Optional[int]:
+        """
+        Lease a global in-flight slot and pop the next lead.
+
+        Returns None when the global limit is reached or the batch is drained.
+        """
+        leases_key = CacheKeys.assessments_in_flight()
+        expires = time.time() + settings.BATCH_ASSESSMENT_LEASE_SECONDS
+
+        # Hold a placeholder first so concurrent dispatchers can't overshoot the cap
+        placeholder = self._lease(batch_id, f"claim-{uuid.uuid4().hex[:8]}")
+        self.redis.zadd(leases_key, {placeholder: expires})
+        if self.redis.zcard(leases_key) > settings.MAX_CONCURRENT_ASSESSMENTS:
+            self.redis.zrem(leases_key, placeholder)
+            return None
+
+        lead_id = self.redis.lpop(CacheKeys.batch_pending(batch_id))
+        if lead_id is None:
+            self.redis.zrem(leases_key, placeholder)
+            return None
+
+        job_key = CacheKeys.batch_job(batch_id)
+        pipe = self.redis.pipeline()
+        pipe.zrem(leases_key, placeholder)
+        pipe.zadd(leases_key, {self._lease(batch_id, lead_id): expires})
+        pipe.hincrby(job_key, "dispatched", 1)
+        pipe.hincrby(job_key, "in_flight", 1)
+        pipe.execute()
+        return int(lead_id)
+
+    def unclaim(self, batch_id: str, lead_id: int) -> None:
+        """Return a claimed lead to the front of the queue (dispatch failed)."""
+        job_key = CacheKeys.batch_job(batch_id)
+        pipe = self.redis.pipeline()
+        pipe.lpush(CacheKeys.batch_pending(batch_id), lead_id)
+        pipe.hincrby(job_key, "dispatched", -1)
+        pipe.hincrby(job_key, "in_flight", -1)
+        pipe.zrem(CacheKeys.assessments_in_flight(), self._lease(batch_id, lead_id))
+        pipe.execute()
+
+    def record_result(self, batch_id: str, lead_id: int, success: bool) -> None:
+        job_key = CacheKeys.batch_job(batch_id)
+        if not self.redis.zrem(CacheKeys.assessments_in_flight(), self._lease(batch_id, lead_id)):
+            # The lease expired and was already counted as failed
+            if success:
+                pipe = self.redis.pipeline()
+                pipe.hincrby(job_key, "failed", -1)
+                pipe.hincrby(job_key, "completed", 1)
+                pipe.execute()
+            logger.warning(f"Late result for lead {lead_id} in batch {batch_id} after its lease expired",
+                           batch_id=batch_id)
+            return
+
+        pipe = self.redis.pipeline()
+        pipe.hincrby(job_key, "completed" if success else "failed", 1)
+        pipe.hincrby(job_key, "in_flight", -1)
+        pipe.execute()
+        self._finish_if_done(batch_id)
+
+    def reap_expired(self) -> int:
+        """Count assessments whose lease ran out as failed and free their slots."""
+        leases_key = CacheKeys.assessments_in_flight()
+        reaped = 0
+        for lease in self.redis.zrangebyscore(leases_key, "-inf", time.time()):
+            # zrem decides the race with a result arriving at the same moment
+            if not self.redis.zrem(leases_key, lease):
+                continue
+            batch_id, lead_id = lease.rsplit(":", 1)
+            if lead_id.startswith("claim-"):
+                continue
+            job_key = CacheKeys.batch_job(batch_id)
+            pipe = self.redis.pipeline()
+            pipe.hincrby(job_key, "failed", 1)
+            pipe.hincrby(job_key, "in_flight", -1)
+            pipe.execute()
+            logger.warning(f"Assessment of lead {lead_id} in batch {batch_id} lost its lease, counted failed",
+                           batch_id=batch_id)
+            self._finish_if_done(batch_id)
+            reaped += 1
+        return reaped
+
+    def _finish_if_done(self, batch_id: str) -> None:
+        status = self.get_status(batch_id)
+        # Results still arrive after a cancel; the batch stays cancelled
+        if status and status["status"] == "running" and status["finished"] >= status["total"]:
+            self._finish(batch_id, "completed")
+
+    def cancel(self, batch_id: str) -> int:
+        """Drop pending leads; assessments already running finish normally."""
+        pending_key = CacheKeys.batch_pending(batch_id)
+        dropped = self.redis.llen(pending_key)
+        self.redis.delete(pending_key)
+        self.redis.hincrby(CacheKeys.batch_job(batch_id), "total", -dropped)
+        self._finish(batch_id, "cancelled")
+        return dropped
+
+    def _finish(self, batch_id: str, status: str) -> None:
+        self.redis.hset(CacheKeys.batch_job(batch_id), mapping={
+            "status": status,
+            "finished_ts": time.time(),
+        })
+        self.redis.srem(CacheKeys.batch_active(), batch_id)
+
+    def active_batches(self) -> List[str]:
+        return sorted(self.redis.smembers(CacheKeys.batch_active()))
+
+    def get_status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Aggregated progress and throughput for a batch."""
+        raw = self.redis.hgetall(CacheKeys.batch_job(batch_id))
+        if not raw:
+            return None
+
+        total = int(raw.get("total", 0))
+        completed = int(raw.get("completed", 0))
+        failed = int(raw.get("failed", 0))
+        finished = completed + failed
+        started_ts = float(raw.get("started_ts", time.time()))
+        end_ts = float(raw["finished_ts"]) if raw.get("finished_ts") else time.time()
+        elapsed = max(end_ts - started_ts, 0.001)
+        per_minute = finished / elapsed * 60
+        remaining = max(total - finished, 0)
+
+        return {
+            "batch_id": batch_id,
+            "status": raw.get("status", "unknown"),
+            "source": raw.get("source"),
+            "created_at": raw.get("created_at"),
+            "total": total,
+            "pending": self.redis.llen(CacheKeys.batch_pending(batch_id)),
+            "in_flight": int(raw.get("in_flight", 0)),
+            "completed": completed,
+            "failed": failed,
+            "finished": finished,
+            "progress": round(finished / total * 100, 1) if total else 100.0,
+            "elapsed_seconds": round(elapsed, 1),
+            "throughput_per_minute": round(per_minute, 2),
+            "eta_seconds": round(remaining / per_minute * 60) if per_minute > 0 else None,
+        }
+
+
+def dispatch_batches(tracker: Optional[BatchJobTracker] = None) -> int:
+    """
+    Fill free global slots from active batches, round-robin.
+
+    Returns:
+        Number of assessments dispatched
+    """
+    from .tasks import full_assessment_orchestrator_task
+
+    tracker = tracker or BatchJobTracker()
+    tracker.reap_expired()
+    dispatched = 0
+    active = tracker.active_batches()
+
+    while active:
+        progressed = []
+        for batch_id in active:
+            lead_id = tracker.claim_next(batch_id)
+            if lead_id is None:
+                continue
+            try:
+                full_assessment_orchestrator_task.apply_async(
+                    kwargs={"lead_id": lead_id},
+                    link=batch_item_completed.s(batch_id, lead_id),
+                    link_error=batch_item_failed.si(batch_id, lead_id),
+                )
+            except Exception as exc:
+                logger.error(f"Failed to dispatch lead {lead_id} for batch {batch_id}: {exc}")
+                tracker.unclaim(batch_id, lead_id)
+                return dispatched
+            dispatched += 1
+            progressed.append(batch_id)
+        active = progressed
+
+    if dispatched:
+        logger.info(f"Dispatched {dispatched} batch assessments")
+    return dispatched
+
+
+def submit_batch(lead_ids: List[int], source: str = "api") -> str:
+    """
+    Create a batch job and start dispatching it.
+
+    Args:
+        lead_ids: Database IDs of leads to assess
+        source: Where the batch came from (api, csv, celery)
+
+    Returns:
+        Batch ID for status tracking
+    """
+    batch_id = BatchJobTracker().create(lead_ids, source=source)
+    dispatch_batch_task.delay()
+    return batch_id
+
+
+async def create_leads_from_rows(rows: List[Dict[str, Any]], source: str = "batch_assessment") -> List[int]:
+    """
+    Insert leads for CSV/JSON rows that are not yet in the database.
+
+    Rows need at least a url; company, email, address, city and state are
+    optional. Returns lead IDs in row order.
+    """
+    from urllib.parse import urlparse
+    from src.core.database import AsyncSessionLocal
+    from src.models.lead import Lead
+
+    leads = []
+    for row in rows:
+        url = (row.get("url") or "").strip()
+        if not url:
+            raise AssessmentError(f"Row is missing url: {row}")
+        if not url.startswith(("http://", "https://")):
+            url = f"https://{url}"
+
+        domain = (urlparse(url).netloc or url).replace("www.", "").split(":")[0]
+        email = row.get("email") or f"assessment-{uuid.uuid4().hex[:10]}@{domain}"
+        state = (row.get("state") or "").strip().upper() or None
+
+        leads.append(Lead(
+            company=row.get("company") or row.get("business_name") or domain,
+            email=email.lower(),
+            url=url,
+            address=row.get("address") or None,
+            city=row.get("city") or None,
+            state=state if state and len(state) == 2 else None,
+            source=source,
+        ))
+
+    async with AsyncSessionLocal() as db:
+        db.add_all(leads)
+        await db.commit()
+        return [lead.id for lead in leads]
+
+
+@celery_app.task(bind=True, soft_time_limit=60, time_limit=90)
+def dispatch_batch_task(self) -> Dict[str, Any]:
+    """Dispatch batch assessments into free global slots."""
+    dispatched = dispatch_batches()
+    return {"task": "dispatch_batch", "dispatched": dispatched}
+
+
+@celery_app.task(bind=True, soft_time_limit=30, time_limit=60)
+def batch_item_completed(self, result: Any, batch_id: str, lead_id: int) -> None:
+    """Link callback: record an assessment result and refill the slot."""
+    # The task completes even when most components failed; count those as failed
+    success = isinstance(result, dict) and result.get("assessment_status") in ("completed", "partial")
+    tracker = BatchJobTracker()
+    tracker.record_result(batch_id, lead_id, success)
+    dispatch_batches(tracker)
+
+
+@celery_app.task(bind=True, soft_time_limit=30, time_limit=60)
+def batch_item_failed(self, batch_id: str, lead_id: int) -> None:
+    """Error callback: record a failed assessment and refill the slot."""
+    tracker = BatchJobTracker()
+    tracker.record_result(batch_id, lead_id, False)
+    dispatch_batches(tracker)
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=True,
+    retry_kwargs={'max_retries': 3},
+    soft_time_limit=300,
+    time_limit=360
+)
+def batch_assessment_task(self, lead_ids: Optional[List[int]] = None, rows: Optional[List[Dict[str, Any]]] = None,
+                          source: str = "celery") -> Dict[str, Any]:
+    """
+    Celery entry point for batch assessments.
+
+    Args:
+        lead_ids: Existing lead IDs to assess
+        rows: Lead rows (url, company, address, city, state) to create first
+        source: Batch origin recorded on the job
+
+    Returns:
+        Dict with the batch ID and lead count
+    """
+    from .utils import run_async_in_celery
+
+    all_ids = list(lead_ids or [])
+    if rows:
+        all_ids.extend(run_async_in_celery(create_leads_from_rows, rows))
+
+    batch_id = submit_batch(all_ids, source=source)
+    return {"task": "batch_assessment", "batch_id": batch_id, "total": len(all_ids)}
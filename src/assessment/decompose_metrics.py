@@ -151,7 +151,7 @@ async def extract_security_metrics_from_new_tables(db: AsyncSession, assessment_
             elif header.header_name.lower() == 'x-frame-options':
                 metrics['security_xframe_options_header'] = header.is_present
         
-        # Add placeholders for tech metrics (these might come from elsewhere)
+        # Placeholders; robots.txt/sitemap.xml and broken link metrics are overlaid from stored security data
         metrics['tech_robots_txt_found'] = False
         metrics['tech_sitemap_xml_found'] = False
         metrics['tech_broken_internal_links_count'] = 0
@@ -182,15 +182,31 @@ def extract_security_metrics(security_data: Optional[Dict[str, Any]]) -> Dict[st
     metrics['security_csp_header_present'] = security_data.get('csp_present', headers_analysis.get('csp', {}).get('present', False))
     metrics['security_xframe_options_header'] = security_data.get('x_frame_options_present', headers_analysis.get('x_frame_options', {}).get('present', False))
     
-    # Technical checks - these are typically not in security data but we'll check anyway
+    # Technical checks
     metrics['tech_robots_txt_found'] = security_data.get('robots_txt_found', False)
     metrics['tech_sitemap_xml_found'] = security_data.get('sitemap_xml_found', False)
     metrics['tech_broken_internal_links_count'] = security_data.get('broken_links_count', 0)
     metrics['tech_js_console_errors_count'] = security_data.get('console_errors_count', 0)
+    # Direct fetch and link check results take precedence over the legacy fields
+    metrics.update(extract_site_check_metrics(security_data))
     
     return metrics
 
 
+def extract_site_check_metrics(security_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extract robots.txt/sitemap.xml presence and broken link counts stored with security data"""
+    seo_signals = (security_data or {}).get('seo_signals') or {}
+    broken_links = (security_data or {}).get('broken_links') or {}
+    metrics = {}
+    if 'present' in seo_signals.get('robots_txt', {}):
+        metrics['tech_robots_txt_found'] = bool(seo_signals['robots_txt']['present'])
+    if 'present' in seo_signals.get('sitemap_xml', {}):
+        metrics['tech_sitemap_xml_found'] = bool(seo_signals['sitemap_xml']['present'])
+    if 'broken_count' in broken_links:
+        metrics['tech_broken_internal_links_count'] = broken_links['broken_count']
+    return metrics
+
+
 async def extract_gbp_metrics_from_new_tables(db: AsyncSession, assessment_id: int) -> Dict[str, Any]:
     """Extract GBP metrics from the new GBPAnalysis table"""
     from src.models.gbp import GBPAnalysis
@@ -504,6 +520,7 @@ async def decompose_and_store_metrics(
             # Fall back to JSON extraction
             security_metrics = extract_security_metrics(assessment.security_headers)
         all_metrics.update(security_metrics)
+        all_metrics.update(extract_site_check_metrics(assessment.security_headers))
         
         # Google Business Profile metrics - check new table first, then fall back to JSON
         gbp_metrics = await extract_gbp_metrics_from_new_tables(db, assessment_id)
@@ -569,8 +586,8 @@ def sync_decompose_and_store_metrics(assessment_id: int) -> bool:
     Returns:
         True if successful, False if failed
     """
-    import asyncio
     from src.core.database import AsyncSessionLocal
+    from src.assessment.utils import run_async_in_celery
     
     async def _decompose():
         async with AsyncSessionLocal() as db:
@@ -578,12 +595,7 @@ def sync_decompose_and_store_metrics(assessment_id: int) -> bool:
             return result is not None
     
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(_decompose())
-        finally:
-            loop.close()
+        return run_async_in_celery(_decompose)
     except Exception as e:
         logger.error(f"Sync decompose failed for assessment {assessment_id}: {e}")
         return False
\ No newline at end of file
@@ -15,6 +15,7 @@ from src.core.database import get_db
 from src.models.lead import Lead, Assessment
 from src.models.assessment_cost import AssessmentCost
 from src.core.logging import get_logger
+from src.core.provider_limits import OPENAI, PAGESPEED, PLACES, SCREENSHOTONE, SEMRUSH
 from .utils import (
     update_assessment_field, 
     update_assessment_status,
@@ -22,6 +23,7 @@ from .utils import (
     sync_update_assessment_status, 
     sync_get_lead_info,
     sync_assess_google_business_profile,
+    sync_skip_if_circuit_open,
     run_async_in_celery,
     debug_async_function_call,
     prepare_assessment_data_for_storage,
@@ -68,6 +70,11 @@ def pagespeed_task(self, lead_id: int) -> Dict[str, Any]:
     """
     task_start = datetime.now(timezone.utc)
     
+    # Fail fast while the provider's circuit breaker is open
+    skipped = sync_skip_if_circuit_open(lead_id, "pagespeed", PAGESPEED, 'pagespeed_data')
+    if skipped:
+        return skipped
+    
     try:
         logger.info(f"Starting PageSpeed assessment for lead {lead_id}")
         
@@ -381,6 +388,11 @@ def gbp_task(self, lead_id: int) -> Dict[str, Any]:
     """
     task_start = datetime.now(timezone.utc)
     
+    # Fail fast while the provider's circuit breaker is open
+    skipped = sync_skip_if_circuit_open(lead_id, "gbp", PLACES, 'gbp_data')
+    if skipped:
+        return skipped
+    
     try:
         logger.info(f"Starting GBP assessment for lead {lead_id}")
         
@@ -527,6 +539,11 @@ def screenshot_task(self, lead_id: int) -> Dict[str, Any]:
     """
     task_start = datetime.now(timezone.utc)
     
+    # Fail fast while the provider's circuit breaker is open
+    skipped = sync_skip_if_circuit_open(lead_id, "screenshot", SCREENSHOTONE, 'visual_analysis')
+    if skipped:
+        return skipped
+    
     try:
         logger.info(f"Starting screenshot capture for lead {lead_id}")
         
@@ -692,6 +709,11 @@ def semrush_task(self, lead_id: int) -> Dict[str, Any]:
     """
     task_start = datetime.now(timezone.utc)
     
+    # Fail fast while the provider's circuit breaker is open
+    skipped = sync_skip_if_circuit_open(lead_id, "semrush", SEMRUSH, 'semrush_data')
+    if skipped:
+        return skipped
+    
     try:
         logger.info(f"Starting SEMrush assessment for lead {lead_id}")
         
@@ -856,6 +878,11 @@ def visual_task(self, lead_id: int) -> Dict[str, Any]:
     """
     task_start = datetime.now(timezone.utc)
     
+    # Fail fast while the provider's circuit breaker is open
+    skipped = sync_skip_if_circuit_open(lead_id, "visual", OPENAI)
+    if skipped:
+        return skipped
+    
     try:
         logger.info(f"Starting visual assessment for lead {lead_id}")
         
@@ -865,7 +892,8 @@ def visual_task(self, lead_id: int) -> Dict[str, Any]:
         if not url:
             raise AssessmentError(f"Lead {lead_id} has no URL for visual analysis")
         
-        # Get screenshot URLs from assessment data
+        # Get screenshot references from assessment data
+        from src.assessments.screenshot_capture import screenshot_ref
         desktop_url = None
         mobile_url = None
         
@@ -878,10 +906,8 @@ def visual_task(self, lead_id: int) -> Dict[str, Any]:
                     desktop_data = visual_data.get("desktop_screenshot", {})
                     mobile_data = visual_data.get("mobile_screenshot", {})
                     
-                    if desktop_data.get("s3_url"):
-                        desktop_url = desktop_data["s3_url"]
-                    if mobile_data.get("s3_url"):
-                        mobile_url = mobile_data["s3_url"]
+                    desktop_url = screenshot_ref(desktop_data)
+                    mobile_url = screenshot_ref(mobile_data)
         except Exception as e:
             logger.warning(f"Could not retrieve assessment data for lead {lead_id}: {e}")
             # Continue without existing screenshot URLs
@@ -1391,8 +1417,9 @@ def aggregate_results(self, assessment_results: List[Dict[str, Any]], lead_id: i
         # Separate successful and failed assessments
         successful_results = [r for r in assessment_results if r.get('status') == 'completed']
         failed_results = [r for r in assessment_results if r.get('status') == 'failed']
+        skipped_results = [r for r in assessment_results if r.get('status') == 'skipped']
         
-        logger.info(f"Aggregating {len(successful_results)} successful and {len(failed_results)} failed assessments")
+        logger.info(f"Aggregating {len(successful_results)} successful, {len(failed_results)} failed and {len(skipped_results)} skipped assessments")
         
         # Calculate total score from available assessment scores
         scores = []
@@ -1412,7 +1439,7 @@ def aggregate_results(self, assessment_results: List[Dict[str, Any]], lead_id: i
         llm_result = llm_analysis_task.delay(lead_id, assessment_results)
         
         # Determine final status
-        if len(failed_results) == 0:
+        if len(failed_results) == 0 and len(skipped_results) == 0:
             final_status = 'completed'
         elif len(successful_results) > 0:
             final_status = 'partial'
@@ -1431,12 +1458,14 @@ def aggregate_results(self, assessment_results: List[Dict[str, Any]], lead_id: i
             "score_breakdown": score_details,
             "successful_assessments": len(successful_results),
             "failed_assessments": len(failed_results),
+            "skipped_assessments": len(skipped_results),
             "llm_task_id": llm_result.id,
             "aggregation_duration_ms": total_duration_ms,
             "completed_at": datetime.now(timezone.utc).isoformat(),
             "assessment_details": {
                 "successful": [{"task": r.get('task'), "score": r.get('score'), "duration_ms": r.get('duration_ms')} for r in successful_results],
-                "failed": [{"task": r.get('task'), "error": r.get('error')} for r in failed_results]
+                "failed": [{"task": r.get('task'), "error": r.get('error')} for r in failed_results],
+                "skipped": [{"task": r.get('task'), "error": r.get('error')} for r in skipped_results]
             }
         }
         
@@ -1493,6 +1522,43 @@ def monitor_assessment_queues() -> Dict[str, Any]:
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
+@celery_app.task
+def reconcile_budget_task() -> Dict[str, Any]:
+    """Resync Redis budget counters with recorded assessment costs"""
+    from src.core.budget import budget
+    return run_async_in_celery(budget.reconcile)
+
+@celery_app.task(soft_time_limit=3600, time_limit=3660)
+def backfill_lighthouse_storage_task(batch_size: int = 50) -> Dict[str, Any]:
+    """Compress legacy raw Lighthouse results and trim embedded copies"""
+    from src.assessments.pagespeed import backfill_compressed_lighthouse
+    return run_async_in_celery(backfill_compressed_lighthouse, batch_size)
+
+@celery_app.task(soft_time_limit=3600, time_limit=3660)
+def bulk_security_scan_task(targets: List[List[Any]]) -> Dict[str, Any]:
+    """Header-only security triage of [assessment_id, domain] pairs, stored in batches"""
+    from dataclasses import asdict
+    from src.assessments.bulk_security_scan import bulk_scan_security_headers
+    stats = run_async_in_celery(bulk_scan_security_headers, [tuple(target) for target in targets])
+    return {**asdict(stats), "domains_per_minute": stats.domains_per_minute}
+
+@celery_app.task(soft_time_limit=1800, time_limit=1860)
+def compare_screenshot_history_task(lead_id: int, recompute: bool = False) -> Dict[str, Any]:
+    """Visual diffs between consecutive desktop and mobile captures of a lead"""
+    from dataclasses import asdict
+    from src.assessments.screenshot_comparison import compare_lead_history
+    from src.core.database import AsyncSessionLocal
+    from src.models.screenshot import ScreenshotType
+
+    async def compare_all():
+        async with AsyncSessionLocal() as db:
+            return {
+                screenshot_type.value: asdict(await compare_lead_history(db, lead_id, screenshot_type, recompute))
+                for screenshot_type in (ScreenshotType.DESKTOP, ScreenshotType.MOBILE)
+            }
+
+    return {"lead_id": lead_id, **run_async_in_celery(compare_all)}
+
 @celery_app.task(
     bind=True,
     autoretry_for=(ConnectionError, TimeoutError, AssessmentError),
@@ -1514,6 +1580,11 @@ def content_generation_task(self, lead_id: int) -> Dict[str, Any]:
     """
     task_start = datetime.now(timezone.utc)
     
+    # Fail fast while the provider's circuit breaker is open
+    skipped = sync_skip_if_circuit_open(lead_id, "content_generation", OPENAI, 'marketing_content')
+    if skipped:
+        return skipped
+    
     try:
         logger.info(f"Starting content generation for lead {lead_id}")
         
@@ -1968,6 +2039,7 @@ def full_assessment_orchestrator_task(self, lead_id: Optional[int] = None, lead_
             "assessment_id": assessment_id,
             "task": "full_assessment_orchestrator",
             "status": "completed",
+            "assessment_status": final_status,
             "execution_id": execution_result.execution_id,
             "orchestration_status": execution_result.status.value,
             "success_rate": execution_result.success_rate,
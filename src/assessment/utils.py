@@ -14,6 +14,8 @@ from sqlalchemy import select, update
 from src.core.database import get_db
 from src.models.lead import Lead, Assessment
 from src.core.logging import get_logger
+from src.core.http_clients import http_clients
+from src.core.browser_pool import shutdown_browser_pool
 
 logger = get_logger(__name__)
 
@@ -21,10 +23,11 @@ T = TypeVar('T')
 
 def run_async_in_celery(async_func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
     """
-    Safely run async functions in Celery workers that don't have event loops.
+    Run an async function from a synchronous Celery task.
     
-    This function handles the event loop management for async functions
-    called from synchronous Celery task contexts.
+    Coroutines are submitted to the worker process's persistent event loop
+    (see src.core.worker_loop), so database engines and HTTP clients created
+    on that loop are reused across calls and tasks.
     
     Args:
         async_func: The async function to run
@@ -37,73 +40,28 @@ def run_async_in_celery(async_func: Callable[..., Awaitable[T]], *args, **kwargs
     Raises:
         Any exception raised by the async function
     """
+    from src.core.worker_loop import worker_loop
+    
     # First validate that we have an async function
     if not asyncio.iscoroutinefunction(async_func):
         raise TypeError(f"Function {async_func.__name__} is not an async function")
     
     logger.debug(f"Starting async execution for {async_func.__name__}")
     
-    # Try different strategies for running the async function
-    try:
-        # Strategy 1: Check if there's a running event loop
-        try:
-            loop = asyncio.get_running_loop()
-            logger.debug(f"Found running loop for {async_func.__name__}, using thread executor")
-            # There's a running loop, we need to run in a separate thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(_run_async_in_new_loop, async_func, *args, **kwargs)
-                result = future.result()
-                logger.debug(f"Successfully completed {async_func.__name__} via thread executor")
-                return result
-        except RuntimeError:
-            # No running loop, try to use existing loop for this thread
-            logger.debug(f"No running loop found for {async_func.__name__}")
-            pass
-        
-        # Strategy 2: Try to get the current thread's event loop
-        try:
-            # In Python 3.10+, get_event_loop() raises DeprecationWarning if no loop
-            # In older versions, it creates a loop if none exists
-            if hasattr(asyncio, 'get_running_loop'):
-                # Python 3.7+ - be more careful about loop handling
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        logger.debug(f"Found running loop in thread for {async_func.__name__}, using new loop")
-                        return _run_async_in_new_loop(async_func, *args, **kwargs)
-                    else:
-                        logger.debug(f"Using existing thread loop for {async_func.__name__}")
-                        result = loop.run_until_complete(async_func(*args, **kwargs))
-                        logger.debug(f"Successfully completed {async_func.__name__} via existing loop")
-                        return result
-                except RuntimeError:
-                    # No loop for this thread
-                    logger.debug(f"No existing loop for thread, creating new one for {async_func.__name__}")
-                    return _run_async_in_new_loop(async_func, *args, **kwargs)
-            else:
-                # Python < 3.7 fallback
-                loop = asyncio.get_event_loop()
-                result = loop.run_until_complete(async_func(*args, **kwargs))
-                logger.debug(f"Successfully completed {async_func.__name__} via legacy loop")
-                return result
-        except Exception as loop_error:
-            logger.debug(f"Loop handling failed for {async_func.__name__}: {loop_error}")
-            # Fall through to new loop strategy
-    
-    except Exception as e:
-        logger.warning(f"Error in async execution strategy for {async_func.__name__}: {e}")
+    if worker_loop.in_loop_thread():
+        # Called synchronously from code already running on the worker loop;
+        # blocking on that loop would deadlock, so isolate it in a new thread
+        logger.debug(f"Nested call for {async_func.__name__}, using isolated loop")
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(_run_async_in_new_loop, async_func, *args, **kwargs).result()
     
-    # Strategy 3: Fallback - always create a new loop
-    logger.debug(f"Falling back to new loop for {async_func.__name__}")
-    return _run_async_in_new_loop(async_func, *args, **kwargs)
+    result = worker_loop.submit(async_func(*args, **kwargs))
+    logger.debug(f"Successfully completed {async_func.__name__} on worker loop")
+    return result
 
 def _run_async_in_new_loop(async_func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
     """Helper function to run async function in a new event loop."""
-    import nest_asyncio
-    # Allow nested event loops - this helps with asyncpg connections
-    nest_asyncio.apply()
-    
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     coro = None
@@ -144,6 +102,12 @@ def _run_async_in_new_loop(async_func: Callable[..., Awaitable[T]], *args, **kwa
         except Exception as cleanup_error:
             logger.debug(f"Task cleanup completed with minor issues: {cleanup_error}")
         finally:
+            try:
+                # Shared HTTP clients and browsers bound to this loop die with it
+                loop.run_until_complete(http_clients.aclose_loop())
+                loop.run_until_complete(shutdown_browser_pool())
+            except Exception as close_error:
+                logger.debug(f"HTTP client cleanup completed with minor issues: {close_error}")
             try:
                 loop.close()
                 logger.debug(f"Closed event loop for {async_func.__name__}")
@@ -473,25 +437,17 @@ def sync_assess_google_business_profile(business_name: str, address: Optional[st
     Returns:
         Dict containing GBP assessment results
     """
-    import asyncio
-    
     try:
         from src.assessments.gbp_integration import assess_google_business_profile
         
-        # Create and run new event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(assess_google_business_profile(
-                business_name=business_name,
-                address=address,
-                city=city,
-                state=state,
-                lead_id=lead_id
-            ))
-            return result
-        finally:
-            loop.close()
+        return run_async_in_celery(
+            assess_google_business_profile,
+            business_name=business_name,
+            address=address,
+            city=city,
+            state=state,
+            lead_id=lead_id
+        )
             
     except Exception as e:
         logger.error(f"Failed to execute GBP assessment: {e}")
@@ -524,6 +480,51 @@ def sync_store_cost_records(cost_records: list) -> bool:
         raise AssessmentError(f"Cost record storage failed: {e}")
 
 
+def sync_skip_if_circuit_open(
+    lead_id: int,
+    task_name: str,
+    provider: str,
+    data_field: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Check a provider's circuit breaker before a Celery component task runs.
+    
+    Args:
+        lead_id: Database ID of the lead being assessed
+        task_name: Component name reported in the task result
+        provider: Provider the task depends on
+        data_field: Assessment field to record the skip in, if any
+        
+    Returns:
+        Skipped task result if the breaker is open, otherwise None
+    """
+    from src.core.circuit_breaker import is_circuit_open
+    
+    if not run_async_in_celery(is_circuit_open, provider):
+        return None
+    
+    reason = f"{task_name} skipped: {provider} circuit open"
+    logger.warning(f"{reason} for lead {lead_id}")
+    
+    if data_field:
+        try:
+            sync_update_assessment_field(
+                lead_id,
+                data_field,
+                {"skipped": True, "error": reason, "timestamp": datetime.now(timezone.utc).isoformat()}
+            )
+        except Exception as db_exc:
+            logger.error(f"Failed to record {task_name} skip: {db_exc}")
+    
+    return {
+        "lead_id": lead_id,
+        "task": task_name,
+        "status": "skipped",
+        "error": reason,
+        "completed_at": datetime.now(timezone.utc).isoformat()
+    }
+
+
 # Test function for async handling
 async def _test_async_function(test_arg: str = "test") -> str:
     """Simple async function for testing the run_async_in_celery function."""
@@ -14,11 +14,16 @@ from enum import Enum
 
 from src.core.config import settings
 from src.models.assessment_cost import AssessmentCost
-from src.assessments.screenshot_capture import capture_website_screenshots, ScreenshotMetadata
+from src.assessments.screenshot_capture import capture_website_screenshots, ScreenshotMetadata, screenshot_ref
 from src.assessments.semrush_integration import assess_semrush_domain, SEMrushMetrics
 from src.assessments.visual_analysis import assess_visual_analysis, VisualAnalysisMetrics
 from src.assessments.score_calculator import calculate_business_score, BusinessImpactScore
 from src.assessments.content_generator import generate_marketing_content, GeneratedContent
+from src.assessments.dag_scheduler import DAGNode, DAGScheduler
+from src.assessments.reachability import URL_DEPENDENT_COMPONENTS, ReachabilityResult, precheck_site
+from src.core.provider_limits import COMPONENT_PROVIDERS, provider_slot
+from src.core.circuit_breaker import CircuitOpenError, is_circuit_open
+from src.core.budget import COMPONENT_COST_ESTIMATES, BudgetExceededError, budget
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +34,7 @@ class AssessmentStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     PARTIALLY_COMPLETED = "partially_completed"
+    UNREACHABLE = "unreachable"
 
 class ComponentStatus(Enum):
     """Individual component execution status."""
@@ -79,6 +85,7 @@ class AssessmentExecution:
     assessment_data: Dict[str, Any]
     error_summary: List[str]
     success_rate: float
+    reachability: Optional[ReachabilityResult] = None
 
 class AssessmentOrchestratorError(Exception):
     """Custom exception for orchestration errors"""
@@ -102,6 +109,19 @@ class AssessmentOrchestrator:
         "content_generation" # PRP-010: Marketing content
     ]
     
+    # Inputs each component reads from assessment_data; anything not listed
+    # here has no upstream dependency and starts immediately
+    COMPONENT_DEPENDENCIES = {
+        "pagespeed": [],
+        "security": [],
+        "gbp": [],
+        "screenshots": [],
+        "semrush": [],
+        "visual_analysis": ["screenshots"],
+        "score_calculation": ["pagespeed", "security", "gbp", "screenshots", "semrush", "visual_analysis"],
+        "content_generation": ["score_calculation"]
+    }
+    
     # Component timeout settings (seconds)
     COMPONENT_TIMEOUTS = {
         "pagespeed": 60,
@@ -126,9 +146,10 @@ class AssessmentOrchestrator:
         "content_generation": 2
     }
     
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None):
         """Initialize assessment orchestrator."""
         self.execution_id = f"assessment_{int(time.time())}"
+        self.max_concurrency = max_concurrency or settings.ASSESSMENT_COMPONENT_CONCURRENCY
         logger.info(f"Assessment Orchestrator initialized: {self.execution_id}")
     
     async def execute_complete_assessment(self, lead_id: int, lead_data: Dict[str, Any]) -> AssessmentExecution:
@@ -171,19 +192,24 @@ class AssessmentOrchestrator:
         try:
             logger.info(f"Starting complete assessment for lead {lead_id}")
             
-            # Execute components in dependency order
+            # Pre-flight: don't spend paid calls and long timeouts on a dead site
+            execution.reachability = await precheck_site(lead_data.get('url'))
+            
+            # Execute components as soon as their inputs are available
+            scheduler = self._build_scheduler(execution, lead_data)
+            outcomes = await scheduler.run()
+            
             for component_name in self.EXECUTION_ORDER:
-                try:
-                    await self._execute_component(execution, component_name, lead_data)
-                except Exception as e:
-                    error_msg = f"{component_name} execution failed: {str(e)}"
-                    execution.error_summary.append(error_msg)
-                    logger.error(error_msg)
-                    
-                    # Continue with other components even if one fails
-                    component_result = getattr(execution, f"{component_name}_result")
-                    component_result.status = ComponentStatus.FAILED
-                    component_result.error_message = str(e)
+                e = outcomes.get(component_name)
+                if e is None:
+                    continue
+                error_msg = f"{component_name} execution failed: {str(e)}"
+                execution.error_summary.append(error_msg)
+                
+                # Other components keep running even if one fails
+                component_result = getattr(execution, f"{component_name}_result")
+                component_result.status = ComponentStatus.FAILED
+                component_result.error_message = str(e)
             
             # Calculate final metrics
             execution.end_time = datetime.now(timezone.utc)
@@ -192,7 +218,9 @@ class AssessmentOrchestrator:
             execution.total_cost_cents = self._calculate_total_cost(execution)
             
             # Determine final status
-            if execution.success_rate >= 0.8:
+            if execution.reachability and not execution.reachability.reachable:
+                execution.status = AssessmentStatus.UNREACHABLE
+            elif execution.success_rate >= 0.8:
                 execution.status = AssessmentStatus.COMPLETED
             elif execution.success_rate >= 0.5:
                 execution.status = AssessmentStatus.PARTIALLY_COMPLETED
@@ -211,6 +239,22 @@ class AssessmentOrchestrator:
             logger.error(f"Assessment orchestration failed for lead {lead_id}: {e}")
             raise AssessmentOrchestratorError(f"Assessment execution failed: {str(e)}")
     
+    def _build_scheduler(self, execution: AssessmentExecution, lead_data: Dict[str, Any]) -> DAGScheduler:
+        """Build the component dependency graph for one execution."""
+        
+        def make_runner(component_name: str):
+            return lambda: self._execute_component(execution, component_name, lead_data)
+        
+        nodes = [
+            DAGNode(
+                name=component_name,
+                func=make_runner(component_name),
+                depends_on=self.COMPONENT_DEPENDENCIES.get(component_name, [])
+            )
+            for component_name in self.EXECUTION_ORDER
+        ]
+        return DAGScheduler(nodes, max_concurrency=self.max_concurrency)
+    
     async def _execute_component(self, execution: AssessmentExecution, component_name: str, lead_data: Dict[str, Any]) -> None:
         """Execute individual assessment component with error handling."""
         
@@ -220,16 +264,34 @@ class AssessmentOrchestrator:
         
         timeout = self.COMPONENT_TIMEOUTS.get(component_name, 60)
         max_retries = self.MAX_RETRIES.get(component_name, 1)
+        provider = COMPONENT_PROVIDERS.get(component_name)
+        
+        reachability = execution.reachability
+        if reachability and not reachability.reachable and component_name in URL_DEPENDENT_COMPONENTS:
+            self._skip_component(execution, component_result, f"{component_name} skipped: {reachability.summary}")
+            return
+        
+        # Admission control: skip paid work the lead or day can no longer afford
+        estimate = COMPONENT_COST_ESTIMATES.get(component_name, 0.0)
+        if estimate and not await budget.can_afford(estimate, execution.lead_id):
+            self._skip_component(execution, component_result, f"{component_name} skipped: budget exhausted")
+            return
         
         for attempt in range(max_retries + 1):
+            # Don't wait out timeouts against a provider that is known to be down
+            if await is_circuit_open(provider):
+                self._skip_component(execution, component_result, f"{component_name} skipped: {provider} circuit open")
+                return
+            
             try:
                 logger.info(f"Executing {component_name} (attempt {attempt + 1}/{max_retries + 1})")
                 
-                # Execute component with timeout
-                result_data = await asyncio.wait_for(
-                    self._call_component_function(component_name, execution.lead_id, lead_data, execution.assessment_data),
-                    timeout=timeout
-                )
+                # Execute component with timeout, holding a slot for its paid provider
+                async with provider_slot(provider, timeout=settings.PROVIDER_SLOT_LEASE_SECONDS):
+                    result_data = await asyncio.wait_for(
+                        self._call_component_function(component_name, execution.lead_id, lead_data, execution.assessment_data),
+                        timeout=timeout
+                    )
                 
                 # Success - store results
                 component_result.status = ComponentStatus.SUCCESS
@@ -255,6 +317,10 @@ class AssessmentOrchestrator:
                 if attempt == max_retries:
                     component_result.error_message = error_msg
                     
+            except (CircuitOpenError, BudgetExceededError) as e:
+                self._skip_component(execution, component_result, f"{component_name} skipped: {e}")
+                return
+                    
             except Exception as e:
                 error_msg = f"{component_name} failed: {str(e)}"
                 logger.warning(f"{error_msg} (attempt {attempt + 1})")
@@ -270,6 +336,15 @@ class AssessmentOrchestrator:
         component_result.end_time = datetime.now(timezone.utc)
         component_result.duration_ms = int((component_result.end_time - component_result.start_time).total_seconds() * 1000)
     
+    def _skip_component(self, execution: AssessmentExecution, component_result: ComponentResult, reason: str) -> None:
+        """Mark a component skipped so the assessment can finish without it."""
+        logger.warning(reason)
+        component_result.status = ComponentStatus.SKIPPED
+        component_result.error_message = reason
+        component_result.end_time = datetime.now(timezone.utc)
+        component_result.duration_ms = int((component_result.end_time - component_result.start_time).total_seconds() * 1000)
+        execution.error_summary.append(reason)
+    
     async def _call_component_function(self, component_name: str, lead_id: int, lead_data: Dict[str, Any], assessment_data: Dict[str, Any]) -> Dict[str, Any]:
         """Call the appropriate component function based on component name."""
         
@@ -346,17 +421,9 @@ class AssessmentOrchestrator:
             # Call Visual Analysis (PRP-008)
             screenshot_data = assessment_data.get("screenshots", {})
             
-            # Extract screenshot URLs - check for s3_url or signed_url
-            desktop_screenshot = screenshot_data.get("desktop_screenshot", {})
-            mobile_screenshot = screenshot_data.get("mobile_screenshot", {})
-            
-            desktop_url = None
-            mobile_url = None
-            
-            if desktop_screenshot:
-                desktop_url = desktop_screenshot.get("s3_url") or desktop_screenshot.get("signed_url")
-            if mobile_screenshot:
-                mobile_url = mobile_screenshot.get("s3_url") or mobile_screenshot.get("signed_url")
+            # Screenshots travel as blob references (legacy results may carry URLs)
+            desktop_url = screenshot_ref(screenshot_data.get("desktop_screenshot"))
+            mobile_url = screenshot_ref(screenshot_data.get("mobile_screenshot"))
             
             if desktop_url and mobile_url:
                 visual_analysis = await assess_visual_analysis(url, desktop_url, mobile_url, lead_id)
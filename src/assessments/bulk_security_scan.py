@@ -0,0 +1,245 @@
+"""
+PRP-004: Bulk Security Header Scan
+Header-only security triage for large domain lists in a bounded asyncio pipeline
+"""
+
+import asyncio
+import logging
+import socket
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from src.assessments.security_analysis import (
+    FETCH_FAILURES, SecurityMetrics, failed_security_metrics, save_security_analyses_bulk,
+    score_security_headers
+)
+from src.assessments.site_fetch import parse_set_cookie
+from src.core.config import settings
+from src.core.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+ScanResult = Tuple[int, SecurityMetrics]
+
+
+class DNSCache:
+    """
+    getaddrinfo results (and failures) reused for a TTL, with concurrent
+    lookups of the same host coalesced.
+
+    Lets a scan drop dead domains without a connection attempt and group
+    domains on shared hosting under one per-IP limit.
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds or settings.BULK_SCAN_DNS_TTL_SECONDS
+        self._entries: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    async def resolve(self, host: str) -> Optional[str]:
+        """First address for host, or None if it does not resolve."""
+        entry = self._entries.get(host)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lookup = self._pending.get(host)
+        if lookup is None:
+            lookup = self._pending[host] = asyncio.create_task(self._lookup(host))
+            lookup.add_done_callback(lambda _: self._pending.pop(host, None))
+        # A cancelled caller must not cancel the lookup other callers share
+        return await asyncio.shield(lookup)
+
+    async def _lookup(self, host: str) -> Optional[str]:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            address = infos[0][4][0] if infos else None
+        except (OSError, UnicodeError):
+            address = None
+        self._entries[host] = (time.monotonic() + self.ttl_seconds, address)
+        return address
+
+
+@dataclass
+class BulkScanStats:
+    """Counters for one bulk scan run"""
+    scanned: int = 0
+    unreachable: int = 0
+    written: int = 0
+    write_errors: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def domains_per_minute(self) -> float:
+        return self.scanned * 60 / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class BulkSecurityScanner:
+    """
+    Scores security headers for many domains without downloading bodies.
+
+    Each request is streamed and the response closed as soon as the headers
+    arrive, and connects to the address the DNS cache already resolved.
+    Bare domains are tried over HTTPS first, then HTTP. Requests to
+    one IP are capped at BULK_SCAN_PER_HOST_CONCURRENCY so a shared host
+    serving hundreds of listed domains is not flooded.
+    """
+
+    def __init__(self):
+        self.dns = DNSCache()
+        self._ip_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def _head_of(self, url: str) -> SecurityMetrics:
+        """
+        Score the headers of url, following redirects by hand so every hop
+        connects to its DNS-cached address instead of httpx resolving the
+        host again. Host and SNI still name the site.
+        """
+        client = get_http_client("bulk_scan")
+        target = httpx.URL(url)
+        cookies = []
+        for _ in range(client.max_redirects + 1):
+            address = await self.dns.resolve(target.host)
+            if address is None:
+                raise httpx.ConnectError(f"DNS lookup failed for {target.host}")
+            request = client.build_request(
+                "GET", target.copy_with(host=address),
+                headers={"Host": target.netloc.decode("ascii")},
+                extensions={"sni_hostname": target.host},
+                timeout=settings.BULK_SCAN_TIMEOUT_SECONDS,
+            )
+            response = await client.send(request, stream=True, follow_redirects=False)
+            # Closing without reading drops the connection after the headers
+            await response.aclose()
+            cookies.extend(
+                cookie
+                for header in response.headers.get_list("set-cookie")
+                if (cookie := parse_set_cookie(header, str(target)))
+            )
+            location = response.headers.get("location")
+            if not response.is_redirect or not location:
+                headers = {name.lower(): value for name, value in response.headers.items()}
+                return score_security_headers(url, headers, cookies)
+            target = target.join(location)
+        raise httpx.TooManyRedirects("Exceeded maximum allowed redirects", request=request)
+
+    async def scan(self, domain: str) -> SecurityMetrics:
+        """Header-only equivalent of the single-site security analysis."""
+        candidates = [domain] if "://" in domain else [f"https://{domain}", f"http://{domain}"]
+        host = urlparse(candidates[0]).hostname or ""
+
+        address = await self.dns.resolve(host)
+        if address is None:
+            return failed_security_metrics(candidates[0], "connect", "DNS lookup failed")
+
+        limit = self._ip_limits.setdefault(address, asyncio.Semaphore(settings.BULK_SCAN_PER_HOST_CONCURRENCY))
+        async with limit:
+            for url in candidates:
+                try:
+                    return await self._head_of(url)
+                except httpx.ConnectError as e:
+                    failure = ("connect", str(e))
+                except httpx.TimeoutException as e:
+                    return failed_security_metrics(url, "timeout", str(e))
+                except httpx.HTTPError as e:
+                    return failed_security_metrics(url, "other", str(e) or type(e).__name__)
+        return failed_security_metrics(candidates[-1], *failure)
+
+
+async def _write_batch(batch: List[ScanResult]) -> int:
+    from src.core.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        try:
+            written = await save_security_analyses_bulk(db, batch)
+            await db.commit()
+            return written
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def bulk_scan_security_headers(
+    targets: Iterable[Tuple[int, str]],
+    concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    write_batch: Callable[[List[ScanResult]], Awaitable[int]] = _write_batch
+) -> BulkScanStats:
+    """
+    Scan (assessment_id, domain) pairs and store the results in batches.
+
+    A bounded queue feeds a fixed set of scan workers, whose results go to
+    a single writer that saves BULK_SCAN_BATCH_SIZE rows per transaction.
+    Memory stays bounded however long the target list is.
+
+    Args:
+        targets: (assessment_id, domain or URL) pairs
+        concurrency: Scan workers (default BULK_SCAN_CONCURRENCY)
+        batch_size: Results per write (default BULK_SCAN_BATCH_SIZE)
+        write_batch: Persists one batch and returns rows written
+    """
+    concurrency = concurrency or settings.BULK_SCAN_CONCURRENCY
+    batch_size = batch_size or settings.BULK_SCAN_BATCH_SIZE
+    scanner = BulkSecurityScanner()
+    stats = BulkScanStats()
+    started = time.monotonic()
+
+    pending: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    results: asyncio.Queue = asyncio.Queue(maxsize=batch_size * 2)
+
+    async def produce() -> None:
+        for target in targets:
+            await pending.put(target)
+        for _ in range(concurrency):
+            await pending.put(None)
+
+    async def work() -> None:
+        while (target := await pending.get()) is not None:
+            assessment_id, domain = target
+            try:
+                metrics = await scanner.scan(domain)
+            except Exception as e:
+                metrics = failed_security_metrics(domain, "other", str(e) or type(e).__name__)
+            await results.put((assessment_id, metrics))
+
+    async def flush(batch: List[ScanResult]) -> None:
+        try:
+            stats.written += await write_batch(batch)
+        except Exception as e:
+            stats.write_errors += len(batch)
+            logger.error(f"Failed to write {len(batch)} bulk security results: {e}")
+
+    async def write() -> None:
+        batch: List[ScanResult] = []
+        while (result := await results.get()) is not None:
+            stats.scanned += 1
+            if any(v.startswith(FETCH_FAILURES) for v in result[1].vulnerabilities):
+                stats.unreachable += 1
+            batch.append(result)
+            if len(batch) >= batch_size:
+                await flush(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+
+    workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+    writer = asyncio.create_task(write())
+    try:
+        await produce()
+        await asyncio.gather(*workers)
+        await results.put(None)
+        await writer
+    finally:
+        for task in (*workers, writer):
+            task.cancel()
+
+    stats.elapsed_seconds = time.monotonic() - started
+    logger.info(
+        f"Bulk security scan: {stats.scanned} domains ({stats.unreachable} unreachable), "
+        f"{stats.written} written in {stats.elapsed_seconds:.1f}s "
+        f"({stats.domains_per_minute:.0f}/min)"
+    )
+    return stats
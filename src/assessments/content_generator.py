@@ -8,11 +8,18 @@ import time
 import json
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 import httpx
 
 from src.core.config import settings
+from src.core.provider_limits import OPENAI
+from src.core.budget import BudgetExceededError, budget_reservation, charges_lead
+from src.core.circuit_breaker import CircuitOpenError, circuit_guard
+from src.core.rate_limiter import acquire_rate_limit
+from src.core.http_clients import get_http_client
+from src.assessments.llm_cache import cached_llm_call, llm_cache_key
+from src.assessments.result_cache import CacheProvenance, record_cache_hit_cost
 from src.models.assessment_cost import AssessmentCost
 
 logger = logging.getLogger(__name__)
@@ -54,6 +61,7 @@ class GeneratedContent:
     content_quality_score: float
     template_version: str
     processing_time_ms: int
+    cache_provenance: Optional[Dict[str, Any]] = None
 
 class ContentGeneratorError(Exception):
     """Custom exception for content generation errors"""
@@ -67,6 +75,9 @@ class ContentGenerator:
     
     # OpenAI API Configuration
     MODEL = "gpt-4o-mini"  # Cost-optimized model
+    TEMPERATURE = 0.3  # Lower temperature for consistent, professional content
+    MAX_TOKENS = 1500
+    SYSTEM_PROMPT = "You are a professional B2B marketing content writer specializing in website audit reports. Generate personalized, data-driven content that follows brand guidelines and avoids spam triggers."
     COST_PER_LEAD = 2.0  # $0.02 in cents (target cost optimization)
     TIMEOUT = 30  # 30 seconds
     MAX_RETRIES = 3
@@ -100,10 +111,13 @@ class ContentGenerator:
     def __init__(self):
         """Initialize content generator with OpenAI API configuration."""
         self.api_key = settings.OPENAI_API_KEY
-        self.client = httpx.AsyncClient(timeout=self.TIMEOUT)
-        self.template_version = "v1.0"
-        
+        self.template_version = "v1.0"  # Bump when prompts or parsing change to invalidate cached responses
         logger.info(f"Content Generator initialized with model: {self.MODEL}")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client for the running event loop."""
+        return get_http_client("openai")
     
     async def generate_email_content(self, lead_id: int, business_data: Dict[str, Any], assessment_data: Dict[str, Any]) -> GeneratedContent:
         """
@@ -136,6 +150,8 @@ class ContentGenerator:
             logger.info(f"Content generation completed for lead {lead_id}: ${generated_content.api_cost_dollars:.4f} cost, {processing_time_ms}ms")
             return generated_content
             
+        except (CircuitOpenError, BudgetExceededError):
+            raise
         except Exception as e:
             logger.error(f"Content generation failed for lead {lead_id}: {e}")
             raise ContentGeneratorError(f"Content generation failed: {str(e)}")
@@ -182,31 +198,66 @@ class ContentGenerator:
         # Create comprehensive content generation prompt
         prompt = self._create_content_generation_prompt(request)
         
+        # The same business and assessment data renders the same prompt; reuse its content
+        content, provenance = await cached_llm_call(
+            "llm_content",
+            llm_cache_key(
+                self.MODEL, self.template_version, self.TEMPERATURE, [self.SYSTEM_PROMPT, prompt],
+                max_tokens=self.MAX_TOKENS
+            ),
+            lambda: self._call_content_api(request, prompt),
+            serialize=asdict,
+            deserialize=lambda data: GeneratedContent(**{**data, "lead_id": request.lead_id, "cache_provenance": None}),
+            cost_of=lambda c: c.api_cost_dollars * 100,
+            cacheable=self._is_complete
+        )
+        if provenance and provenance.cache_hit:
+            content.api_cost_dollars = 0.0
+            content.cache_provenance = provenance.dict()
+        return content
+    
+    @staticmethod
+    def _is_complete(content: GeneratedContent) -> bool:
+        """Whether every section came back, so a truncated response isn't cached"""
+        return all([
+            content.email_body.strip(),
+            content.executive_summary.strip(),
+            content.issue_insights,
+            content.recommended_actions,
+            content.urgency_indicators,
+        ])
+    
+    async def _call_content_api(self, request: ContentGenerationRequest, prompt: str) -> GeneratedContent:
+        """Single OpenAI chat completion for all content types."""
+        
         try:
-            response = await self.client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.MODEL,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a professional B2B marketing content writer specializing in website audit reports. Generate personalized, data-driven content that follows brand guidelines and avoids spam triggers."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": 1500,
-                    "temperature": 0.3,  # Lower temperature for consistent, professional content
-                    "response_format": {"type": "json_object"}
-                },
-                timeout=self.TIMEOUT
-            )
+            await acquire_rate_limit(OPENAI)
+            async with budget_reservation(OPENAI, self.COST_PER_LEAD), circuit_guard(OPENAI) as call:
+                response = await self.client.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "model": self.MODEL,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": self.SYSTEM_PROMPT
+                            },
+                            {
+                                "role": "user",
+                                "content": prompt
+                            }
+                        ],
+                        "max_tokens": self.MAX_TOKENS,
+                        "temperature": self.TEMPERATURE,
+                        "response_format": {"type": "json_object"}
+                    },
+                    timeout=self.TIMEOUT
+                )
+                call.check(response.status_code)
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -221,6 +272,9 @@ class ContentGenerator:
         except httpx.TimeoutException:
             logger.error("Content generation API timeout")
             raise ContentGeneratorError("Content generation request timed out")
+        except (CircuitOpenError, BudgetExceededError):
+            # Skip content generation rather than retrying while OpenAI is failing or over budget
+            raise
         except Exception as e:
             logger.error(f"Content generation API error: {e}")
             raise ContentGeneratorError(f"Content generation failed: {str(e)}")
@@ -467,9 +521,10 @@ Generate professional, personalized content that drives engagement while maintai
             logger.warning("Incomplete content generation - missing required fields")
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Kept for callers; the shared HTTP client is closed at shutdown."""
+        pass
 
+@charges_lead
 async def generate_marketing_content(lead_id: int, business_data: Dict[str, Any], assessment_data: Dict[str, Any]) -> GeneratedContent:
     """
     Main entry point for marketing content generation.
@@ -493,6 +548,8 @@ async def generate_marketing_content(lead_id: int, business_data: Dict[str, Any]
             # Generate marketing content
             logger.info(f"Starting content generation for lead {lead_id}")
             generated_content = await generator.generate_email_content(lead_id, business_data, assessment_data)
+            if generated_content.cache_provenance:
+                await record_cache_hit_cost(lead_id, "openai_content", CacheProvenance(**generated_content.cache_provenance))
             
             logger.info(f"Content generation completed for lead {lead_id}: {len(generated_content.issue_insights)} insights, {len(generated_content.recommended_actions)} actions")
             return generated_content
@@ -500,6 +557,9 @@ async def generate_marketing_content(lead_id: int, business_data: Dict[str, Any]
         finally:
             await generator.close()
             
+    except (CircuitOpenError, BudgetExceededError):
+        # Orchestrators skip the component instead of failing and retrying it
+        raise
     except Exception as e:
         logger.error(f"Marketing content generation failed for lead {lead_id}: {e}")
         raise ContentGeneratorError(f"Content generation failed: {str(e)}")
@@ -0,0 +1,129 @@
+"""
+PRP-011: Assessment DAG Scheduler
+Dependency-graph execution of assessment components with bounded concurrency
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DAGSchedulerError(Exception):
+    """Custom exception for invalid dependency graphs"""
+    pass
+
+
+@dataclass
+class DAGNode:
+    """Single schedulable unit with the names of the nodes it reads from."""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class DAGScheduler:
+    """
+    Runs every node whose dependencies have finished, up to max_concurrency
+    nodes at a time.
+
+    Dependencies only order execution: a node still runs when an upstream
+    node failed, so consumers can fall back the same way they did under the
+    serial execution order. Node exceptions are collected, never raised.
+    """
+
+    def __init__(self, nodes: List[DAGNode], max_concurrency: int = 4):
+        if max_concurrency < 1:
+            raise DAGSchedulerError("max_concurrency must be at least 1")
+
+        self.nodes: Dict[str, DAGNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise DAGSchedulerError(f"Duplicate node: {node.name}")
+            self.nodes[node.name] = node
+
+        self.max_concurrency = max_concurrency
+        self._validate()
+
+    def _validate(self) -> None:
+        """Reject unknown dependencies and cycles before anything runs."""
+        for node in self.nodes.values():
+            for dependency in node.depends_on:
+                if dependency not in self.nodes:
+                    raise DAGSchedulerError(f"{node.name} depends on unknown node {dependency}")
+
+        # Kahn's algorithm - any node left unvisited is part of a cycle
+        remaining = {name: len(node.depends_on) for name, node in self.nodes.items()}
+        ready = [name for name, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for name, node in self.nodes.items():
+                if current in node.depends_on:
+                    remaining[name] -= 1
+                    if remaining[name] == 0:
+                        ready.append(name)
+
+        if visited != len(self.nodes):
+            cyclic = sorted(name for name, count in remaining.items() if count > 0)
+            raise DAGSchedulerError(f"Dependency cycle detected between: {', '.join(cyclic)}")
+
+    def critical_path_length(self, weights: Dict[str, float]) -> float:
+        """Longest weighted dependency chain, i.e. the best-case wall time."""
+        memo: Dict[str, float] = {}
+
+        def longest(name: str) -> float:
+            if name not in memo:
+                upstream = [longest(dep) for dep in self.nodes[name].depends_on]
+                memo[name] = weights.get(name, 0.0) + max(upstream, default=0.0)
+            return memo[name]
+
+        return max((longest(name) for name in self.nodes), default=0.0)
+
+    async def run(self) -> Dict[str, Optional[BaseException]]:
+        """
+        Execute the graph.
+
+        Returns:
+            Dict mapping node name to the exception it raised, or None on success
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        outcomes: Dict[str, Optional[BaseException]] = {}
+        pending_deps = {name: set(node.depends_on) for name, node in self.nodes.items()}
+        running: Dict[asyncio.Task, str] = {}
+
+        async def run_node(node: DAGNode) -> None:
+            async with semaphore:
+                await node.func()
+
+        def start_ready_nodes() -> None:
+            for name in list(pending_deps):
+                if not pending_deps[name]:
+                    del pending_deps[name]
+                    logger.debug(f"DAG node ready: {name}")
+                    task = asyncio.create_task(run_node(self.nodes[name]), name=f"dag:{name}")
+                    running[task] = name
+
+        start_ready_nodes()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    exc = task.exception()
+                    outcomes[name] = exc
+                    if exc is not None:
+                        logger.error(f"DAG node {name} raised: {exc}")
+                    for deps in pending_deps.values():
+                        deps.discard(name)
+                start_ready_nodes()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+
+        return outcomes
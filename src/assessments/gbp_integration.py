@@ -3,7 +3,6 @@ PRP-005: Google Business Profile Integration
 Google Places API v1 integration with fuzzy matching and comprehensive data extraction
 """
 
-import asyncio
 import time
 import logging
 from datetime import datetime, timezone, timedelta
@@ -16,6 +15,12 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.provider_limits import PLACES
+from src.core.budget import BudgetExceededError, budget_reservation, charges_lead
+from src.core.circuit_breaker import CircuitOpenError, circuit_guard
+from src.core.rate_limiter import acquire_rate_limit
+from src.core.http_clients import get_http_client
+from src.core.bulk import BulkWriter
 from src.core.database import AsyncSessionLocal
 from src.models.assessment_cost import AssessmentCost
 from src.models.gbp import GBPAnalysis, GBPBusinessHours, GBPReviews, GBPPhotos
@@ -178,25 +183,19 @@ class GBPClient:
     
     BASE_URL = "https://places.googleapis.com/v1"
     COST_PER_SEARCH = 1.7  # $0.017 in cents
-    MAX_QPS = 10  # Google Places API limit
     
     def __init__(self):
         self.api_key = settings.GOOGLE_PLACES_API_KEY
-        self.client = httpx.AsyncClient(timeout=30.0)
         self.matcher = BusinessMatcher()
-        self.last_request_time = 0.0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client for the running event loop."""
+        return get_http_client("places")
         
     async def _rate_limit(self):
-        """Enforce rate limiting to stay within 10 QPS."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        min_interval = 1.0 / self.MAX_QPS  # 0.1 seconds between requests
-        
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            await asyncio.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Enforce the Places QPS limit shared by every process."""
+        await acquire_rate_limit(PLACES)
     
     async def search_business(self, business_name: str, address: Optional[str] = None, city: Optional[str] = None, state: Optional[str] = None) -> List[Dict]:
         """Search for business using Google Places API Text Search."""
@@ -238,12 +237,14 @@ class GBPClient:
         }
         
         try:
-            response = await self.client.post(
-                f"{self.BASE_URL}/places:searchText",
-                json=payload,
-                headers=headers
-            )
-            
+            async with budget_reservation(PLACES, self.COST_PER_SEARCH), circuit_guard(PLACES) as call:
+                response = await self.client.post(
+                    f"{self.BASE_URL}/places:searchText",
+                    json=payload,
+                    headers=headers
+                )
+                call.check(response.status_code)
+
             if response.status_code == 200:
                 data = response.json()
                 return data.get("places", [])
@@ -461,6 +462,9 @@ async def save_gbp_analysis_to_db(
         db.add(gbp_analysis)
         await db.flush()  # Get the ID before adding related records
         
+        # Child rows are written in bulk, one INSERT batch per table
+        rows = BulkWriter(db)
+        
         # Add business hours
         for day, hours in gbp_data.hours.regular_hours.items():
             if hours:
@@ -469,7 +473,8 @@ async def save_gbp_analysis_to_db(
                 open_time = parts[0].strip() if len(parts) > 0 else None
                 close_time = parts[1].strip() if len(parts) > 1 else None
                 
-                business_hours = GBPBusinessHours(
+                rows.add(
+                    GBPBusinessHours,
                     gbp_analysis_id=gbp_analysis.id,
                     day_of_week=day,
                     open_time=open_time,
@@ -477,19 +482,18 @@ async def save_gbp_analysis_to_db(
                     is_closed=False,
                     hours_text=hours
                 )
-                db.add(business_hours)
         
         # Add closed days (days not in regular_hours)
         all_days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
         for day in all_days:
             if day not in gbp_data.hours.regular_hours:
-                business_hours = GBPBusinessHours(
+                rows.add(
+                    GBPBusinessHours,
                     gbp_analysis_id=gbp_analysis.id,
                     day_of_week=day,
                     is_closed=True,
                     hours_text="Closed"
                 )
-                db.add(business_hours)
         
         # Add review distribution
         if gbp_data.reviews.rating_distribution:
@@ -498,13 +502,13 @@ async def save_gbp_analysis_to_db(
                 rating = int(rating_str)
                 percentage = (count / total_reviews * 100) if total_reviews > 0 else 0
                 
-                review = GBPReviews(
+                rows.add(
+                    GBPReviews,
                     gbp_analysis_id=gbp_analysis.id,
                     rating=rating,
                     review_count=count,
                     percentage=percentage
                 )
-                db.add(review)
         
         # Add photo categories
         if gbp_data.photos.photo_categories:
@@ -512,14 +516,15 @@ async def save_gbp_analysis_to_db(
             for category, count in gbp_data.photos.photo_categories.items():
                 percentage = (count / total_photos * 100) if total_photos > 0 else 0
                 
-                photo = GBPPhotos(
+                rows.add(
+                    GBPPhotos,
                     gbp_analysis_id=gbp_analysis.id,
                     category=category,
                     photo_count=count,
                     percentage=percentage
                 )
-                db.add(photo)
         
+        await rows.flush()
         await db.commit()
         return gbp_analysis
         
@@ -529,6 +534,7 @@ async def save_gbp_analysis_to_db(
         raise
 
 
+@charges_lead
 async def assess_google_business_profile(
     business_name: str, 
     address: Optional[str], 
@@ -571,9 +577,20 @@ async def assess_google_business_profile(
         # Initialize GBP client
         gbp_client = GBPClient()
         
-        # Search for business
+        # Search for business, reusing recent results for the same query
+        from src.assessments.result_cache import component_cache, canonical_text, record_cache_hit_cost
         logger.info(f"Searching Google Business Profile for: {business_name}")
-        search_results = await gbp_client.search_business(business_name, address, city, state)
+        search_results, provenance = await component_cache.get_or_compute(
+            "gbp",
+            canonical_text(business_name, address, city, state),
+            lambda: gbp_client.search_business(business_name, address, city, state),
+            serialize=lambda places: places,
+            deserialize=lambda places: places,
+            cost_of=lambda _: GBPClient.COST_PER_SEARCH
+        )
+        if provenance.cache_hit:
+            cost_record.cost_cents = 0.0
+            await record_cache_hit_cost(lead_id, "google_business_profile", provenance, assessment_id)
         
         if not search_results:
             # No results found
@@ -593,6 +610,7 @@ async def assess_google_business_profile(
                 "search_results_count": 0,
                 "match_found": False,
                 "cost_records": [],  # Exclude SQLAlchemy objects to avoid serialization issues
+                "cache_provenance": provenance.dict(),
                 "analysis_timestamp": datetime.now(timezone.utc).isoformat(),
                 "analysis_duration_ms": int((time.time() - start_time) * 1000)
             }
@@ -634,6 +652,7 @@ async def assess_google_business_profile(
                 "match_found": False,
                 "match_confidence": confidence,
                 "cost_records": [],  # Exclude SQLAlchemy objects to avoid serialization issues
+                "cache_provenance": provenance.dict(),
                 "analysis_timestamp": datetime.now(timezone.utc).isoformat(),
                 "analysis_duration_ms": int((time.time() - start_time) * 1000)
             }
@@ -669,6 +688,7 @@ async def assess_google_business_profile(
             "match_found": True,
             "match_confidence": confidence,
             "cost_records": [],  # Exclude SQLAlchemy objects to avoid serialization issues
+            "cache_provenance": provenance.dict(),
             "analysis_timestamp": datetime.now(timezone.utc).isoformat(),
             "analysis_duration_ms": int((end_time - start_time) * 1000)
         }
@@ -686,6 +706,10 @@ async def assess_google_business_profile(
         
         return result
         
+    except (CircuitOpenError, BudgetExceededError):
+        # Orchestrators skip the component instead of failing and retrying it
+        raise
+    
     except GBPIntegrationError as e:
         # Update cost record with error
         end_time = time.time()
@@ -0,0 +1,217 @@
+"""
+PRP-006: Image Processing Service
+Decode, resize, transcode and hash jobs run in the process pool with a bounded queue and per-job timing
+"""
+
+import asyncio
+import base64
+import io
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+from PIL import Image
+from prometheus_client import Counter, Histogram
+
+from src.assessments.screenshot_hashing import ImageHashes
+from src.core.config import settings
+from src.core.http_clients import get_http_client
+from src.core.process_pool import pool_size, run_in_process
+from src.core.storage.blob_store import LocalBlobStore, get_blob_store, is_blob_ref
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Jobs take encoded image bytes or the path of a local file, which workers
+# read themselves instead of receiving a copy over the pool's pipe
+ImageSource = Union[bytes, str]
+
+IMAGE_JOB_SECONDS = Histogram(
+    "leadfactory_image_job_seconds",
+    "Image job time by phase: waiting for a worker, transfer to and from it, and compute",
+    ["job", "phase"],
+)
+IMAGE_JOBS = Counter(
+    "leadfactory_image_jobs_total",
+    "Image jobs by outcome (ok, error, rejected)",
+    ["job", "outcome"],
+)
+
+
+class ImageServiceError(Exception):
+    """Raised when an image job fails"""
+    pass
+
+
+class ImageServiceBusyError(ImageServiceError):
+    """Raised when the job queue is full"""
+    pass
+
+
+@dataclass
+class ImageInfo:
+    width: int
+    height: int
+    format: str
+
+
+@dataclass
+class VisionImage:
+    """Screenshot prepared for a vision API request"""
+    base64: str
+    size_bytes: int
+    hashes: ImageHashes
+
+
+async def load_image_source(ref: str) -> ImageSource:
+    """Job input for a blob reference, data: URL or http(s) URL"""
+    if is_blob_ref(ref):
+        store = get_blob_store()
+        if isinstance(store, LocalBlobStore):
+            return str(store.path_of(ref))
+        return await store.read_bytes(ref)
+    if ref.startswith("data:"):
+        # Captures cached before screenshots moved to the blob store
+        return base64.b64decode(ref.split(",", 1)[1])
+    response = await get_http_client("site").get(ref)
+    response.raise_for_status()
+    return response.content
+
+
+# Jobs: module-level so they can be pickled to worker processes
+
+def _read(source: ImageSource) -> bytes:
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return f.read()
+    return source
+
+
+def _open(source: ImageSource) -> Image.Image:
+    return Image.open(source if isinstance(source, str) else io.BytesIO(source))
+
+
+def probe_image(source: ImageSource) -> ImageInfo:
+    """Dimensions and format, decoding the header only"""
+    with _open(source) as image:
+        return ImageInfo(image.width, image.height, (image.format or "").lower())
+
+
+def hash_image(source: ImageSource) -> ImageHashes:
+    with _open(source) as image:
+        return ImageHashes.of(image)
+
+
+def transcode_image(source: ImageSource, format: str = "JPEG", quality: int = 85,
+                    max_side: Optional[int] = None) -> bytes:
+    """Re-encode, downscaling first so neither side exceeds max_side"""
+    with _open(source) as image:
+        if max_side and max(image.size) > max_side:
+            image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        if format.upper() == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, format=format, quality=quality)
+        return buffer.getvalue()
+
+
+def prepare_for_vision(source: ImageSource, max_side: int = 2048, quality: int = 85) -> VisionImage:
+    """
+    Fingerprint and base64-encode a screenshot in one decode, re-encoding as
+    JPEG only when it is larger than max_side.
+    """
+    with _open(source) as image:
+        hashes = ImageHashes.of(image)
+        if max(image.size) > max_side:
+            image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, format="JPEG", quality=quality)
+            raw = buffer.getvalue()
+        else:
+            raw = _read(source)
+    return VisionImage(base64.b64encode(raw).decode("ascii"), len(raw), hashes)
+
+
+def _timed(func: Callable[..., T], *args: Any, **kwargs: Any) -> Tuple[T, float]:
+    """Runs in the worker: the result and the compute time alone"""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+class ImageService:
+    """
+    Front door to the process pool for image work.
+
+    At most one job per worker is handed to the pool; up to max_queue more
+    wait here, and beyond that jobs are rejected with ImageServiceBusyError
+    rather than piling up decoded images in memory.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: Optional[int] = None):
+        self.workers = workers or pool_size()
+        self.max_queue = settings.IMAGE_SERVICE_MAX_QUEUE if max_queue is None else max_queue
+        self._slots = asyncio.Semaphore(self.workers)
+        self._pending = 0
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def queued(self) -> int:
+        return max(0, self._pending - self.workers)
+
+    def _record(self, job: str, outcome: str, timings: Dict[str, float]) -> None:
+        IMAGE_JOBS.labels(job, outcome).inc()
+        for phase, seconds in timings.items():
+            IMAGE_JOB_SECONDS.labels(job, phase).observe(seconds)
+
+        stats = self._stats.setdefault(job, {"ok": 0, "error": 0, "rejected": 0, "queued_ms": 0.0, "compute_ms": 0.0, "max_ms": 0.0})
+        stats[outcome] += 1
+        stats["queued_ms"] += timings.get("queued", 0.0) * 1000
+        stats["compute_ms"] += timings.get("compute", 0.0) * 1000
+        stats["max_ms"] = max(stats["max_ms"], sum(timings.values()) * 1000)
+
+    async def run(self, job: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run func(*args, **kwargs) on a worker, recording timing under job"""
+        if self._pending >= self.workers + self.max_queue:
+            self._record(job, "rejected", {})
+            raise ImageServiceBusyError(f"Image queue full ({self.queued} jobs waiting)")
+
+        self._pending += 1
+        timings: Dict[str, float] = {}
+        submitted = time.perf_counter()
+        try:
+            async with self._slots:
+                started = time.perf_counter()
+                timings["queued"] = started - submitted
+                result, timings["compute"] = await run_in_process(_timed, func, *args, **kwargs)
+                timings["transfer"] = max(0.0, time.perf_counter() - started - timings["compute"])
+        except Exception as e:
+            self._record(job, "error", timings)
+            raise ImageServiceError(f"Image job {job} failed: {e}") from e
+        finally:
+            self._pending -= 1
+
+        self._record(job, "ok", timings)
+        logger.debug(
+            f"Image job {job}: queued {timings['queued'] * 1000:.0f}ms, "
+            f"transfer {timings['transfer'] * 1000:.0f}ms, compute {timings['compute'] * 1000:.0f}ms"
+        )
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-job counts and timing totals, plus current load"""
+        return {"workers": self.workers, "pending": self._pending, "queued": self.queued, "jobs": self._stats}
+
+
+_services: Dict[int, Tuple[asyncio.AbstractEventLoop, ImageService]] = {}
+
+
+def get_image_service() -> ImageService:
+    """Image service for the running event loop (its queue is loop-bound)"""
+    loop = asyncio.get_running_loop()
+    entry = _services.get(id(loop))
+    if entry is None or entry[0] is not loop:
+        entry = _services[id(loop)] = (loop, ImageService())
+    return entry[1]
@@ -0,0 +1,193 @@
+"""
+PRP-004: Broken Link Checker
+Bounded async check of a site's internal links for the broken-link metric
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+from lxml import etree, html as lxml_html
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Servers that refuse HEAD outright; retry these with a one-byte ranged GET
+HEAD_UNSUPPORTED = {403, 405, 501}
+
+
+class LinkCheckResult(BaseModel):
+    """Internal link check results"""
+    links_found: int = 0
+    checked: int = 0
+    broken_count: int = 0
+    broken: List[Dict[str, Any]] = []
+    skipped_robots: int = 0
+    unchecked: int = 0
+    duration_ms: int = 0
+
+
+def _site_host(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _normalize(url: str) -> Optional[str]:
+    try:
+        parsed = urlparse(urldefrag(url.strip())[0])
+    except ValueError:
+        # Malformed URL such as an unclosed IPv6 bracket
+        return None
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return parsed._replace(path=parsed.path or "/").geturl()
+
+
+def extract_internal_links(page_url: str, html: str) -> List[str]:
+    """
+    Same-site <a href> targets of a page, absolute, without fragments, in
+    document order and deduplicated.
+    """
+    try:
+        document = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return []
+
+    base = document.xpath("string(//base/@href)").strip() or page_url
+    site = _site_host(page_url)
+    links, seen = [], set()
+    for href in document.xpath("//a/@href"):
+        try:
+            url = _normalize(urljoin(base, href))
+        except ValueError:
+            continue
+        if url and url not in seen and _site_host(url) == site:
+            seen.add(url)
+            links.append(url)
+    return links
+
+
+def _robots_parser(rules: Optional[List[str]]) -> Optional[RobotFileParser]:
+    if not rules:
+        return None
+    parser = RobotFileParser()
+    parser.parse(["User-agent: *", *rules])
+    return parser
+
+
+async def _check_url(client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore) -> Union[int, str, None]:
+    """
+    HEAD the URL, falling back to a ranged GET for servers that reject HEAD.
+
+    Returns:
+        Final status code, an error name for unreachable links, or None if
+        the request timed out (inconclusive)
+    """
+    timeout = settings.LINK_CHECK_REQUEST_TIMEOUT_SECONDS
+    async with semaphore:
+        try:
+            response = await client.head(url, timeout=timeout)
+            if response.status_code not in HEAD_UNSUPPORTED:
+                return response.status_code
+            async with client.stream("GET", url, headers={"Range": "bytes=0-0"}, timeout=timeout) as response:
+                return response.status_code
+        except httpx.TimeoutException:
+            return None
+        except httpx.HTTPError as e:
+            return type(e).__name__
+
+
+def _is_broken(status: Union[int, str]) -> bool:
+    # 429 means we were throttled, not that the page is gone
+    return isinstance(status, str) or (status >= 400 and status != 429)
+
+
+async def check_internal_links(
+    page_url: str,
+    html: str,
+    sitemap_urls: Iterable[str] = (),
+    robots_rules: Optional[List[str]] = None,
+    time_budget: Optional[float] = None
+) -> LinkCheckResult:
+    """
+    Check the internal links of a fetched landing page.
+
+    Links come from the page's anchors plus an optional sitemap sample,
+    deduplicated and filtered by robots.txt. At most LINK_CHECK_MAX_URLS
+    are checked, LINK_CHECK_PER_HOST_CONCURRENCY at a time per host, and
+    whatever has not finished when the time budget runs out is cancelled and
+    counted as unchecked rather than broken.
+
+    Args:
+        page_url: Final URL of the landing page
+        html: Landing page HTML
+        sitemap_urls: Page URLs sampled from the sitemap
+        robots_rules: Allow/Disallow lines for all user agents
+        time_budget: Seconds allowed, capped at LINK_CHECK_TIME_BUDGET_SECONDS
+    """
+    started = time.monotonic()
+    result = LinkCheckResult()
+
+    site = _site_host(page_url)
+    landing = _normalize(page_url)
+    candidates = list(dict.fromkeys(
+        url for url in [
+            *extract_internal_links(page_url, html),
+            *(_normalize(u) for u in sitemap_urls)
+        ]
+        if url and url != landing and _site_host(url) == site
+    ))
+    result.links_found = len(candidates)
+
+    robots = _robots_parser(robots_rules)
+    allowed = [url for url in candidates if robots is None or robots.can_fetch("*", url)]
+    result.skipped_robots = len(candidates) - len(allowed)
+    to_check = allowed[:settings.LINK_CHECK_MAX_URLS]
+    result.unchecked = len(allowed) - len(to_check)
+
+    if to_check:
+        client = get_http_client("site")
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        tasks = {}
+        for url in to_check:
+            semaphore = host_limits.setdefault(
+                urlparse(url).netloc, asyncio.Semaphore(settings.LINK_CHECK_PER_HOST_CONCURRENCY)
+            )
+            tasks[asyncio.create_task(_check_url(client, url, semaphore))] = url
+
+        budget = settings.LINK_CHECK_TIME_BUDGET_SECONDS
+        if time_budget is not None:
+            budget = min(budget, time_budget)
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=budget)
+        finally:
+            # Also stops the requests when the caller is cancelled or times out
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        result.unchecked += len(pending)
+
+        for task in done:
+            status = task.result()
+            if status is None:
+                result.unchecked += 1
+                continue
+            result.checked += 1
+            if _is_broken(status):
+                result.broken.append({'url': tasks[task], 'status': status})
+
+    result.broken_count = len(result.broken)
+    result.broken = sorted(result.broken, key=lambda link: link['url'])[:20]
+    result.duration_ms = int((time.monotonic() - started) * 1000)
+    logger.info(
+        f"Link check for {page_url}: {result.checked} checked, {result.broken_count} broken, "
+        f"{result.unchecked} unchecked in {result.duration_ms}ms"
+    )
+    return result
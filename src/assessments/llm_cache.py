@@ -0,0 +1,190 @@
+"""
+PRP-011: LLM Response Cache
+Content-addressed reuse of OpenAI vision and content-generation results, in Redis with an optional on-disk tier
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
+from src.assessments.result_cache import CacheProvenance, component_cache
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def llm_cache_key(
+    model: str,
+    prompt_version: str,
+    temperature: float,
+    messages: Sequence[str],
+    images: Sequence[str] = (),
+    **params: Any
+) -> str:
+    """
+    Hash of everything that determines a response.
+
+    The rendered prompt text is part of the key, so editing a prompt template
+    (or any input it renders) misses the cache on its own; prompt_version is
+    bumped for changes the text doesn't show, such as response parsing.
+    Images (base64) contribute their SHA-256.
+    """
+    digest = hashlib.sha256()
+    header = json.dumps({"model": model, "prompt_version": prompt_version,
+                         "temperature": float(temperature), **params}, sort_keys=True)
+    for part in (header, *messages):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    for image in images:
+        digest.update(hashlib.sha256(image.encode("ascii")).digest())
+    return digest.hexdigest()
+
+
+class DiskCacheTier:
+    """
+    Second tier of JSON files, so responses survive Redis eviction and
+    flushes. Entries expire by file age with the Redis TTL; expired files are
+    deleted when read, and by a sweep of the namespace run on write at most
+    once per LLM_CACHE_DISK_SWEEP_INTERVAL_SECONDS.
+    """
+
+    # Shared across instances: one is created per call
+    _last_sweep: Dict[Path, float] = {}
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def _path(self, namespace: str, key: str) -> Path:
+        return self.root / namespace / key[:2] / f"{key}.json"
+
+    @staticmethod
+    def _read(path: Path, ttl: int) -> Optional[Any]:
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: Path, value: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _sweep(directory: Path, ttl: int) -> int:
+        cutoff = time.time() - ttl
+        removed = 0
+        for path in directory.glob("*/*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    async def get(self, namespace: str, key: str, ttl: int) -> Optional[Any]:
+        return await asyncio.to_thread(self._read, self._path(namespace, key), ttl)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            await asyncio.to_thread(self._write, self._path(namespace, key), value)
+        except OSError as e:
+            logger.warning(f"Failed to write {namespace} response to disk cache: {e}")
+        if ttl is not None:
+            await self.sweep(namespace, ttl)
+
+    async def sweep(self, namespace: str, ttl: int, force: bool = False) -> int:
+        """Delete expired files in a namespace, unless swept recently"""
+        directory = self.root / namespace
+        now = time.monotonic()
+        last = self._last_sweep.get(directory)
+        if not force and last is not None and now - last < settings.LLM_CACHE_DISK_SWEEP_INTERVAL_SECONDS:
+            return 0
+        self._last_sweep[directory] = now
+        removed = await asyncio.to_thread(self._sweep, directory, ttl)
+        if removed:
+            logger.info(f"Swept {removed} expired {namespace} responses from disk cache")
+        return removed
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await asyncio.to_thread(self._path(namespace, key).unlink, missing_ok=True)
+
+
+def _disk_tier() -> Optional[DiskCacheTier]:
+    return DiskCacheTier(settings.LLM_CACHE_DISK_DIR) if settings.LLM_CACHE_DISK_DIR else None
+
+
+async def cached_llm_call(
+    component: str,
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    serialize: Callable[[T], Any],
+    deserialize: Callable[[Any], T],
+    cost_of: Callable[[T], float] = lambda _: 0.0,
+    cacheable: Callable[[T], bool] = lambda _: True,
+) -> Tuple[T, Optional[CacheProvenance]]:
+    """
+    Serve an LLM result from Redis, then disk, then the live call.
+
+    Built on the component cache, so concurrent identical calls are coalesced
+    and Redis outages fall through. Provenance is None when LLM_CACHE_ENABLED
+    is off; disk hits are reported as cache hits. Payloads failing cacheable
+    (empty or defaulted responses) are returned but stored in neither tier.
+    """
+    if not settings.LLM_CACHE_ENABLED:
+        return await compute(), None
+
+    disk = _disk_tier()
+    disk_hit = False
+
+    async def compute_via_disk() -> T:
+        nonlocal disk_hit
+        if disk is not None:
+            stored = await disk.get(component, key, component_cache.ttl_for(component))
+            if stored is not None:
+                try:
+                    payload = deserialize(stored)
+                    disk_hit = True
+                    logger.info(f"Disk cache hit for {component} {key[:12]}")
+                    return payload
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable {component} disk cache entry: {e}")
+
+        payload = await compute()
+        if disk is not None and cacheable(payload):
+            await disk.set(component, key, serialize(payload), ttl=component_cache.ttl_for(component))
+        return payload
+
+    payload, provenance = await component_cache.get_or_compute(
+        component, key, compute_via_disk, serialize, deserialize,
+        cost_of=cost_of, cacheable=cacheable
+    )
+    if disk_hit:
+        provenance.cache_hit = True
+    return payload, provenance
+
+
+async def invalidate_llm_response(component: str, key: str) -> None:
+    """Drop one cached response from both tiers"""
+    await component_cache.invalidate(component, key)
+    disk = _disk_tier()
+    if disk is not None:
+        await disk.delete(component, key)
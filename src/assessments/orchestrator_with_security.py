@@ -65,9 +65,8 @@ async def run_assessments(url: str, business_name: str = "", assessment_id: Opti
             domain = domain.replace('www.', '')
         
         # PageSpeed assessment
-        from src.assessments.pagespeed import get_pagespeed_client
-        client = get_pagespeed_client()
-        pagespeed_task = asyncio.create_task(client.analyze_mobile_first(url))
+        from src.assessments.pagespeed import analyze_mobile_first_cached, trim_lighthouse_result
+        pagespeed_task = asyncio.create_task(analyze_mobile_first_cached(url))
         phase1_tasks.append(("pagespeed", pagespeed_task))
         
         # Security assessment
@@ -89,7 +88,7 @@ async def run_assessments(url: str, business_name: str = "", assessment_id: Opti
             phase1_tasks.append(("gbp", gbp_task))
         
         # Screenshot capture assessment
-        from src.assessments.screenshot_capture import capture_website_screenshots
+        from src.assessments.screenshot_capture import capture_website_screenshots, screenshot_ref
         screenshot_task = asyncio.create_task(capture_website_screenshots(url, lead_id))
         phase1_tasks.append(("screenshot", screenshot_task))
         
@@ -104,6 +103,9 @@ async def run_assessments(url: str, business_name: str = "", assessment_id: Opti
         for assessment_name, task in phase1_tasks:
             try:
                 result = await task
+                if assessment_name == "pagespeed":
+                    result, provenance = result
+                    results["cache_provenance"] = {"pagespeed": provenance.dict()}
                 results["assessments"][assessment_name] = {
                     "status": "success",
                     "data": result
@@ -127,13 +129,11 @@ async def run_assessments(url: str, business_name: str = "", assessment_id: Opti
             mobile_url = None
             
             if screenshot_results.desktop_screenshot:
-                desktop_url = (screenshot_results.desktop_screenshot.s3_url or 
-                              screenshot_results.desktop_screenshot.signed_url or
+                desktop_url = (screenshot_ref(screenshot_results.desktop_screenshot) or
                               f"https://screenshotone.com/image/{url}/desktop.webp")  # Fallback URL
             
             if screenshot_results.mobile_screenshot:
-                mobile_url = (screenshot_results.mobile_screenshot.s3_url or 
-                             screenshot_results.mobile_screenshot.signed_url or
+                mobile_url = (screenshot_ref(screenshot_results.mobile_screenshot) or
                              f"https://screenshotone.com/image/{url}/mobile.webp")  # Fallback URL
             
             if desktop_url and mobile_url:
@@ -173,14 +173,14 @@ async def run_assessments(url: str, business_name: str = "", assessment_id: Opti
             results["pagespeed_data"] = {
                 "mobile_analysis": {
                     "core_web_vitals": mobile_result.core_web_vitals.dict() if mobile_result else {},
-                    "lighthouse_result": mobile_result.lighthouse_result if mobile_result else {},
+                    "lighthouse_result": trim_lighthouse_result(mobile_result.lighthouse_result) if mobile_result else {},
                     "url": mobile_result.url if mobile_result else url,
                     "strategy": mobile_result.strategy if mobile_result else "mobile",
                     "analysis_timestamp": mobile_result.analysis_timestamp if mobile_result else datetime.now().isoformat()
                 } if mobile_result else {},
                 "desktop_analysis": {
                     "core_web_vitals": desktop_result.core_web_vitals.dict() if desktop_result else {},
-                    "lighthouse_result": desktop_result.lighthouse_result if desktop_result else {},
+                    "lighthouse_result": trim_lighthouse_result(desktop_result.lighthouse_result) if desktop_result else {},
                     "url": desktop_result.url if desktop_result else url,
                     "strategy": desktop_result.strategy if desktop_result else "desktop",
                     "analysis_timestamp": desktop_result.analysis_timestamp if desktop_result else datetime.now().isoformat()
@@ -220,8 +220,7 @@ async def run_assessments(url: str, business_name: str = "", assessment_id: Opti
                 "success": screenshot_data.get("success", False),
                 "desktop": {
                     "captured": screenshot_data.get("desktop_screenshot") is not None,
-                    "url": (screenshot_data.get("desktop_screenshot", {}).get("s3_url") or 
-                           screenshot_data.get("desktop_screenshot", {}).get("signed_url") or
+                    "url": (screenshot_ref(screenshot_data.get("desktop_screenshot")) or
                            f"https://screenshotone.com/image/{url}/desktop.webp" if screenshot_data.get("desktop_screenshot") else None),
                     "width": screenshot_data.get("desktop_screenshot", {}).get("width"),
                     "height": screenshot_data.get("desktop_screenshot", {}).get("height"),
@@ -230,8 +229,7 @@ async def run_assessments(url: str, business_name: str = "", assessment_id: Opti
                 } if screenshot_data.get("desktop_screenshot") else {"captured": False},
                 "mobile": {
                     "captured": screenshot_data.get("mobile_screenshot") is not None,
-                    "url": (screenshot_data.get("mobile_screenshot", {}).get("s3_url") or 
-                           screenshot_data.get("mobile_screenshot", {}).get("signed_url") or
+                    "url": (screenshot_ref(screenshot_data.get("mobile_screenshot")) or
                            f"https://screenshotone.com/image/{url}/mobile.webp" if screenshot_data.get("mobile_screenshot") else None),
                     "width": screenshot_data.get("mobile_screenshot", {}).get("width"),
                     "height": screenshot_data.get("mobile_screenshot", {}).get("height"),
@@ -3,13 +3,22 @@ PRP-003: PageSpeed Integration
 Google PageSpeed Insights API v5 integration for Core Web Vitals capture
 """
 
+import asyncio
 import httpx
 import logging
+import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 from src.core.config import settings
+from src.core.provider_limits import PAGESPEED
+from src.core.budget import BudgetExceededError, budget, budget_reservation, charges_lead
+from src.core.circuit_breaker import CircuitOpenError, circuit_guard
+from src.core.rate_limiter import acquire_rate_limit
+from src.core.http_clients import get_http_client
+from src.core.bulk import BulkWriter
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +44,13 @@ class PageSpeedResult(BaseModel):
     analysis_timestamp: str
     analysis_duration_ms: int
     cost_cents: float = Field(default=0.25, description="API call cost in cents")
+    hedged_requests: int = Field(default=0, description="Duplicate requests sent to cut tail latency")
+    
+    def compact_dict(self) -> Dict[str, Any]:
+        """dict() with the Lighthouse result trimmed for hot JSON columns"""
+        data = self.dict(exclude={"lighthouse_result"})
+        data["lighthouse_result"] = trim_lighthouse_result(self.lighthouse_result)
+        return data
 
 
 class PageSpeedError(Exception):
@@ -42,6 +58,70 @@ class PageSpeedError(Exception):
     pass
 
 
+# Audits whose details are base64 images already kept in pagespeed_screenshots
+SCREENSHOT_AUDITS = ("full-page-screenshot", "screenshot-thumbnails", "final-screenshot")
+
+_AUDIT_SUMMARY_FIELDS = ("score", "numericValue", "numericUnit", "displayValue")
+
+
+def trim_lighthouse_result(lighthouse: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summary of a Lighthouse result for hot JSON columns: version, URLs,
+    category scores and per-audit values, without audit details,
+    screenshots or i18n strings. The complete result is stored compressed
+    on PageSpeedAnalysis. Trimming an already trimmed result is a no-op.
+    """
+    if not lighthouse:
+        return {}
+    
+    summary = {
+        key: lighthouse[key]
+        for key in ("lighthouseVersion", "requestedUrl", "finalUrl", "fetchTime")
+        if key in lighthouse
+    }
+    summary["categories"] = {
+        category_id: {"score": category.get("score")}
+        for category_id, category in lighthouse.get("categories", {}).items()
+    }
+    summary["audits"] = {
+        audit_id: {field: audit[field] for field in _AUDIT_SUMMARY_FIELDS if field in audit}
+        for audit_id, audit in lighthouse.get("audits", {}).items()
+    }
+    return summary
+
+
+class LatencyTracker:
+    """
+    Rolling window of successful PageSpeed request latencies per strategy.
+    The hedge delay follows the configured quantile of recent calls.
+    """
+    
+    MIN_SAMPLES = 20
+    
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+    
+    def record(self, strategy: str, seconds: float) -> None:
+        self._samples.setdefault(strategy, deque(maxlen=self.window)).append(seconds)
+    
+    def quantile(self, strategy: str, q: float) -> Optional[float]:
+        samples = sorted(self._samples.get(strategy, ()))
+        if len(samples) < self.MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+    
+    def hedge_delay(self, strategy: str) -> float:
+        observed = self.quantile(strategy, settings.PAGESPEED_HEDGE_QUANTILE)
+        if observed is None:
+            return settings.PAGESPEED_HEDGE_DEFAULT_DELAY_SECONDS
+        return max(settings.PAGESPEED_HEDGE_MIN_DELAY_SECONDS, observed)
+
+
+# Process-wide latency history shared by all PageSpeed clients
+latency_tracker = LatencyTracker()
+
+
 class PageSpeedClient:
     """
     Google PageSpeed Insights API v5 client with rate limiting and cost tracking
@@ -51,7 +131,6 @@ class PageSpeedClient:
     BASE_URL = "https://pagespeedonline.googleapis.com/pagespeedonline/v5/runPagespeed"
     COST_PER_CALL = 0.25  # $0.0025 in cents
     FREE_QUOTA_DAILY = 25000
-    RATE_LIMIT_PER_SECOND = 50
     
     def __init__(self, api_key: Optional[str] = None):
         """Initialize PageSpeed client with API key and rate limiting"""
@@ -59,13 +138,12 @@ class PageSpeedClient:
         if not self.api_key:
             raise PageSpeedError("Google PageSpeed API key not configured")
         
-        # HTTP client with timeout configuration
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(60.0),  # Increased to 60-second timeout for complex sites
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
-        )
-        
         logger.info("PageSpeed client initialized", api_key_configured=bool(self.api_key))
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client for the running event loop."""
+        return get_http_client("pagespeed")
     
     async def analyze_url(
         self, 
@@ -110,8 +188,8 @@ class PageSpeedClient:
                 "params": {k: v for k, v in params.items() if k != 'key'}  # Don't log API key
             })
             
-            # Make API request with timeout
-            response = await self.client.get(self.BASE_URL, params=params)
+            # Make API request with timeout, hedged against slow responses
+            response, hedged_requests = await self._send_hedged(params, strategy)
             
             logger.info(f"PageSpeed API response received", extra={
                 "status_code": response.status_code,
@@ -143,7 +221,8 @@ class PageSpeedClient:
                 loading_experience=api_data.get("loadingExperience"),
                 analysis_timestamp=start_time.isoformat(),
                 analysis_duration_ms=duration_ms,
-                cost_cents=self.COST_PER_CALL
+                cost_cents=self.COST_PER_CALL * (1 + hedged_requests),
+                hedged_requests=hedged_requests
             )
             
             logger.info(
@@ -152,7 +231,8 @@ class PageSpeedClient:
                 strategy=strategy,
                 performance_score=core_web_vitals.performance_score,
                 duration_ms=duration_ms,
-                cost_cents=self.COST_PER_CALL
+                cost_cents=result.cost_cents,
+                hedged_requests=hedged_requests
             )
             
             return result
@@ -166,10 +246,78 @@ class PageSpeedClient:
             logger.error(f"PageSpeed API request failed", url=url, error=str(exc))
             raise PageSpeedError(f"Network error during API request: {exc}")
             
+        except (CircuitOpenError, BudgetExceededError):
+            # Orchestrators skip the component instead of retrying it
+            raise
+            
         except Exception as exc:
             logger.error(f"PageSpeed analysis failed", url=url, error=str(exc))
             raise PageSpeedError(f"Unexpected error during PageSpeed analysis: {exc}")
     
+    async def _send(self, params: Dict[str, Any], strategy: str, sent: Optional[asyncio.Event] = None,
+                    hedge: bool = False) -> httpx.Response:
+        """
+        Single API request within the shared rate, budget and breaker.
+        
+        Sets sent once the request goes out. A cancelled original request
+        records its elapsed time as a lower bound on latency, so requests
+        that hedges beat still count towards the hedge delay.
+        """
+        await acquire_rate_limit(PAGESPEED)
+        start = time.monotonic()
+        async with budget_reservation(PAGESPEED, self.COST_PER_CALL) as reservation, circuit_guard(PAGESPEED) as call:
+            try:
+                if sent is not None:
+                    sent.set()
+                response = await self.client.get(self.BASE_URL, params=params)
+            except asyncio.CancelledError:
+                # A losing hedge cancelled mid-request was still sent and is billed
+                await budget.commit(reservation)
+                if not hedge:
+                    latency_tracker.record(strategy, time.monotonic() - start)
+                raise
+            call.check(response.status_code)
+        if response.status_code == 200:
+            latency_tracker.record(strategy, time.monotonic() - start)
+        return response
+    
+    async def _send_hedged(self, params: Dict[str, Any], strategy: str) -> Tuple[httpx.Response, int]:
+        """
+        Send the request and, if it is still outstanding after the hedge
+        delay, a duplicate. The first successful response wins and the
+        other request is cancelled; its budget is still charged if it had
+        gone out, and released only if it never did.
+        
+        Returns:
+            Response and the number of duplicate requests that went out
+        """
+        if not settings.PAGESPEED_HEDGE_ENABLED:
+            return await self._send(params, strategy), 0
+        
+        hedge_sent = asyncio.Event()
+        tasks = [asyncio.create_task(self._send(params, strategy))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=latency_tracker.hedge_delay(strategy))
+            if not done:
+                logger.info("Hedging slow PageSpeed request", url=params["url"], strategy=strategy)
+                tasks.append(asyncio.create_task(self._send(params, strategy, sent=hedge_sent, hedge=True)))
+            
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().status_code == 200:
+                        return task.result(), int(hedge_sent.is_set())
+            
+            # No request succeeded: report the original one's outcome
+            return tasks[0].result(), int(hedge_sent.is_set())
+        finally:
+            # Let losers settle their budget and latency before the result is costed
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            await asyncio.gather(*losers, return_exceptions=True)
+    
     def _extract_core_web_vitals(self, api_data: Dict) -> CoreWebVitals:
         """
         Extract Core Web Vitals metrics from PageSpeed API response
@@ -230,6 +378,9 @@ class PageSpeedClient:
         Mobile-first analysis with optional desktop fallback
         Implements PRP-003 mobile-first strategy
         
+        Both strategies run concurrently. A mobile failure is fatal and
+        cancels the desktop run; a desktop failure leaves a mobile-only result.
+        
         Args:
             url: URL to analyze
             
@@ -237,27 +388,30 @@ class PageSpeedClient:
             Dict with mobile results and optional desktop results
         """
         results = {}
+        desktop_task = asyncio.create_task(self.analyze_url(url, strategy="desktop"))
         
         try:
             # Primary mobile analysis
             results["mobile"] = await self.analyze_url(url, strategy="mobile")
-            
-            # Optional desktop analysis if mobile succeeds
-            try:
-                results["desktop"] = await self.analyze_url(url, strategy="desktop")
-            except PageSpeedError as exc:
-                logger.warning(f"Desktop analysis failed, mobile-only result", url=url, error=str(exc))
-                # Continue with mobile-only results
-            
-        except PageSpeedError:
-            # If mobile analysis fails, this is a critical error
+        except BaseException:
+            # If mobile analysis fails, this is a critical error; wait for the
+            # desktop run to settle its budget and hedge accounting first
+            desktop_task.cancel()
+            await asyncio.gather(desktop_task, return_exceptions=True)
             raise
         
+        # Optional desktop analysis
+        try:
+            results["desktop"] = await desktop_task
+        except (PageSpeedError, CircuitOpenError, BudgetExceededError) as exc:
+            logger.warning(f"Desktop analysis failed, mobile-only result", url=url, error=str(exc))
+            # Continue with mobile-only results
+        
         return results
     
     async def close(self):
-        """Close HTTP client connections"""
-        await self.client.aclose()
+        """Kept for callers; the shared HTTP client is closed at shutdown."""
+        pass
 
 
 # Global client instance for reuse
@@ -274,6 +428,30 @@ def get_pagespeed_client() -> PageSpeedClient:
     return _pagespeed_client
 
 
+async def analyze_mobile_first_cached(url: str):
+    """
+    Mobile-first analysis through the component cache, so recent results are
+    reused and concurrent requests for the same URL share one API call.
+    
+    Returns:
+        Tuple of strategy results and their CacheProvenance
+    """
+    from src.assessments.result_cache import component_cache, canonical_url
+    
+    client = get_pagespeed_client()
+    return await component_cache.get_or_compute(
+        "pagespeed",
+        canonical_url(url),
+        lambda: client.analyze_mobile_first(url),
+        serialize=lambda res: {strategy: result.dict() for strategy, result in res.items()},
+        deserialize=lambda data: {strategy: PageSpeedResult(**result) for strategy, result in data.items()},
+        cost_of=lambda res: sum(result.cost_cents for result in res.values()),
+        # A mobile-only result after a desktop failure is not reused
+        cacheable=lambda res: "mobile" in res and "desktop" in res
+    )
+
+
+@charges_lead
 async def assess_pagespeed(url: str, company: str = None, lead_id: int = None, assessment_id: int = None) -> Dict[str, Any]:
     """
     Convenience function for PageSpeed assessment with cost tracking
@@ -294,29 +472,45 @@ async def assess_pagespeed(url: str, company: str = None, lead_id: int = None, a
         PageSpeedElement, PageSpeedEntity, PageSpeedOpportunity
     )
     
+    from src.assessments.result_cache import record_cache_hit_cost
+    
     cost_records = []
     
     try:
-        client = get_pagespeed_client()
-        
-        # Mobile-first analysis per PRP-003
-        results = await client.analyze_mobile_first(url)
+        # Mobile-first analysis per PRP-003, reused for recently analyzed URLs
+        results, provenance = await analyze_mobile_first_cached(url)
         
         # Use mobile results as primary
         mobile_result = results["mobile"]
         desktop_result = results.get("desktop")
         
-        # Create cost records for each API call
-        if lead_id:
+        # Create cost records for each API call (cache hits are recorded at zero cost)
+        if provenance.cache_hit:
+            hit_record = await record_cache_hit_cost(lead_id, "pagespeed", provenance, assessment_id)
+            if hit_record:
+                cost_records.append(hit_record)
+        elif lead_id:
             for strategy, result in results.items():
+                hedge_cost = result.hedged_requests * PageSpeedClient.COST_PER_CALL
                 cost_record = AssessmentCost.create_pagespeed_cost(
                     lead_id=lead_id,
-                    cost_cents=result.cost_cents,
+                    cost_cents=result.cost_cents - hedge_cost,
                     response_status="success",
                     response_time_ms=result.analysis_duration_ms,
                     api_quota_used=False  # Assume paid tier for now
                 )
                 cost_records.append(cost_record)
+                
+                # Duplicate requests sent for tail latency are billed separately
+                if result.hedged_requests:
+                    hedge_record = AssessmentCost.create_pagespeed_cost(
+                        lead_id=lead_id,
+                        cost_cents=hedge_cost,
+                        response_status="success",
+                        api_quota_used=False
+                    )
+                    hedge_record.retry_count = result.hedged_requests
+                    cost_records.append(hedge_record)
         
         # Save detailed PageSpeed data to new tables if assessment_id provided
         if assessment_id:
@@ -335,14 +529,15 @@ async def assess_pagespeed(url: str, company: str = None, lead_id: int = None, a
         assessment_data = {
             "url": url,
             "company": company,
-            "mobile_analysis": mobile_result.dict(),
-            "desktop_analysis": desktop_result.dict() if desktop_result else None,
+            "mobile_analysis": mobile_result.compact_dict(),
+            "desktop_analysis": desktop_result.compact_dict() if desktop_result else None,
             "primary_strategy": "mobile",
             "core_web_vitals": mobile_result.core_web_vitals.dict(),
             "performance_score": mobile_result.core_web_vitals.performance_score or 0,
             "analysis_timestamp": mobile_result.analysis_timestamp,
-            "total_cost_cents": sum(r.cost_cents for r in results.values()),
-            "api_calls_made": len(results),
+            "total_cost_cents": 0.0 if provenance.cache_hit else sum(r.cost_cents for r in results.values()),
+            "api_calls_made": 0 if provenance.cache_hit else sum(1 + r.hedged_requests for r in results.values()),
+            "cache_provenance": provenance.dict(),
             "cost_records": []  # Exclude SQLAlchemy objects to avoid serialization issues
         }
         
@@ -362,6 +557,9 @@ async def assess_pagespeed(url: str, company: str = None, lead_id: int = None, a
         
         logger.error(f"PageSpeed assessment failed", url=url, company=company, error=str(exc))
         raise
+    except (CircuitOpenError, BudgetExceededError):
+        # Orchestrators skip the component instead of recording a failure
+        raise
     except Exception as exc:
         # Create error cost record for unexpected errors
         if lead_id:
@@ -445,12 +643,11 @@ async def save_pagespeed_analysis_to_db(
             # Benchmark and credits
             benchmark_index=lighthouse.get('benchmarkIndex'),
             credits=lighthouse.get('credits'),
-            
-            # Raw data
-            raw_lighthouse_result=lighthouse,
-            i18n_strings=lighthouse.get('i18n')
         )
         
+        # Complete result (including i18n strings) kept once, compressed
+        analysis.store_raw_lighthouse(lighthouse)
+        
         # Extract Speed Index if available
         audits = lighthouse.get('audits', {})
         if 'speed-index' in audits:
@@ -459,9 +656,13 @@ async def save_pagespeed_analysis_to_db(
         db.add(analysis)
         await db.flush()  # Get the ID
         
+        # Child rows are written in bulk, one INSERT batch per table
+        rows = BulkWriter(db)
+        
         # Save all audits
         for audit_id, audit_data in audits.items():
-            audit = PageSpeedAudit(
+            rows.add(
+                PageSpeedAudit,
                 pagespeed_analysis_id=analysis.id,
                 audit_id=audit_id,
                 title=audit_data.get('title'),
@@ -472,11 +673,10 @@ async def save_pagespeed_analysis_to_db(
                 explanation=audit_data.get('explanation'),
                 error_message=audit_data.get('errorMessage'),
                 warnings=audit_data.get('warnings'),
-                details=audit_data.get('details'),
+                details=None if audit_id in SCREENSHOT_AUDITS else audit_data.get('details'),
                 numeric_value=audit_data.get('numericValue'),
                 numeric_unit=audit_data.get('numericUnit')
             )
-            db.add(audit)
         
         # Save screenshots
         if 'audits' in lighthouse:
@@ -484,7 +684,8 @@ async def save_pagespeed_analysis_to_db(
             if 'full-page-screenshot' in audits:
                 screenshot_data = audits['full-page-screenshot'].get('details', {})
                 if screenshot_data.get('screenshot'):
-                    screenshot = PageSpeedScreenshot(
+                    rows.add(
+                        PageSpeedScreenshot,
                         pagespeed_analysis_id=analysis.id,
                         screenshot_type='full_page',
                         data=screenshot_data['screenshot'].get('data'),
@@ -492,27 +693,27 @@ async def save_pagespeed_analysis_to_db(
                         width=screenshot_data['screenshot'].get('width'),
                         mime_type=screenshot_data['screenshot'].get('mimeType', 'image/webp')
                     )
-                    db.add(screenshot)
             
             # Screenshot thumbnails from filmstrip
             if 'screenshot-thumbnails' in audits:
                 filmstrip = audits['screenshot-thumbnails'].get('details', {}).get('items', [])
                 for frame in filmstrip:
                     if frame.get('data'):
-                        screenshot = PageSpeedScreenshot(
+                        rows.add(
+                            PageSpeedScreenshot,
                             pagespeed_analysis_id=analysis.id,
                             screenshot_type='filmstrip',
                             data=frame.get('data'),
                             timestamp_ms=frame.get('timing'),
                             mime_type='image/jpeg'
                         )
-                        db.add(screenshot)
         
         # Save element positioning data
         if 'full-page-screenshot' in audits:
             nodes = audits['full-page-screenshot'].get('details', {}).get('nodes', {})
             for node_id, node_data in nodes.items():
-                element = PageSpeedElement(
+                rows.add(
+                    PageSpeedElement,
                     pagespeed_analysis_id=analysis.id,
                     node_id=node_id,
                     selector=node_data.get('selector'),
@@ -521,7 +722,6 @@ async def save_pagespeed_analysis_to_db(
                     node_label=node_data.get('nodeLabel'),
                     element_type=node_data.get('type')
                 )
-                db.add(element)
         
         # Save third-party entities
         if 'third-party-summary' in audits:
@@ -529,7 +729,8 @@ async def save_pagespeed_analysis_to_db(
             for entity_data in entities:
                 if entity_data.get('entity'):
                     entity_info = entity_data['entity']
-                    entity = PageSpeedEntity(
+                    rows.add(
+                        PageSpeedEntity,
                         pagespeed_analysis_id=analysis.id,
                         name=entity_info.get('text', entity_info.get('url', 'Unknown')),
                         homepage=entity_info.get('url'),
@@ -541,7 +742,6 @@ async def save_pagespeed_analysis_to_db(
                         blocking_time_ms=entity_data.get('blockingTime'),
                         transfer_size_bytes=entity_data.get('transferSize')
                     )
-                    db.add(entity)
         
         # Save performance opportunities
         opportunities = []
@@ -549,7 +749,8 @@ async def save_pagespeed_analysis_to_db(
             # Check if this audit represents an opportunity (has savings)
             details = audit_data.get('details', {})
             if details.get('type') == 'opportunity' and details.get('overallSavingsMs'):
-                opportunity = PageSpeedOpportunity(
+                rows.add(
+                    PageSpeedOpportunity,
                     pagespeed_analysis_id=analysis.id,
                     audit_id=audit_id,
                     title=audit_data.get('title'),
@@ -559,7 +760,8 @@ async def save_pagespeed_analysis_to_db(
                     rating='fail' if audit_data.get('score', 1) < 0.5 else 'average' if audit_data.get('score', 1) < 0.9 else 'pass',
                     details=details
                 )
-                db.add(opportunity)
+        
+        await rows.flush()
     
     # Save mobile analysis (always available)
     await save_strategy_analysis(mobile_result, 'mobile')
@@ -589,4 +791,98 @@ def extract_category_score(lighthouse_result: Dict[str, Any], category: str) ->
         score = categories[category].get('score')
         if score is not None:
             return int(score * 100)
-    return None
\ No newline at end of file
+    return None
+
+
+def _trim_pagespeed_data(pagespeed_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim Lighthouse results embedded in an Assessment.pagespeed_data blob"""
+    trimmed = dict(pagespeed_data)
+    for key in ("mobile_analysis", "desktop_analysis"):
+        analysis = trimmed.get(key)
+        if isinstance(analysis, dict) and analysis.get("lighthouse_result"):
+            trimmed[key] = {**analysis, "lighthouse_result": trim_lighthouse_result(analysis["lighthouse_result"])}
+    return trimmed
+
+
+async def backfill_compressed_lighthouse(batch_size: int = 50) -> Dict[str, int]:
+    """
+    Convert rows written before raw Lighthouse results were compressed.
+    
+    Moves raw_lighthouse_result into the compressed column, clears the
+    legacy JSON copies and screenshot audit details, and trims the
+    Lighthouse payloads embedded in Assessment.pagespeed_data. Works in
+    id-ordered batches, one transaction each, and is safe to re-run.
+    
+    Returns:
+        Counts of converted analyses and trimmed assessments
+    """
+    from sqlalchemy import null, select, update
+    from src.core.compression import compress_json
+    from src.core.database import AsyncSessionLocal
+    from src.models.lead import Assessment
+    from src.models.pagespeed import PageSpeedAnalysis, PageSpeedAudit
+    
+    converted = 0
+    last_id = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(PageSpeedAnalysis.id, PageSpeedAnalysis.raw_lighthouse_result)
+                .where(
+                    PageSpeedAnalysis.id > last_id,
+                    PageSpeedAnalysis.raw_lighthouse_compressed.is_(None),
+                    PageSpeedAnalysis.raw_lighthouse_result.isnot(None)
+                )
+                .order_by(PageSpeedAnalysis.id)
+                .limit(batch_size)
+            )).all()
+            if not rows:
+                break
+            
+            for analysis_id, lighthouse in rows:
+                values = {"raw_lighthouse_result": null(), "i18n_strings": null()}
+                if lighthouse:
+                    values["raw_lighthouse_compressed"], values["raw_lighthouse_encoding"] = compress_json(lighthouse)
+                await db.execute(
+                    update(PageSpeedAnalysis).where(PageSpeedAnalysis.id == analysis_id).values(**values)
+                )
+                await db.execute(
+                    update(PageSpeedAudit)
+                    .where(
+                        PageSpeedAudit.pagespeed_analysis_id == analysis_id,
+                        PageSpeedAudit.audit_id.in_(SCREENSHOT_AUDITS)
+                    )
+                    .values(details=null())
+                )
+            await db.commit()
+            converted += len(rows)
+            last_id = rows[-1][0]
+            logger.info("Compressed legacy Lighthouse results", batch=len(rows), last_id=last_id)
+    
+    trimmed = 0
+    last_id = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(Assessment.id, Assessment.pagespeed_data)
+                .where(Assessment.id > last_id, Assessment.pagespeed_data.isnot(None))
+                .order_by(Assessment.id)
+                .limit(batch_size)
+            )).all()
+            if not rows:
+                break
+            
+            for assessment_id, pagespeed_data in rows:
+                if not isinstance(pagespeed_data, dict):
+                    continue
+                compact = _trim_pagespeed_data(pagespeed_data)
+                if compact != pagespeed_data:
+                    await db.execute(
+                        update(Assessment).where(Assessment.id == assessment_id).values(pagespeed_data=compact)
+                    )
+                    trimmed += 1
+            await db.commit()
+            last_id = rows[-1][0]
+    
+    logger.info("Lighthouse storage backfill complete", converted=converted, trimmed=trimmed)
+    return {"analyses_compressed": converted, "assessments_trimmed": trimmed}
@@ -0,0 +1,155 @@
+"""
+PRP-011: Reachability Pre-check
+Fast DNS and HTTP probe run before paid components, with negative caching of dead domains
+"""
+
+import asyncio
+import logging
+import socket
+import time
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from pydantic import BaseModel
+
+from src.core.cache import cache, CacheKeys
+from src.core.config import settings
+from src.core.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Components that need a live site; anything else (GBP, scoring, content)
+# still runs when the site is down
+URL_DEPENDENT_COMPONENTS = frozenset({"pagespeed", "security", "screenshots", "semrush", "visual_analysis"})
+
+
+class ReachabilityResult(BaseModel):
+    """Outcome of the pre-flight probe"""
+    url: str
+    host: str = ""
+    reachable: bool
+    reason: Optional[str] = None  # invalid_url, dns, connect or timeout when unreachable
+    detail: Optional[str] = None
+    status_code: Optional[int] = None
+    transient: bool = False  # Timeouts and temporary DNS failures may clear up soon
+    elapsed_ms: int = 0
+    cached: bool = False
+
+    @property
+    def summary(self) -> str:
+        return f"site unreachable ({self.reason}): {self.detail or self.host}"
+
+
+async def _resolves(host: str, port: int) -> Optional[Tuple[str, bool]]:
+    """None if host resolves, otherwise why not and whether that may be transient"""
+    try:
+        infos = await asyncio.wait_for(
+            asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM),
+            timeout=settings.REACHABILITY_DNS_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        return "DNS lookup timed out", True
+    except socket.gaierror as e:
+        return str(e) or "DNS lookup failed", e.errno == socket.EAI_AGAIN
+    except (OSError, UnicodeError) as e:
+        return str(e) or "DNS lookup failed", False
+    return None if infos else ("DNS lookup returned no addresses", False)
+
+
+async def _probe(url: str) -> int:
+    """Status code of the first response from url; the body is never read"""
+    client = get_http_client("site")
+    timeout = httpx.Timeout(
+        settings.REACHABILITY_CONNECT_TIMEOUT_SECONDS,
+        connect=settings.REACHABILITY_CONNECT_TIMEOUT_SECONDS
+    )
+    # Any response, redirect or error page included, proves the host is up
+    async with client.stream("GET", url, timeout=timeout, follow_redirects=False) as response:
+        return response.status_code
+
+
+async def _check(url: str) -> ReachabilityResult:
+    target = url if "://" in url else f"https://{url}"
+    parsed = urlparse(target)
+    host = parsed.hostname
+    if not host or parsed.scheme not in ("http", "https"):
+        return ReachabilityResult(url=url, reachable=False, reason="invalid_url", detail=f"Cannot probe {url!r}")
+
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    dns_failure = await _resolves(host, port)
+    if dns_failure:
+        detail, transient = dns_failure
+        return ReachabilityResult(url=url, host=host, reachable=False, reason="dns", detail=detail, transient=transient)
+
+    # A refused or filtered HTTPS port doesn't make a site dead if it still answers on HTTP
+    candidates = [target]
+    if parsed.scheme == "https" and parsed.port is None:
+        candidates.append(parsed._replace(scheme="http").geturl())
+
+    failure, timed_out = None, False
+    for candidate in candidates:
+        try:
+            status_code = await _probe(candidate)
+            return ReachabilityResult(url=url, host=host, reachable=True, status_code=status_code)
+        except httpx.ConnectTimeout as e:
+            failure, timed_out = str(e) or "Connect timed out", True
+        except httpx.TimeoutException:
+            # Connected but slow to answer: up, just slow, which the components can report on
+            return ReachabilityResult(url=url, host=host, reachable=True)
+        except httpx.ConnectError as e:
+            failure = str(e) or "Connection failed"
+        except httpx.HTTPError as e:
+            # Protocol-level errors mean something answered
+            logger.info(f"Reachability probe for {candidate} got a malformed response: {e}")
+            return ReachabilityResult(url=url, host=host, reachable=True)
+    if timed_out:
+        return ReachabilityResult(url=url, host=host, reachable=False, reason="timeout", detail=failure, transient=True)
+    return ReachabilityResult(url=url, host=host, reachable=False, reason="connect", detail=failure)
+
+
+async def check_reachability(url: str) -> ReachabilityResult:
+    """
+    Decide within a few seconds whether url is worth assessing.
+
+    Resolves the host, then opens one request and closes it as soon as the
+    status line arrives. Dead results are cached per host for
+    REACHABILITY_NEGATIVE_TTL_SECONDS so repeat leads for a dead domain cost
+    a single Redis read; timeouts and temporary DNS failures only for
+    REACHABILITY_TRANSIENT_TTL_SECONDS. Live results are not cached.
+    """
+    started = time.monotonic()
+    host = urlparse(url if "://" in url else f"https://{url}").hostname or ""
+
+    if host:
+        cached = await cache.get(CacheKeys.unreachable_host(host))
+        if cached:
+            return ReachabilityResult(**{**cached, "url": url, "cached": True})
+
+    result = await _check(url)
+    result.elapsed_ms = int((time.monotonic() - started) * 1000)
+
+    if not result.reachable:
+        logger.warning(f"Reachability pre-check failed for {url} in {result.elapsed_ms}ms: {result.summary}")
+        if result.host:
+            await cache.set(
+                CacheKeys.unreachable_host(result.host),
+                result.dict(exclude={"cached"}),
+                ttl=settings.REACHABILITY_TRANSIENT_TTL_SECONDS if result.transient
+                else settings.REACHABILITY_NEGATIVE_TTL_SECONDS
+            )
+    return result
+
+
+async def precheck_site(url: Optional[str]) -> Optional[ReachabilityResult]:
+    """
+    Orchestrator entry point: the pre-check result, or None when components
+    should simply all run (check disabled, no URL, or the probe itself broke).
+    """
+    if not settings.REACHABILITY_CHECK_ENABLED or not url:
+        return None
+    try:
+        return await check_reachability(url)
+    except Exception as e:
+        logger.warning(f"Reachability pre-check errored for {url}, running all components: {e}")
+        return None
@@ -0,0 +1,248 @@
+"""
+PRP-011: Component Result Cache
+Reuse provider results for recently assessed sites, keyed by canonical URL/domain
+"""
+
+import logging
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.core.cache import CacheKeys, cache
+from src.core.config import settings
+from src.core.single_flight import single_flight
+from src.models.assessment_cost import AssessmentCost
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Tracking parameters that never change what a page renders
+_IGNORED_QUERY_PARAMS = {"fbclid", "gclid", "msclkid", "ref", "mc_cid", "mc_eid"}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL so cosmetic variants share one cache entry.
+
+    Lowercases scheme and host, drops "www.", default ports, fragments,
+    utm_* and click-tracking params, sorts the remaining query and strips
+    a trailing slash. Bare domains are treated as https.
+    """
+    url = (url or "").strip()
+    if "://" not in url:
+        url = f"https://{url}"
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    port = parts.port
+    netloc = host
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        netloc = f"{host}:{port}"
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _IGNORED_QUERY_PARAMS
+    )
+    path = parts.path.rstrip("/")
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def canonical_domain(url_or_domain: str) -> str:
+    """Registrable host for domain-level providers such as SEMrush."""
+    return urlsplit(canonical_url(url_or_domain)).hostname or ""
+
+
+def canonical_text(*parts: Optional[str]) -> str:
+    """Case/whitespace-insensitive key for free-text lookups (e.g. Places search)."""
+    return "|".join(" ".join((part or "").lower().split()) for part in parts)
+
+
+@dataclass
+class CacheProvenance:
+    """Where a component result came from."""
+    component: str
+    cache_key: str
+    cache_hit: bool
+    cached_at: str
+    ttl_seconds: int
+    source_cost_cents: float
+    age_seconds: int = 0
+    coalesced: bool = False
+
+    def dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ComponentResultCache:
+    """
+    Redis-backed cache for expensive provider calls.
+
+    Entries store the serialized provider payload together with provenance
+    (when it was fetched and what it originally cost). Failed lookups or
+    Redis outages fall through to the live call. Concurrent misses for the
+    same key are coalesced so only one live call is in flight at a time.
+    """
+
+    def component_ttls(self) -> Dict[str, int]:
+        return {
+            "pagespeed": settings.CACHE_TTL_PAGESPEED,
+            "semrush": settings.CACHE_TTL_SEMRUSH,
+            "gbp": settings.CACHE_TTL_GBP,
+            "security": settings.CACHE_TTL_SECURITY,
+            "screenshots": settings.CACHE_TTL_SCREENSHOTS,
+            "site_fetch": settings.CACHE_TTL_SITE_FETCH,
+            "llm_vision": settings.CACHE_TTL_LLM,
+            "llm_content": settings.CACHE_TTL_LLM,
+        }
+
+    def ttl_for(self, component: str) -> int:
+        return self.component_ttls().get(component, settings.CACHE_TTL)
+
+    async def get_or_compute(
+        self,
+        component: str,
+        subject: str,
+        compute: Callable[[], Awaitable[T]],
+        serialize: Callable[[T], Any],
+        deserialize: Callable[[Any], T],
+        cost_of: Callable[[T], float] = lambda _: 0.0,
+        cacheable: Callable[[T], bool] = lambda _: True,
+    ) -> Tuple[T, CacheProvenance]:
+        """
+        Return a cached payload for (component, subject) or compute and store it.
+
+        Args:
+            component: Cache namespace, also selects the TTL
+            subject: Canonical URL/domain/query the payload describes
+            compute: Live provider call
+            serialize/deserialize: Convert the payload to and from JSON-safe data
+            cost_of: Original provider cost in cents, recorded as provenance
+            cacheable: Whether a fresh payload is good enough to store
+
+        Returns:
+            Tuple of payload and its provenance
+        """
+        key = CacheKeys.component_result(component, subject)
+        ttl = self.ttl_for(component)
+
+        if settings.COMPONENT_CACHE_ENABLED:
+            entry = await cache.get(key)
+            if entry and "payload" in entry:
+                try:
+                    payload = deserialize(entry["payload"])
+                    provenance = CacheProvenance(**{**entry["provenance"], "cache_hit": True})
+                    provenance.age_seconds = int(time.time() - entry.get("stored_ts", time.time()))
+                    logger.info(f"Cache hit for {component} {subject} (age {provenance.age_seconds}s)")
+                    return payload, provenance
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable {component} cache entry for {subject}: {e}")
+                    await cache.delete(key)
+
+        if settings.COMPONENT_CACHE_ENABLED:
+            # Waiters reuse the result, so it must meet the same bar as a cache entry
+            payload, shared = await single_flight.do(key, compute, serialize, deserialize, shareable=cacheable)
+        else:
+            payload, shared = await compute(), False
+        provenance = CacheProvenance(
+            component=component,
+            cache_key=key,
+            cache_hit=shared,
+            cached_at=datetime.now(timezone.utc).isoformat(),
+            ttl_seconds=ttl,
+            source_cost_cents=float(cost_of(payload) or 0.0),
+            coalesced=shared,
+        )
+        if shared:
+            logger.info(f"Shared in-flight {component} result for {subject}")
+            return payload, provenance
+
+        if settings.COMPONENT_CACHE_ENABLED and cacheable(payload):
+            await cache.set(key, {
+                "payload": serialize(payload),
+                "provenance": provenance.dict(),
+                "stored_ts": time.time(),
+            }, ttl=ttl)
+
+        return payload, provenance
+
+    async def invalidate(self, component: str, subject: str) -> bool:
+        return await cache.delete(CacheKeys.component_result(component, subject))
+
+
+async def record_cache_hit_cost(
+    lead_id: Optional[int],
+    service_name: str,
+    provenance: CacheProvenance,
+    assessment_id: Optional[int] = None
+) -> Optional[AssessmentCost]:
+    """Persist a zero-cost AssessmentCost row for a cache hit (best effort)."""
+    if not lead_id or not provenance.cache_hit:
+        return None
+
+    logger.info(f"{service_name} served from cache, saved {provenance.source_cost_cents:.2f} cents")
+
+    cost_record = AssessmentCost.create_cache_hit_cost(
+        lead_id=lead_id,
+        service_name=service_name,
+        cache_key=provenance.cache_key,
+        assessment_id=assessment_id
+    )
+    try:
+        from src.core.database import AsyncSessionLocal
+        async with AsyncSessionLocal() as db:
+            db.add(cost_record)
+            await db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to record cache hit cost for {service_name}: {e}")
+    return cost_record
+
+
+# Add create_cache_hit_cost method to AssessmentCost model
+def create_cache_hit_cost_method(cls, lead_id: int, service_name: str, cache_key: str, assessment_id: Optional[int] = None):
+    """
+    Create zero-cost record for a provider result served from cache.
+    The cache key is kept in api_endpoint so the row traces back to the
+    original paid call.
+
+    Args:
+        lead_id: ID of the lead being assessed
+        service_name: Service whose result was reused
+        cache_key: Cache entry the result came from
+        assessment_id: Optional assessment ID
+
+    Returns:
+        AssessmentCost instance
+    """
+    now = datetime.now(timezone.utc)
+
+    return cls(
+        lead_id=lead_id,
+        assessment_id=assessment_id,
+        service_name=service_name,
+        api_endpoint=f"cache://{cache_key}"[:200],
+        cost_cents=0.0,
+        currency="USD",
+        request_timestamp=now,
+        response_status="cache_hit",
+        response_time_ms=0,
+        api_quota_used=False,
+        rate_limited=False,
+        retry_count=0,
+        daily_budget_date=now.strftime("%Y-%m-%d"),
+        monthly_budget_date=now.strftime("%Y-%m")
+    )
+
+# Monkey patch the method to AssessmentCost
+AssessmentCost.create_cache_hit_cost = classmethod(create_cache_hit_cost_method)
+
+
+# Global component cache instance
+component_cache = ComponentResultCache()
@@ -1,6 +1,6 @@
 """
 PRP-006: ScreenshotOne Integration
-Automated screenshot capture with desktop/mobile viewports and S3 storage
+Automated screenshot capture with desktop/mobile viewports and blob storage
 """
 
 import asyncio
@@ -9,16 +9,20 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import quote
-import base64
-import io
 
 import httpx
-from PIL import Image
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.provider_limits import SCREENSHOTONE
+from src.core.budget import BudgetExceededError, budget_reservation, charges_lead
+from src.core.circuit_breaker import CircuitOpenError, circuit_guard
+from src.core.rate_limiter import acquire_rate_limit
+from src.core.http_clients import get_http_client
 from src.core.database import AsyncSessionLocal
+from src.core.storage.blob_store import get_blob_store
+from src.assessments.image_processing import probe_image
 from src.models.assessment_cost import AssessmentCost
 from src.models.screenshot import Screenshot, ScreenshotType, ScreenshotStatus
 
@@ -34,6 +38,7 @@ class ScreenshotMetadata(BaseModel):
     format: str = Field(..., description="Image format (webp)")
     quality: int = Field(..., description="Image quality percentage")
     capture_timestamp: str = Field(..., description="When screenshot was captured")
+    blob_ref: Optional[str] = Field(None, description="Blob store reference to the image")
     s3_url: Optional[str] = Field(None, description="S3 storage URL")
     signed_url: Optional[str] = Field(None, description="Signed URL for access")
     capture_duration_ms: int = Field(0, description="Time taken to capture")
@@ -48,6 +53,7 @@ class ScreenshotResults(BaseModel):
     error_message: Optional[str] = Field(None, description="Error details if failed")
     total_duration_ms: int = Field(0, description="Total processing time")
     cost_records: List[Any] = Field(default_factory=list, description="Cost tracking records")
+    cache_provenance: Optional[Dict[str, Any]] = Field(None, description="Result cache provenance")
     
     class Config:
         arbitrary_types_allowed = True
@@ -56,6 +62,13 @@ class ScreenshotCaptureError(Exception):
     """Custom exception for screenshot capture errors"""
     pass
 
+def screenshot_ref(screenshot: Any) -> Optional[str]:
+    """Where a screenshot's image can be read: its blob reference, else a legacy URL."""
+    if not screenshot:
+        return None
+    get = screenshot.get if isinstance(screenshot, dict) else lambda field: getattr(screenshot, field, None)
+    return get("blob_ref") or get("s3_url") or get("signed_url")
+
 class ScreenshotOneClient:
     """ScreenshotOne API client with retry logic and optimization."""
     
@@ -71,7 +84,11 @@ class ScreenshotOneClient:
     
     def __init__(self):
         self.api_key = settings.SCREENSHOTONE_API_KEY
-        self.client = httpx.AsyncClient(timeout=self.TIMEOUT)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client for the running event loop."""
+        return get_http_client("screenshotone")
         
     async def _capture_screenshot(self, url: str, viewport: Dict[str, int], viewport_name: str) -> Optional[ScreenshotMetadata]:
         """Capture a single screenshot with specified viewport."""
@@ -108,16 +125,21 @@ class ScreenshotOneClient:
             })
         
         try:
-            response = await self.client.get(self.BASE_URL, params=params)
+            await acquire_rate_limit(SCREENSHOTONE)
+            async with budget_reservation(SCREENSHOTONE, self.COST_PER_SCREENSHOT), circuit_guard(SCREENSHOTONE) as call:
+                response = await self.client.get(self.BASE_URL, params=params)
+                call.check(response.status_code)
             
             if response.status_code == 200:
                 # Get image data
                 image_data = response.content
                 
-                # Validate image and get metadata
+                # Validate image and get metadata. Only the header is parsed, which is
+                # cheaper inline than shipping the bytes to the image service
                 try:
-                    image = Image.open(io.BytesIO(image_data))
-                    actual_width, actual_height = image.size
+                    info = probe_image(image_data)
+                    actual_width, actual_height = info.width, info.height
+                    image_format = info.format or 'webp'
                     file_size = len(image_data)
                     
                     # Validate file size
@@ -126,43 +148,43 @@ class ScreenshotOneClient:
                         # Could implement compression here if needed
                     
                     # Validate format
-                    if image.format.lower() != 'webp':
-                        logger.warning(f"Screenshot format {image.format} is not WebP as expected")
-                    
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    
-                    # Store the image data temporarily for potential S3 upload
-                    # This will be handled by the orchestrator or a separate upload process
-                    metadata = ScreenshotMetadata(
-                        viewport=viewport_name,
-                        width=actual_width,
-                        height=actual_height,
-                        file_size_bytes=file_size,
-                        format=image.format.lower() if image.format else 'webp',
-                        quality=75,  # Updated to match API setting
-                        capture_timestamp=datetime.now(timezone.utc).isoformat(),
-                        capture_duration_ms=duration_ms
-                    )
-                    
-                    # Store raw image data as a temporary attribute (not in the model)
-                    # This allows the caller to handle S3 upload if needed
-                    metadata._raw_image_data = image_data
-                    
-                    # Create a full base64 data URL for visual analysis
-                    # In production, this would be the S3 URL
-                    metadata.signed_url = f"data:image/webp;base64,{base64.b64encode(image_data).decode('utf-8')}"
-                    
-                    return metadata
+                    if image_format != 'webp':
+                        logger.warning(f"Screenshot format {image_format} is not WebP as expected")
                     
                 except Exception as img_error:
                     logger.error(f"Image validation failed: {img_error}")
                     raise ScreenshotCaptureError(f"Invalid image data received: {img_error}")
-                    
+                
+                # Write the image once; only its reference travels from here on
+                blob_ref = await get_blob_store().put(
+                    image_data,
+                    prefix="screenshots",
+                    extension=image_format,
+                    content_type=f"image/{image_format}"
+                )
+                
+                duration_ms = int((time.time() - start_time) * 1000)
+                
+                return ScreenshotMetadata(
+                    viewport=viewport_name,
+                    width=actual_width,
+                    height=actual_height,
+                    file_size_bytes=file_size,
+                    format=image_format,
+                    quality=75,  # Updated to match API setting
+                    capture_timestamp=datetime.now(timezone.utc).isoformat(),
+                    blob_ref=blob_ref,
+                    capture_duration_ms=duration_ms
+                )
+                
             else:
                 error_msg = f"ScreenshotOne API error: {response.status_code} - {response.text}"
                 logger.error(error_msg)
                 raise ScreenshotCaptureError(error_msg)
                 
+        except (CircuitOpenError, BudgetExceededError):
+            # Skip the remaining retries while ScreenshotOne is failing or over budget
+            raise
         except httpx.TimeoutException:
             logger.error(f"ScreenshotOne API timeout for {url}")
             raise ScreenshotCaptureError("Screenshot capture timed out")
@@ -207,8 +229,8 @@ class ScreenshotOneClient:
         return desktop_screenshot, mobile_screenshot
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Kept for callers; the shared HTTP client is closed at shutdown."""
+        pass
 
 async def save_screenshots_to_db(
     assessment_id: int,
@@ -233,11 +255,6 @@ async def save_screenshots_to_db(
         if screenshot_results.desktop_screenshot:
             desktop_meta = screenshot_results.desktop_screenshot
             
-            # Try to upload to S3 if available
-            s3_url = desktop_meta.s3_url
-            if not s3_url and hasattr(desktop_meta, '_raw_image_data'):
-                s3_url = await upload_screenshot_to_s3(desktop_meta, assessment_id, "desktop")
-            
             desktop_screenshot = Screenshot(
                 assessment_id=assessment_id,
                 url=screenshot_results.url,
@@ -246,7 +263,7 @@ async def save_screenshots_to_db(
                 viewport_height=1080,
                 device_scale_factor=1.0,
                 is_mobile=False,
-                image_url=s3_url or desktop_meta.signed_url,
+                image_url=screenshot_ref(desktop_meta),
                 image_format=desktop_meta.format,
                 image_width=desktop_meta.width,
                 image_height=desktop_meta.height,
@@ -257,10 +274,10 @@ async def save_screenshots_to_db(
                 quality_score=desktop_meta.quality,
                 is_complete=True,
                 has_errors=False,
-                metadata={
+                capture_metadata={
                     "viewport": desktop_meta.viewport,
                     "quality": desktop_meta.quality,
-                    "s3_uploaded": s3_url is not None
+                    "blob_ref": desktop_meta.blob_ref
                 }
             )
             db.add(desktop_screenshot)
@@ -271,11 +288,6 @@ async def save_screenshots_to_db(
         if screenshot_results.mobile_screenshot:
             mobile_meta = screenshot_results.mobile_screenshot
             
-            # Try to upload to S3 if available
-            s3_url = mobile_meta.s3_url
-            if not s3_url and hasattr(mobile_meta, '_raw_image_data'):
-                s3_url = await upload_screenshot_to_s3(mobile_meta, assessment_id, "mobile")
-            
             mobile_screenshot = Screenshot(
                 assessment_id=assessment_id,
                 url=screenshot_results.url,
@@ -284,7 +296,7 @@ async def save_screenshots_to_db(
                 viewport_height=844,
                 device_scale_factor=2.0,
                 is_mobile=True,
-                image_url=s3_url or mobile_meta.signed_url,
+                image_url=screenshot_ref(mobile_meta),
                 image_format=mobile_meta.format,
                 image_width=mobile_meta.width,
                 image_height=mobile_meta.height,
@@ -295,10 +307,10 @@ async def save_screenshots_to_db(
                 quality_score=mobile_meta.quality,
                 is_complete=True,
                 has_errors=False,
-                metadata={
+                capture_metadata={
                     "viewport": mobile_meta.viewport,
                     "quality": mobile_meta.quality,
-                    "s3_uploaded": s3_url is not None
+                    "blob_ref": mobile_meta.blob_ref
                 },
                 user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
             )
@@ -321,7 +333,7 @@ async def save_screenshots_to_db(
                 error_message=screenshot_results.error_message,
                 processing_attempts=1,
                 has_errors=True,
-                metadata={
+                capture_metadata={
                     "total_duration_ms": screenshot_results.total_duration_ms,
                     "error": screenshot_results.error_message
                 }
@@ -345,6 +357,11 @@ async def save_screenshots_to_db(
         raise
 
 
+def _restore_screenshot_metadata(data: Optional[Dict[str, Any]]) -> Optional[ScreenshotMetadata]:
+    """Rebuild cached screenshot metadata; the image itself stays in the blob store."""
+    return ScreenshotMetadata(**data) if data else None
+
+@charges_lead
 async def capture_website_screenshots(url: str, lead_id: int, assessment_id: Optional[int] = None) -> ScreenshotResults:
     """
     Main entry point for website screenshot capture.
@@ -393,9 +410,23 @@ async def capture_website_screenshots(url: str, lead_id: int, assessment_id: Opt
         screenshot_client = ScreenshotOneClient()
         
         try:
-            # Capture screenshots
+            # Capture screenshots, reusing a recent capture of the same page
+            from src.assessments.result_cache import component_cache, canonical_url, record_cache_hit_cost
             logger.info(f"Starting screenshot capture for: {url}")
-            desktop_screenshot, mobile_screenshot = await screenshot_client.capture_screenshots_with_retry(url)
+            (desktop_screenshot, mobile_screenshot), provenance = await component_cache.get_or_compute(
+                "screenshots",
+                canonical_url(url),
+                lambda: screenshot_client.capture_screenshots_with_retry(url),
+                serialize=lambda pair: [m.dict() if m else None for m in pair],
+                deserialize=lambda data: tuple(_restore_screenshot_metadata(m) for m in data),
+                cost_of=lambda pair: ScreenshotOneClient.COST_PER_SCREENSHOT * sum(1 for m in pair if m),
+                # Only reuse complete captures
+                cacheable=lambda pair: all(pair)
+            )
+            if provenance.cache_hit:
+                desktop_cost.cost_cents = 0.0
+                mobile_cost.cost_cents = 0.0
+                await record_cache_hit_cost(lead_id, "screenshotone", provenance, assessment_id)
             
             # Update cost records with success/failure
             end_time = time.time()
@@ -436,13 +467,13 @@ async def capture_website_screenshots(url: str, lead_id: int, assessment_id: Opt
                 # Create a simple dict instead of a type object
                 screenshots_list.append({
                     'device_type': 'desktop',
-                    'screenshot_url': desktop_screenshot.s3_url or desktop_screenshot.signed_url or ''
+                    'screenshot_url': screenshot_ref(desktop_screenshot) or ''
                 })
             if mobile_screenshot:
                 # Create a simple dict instead of a type object
                 screenshots_list.append({
                     'device_type': 'mobile',
-                    'screenshot_url': mobile_screenshot.s3_url or mobile_screenshot.signed_url or ''
+                    'screenshot_url': screenshot_ref(mobile_screenshot) or ''
                 })
             
             # Create the results object
@@ -454,7 +485,8 @@ async def capture_website_screenshots(url: str, lead_id: int, assessment_id: Opt
                 screenshots=screenshots_list,
                 error_message=error_message,
                 total_duration_ms=total_duration,
-                cost_records=[]  # Exclude SQLAlchemy objects to avoid serialization issues
+                cost_records=[],  # Exclude SQLAlchemy objects to avoid serialization issues
+                cache_provenance=provenance.dict()
             )
             
             # Save to database if assessment_id is provided
@@ -473,6 +505,10 @@ async def capture_website_screenshots(url: str, lead_id: int, assessment_id: Opt
         finally:
             await screenshot_client.close()
             
+    except (CircuitOpenError, BudgetExceededError):
+        # Orchestrators skip the component instead of recording a failed capture
+        raise
+    
     except ScreenshotCaptureError as e:
         # Update cost records with error
         end_time = time.time()
@@ -573,61 +609,3 @@ def create_screenshot_cost_method(cls, lead_id: int, cost_cents: float = 0.20, v
 # Monkey patch the method to AssessmentCost
 AssessmentCost.create_screenshot_cost = classmethod(create_screenshot_cost_method)
 
-
-async def upload_screenshot_to_s3(
-    screenshot_metadata: ScreenshotMetadata,
-    assessment_id: int,
-    viewport: str
-) -> Optional[str]:
-    """
-    Upload screenshot image data to S3 if configured.
-    
-    Args:
-        screenshot_metadata: Screenshot metadata with raw image data
-        assessment_id: Assessment ID for organizing files
-        viewport: Viewport type (desktop/mobile)
-        
-    Returns:
-        S3 URL if uploaded successfully, None otherwise
-    """
-    try:
-        # Check if S3 is configured
-        if not settings.AWS_S3_BUCKET_NAME:
-            logger.debug("S3 not configured, skipping screenshot upload")
-            return None
-        
-        # Check if we have raw image data
-        if not hasattr(screenshot_metadata, '_raw_image_data'):
-            logger.warning("No raw image data available for S3 upload")
-            return None
-        
-        # Import S3 client (lazy import to avoid issues if not configured)
-        from src.core.storage.s3_client import S3Client
-        
-        # Generate S3 key
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        s3_key = f"screenshots/assessment_{assessment_id}/{viewport}_{timestamp}.{screenshot_metadata.format}"
-        
-        # Initialize S3 client and upload
-        s3_client = S3Client()
-        
-        # Upload the image data
-        file_url = s3_client.upload_file_object(
-            file_obj=io.BytesIO(screenshot_metadata._raw_image_data),
-            key=s3_key,
-            content_type=f"image/{screenshot_metadata.format}",
-            metadata={
-                "assessment_id": str(assessment_id),
-                "viewport": viewport,
-                "width": str(screenshot_metadata.width),
-                "height": str(screenshot_metadata.height),
-                "capture_timestamp": screenshot_metadata.capture_timestamp
-            }
-        )
-        
-        logger.info(f"Successfully uploaded screenshot to S3: {s3_key}")
-        return file_url
-        
-    except Exception as e:
-        logger.error(f"Failed to upload screenshot to S3: {e}")
-        return None
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+PRP-006: Screenshot Comparison
+"What changed since last time" diffs between stored screenshots, saved as ScreenshotComparison rows
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.assessments.image_processing import get_image_service, load_image_source
+from src.assessments.visual_diff import VisualDiff, compute_visual_diff
+from src.core.process_pool import pool_size
+from src.core.storage.blob_store import get_blob_store, is_blob_ref
+from src.models.lead import Assessment
+from src.models.screenshot import Screenshot, ScreenshotComparison, ScreenshotStatus, ScreenshotType
+
+logger = logging.getLogger(__name__)
+
+
+class ScreenshotComparisonError(Exception):
+    """Raised when two screenshots cannot be compared"""
+    pass
+
+
+@dataclass
+class HistoryComparisonStats:
+    """Outcome of comparing one lead's screenshot history"""
+    screenshots: int = 0
+    compared: int = 0
+    already_compared: int = 0
+    failed: int = 0
+
+
+async def diff_screenshots(before_ref: str, after_ref: str) -> VisualDiff:
+    """Diff two stored images; the pixel work runs in the image service"""
+    if not before_ref or not after_ref:
+        raise ScreenshotComparisonError("Both screenshots need a stored image")
+
+    # Blob keys are content hashes: the same reference means the same bytes
+    if before_ref == after_ref and is_blob_ref(before_ref):
+        return VisualDiff.identical()
+
+    try:
+        before, after = await asyncio.gather(load_image_source(before_ref), load_image_source(after_ref))
+        return await get_image_service().run("visual_diff", compute_visual_diff, before, after)
+    except Exception as e:
+        raise ScreenshotComparisonError(f"Failed to diff screenshots: {e}")
+
+
+async def save_comparison(
+    db: AsyncSession,
+    before: Screenshot,
+    after: Screenshot,
+    diff: VisualDiff,
+    comparison_type: str = "historical"
+) -> None:
+    """Store the heatmap and upsert the comparison row (left for the caller to commit)"""
+    diff_image_url = None
+    if diff.heatmap_png:
+        diff_image_url = await get_blob_store().put(
+            diff.heatmap_png, prefix="screenshot-diffs", extension="png", content_type="image/png"
+        )
+
+    values = dict(
+        visual_similarity_score=diff.similarity,
+        layout_changes=diff.layout_changes,
+        color_changes=diff.color_changes,
+        diff_image_url=diff_image_url,
+        diff_regions={"regions": diff.regions, "changed_fraction": diff.changed_fraction},
+        summary=diff.summary,
+    )
+    # A near-duplicate match may already have recorded this pair; keep its type
+    await db.execute(
+        insert(ScreenshotComparison)
+        .values(screenshot_a_id=before.id, screenshot_b_id=after.id, comparison_type=comparison_type, **values)
+        .on_conflict_do_update(constraint="uq_screenshot_comparison", set_=values)
+    )
+
+
+async def compare_screenshots(
+    db: AsyncSession,
+    before: Screenshot,
+    after: Screenshot,
+    comparison_type: str = "historical"
+) -> VisualDiff:
+    """Diff two screenshots and record the comparison"""
+    diff = await diff_screenshots(before.image_url, after.image_url)
+    await save_comparison(db, before, after, diff, comparison_type)
+    await db.commit()
+    return diff
+
+
+async def compare_lead_history(
+    db: AsyncSession,
+    lead_id: int,
+    screenshot_type: ScreenshotType = ScreenshotType.DESKTOP,
+    recompute: bool = False
+) -> HistoryComparisonStats:
+    """
+    Compare each of a lead's screenshots with the previous capture of the same
+    viewport.
+
+    Pairs that already have diff metrics are skipped unless recompute is set.
+    Diffs run concurrently, bounded by the pool size; rows are written once
+    at the end.
+    """
+    stmt = (
+        select(Screenshot)
+        .join(Assessment, Assessment.id == Screenshot.assessment_id)
+        .where(
+            Assessment.lead_id == lead_id,
+            Screenshot.screenshot_type == screenshot_type,
+            Screenshot.status == ScreenshotStatus.COMPLETED,
+            Screenshot.image_url.isnot(None),
+        )
+        .order_by(Screenshot.capture_timestamp)
+    )
+    screenshots = list((await db.execute(stmt)).scalars())
+    stats = HistoryComparisonStats(screenshots=len(screenshots))
+    pairs = list(zip(screenshots, screenshots[1:]))
+    if not pairs:
+        return stats
+
+    if not recompute:
+        done = set((await db.execute(
+            select(ScreenshotComparison.screenshot_a_id, ScreenshotComparison.screenshot_b_id).where(
+                tuple_(ScreenshotComparison.screenshot_a_id, ScreenshotComparison.screenshot_b_id).in_(
+                    [(before.id, after.id) for before, after in pairs]
+                ),
+                ScreenshotComparison.layout_changes.isnot(None),
+            )
+        )).all())
+        stats.already_compared = len(done)
+        pairs = [(before, after) for before, after in pairs if (before.id, after.id) not in done]
+
+    # Each in-flight diff holds both images in memory
+    limit = asyncio.Semaphore(pool_size())
+
+    async def diff(before: Screenshot, after: Screenshot) -> Optional[VisualDiff]:
+        async with limit:
+            try:
+                return await diff_screenshots(before.image_url, after.image_url)
+            except ScreenshotComparisonError as e:
+                logger.warning(f"Screenshot {before.id} -> {after.id} comparison failed: {e}")
+                return None
+
+    diffs = await asyncio.gather(*(diff(before, after) for before, after in pairs))
+    for (before, after), result in zip(pairs, diffs):
+        if result is None:
+            stats.failed += 1
+            continue
+        await save_comparison(db, before, after, result)
+        stats.compared += 1
+
+    await db.commit()
+    logger.info(f"Compared screenshot history for lead {lead_id}: {stats}")
+    return stats
@@ -0,0 +1,203 @@
+"""
+PRP-006: Screenshot Perceptual Hashing
+pHash/dHash fingerprints of screenshots and a near-duplicate index for reusing visual analyses
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+import numpy as np
+from PIL import Image
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.core.config import settings
+from src.models.screenshot import Screenshot, ScreenshotComparison, ScreenshotType
+from src.models.visual_analysis import AnalysisStatus, VisualAnalysis
+
+logger = logging.getLogger(__name__)
+
+HASH_BITS = 64
+_MASK = (1 << HASH_BITS) - 1
+
+# pHash keeps the lowest 8x8 frequencies of a 32x32 DCT
+_PHASH_SIZE = 32
+_PHASH_LOW = 8
+_k, _n = np.ogrid[:_PHASH_SIZE, :_PHASH_SIZE]
+_DCT = np.cos(np.pi * (2 * _n + 1) * _k / (2 * _PHASH_SIZE))  # DCT-II basis (unscaled)
+
+
+def _grayscale(image: Image.Image, size: tuple) -> np.ndarray:
+    return np.asarray(image.convert("L").resize(size, Image.Resampling.LANCZOS), dtype=np.float64)
+
+
+def _pack(bits: np.ndarray) -> int:
+    return int(np.packbits(bits.astype(np.uint8)).view(">u8")[0])
+
+
+@dataclass(frozen=True)
+class ImageHashes:
+    """64-bit perceptual (DCT) and difference (gradient) hashes of one image"""
+    phash: int
+    dhash: int
+
+    @classmethod
+    def of(cls, image: Image.Image) -> "ImageHashes":
+        pixels = _grayscale(image, (_PHASH_SIZE, _PHASH_SIZE))
+        low = (_DCT @ pixels @ _DCT.T)[:_PHASH_LOW, :_PHASH_LOW].ravel()
+        # The DC term is the mean brightness and would skew the median
+        phash = _pack(low > np.median(low[1:]))
+
+        pixels = _grayscale(image, (9, 8))
+        dhash = _pack(pixels[:, 1:] > pixels[:, :-1])
+        return cls(phash, dhash)
+
+    @classmethod
+    def from_hex(cls, value: str) -> "ImageHashes":
+        return cls(int(value[:16], 16), int(value[16:], 16))
+
+    def hex(self) -> str:
+        return f"{self.phash:016x}{self.dhash:016x}"
+
+    def distance(self, other: "ImageHashes") -> int:
+        """Bits that differ, taking the worse of the two hashes"""
+        return max(bin(self.phash ^ other.phash).count("1"), bin(self.dhash ^ other.dhash).count("1"))
+
+
+def to_db_hash(value: int) -> int:
+    """Unsigned 64-bit hash as the signed value a BIGINT column holds"""
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def hamming_distances(hashes: Any, target: Any) -> np.ndarray:
+    """
+    Bit distance between stored (signed) hashes and target, elementwise with
+    broadcasting, so one call scores every candidate in the index.
+    """
+    xor = np.asarray(hashes, dtype=np.int64).view(np.uint64) ^ np.asarray(target, dtype=np.int64).view(np.uint64)
+    bytes_ = np.ascontiguousarray(xor)[..., np.newaxis].view(np.uint8)
+    return np.unpackbits(bytes_, axis=-1).sum(axis=-1)
+
+
+@dataclass
+class NearDuplicate:
+    """Prior analysis whose screenshots match the ones being analyzed"""
+    visual_analysis_id: int
+    screenshot_id: int
+    distance: int
+    analysis_timestamp: datetime
+    raw_analysis_data: Dict[str, Any]
+
+
+async def find_near_duplicate(
+    db: AsyncSession,
+    desktop: ImageHashes,
+    mobile: ImageHashes,
+    max_distance: Optional[int] = None
+) -> Optional[NearDuplicate]:
+    """
+    Most similar completed visual analysis whose desktop and mobile screenshots
+    are both within max_distance bits of the given hashes.
+
+    Fetches only the hash columns of the most recent candidates and scores
+    them in one vectorized pass; the analysis itself is loaded for the winner.
+    """
+    max_distance = settings.VISUAL_REUSE_MAX_DISTANCE if max_distance is None else max_distance
+    desktop_shot = aliased(Screenshot)
+    mobile_shot = aliased(Screenshot)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.VISUAL_REUSE_MAX_AGE_DAYS)
+
+    stmt = (
+        select(
+            VisualAnalysis.id,
+            desktop_shot.id,
+            desktop_shot.perceptual_hash,
+            desktop_shot.difference_hash,
+            mobile_shot.perceptual_hash,
+            mobile_shot.difference_hash,
+        )
+        .join(desktop_shot, desktop_shot.id == VisualAnalysis.screenshot_id)
+        .join(mobile_shot, and_(
+            mobile_shot.assessment_id == VisualAnalysis.assessment_id,
+            mobile_shot.screenshot_type == ScreenshotType.MOBILE,
+        ))
+        .where(
+            VisualAnalysis.status == AnalysisStatus.COMPLETED,
+            VisualAnalysis.created_at >= cutoff,
+            desktop_shot.perceptual_hash.isnot(None),
+            desktop_shot.difference_hash.isnot(None),
+            mobile_shot.perceptual_hash.isnot(None),
+            mobile_shot.difference_hash.isnot(None),
+        )
+        .order_by(VisualAnalysis.created_at.desc())
+        .limit(settings.VISUAL_REUSE_MAX_CANDIDATES)
+    )
+    rows = (await db.execute(stmt)).all()
+    if not rows:
+        return None
+
+    candidates = np.array([row[2:] for row in rows], dtype=np.int64)
+    target = np.array([to_db_hash(h) for h in (desktop.phash, desktop.dhash, mobile.phash, mobile.dhash)], dtype=np.int64)
+    distances = hamming_distances(candidates, target).max(axis=1)
+    best = int(np.argmin(distances))
+    if distances[best] > max_distance:
+        return None
+
+    analysis = await db.get(VisualAnalysis, rows[best][0])
+    if analysis is None or not analysis.raw_analysis_data:
+        return None
+
+    logger.info(f"Screenshots match visual analysis {analysis.id} at distance {distances[best]} ({len(rows)} candidates)")
+    return NearDuplicate(
+        visual_analysis_id=analysis.id,
+        screenshot_id=rows[best][1],
+        distance=int(distances[best]),
+        analysis_timestamp=analysis.analysis_timestamp,
+        raw_analysis_data=analysis.raw_analysis_data,
+    )
+
+
+async def index_screenshots(db: AsyncSession, assessment_id: int, hashes: Dict[str, ImageHashes]) -> Dict[str, int]:
+    """
+    Store hashes on the assessment's screenshot rows, keyed by image reference.
+
+    Returns the screenshot id for each reference found. Changes are left for
+    the caller to commit.
+    """
+    if not hashes:
+        return {}
+
+    stmt = select(Screenshot).where(
+        Screenshot.assessment_id == assessment_id,
+        Screenshot.image_url.in_(list(hashes))
+    )
+    ids = {}
+    for screenshot in (await db.execute(stmt)).scalars():
+        image_hashes = hashes[screenshot.image_url]
+        screenshot.perceptual_hash = to_db_hash(image_hashes.phash)
+        screenshot.difference_hash = to_db_hash(image_hashes.dhash)
+        ids[screenshot.image_url] = screenshot.id
+    return ids
+
+
+async def record_near_duplicate(db: AsyncSession, prior_screenshot_id: int, screenshot_id: int,
+                                distance: int, visual_analysis_id: int) -> None:
+    """Record the match as a screenshot comparison (left for the caller to commit)"""
+    if prior_screenshot_id == screenshot_id:
+        return
+
+    await db.execute(
+        insert(ScreenshotComparison)
+        .values(
+            screenshot_a_id=prior_screenshot_id,
+            screenshot_b_id=screenshot_id,
+            comparison_type="near_duplicate",
+            visual_similarity_score=round(100 * (1 - distance / HASH_BITS), 1),
+            summary=f"Perceptual hash distance {distance}/{HASH_BITS}; reused visual analysis {visual_analysis_id}"
+        )
+        .on_conflict_do_nothing(constraint="uq_screenshot_comparison")
+    )
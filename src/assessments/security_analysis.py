@@ -4,14 +4,19 @@ Analyzes website security headers and SSL configuration
 """
 
 import asyncio
-import httpx
 import ssl
-import socket
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import logging
 from pydantic import BaseModel
 
+from src.assessments.link_checker import check_internal_links
+from src.assessments.seo_files import fetch_seo_files
+from src.assessments.site_fetch import get_site_fetch
+from src.core.bulk import BulkWriter
+from src.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,7 +30,10 @@ class SecurityMetrics(BaseModel):
     vulnerabilities: List[str] = []
     recommendations: List[str] = []
     analysis_timestamp: Optional[str] = None
+    seo_signals: Dict[str, Any] = {}
+    broken_links: Dict[str, Any] = {}
     cost_records: List[Any] = []
+    cache_provenance: Optional[Dict[str, Any]] = None
 
 
 REQUIRED_SECURITY_HEADERS = {
@@ -38,6 +46,9 @@ REQUIRED_SECURITY_HEADERS = {
     "Permissions-Policy": "Controls browser feature permissions"
 }
 
+# Vulnerability prefixes meaning the site could not be fetched at all
+FETCH_FAILURES = ("Failed to connect", "Website response timeout", "Analysis error")
+
 
 async def assess_security_headers(url: str, lead_id: Optional[int] = None, assessment_id: Optional[int] = None) -> SecurityMetrics:
     """
@@ -51,108 +62,40 @@ async def assess_security_headers(url: str, lead_id: Optional[int] = None, asses
     Returns:
         SecurityMetrics object with assessment results
     """
-    logger.info(f"Starting security assessment for {url}")
+    from src.assessments.result_cache import component_cache, canonical_url, record_cache_hit_cost
+    from urllib.parse import urlparse
     
-    metrics = SecurityMetrics(analysis_timestamp=datetime.utcnow().isoformat())
+    logger.info(f"Starting security assessment for {url}")
     
-    try:
-        # Check if URL uses HTTPS
-        metrics.has_https = url.startswith("https://")
-        
-        # Make HTTP request to check headers
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            timeout=30.0,
-            verify=False  # Allow self-signed certs for now
-        ) as client:
-            response = await client.get(url)
-            
-            # Analyze security headers
-            headers = response.headers
-            metrics.security_headers = {}
-            
-            for header, description in REQUIRED_SECURITY_HEADERS.items():
-                header_lower = header.lower()
-                value = headers.get(header_lower)
-                
-                if value:
-                    metrics.security_headers[header] = {
-                        "present": True,
-                        "value": value,
-                        "description": description
-                    }
-                else:
-                    metrics.missing_headers.append(header)
-                    metrics.security_headers[header] = {
-                        "present": False,
-                        "value": None,
-                        "description": description
-                    }
-            
-            # Check for additional security indicators
-            if headers.get("server"):
-                server_header = headers.get("server", "").lower()
-                if any(version in server_header for version in ["apache/", "nginx/", "iis/"]):
-                    metrics.vulnerabilities.append("Server version exposed in headers")
-            
-            # Calculate security score
-            total_headers = len(REQUIRED_SECURITY_HEADERS)
-            present_headers = total_headers - len(metrics.missing_headers)
-            base_score = int((present_headers / total_headers) * 70)
-            
-            # Add points for HTTPS
-            if metrics.has_https:
-                base_score += 20
-                metrics.ssl_grade = "A"  # Simplified SSL grade
-            else:
-                metrics.vulnerabilities.append("Site does not use HTTPS")
-                metrics.recommendations.append("Implement HTTPS with a valid SSL certificate")
-            
-            # Additional points for strong CSP
-            csp = headers.get("content-security-policy")
-            if csp and "default-src" in csp:
-                base_score += 10
-            
-            metrics.security_score = min(base_score, 100)
-            
-            # Generate recommendations
-            for header in metrics.missing_headers:
-                metrics.recommendations.append(f"Implement {header} header")
-            
-            # Check for cookies without secure flag
-            cookies = response.cookies
-            for cookie_name, cookie_value in cookies.items():
-                # Note: httpx doesn't expose all cookie attributes easily
-                metrics.recommendations.append(f"Ensure cookie '{cookie_name}' has Secure and HttpOnly flags")
-            
-            logger.info(f"Security assessment completed for {url}: score {metrics.security_score}")
-            
-    except httpx.ConnectError:
-        logger.error(f"Failed to connect to {url}")
-        metrics.vulnerabilities.append("Failed to connect to website")
-        metrics.security_score = 0
-    except httpx.TimeoutException:
-        logger.error(f"Timeout while analyzing {url}")
-        metrics.vulnerabilities.append("Website response timeout")
-        metrics.security_score = 0
-    except Exception as e:
-        logger.error(f"Security analysis failed for {url}: {e}")
-        metrics.vulnerabilities.append(f"Analysis error: {str(e)}")
-        metrics.security_score = 0
+    metrics, provenance = await component_cache.get_or_compute(
+        "security",
+        canonical_url(url),
+        lambda: _analyze_security_headers(url),
+        serialize=lambda m: m.dict(exclude={"cost_records", "cache_provenance"}),
+        deserialize=lambda data: SecurityMetrics(**data),
+        # Connection failures say nothing lasting about the site's headers,
+        # and incomplete SEO/link checks should be retried next time
+        cacheable=lambda m: (
+            not any(v.startswith(FETCH_FAILURES) for v in m.vulnerabilities)
+            and "error" not in m.seo_signals and "error" not in m.broken_links
+        )
+    )
+    metrics.cache_provenance = provenance.dict()
+    if provenance.cache_hit:
+        await record_cache_hit_cost(lead_id, "security_headers", provenance, assessment_id)
     
     # Save detailed security data to new tables if assessment_id provided
     if assessment_id:
         from src.core.database import AsyncSessionLocal
-        from urllib.parse import urlparse
         
         async with AsyncSessionLocal() as db:
             try:
                 # Get SSL certificate data if HTTPS
+                # (normally cached: the shared site fetch probed it alongside the page GET)
                 ssl_cert_data = None
                 if metrics.has_https:
                     try:
-                        hostname = urlparse(url).hostname
-                        ssl_cert_data = await analyze_ssl_certificate(hostname)
+                        ssl_cert_data = await analyze_ssl_certificate(urlparse(url).hostname)
                     except Exception as ssl_e:
                         logger.warning(f"Failed to get SSL certificate data: {ssl_e}")
                 
@@ -168,61 +111,183 @@ async def assess_security_headers(url: str, lead_id: Optional[int] = None, asses
     return metrics
 
 
-async def save_security_analysis_to_db(
-    db,
-    assessment_id: int,
-    security_metrics: SecurityMetrics,
-    ssl_cert_data: Optional[Dict[str, Any]] = None
-) -> None:
+def failed_security_metrics(url: str, error_type: Optional[str], error: Optional[str]) -> SecurityMetrics:
+    """Metrics for a site whose landing page could not be fetched"""
+    metrics = SecurityMetrics(analysis_timestamp=datetime.utcnow().isoformat(), has_https=url.startswith("https://"))
+    if error_type == "connect":
+        logger.error(f"Failed to connect to {url}")
+        metrics.vulnerabilities.append("Failed to connect to website")
+    elif error_type == "timeout":
+        logger.error(f"Timeout while analyzing {url}")
+        metrics.vulnerabilities.append("Website response timeout")
+    else:
+        logger.error(f"Security analysis failed for {url}: {error}")
+        metrics.vulnerabilities.append(f"Analysis error: {error}")
+    return metrics
+
+
+def score_security_headers(url: str, headers: Dict[str, str], cookies: List[Dict[str, Any]]) -> SecurityMetrics:
     """
-    Save security analysis results to the new database schema
+    Score a landing page's security headers and cookies
     
     Args:
-        db: Database session
-        assessment_id: Assessment ID to link results to
-        security_metrics: SecurityMetrics object with assessment results
-        ssl_cert_data: Optional SSL certificate data from analyze_ssl_certificate
+        url: URL that was requested
+        headers: Response headers with lowercased names
+        cookies: Parsed Set-Cookie attributes (see site_fetch.parse_set_cookie)
+        
+    Returns:
+        SecurityMetrics with headers, score, vulnerabilities and recommendations
     """
-    from src.models.security import (
-        SecurityAnalysis, SecurityHeader, SecurityVulnerability,
-        SecurityCookie, SecurityRecommendation
-    )
-    from datetime import datetime
+    metrics = SecurityMetrics(analysis_timestamp=datetime.utcnow().isoformat())
     
-    # Create main security analysis record
-    analysis = SecurityAnalysis(
-        assessment_id=assessment_id,
-        has_https=security_metrics.has_https,
-        ssl_grade=security_metrics.ssl_grade,
-        security_score=security_metrics.security_score,
-        analysis_timestamp=datetime.fromisoformat(security_metrics.analysis_timestamp) if security_metrics.analysis_timestamp else datetime.utcnow(),
-        raw_headers={k: v for k, v in security_metrics.security_headers.items()}
-    )
+    # Check if URL uses HTTPS
+    metrics.has_https = url.startswith("https://")
+    
+    for header, description in REQUIRED_SECURITY_HEADERS.items():
+        header_lower = header.lower()
+        value = headers.get(header_lower)
+        
+        if value:
+            metrics.security_headers[header] = {
+                "present": True,
+                "value": value,
+                "description": description
+            }
+        else:
+            metrics.missing_headers.append(header)
+            metrics.security_headers[header] = {
+                "present": False,
+                "value": None,
+                "description": description
+            }
+    
+    # Check for additional security indicators
+    if headers.get("server"):
+        server_header = headers.get("server", "").lower()
+        if any(version in server_header for version in ["apache/", "nginx/", "iis/"]):
+            metrics.vulnerabilities.append("Server version exposed in headers")
+    
+    # Calculate security score
+    total_headers = len(REQUIRED_SECURITY_HEADERS)
+    present_headers = total_headers - len(metrics.missing_headers)
+    base_score = int((present_headers / total_headers) * 70)
+    
+    # Add points for HTTPS
+    if metrics.has_https:
+        base_score += 20
+        metrics.ssl_grade = "A"  # Simplified SSL grade
+    else:
+        metrics.vulnerabilities.append("Site does not use HTTPS")
+        metrics.recommendations.append("Implement HTTPS with a valid SSL certificate")
+    
+    # Additional points for strong CSP
+    csp = headers.get("content-security-policy")
+    if csp and "default-src" in csp:
+        base_score += 10
+    
+    metrics.security_score = min(base_score, 100)
+    
+    # Generate recommendations
+    for header in metrics.missing_headers:
+        metrics.recommendations.append(f"Implement {header} header")
+    
+    # Check for cookies without Secure/HttpOnly flags
+    for cookie in cookies:
+        if not (cookie["secure"] and cookie["httponly"]):
+            metrics.recommendations.append(f"Ensure cookie '{cookie['name']}' has Secure and HttpOnly flags")
+    
+    return metrics
+
+
+async def _analyze_security_headers(url: str) -> SecurityMetrics:
+    """Score the security headers of the shared landing page fetch (uncached)"""
+    # SEO files and links share one deadline so they can't push the header
+    # result past the component timeout
+    deadline = time.monotonic() + settings.SECURITY_SIGNALS_TIME_BUDGET_SECONDS
+    
+    site = await get_site_fetch(url)
+    if not site.ok:
+        return failed_security_metrics(url, site.error_type, site.error)
+    
+    metrics = score_security_headers(url, site.headers, site.cookies)
+    
+    try:
+        # robots.txt/sitemap.xml live on the origin the landing page redirected to
+        metrics.seo_signals = await asyncio.wait_for(
+            fetch_seo_files(site.final_url), timeout=max(0.0, deadline - time.monotonic())
+        )
+    except Exception as e:
+        logger.warning(f"SEO file fetch failed for {url}: {e!r}")
+        metrics.seo_signals = {"error": f"SEO files not fetched: {e!r}"}
+    
+    if settings.LINK_CHECK_ENABLED and "html" in site.content_type:
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError("no time left in the security budget")
+            link_check = await check_internal_links(
+                site.final_url,
+                site.body,
+                sitemap_urls=metrics.seo_signals.get("sitemap_xml", {}).get("url_sample", []),
+                robots_rules=metrics.seo_signals.get("robots_txt", {}).get("rules"),
+                time_budget=remaining
+            )
+            metrics.broken_links = link_check.dict()
+        except Exception as e:
+            # A finding about the check, not about the site's security
+            logger.warning(f"Link check failed for {url}: {e!r}")
+            metrics.broken_links = {"error": f"Link check not completed: {e!r}"}
+    
+    logger.info(f"Security assessment completed for {url}: score {metrics.security_score}")
+    return metrics
+
+
+def _security_analysis_values(
+    assessment_id: int,
+    security_metrics: SecurityMetrics,
+    ssl_cert_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Column values for one security_analysis row"""
+    values = {
+        "assessment_id": assessment_id,
+        "has_https": security_metrics.has_https,
+        "ssl_grade": security_metrics.ssl_grade,
+        "security_score": security_metrics.security_score,
+        "analysis_timestamp": datetime.fromisoformat(security_metrics.analysis_timestamp) if security_metrics.analysis_timestamp else datetime.utcnow(),
+        "raw_headers": {k: v for k, v in security_metrics.security_headers.items()}
+    }
     
     # Add SSL certificate data if available
     if ssl_cert_data and ssl_cert_data.get("is_valid"):
-        analysis.ssl_issuer = ssl_cert_data.get("issuer", {}).get("organizationName", "Unknown")
-        analysis.ssl_protocol = ssl_cert_data.get("version")
-        analysis.ssl_certificate_data = ssl_cert_data
+        values["ssl_issuer"] = ssl_cert_data.get("issuer", {}).get("organizationName", "Unknown")
+        values["ssl_protocol"] = ssl_cert_data.get("protocol")
+        values["ssl_cipher_suite"] = ssl_cert_data.get("cipher")
+        values["ssl_certificate_data"] = ssl_cert_data
         
         # Parse SSL expiration date if available
         if ssl_cert_data.get("not_after"):
             try:
                 # SSL date format: 'Oct 15 23:59:59 2024 GMT'
-                from datetime import datetime
                 expires_str = ssl_cert_data["not_after"]
-                analysis.ssl_expires = datetime.strptime(expires_str, "%b %d %H:%M:%S %Y %Z")
+                values["ssl_expires"] = datetime.strptime(expires_str, "%b %d %H:%M:%S %Y %Z")
             except Exception as e:
                 logger.warning(f"Failed to parse SSL expiration date: {e}")
     
-    db.add(analysis)
-    await db.flush()  # Get the ID
+    return values
+
+
+def _queue_security_child_rows(rows: BulkWriter, analysis_id: int, security_metrics: SecurityMetrics) -> None:
+    """Queue header, vulnerability, recommendation and cookie rows for one analysis"""
+    from src.models.security import (
+        SecurityHeader, SecurityVulnerability, SecurityCookie, SecurityRecommendation
+    )
     
     # Save security headers
     for header_name, header_info in security_metrics.security_headers.items():
         if isinstance(header_info, dict):
-            header = SecurityHeader(
-                security_analysis_id=analysis.id,
+            rows.add(
+                SecurityHeader,
+                security_analysis_id=analysis_id,
                 header_name=header_name,
                 header_value=header_info.get("value"),
                 is_present=header_info.get("present", False),
@@ -230,7 +295,6 @@ async def save_security_analysis_to_db(
                 severity="high" if not header_info.get("present") else "info",
                 recommendation=header_info.get("description", "")
             )
-            db.add(header)
     
     # Save vulnerabilities
     for vuln_text in security_metrics.vulnerabilities:
@@ -248,14 +312,14 @@ async def save_security_analysis_to_db(
             vuln_type = "connectivity"
             severity = "critical"
         
-        vulnerability = SecurityVulnerability(
-            security_analysis_id=analysis.id,
+        rows.add(
+            SecurityVulnerability,
+            security_analysis_id=analysis_id,
             vulnerability_type=vuln_type,
             severity=severity,
             description=vuln_text,
             recommendation="Address this vulnerability to improve security posture"
         )
-        db.add(vulnerability)
     
     # Save recommendations
     priority = 1
@@ -278,8 +342,9 @@ async def save_security_analysis_to_db(
             impact = "medium"
             effort = "low"
         
-        recommendation = SecurityRecommendation(
-            security_analysis_id=analysis.id,
+        rows.add(
+            SecurityRecommendation,
+            security_analysis_id=analysis_id,
             category=category,
             priority=priority,
             title=rec_text[:255],  # Truncate if too long
@@ -287,7 +352,6 @@ async def save_security_analysis_to_db(
             impact=impact,
             estimated_effort=effort
         )
-        db.add(recommendation)
         priority += 1
     
     # Note: Cookie analysis would need to be enhanced in assess_security_headers
@@ -300,21 +364,128 @@ async def save_security_analysis_to_db(
             match = re.search(r"cookie '([^']+)'", rec_text)
             if match:
                 cookie_name = match.group(1)
-                cookie = SecurityCookie(
-                    security_analysis_id=analysis.id,
+                rows.add(
+                    SecurityCookie,
+                    security_analysis_id=analysis_id,
                     cookie_name=cookie_name,
                     has_secure_flag=False,  # Assumed from recommendation
                     has_httponly_flag=False,  # Assumed from recommendation
                     has_samesite=False,
                     recommendation="Set Secure and HttpOnly flags for this cookie"
                 )
-                db.add(cookie)
+
+
+async def save_security_analysis_to_db(
+    db,
+    assessment_id: int,
+    security_metrics: SecurityMetrics,
+    ssl_cert_data: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Save security analysis results to the new database schema
+    
+    Args:
+        db: Database session
+        assessment_id: Assessment ID to link results to
+        security_metrics: SecurityMetrics object with assessment results
+        ssl_cert_data: Optional SSL certificate data from analyze_ssl_certificate
+    """
+    from src.models.security import SecurityAnalysis
+    
+    # Create main security analysis record
+    analysis = SecurityAnalysis(**_security_analysis_values(assessment_id, security_metrics, ssl_cert_data))
+    db.add(analysis)
+    await db.flush()  # Get the ID
+    
+    # Child rows are written in bulk, one INSERT batch per table
+    rows = BulkWriter(db)
+    _queue_security_child_rows(rows, analysis.id, security_metrics)
+    await rows.flush()
+
+
+async def save_security_analyses_bulk(db, results: List[Tuple[int, SecurityMetrics]]) -> int:
+    """
+    Save many (assessment_id, SecurityMetrics) results with one INSERT batch
+    per table, parents included.
+    
+    Returns:
+        Number of security_analysis rows written
+    """
+    from sqlalchemy import insert
+    from src.models.security import SecurityAnalysis
+    
+    if not results:
+        return 0
+    
+    inserted = await db.execute(
+        insert(SecurityAnalysis).returning(SecurityAnalysis.id, sort_by_parameter_order=True),
+        [_security_analysis_values(assessment_id, metrics) for assessment_id, metrics in results]
+    )
+    rows = BulkWriter(db)
+    for analysis_id, (_, metrics) in zip(inserted.scalars().all(), results):
+        _queue_security_child_rows(rows, analysis_id, metrics)
+    await rows.flush()
+    return len(results)
+
+
+def _certificate_chain(ssl_object: ssl.SSLObject) -> List[Dict[str, Any]]:
+    """Subject/issuer of each certificate in the verified chain, leaf first"""
+    # Public from Python 3.13; earlier versions only expose it on the C object
+    get_chain = getattr(ssl_object, "get_verified_chain", None) or \
+        getattr(getattr(ssl_object, "_sslobj", None), "get_verified_chain", None)
+    if get_chain is None:
+        return []
+    
+    chain = []
+    for cert in get_chain():
+        # Certificate objects carry parsed fields; 3.13 returns bare DER bytes
+        info = cert.get_info() if hasattr(cert, "get_info") else {}
+        chain.append({
+            "subject": dict(x[0] for x in info.get("subject", [])),
+            "issuer": dict(x[0] for x in info.get("issuer", [])),
+            "not_after": info.get("notAfter")
+        })
+    return chain
+
+
+async def _probe_tls(hostname: str, port: int) -> Dict[str, Any]:
+    """Complete a TLS handshake without blocking the loop and read the negotiated session"""
+    context = ssl.create_default_context()
+    _, writer = await asyncio.wait_for(
+        asyncio.open_connection(hostname, port, ssl=context, server_hostname=hostname),
+        timeout=settings.TLS_PROBE_TIMEOUT_SECONDS
+    )
+    try:
+        ssl_object = writer.get_extra_info("ssl_object")
+        cert = ssl_object.getpeercert()
+        cipher_name, _, cipher_bits = ssl_object.cipher()
+        
+        return {
+            "issuer": dict(x[0] for x in cert.get("issuer", [])),
+            "subject": dict(x[0] for x in cert.get("subject", [])),
+            "version": cert.get("version"),
+            "serial_number": cert.get("serialNumber"),
+            "not_before": cert.get("notBefore"),
+            "not_after": cert.get("notAfter"),
+            "signature_algorithm": cert.get("signatureAlgorithm"),
+            "protocol": ssl_object.version(),
+            "cipher": cipher_name,
+            "cipher_bits": cipher_bits,
+            "chain": _certificate_chain(ssl_object),
+            "is_valid": True
+        }
+    finally:
+        # Nothing to send; skip the close_notify round trip
+        writer.transport.abort()
 
 
 async def analyze_ssl_certificate(hostname: str, port: int = 443) -> Dict[str, Any]:
     """
     Analyze SSL certificate details
     
+    Valid results are cached by hostname until shortly before the
+    certificate expires (capped so renewals are picked up).
+    
     Args:
         hostname: Domain to check
         port: Port number (default 443)
@@ -322,28 +493,28 @@ async def analyze_ssl_certificate(hostname: str, port: int = 443) -> Dict[str, A
     Returns:
         Dict with certificate details
     """
+    from src.core.cache import cache, CacheKeys
+    
+    cache_key = CacheKeys.tls_certificate(hostname, port)
+    cached = await cache.get(cache_key)
+    if cached:
+        return cached
+    
     try:
-        # Create SSL context
-        context = ssl.create_default_context()
-        
-        # Connect and get certificate
-        with socket.create_connection((hostname, port), timeout=10) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                cert = ssock.getpeercert()
-                
-                return {
-                    "issuer": dict(x[0] for x in cert.get("issuer", [])),
-                    "subject": dict(x[0] for x in cert.get("subject", [])),
-                    "version": cert.get("version"),
-                    "serial_number": cert.get("serialNumber"),
-                    "not_before": cert.get("notBefore"),
-                    "not_after": cert.get("notAfter"),
-                    "signature_algorithm": cert.get("signatureAlgorithm"),
-                    "is_valid": True
-                }
+        cert_data = await _probe_tls(hostname, port)
     except Exception as e:
         logger.error(f"SSL certificate analysis failed: {e}")
-        return {"is_valid": False, "error": str(e)}
+        return {"is_valid": False, "error": str(e) or type(e).__name__}
+    
+    try:
+        seconds_left = ssl.cert_time_to_seconds(cert_data["not_after"]) - time.time()
+    except (KeyError, TypeError, ValueError):
+        seconds_left = 0
+    ttl = int(min(seconds_left - settings.TLS_CERT_CACHE_EXPIRY_MARGIN_SECONDS,
+                  settings.TLS_CERT_CACHE_MAX_TTL_SECONDS))
+    if ttl > 0:
+        await cache.set(cache_key, cert_data, ttl=ttl)
+    return cert_data
 
 
 # Test function
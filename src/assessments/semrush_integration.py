@@ -14,6 +14,12 @@ import httpx
 from pydantic import BaseModel, Field
 
 from src.core.config import settings
+from src.core.provider_limits import SEMRUSH
+from src.core.budget import BudgetExceededError, budget_reservation, charges_lead
+from src.core.circuit_breaker import CircuitOpenError, circuit_guard
+from src.core.rate_limiter import acquire_rate_limit
+from src.core.http_clients import get_http_client
+from src.core.bulk import BulkWriter
 
 # Try to import AssessmentCost, but make it optional for testing
 try:
@@ -51,6 +57,7 @@ class SEMrushMetrics(BaseModel):
     analysis_timestamp: str = Field(..., description="When analysis was performed")
     api_cost_units: float = Field(0.0, description="API units consumed")
     extraction_duration_ms: int = Field(0, description="Time taken for analysis")
+    errors: List[str] = Field(default_factory=list, description="Failed sub-requests; their metrics are zeroed")
 
 class SEMrushResults(BaseModel):
     """Complete SEMrush assessment results."""
@@ -60,6 +67,7 @@ class SEMrushResults(BaseModel):
     error_message: Optional[str] = Field(None, description="Error details if failed")
     total_duration_ms: int = Field(0, description="Total processing time")
     cost_records: List[Any] = Field(default_factory=list, description="Cost tracking records")
+    cache_provenance: Optional[Dict[str, Any]] = Field(None, description="Result cache provenance")
     
     class Config:
         arbitrary_types_allowed = True
@@ -86,7 +94,11 @@ class SEMrushClient:
     
     def __init__(self):
         self.api_key = settings.SEMRUSH_API_KEY
-        self.client = httpx.AsyncClient(timeout=self.TIMEOUT)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client for the running event loop."""
+        return get_http_client("semrush")
         
     async def _check_api_balance(self) -> int:
         """Check remaining API units balance."""
@@ -95,13 +107,16 @@ class SEMrushClient:
             raise SEMrushIntegrationError("SEMrush API key not configured")
         
         try:
-            response = await self.client.get(
-                self.BASE_URL,
-                params={
-                    'type': 'api_units',
-                    'key': self.api_key
-                }
-            )
+            await acquire_rate_limit(SEMRUSH)
+            async with circuit_guard(SEMRUSH) as call:
+                response = await self.client.get(
+                    self.BASE_URL,
+                    params={
+                        'type': 'api_units',
+                        'key': self.api_key
+                    }
+                )
+                call.check(response.status_code)
             
             if response.status_code == 200:
                 balance_text = response.text.strip()
@@ -110,6 +125,8 @@ class SEMrushClient:
                 logger.warning(f"Failed to check API balance: {response.status_code}")
                 return 0
                 
+        except (CircuitOpenError, BudgetExceededError):
+            raise
         except Exception as e:
             logger.error(f"API balance check failed: {e}")
             return 0
@@ -128,7 +145,10 @@ class SEMrushClient:
             params.update(extra_params)
         
         try:
-            response = await self.client.get(self.BASE_URL, params=params)
+            await acquire_rate_limit(SEMRUSH)
+            async with budget_reservation(SEMRUSH, self.COST_PER_DOMAIN / len(self.COSTS)), circuit_guard(SEMRUSH) as call:
+                response = await self.client.get(self.BASE_URL, params=params)
+                call.check(response.status_code)
             
             if response.status_code == 200:
                 return response.text.strip()
@@ -142,6 +162,9 @@ class SEMrushClient:
         except httpx.TimeoutException:
             logger.error(f"SEMrush API timeout for {domain}")
             raise SEMrushIntegrationError("API request timed out")
+        except (CircuitOpenError, BudgetExceededError):
+            # Skip the domain rather than zeroing its metrics while SEMrush is failing or over budget
+            raise
         except Exception as e:
             logger.error(f"SEMrush API request failed: {e}")
             raise SEMrushIntegrationError(f"API request failed: {str(e)}")
@@ -200,8 +223,8 @@ class SEMrushClient:
             
             return {'authority_score': 0, 'api_cost': self.COSTS['domain_overview']}
             
-        except SEMrushIntegrationError:
-            return {'authority_score': 0, 'api_cost': 0}
+        except SEMrushIntegrationError as e:
+            return {'authority_score': 0, 'api_cost': 0, 'error': str(e)}
     
     async def _extract_backlink_analysis(self, domain: str) -> Dict[str, Any]:
         """Extract backlink toxicity score and analysis."""
@@ -238,8 +261,8 @@ class SEMrushClient:
             
             return {'toxicity_score': 0.0, 'api_cost': self.COSTS['backlinks_overview']}
             
-        except SEMrushIntegrationError:
-            return {'toxicity_score': 0.0, 'api_cost': 0}
+        except SEMrushIntegrationError as e:
+            return {'toxicity_score': 0.0, 'api_cost': 0, 'error': str(e)}
     
     async def _extract_organic_traffic(self, domain: str) -> Dict[str, Any]:
         """Extract organic traffic estimate and keyword rankings."""
@@ -285,8 +308,8 @@ class SEMrushClient:
             
             return {'traffic_estimate': 0, 'keywords_count': 0, 'api_cost': self.COSTS['domain_organic']}
             
-        except SEMrushIntegrationError:
-            return {'traffic_estimate': 0, 'keywords_count': 0, 'api_cost': 0}
+        except SEMrushIntegrationError as e:
+            return {'traffic_estimate': 0, 'keywords_count': 0, 'api_cost': 0, 'error': str(e)}
     
     async def _extract_site_health(self, domain: str) -> Dict[str, Any]:
         """Extract site health score and technical issues."""
@@ -348,8 +371,8 @@ class SEMrushClient:
                 'api_cost': self.COSTS['site_health']
             }
             
-        except SEMrushIntegrationError:
-            return {'health_score': 0.0, 'issues': [], 'api_cost': 0}
+        except SEMrushIntegrationError as e:
+            return {'health_score': 0.0, 'issues': [], 'api_cost': 0, 'error': str(e)}
     
     async def analyze_domain(self, domain: str) -> SEMrushMetrics:
         """Perform comprehensive domain analysis."""
@@ -378,9 +401,15 @@ class SEMrushClient:
             )
             
             # Handle any exceptions from parallel execution
+            errors = []
             for data in [authority_data, backlink_data, traffic_data, health_data]:
+                if isinstance(data, (CircuitOpenError, BudgetExceededError)):
+                    raise data
                 if isinstance(data, Exception):
                     logger.error(f"SEMrush analysis component failed: {data}")
+                    errors.append(str(data))
+                elif data.get('error'):
+                    errors.append(data['error'])
             
             # Ensure we have valid data dictionaries
             authority_data = authority_data if isinstance(authority_data, dict) else {'authority_score': 0, 'api_cost': 0}
@@ -416,19 +445,22 @@ class SEMrushClient:
                 domain=domain,
                 analysis_timestamp=datetime.now(timezone.utc).isoformat(),
                 api_cost_units=total_cost,
-                extraction_duration_ms=duration_ms
+                extraction_duration_ms=duration_ms,
+                errors=errors
             )
             
             logger.info(f"SEMrush analysis completed for {domain}: {total_cost} units, {duration_ms}ms")
             return metrics
             
+        except (CircuitOpenError, BudgetExceededError):
+            raise
         except Exception as e:
             logger.error(f"SEMrush domain analysis failed for {domain}: {e}")
             raise SEMrushIntegrationError(f"Domain analysis failed: {str(e)}")
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Kept for callers; the shared HTTP client is closed at shutdown."""
+        pass
 
 async def save_semrush_analysis_to_db(
     semrush_results: SEMrushResults,
@@ -497,7 +529,8 @@ async def save_semrush_analysis_to_db(
                 .where(SEMrushTechnicalIssue.semrush_analysis_id == analysis.id)
             )
         
-        # Save technical issues
+        # Save technical issues in one bulk insert
+        rows = BulkWriter(db)
         for issue in metrics.technical_issues:
             # Map severity
             severity_map = {
@@ -514,14 +547,15 @@ async def save_semrush_analysis_to_db(
                 "Technical": IssueType.TECHNICAL
             }
             
-            technical_issue = SEMrushTechnicalIssue(
+            rows.add(
+                SEMrushTechnicalIssue,
                 semrush_analysis_id=analysis.id,
                 issue_type=type_map.get(issue.issue_type, IssueType.TECHNICAL),
                 severity=severity_map.get(issue.severity, IssueSeverity.MEDIUM),
                 category=issue.category,
                 description=issue.description
             )
-            db.add(technical_issue)
+        await rows.flush()
         
         await db.commit()
         logger.info(f"Saved SEMrush analysis for {metrics.domain} to assessment {assessment_id}")
@@ -532,6 +566,7 @@ async def save_semrush_analysis_to_db(
         raise
 
 
+@charges_lead
 async def assess_semrush_domain(domain: str, lead_id: int, assessment_id: Optional[int] = None) -> SEMrushResults:
     """
     Main entry point for SEMrush domain assessment.
@@ -562,9 +597,22 @@ async def assess_semrush_domain(domain: str, lead_id: int, assessment_id: Option
         semrush_client = SEMrushClient()
         
         try:
-            # Perform domain analysis
+            # Perform domain analysis, reusing recent metrics for the same domain
+            from src.assessments.result_cache import component_cache, canonical_domain, record_cache_hit_cost
             logger.info(f"Starting SEMrush analysis for: {domain}")
-            metrics = await semrush_client.analyze_domain(domain)
+            metrics, provenance = await component_cache.get_or_compute(
+                "semrush",
+                canonical_domain(domain),
+                lambda: semrush_client.analyze_domain(domain),
+                serialize=lambda m: m.dict(),
+                deserialize=lambda data: SEMrushMetrics(**data),
+                cost_of=lambda _: SEMrushClient.COST_PER_DOMAIN,
+                # Zeroed metrics from failed sub-requests would be served for the full TTL
+                cacheable=lambda m: not m.errors and m.api_cost_units > 0
+            )
+            if provenance.cache_hit:
+                cost_record.cost_cents = 0.0
+                await record_cache_hit_cost(lead_id, "semrush", provenance, assessment_id)
             
             # Update cost record with success
             end_time = time.time()
@@ -578,7 +626,8 @@ async def assess_semrush_domain(domain: str, lead_id: int, assessment_id: Option
                 success=True,
                 metrics=metrics,
                 total_duration_ms=int((end_time - start_time) * 1000),
-                cost_records=[]  # Exclude SQLAlchemy objects to avoid serialization issues
+                cost_records=[],  # Exclude SQLAlchemy objects to avoid serialization issues
+                cache_provenance=provenance.dict()
             )
             
             # Save to database if assessment_id provided
@@ -609,6 +658,10 @@ async def assess_semrush_domain(domain: str, lead_id: int, assessment_id: Option
             cost_records=[]  # Exclude SQLAlchemy objects to avoid serialization issues
         )
     
+    except (CircuitOpenError, BudgetExceededError):
+        # Orchestrators skip the component instead of recording a failure
+        raise
+    
     except Exception as e:
         # Update cost record with unexpected error
         end_time = time.time()
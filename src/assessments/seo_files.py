@@ -0,0 +1,264 @@
+"""
+PRP-004: SEO File Fetcher
+Direct concurrent fetch of robots.txt and sitemap.xml with streamed, size-capped parsing
+"""
+
+import asyncio
+import logging
+import zlib
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+from lxml import etree
+
+from src.core.cache import cache, CacheKeys
+from src.core.config import settings
+from src.core.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+class RobotsTxtReader:
+    """
+    Buffers robots.txt (small by definition), extracting Sitemap directives
+    and the Allow/Disallow rules that apply to all user agents.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+
+    def close(self) -> None:
+        pass
+
+    def summary(self) -> Dict[str, Any]:
+        text = b"".join(self._chunks).decode("utf-8", errors="replace")
+        sitemap_urls, rules = [], []
+        agents, in_rules = [], False
+        for line in text.splitlines():
+            name, _, value = line.partition(":")
+            name, value = name.strip().lower(), value.strip()
+            if name == "sitemap" and value:
+                sitemap_urls.append(value)
+            elif name == "user-agent":
+                # A user-agent line after rules starts a new group
+                if in_rules:
+                    agents, in_rules = [], False
+                agents.append(value.split("#", 1)[0].strip())
+            elif name in ("allow", "disallow"):
+                in_rules = True
+                if "*" in agents:
+                    rules.append(f"{name.capitalize()}: {value.split('#', 1)[0].strip()}")
+        return {
+            'has_sitemap_directive': bool(sitemap_urls),
+            'sitemap_urls': sitemap_urls[:settings.SEO_SITEMAP_MAX_CHILDREN],
+            'rules': rules[:200]
+        }
+
+
+class SitemapCounter:
+    """
+    Incremental sitemap parser fed one chunk at a time.
+
+    Uses lxml's pull parser (the feed-driven form of iterparse) to count
+    <url> entries in a urlset and collect <loc>s from a sitemapindex. Each
+    entry is cleared and detached once counted, so memory stays flat no
+    matter how large the sitemap is. The first few page URLs are kept as a
+    sample for the link checker.
+    """
+
+    def __init__(self):
+        self._parser = etree.XMLPullParser(
+            events=("start", "end"), resolve_entities=False, no_network=True
+        )
+        self.root_tag: Optional[str] = None
+        self.url_count = 0
+        self.sitemap_count = 0
+        self.child_sitemaps: List[str] = []
+        self.url_sample: List[str] = []
+        self.error: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> None:
+        if self.error is None:
+            try:
+                self._parser.feed(chunk)
+                self._drain()
+            except etree.XMLSyntaxError as e:
+                self.error = str(e)[:200]
+
+    def close(self) -> None:
+        if self.error is None:
+            try:
+                self._parser.close()
+                self._drain()
+            except etree.XMLSyntaxError as e:
+                self.error = str(e)[:200]
+
+    def _drain(self) -> None:
+        for event, elem in self._parser.read_events():
+            tag = etree.QName(elem).localname
+            if event == "start":
+                if self.root_tag is None:
+                    self.root_tag = tag
+                continue
+
+            if tag == "url":
+                self.url_count += 1
+                if len(self.url_sample) < settings.LINK_CHECK_SITEMAP_SAMPLE_SIZE:
+                    loc = (elem.findtext("{*}loc") or "").strip()
+                    if loc:
+                        self.url_sample.append(loc)
+            elif tag == "sitemap":
+                self.sitemap_count += 1
+                loc = (elem.findtext("{*}loc") or "").strip()
+                if loc and len(self.child_sitemaps) < settings.SEO_SITEMAP_MAX_CHILDREN:
+                    self.child_sitemaps.append(loc)
+            else:
+                continue
+
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'is_valid_xml': self.error is None and self.root_tag in ("urlset", "sitemapindex"),
+            'is_index': self.root_tag == "sitemapindex",
+            'url_count': self.url_count,
+            'sitemap_count': self.sitemap_count,
+            'child_sitemaps': self.child_sitemaps,
+            'url_sample': self.url_sample,
+            **({'parse_error': self.error} if self.error else {})
+        }
+
+
+def _decoder_for(url: str, response: httpx.Response):
+    """Gzip sitemaps are served as files, not with Content-Encoding, so httpx leaves them packed."""
+    content_type = response.headers.get("content-type", "")
+    if urlparse(url).path.endswith(".gz") or "gzip" in content_type:
+        return zlib.decompressobj(zlib.MAX_WBITS | 32)
+    return None
+
+
+async def _fetch_file(url: str, reader: Any, max_bytes: int) -> Dict[str, Any]:
+    """
+    Conditionally GET one file and stream it into reader, stopping at max_bytes.
+
+    Validators from the last 200 are sent as If-None-Match/If-Modified-Since;
+    a 304 returns the result cached alongside them.
+    """
+    cache_key = CacheKeys.seo_file(url)
+    cached = await cache.get(cache_key)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    result = {'url': url, 'present': False, 'status_code': None, 'size_bytes': 0, 'truncated': False}
+    try:
+        client = get_http_client("site")
+        async with client.stream(
+            "GET", url, headers=headers, timeout=settings.SEO_FILE_TIMEOUT_SECONDS
+        ) as response:
+            result['status_code'] = response.status_code
+            if response.status_code == 304 and cached:
+                return {**cached["result"], 'not_modified': True}
+            if response.status_code != 200:
+                return {**result, **reader.summary()}
+
+            decoder = _decoder_for(url, response)
+            async for chunk in response.aiter_bytes():
+                remaining = max_bytes - result['size_bytes']
+                data = decoder.decompress(chunk, remaining + 1) if decoder else chunk
+                if len(data) > remaining:
+                    reader.feed(data[:remaining])
+                    result['size_bytes'] = max_bytes
+                    result['truncated'] = True
+                    break
+                reader.feed(data)
+                result['size_bytes'] += len(data)
+
+            if not result['truncated']:
+                reader.close()
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+    except (httpx.HTTPError, zlib.error) as e:
+        return {**result, **reader.summary(), 'error': str(e)[:200]}
+
+    result = {**result, 'present': True, **reader.summary()}
+    if etag or last_modified:
+        await cache.set(
+            cache_key,
+            {"etag": etag, "last_modified": last_modified, "result": result},
+            ttl=settings.SEO_FILE_CACHE_TTL_SECONDS
+        )
+    return result
+
+
+async def fetch_robots_txt(origin: str) -> Dict[str, Any]:
+    return await _fetch_file(f"{origin}/robots.txt", RobotsTxtReader(), settings.SEO_ROBOTS_MAX_BYTES)
+
+
+async def fetch_sitemap(url: str) -> Dict[str, Any]:
+    """
+    Fetch a sitemap and count its URLs. For a sitemap index the child
+    sitemaps are fetched concurrently (one level deep, up to
+    SEO_SITEMAP_MAX_CHILDREN) and their URL counts summed.
+    """
+    sitemap = await _fetch_file(url, SitemapCounter(), settings.SEO_SITEMAP_MAX_BYTES)
+    if not sitemap.get('is_index'):
+        sitemap['url_count_complete'] = sitemap['present'] and not sitemap['truncated']
+        return sitemap
+
+    children = await asyncio.gather(*(
+        _fetch_file(child, SitemapCounter(), settings.SEO_SITEMAP_MAX_BYTES)
+        for child in sitemap['child_sitemaps']
+    ))
+    sitemap['url_count'] = sum(child.get('url_count', 0) for child in children)
+    sitemap['url_sample'] = [
+        url for child in children for url in child.get('url_sample', [])
+    ][:settings.LINK_CHECK_SITEMAP_SAMPLE_SIZE]
+    sitemap['url_count_complete'] = (
+        not sitemap['truncated']
+        and len(children) == sitemap['sitemap_count']
+        and all(child['present'] and not child['truncated'] for child in children)
+    )
+    return sitemap
+
+
+async def fetch_seo_files(base_url: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch robots.txt and sitemap.xml for a site's origin concurrently over
+    the pooled site client.
+
+    If /sitemap.xml is missing, the first Sitemap directive in robots.txt
+    is tried instead.
+
+    Returns:
+        {'robots_txt': {...}, 'sitemap_xml': {...}}; errors are reported in
+        the per-file dicts rather than raised
+    """
+    parsed = urlparse(base_url)
+    if not parsed.scheme or not parsed.netloc:
+        error = f'URL parsing error: {base_url!r}'
+        return {
+            'robots_txt': {'present': False, 'error': error},
+            'sitemap_xml': {'present': False, 'error': error}
+        }
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    default_sitemap = f"{origin}/sitemap.xml"
+
+    robots_txt, sitemap_xml = await asyncio.gather(
+        fetch_robots_txt(origin), fetch_sitemap(default_sitemap)
+    )
+
+    declared = [u for u in robots_txt.get('sitemap_urls', []) if u != default_sitemap]
+    if not sitemap_xml['present'] and declared:
+        sitemap_xml = await fetch_sitemap(declared[0])
+
+    return {'robots_txt': robots_txt, 'sitemap_xml': sitemap_xml}
@@ -19,7 +19,7 @@ async def run_pagespeed_assessment(url: str, business_name: str = "") -> Dict[st
         logger.info(f"Starting PageSpeed assessment for {url}")
         
         # Import PageSpeed client directly - bypass the assess_pagespeed wrapper that uses database
-        from src.assessments.pagespeed import get_pagespeed_client
+        from src.assessments.pagespeed import get_pagespeed_client, trim_lighthouse_result
         
         # Get the PageSpeed client
         client = get_pagespeed_client()
@@ -35,14 +35,14 @@ async def run_pagespeed_assessment(url: str, business_name: str = "") -> Dict[st
         pagespeed_data = {
             "mobile_analysis": {
                 "core_web_vitals": mobile_result.core_web_vitals.dict() if mobile_result else {},
-                "lighthouse_result": mobile_result.lighthouse_result if mobile_result else {},
+                "lighthouse_result": trim_lighthouse_result(mobile_result.lighthouse_result) if mobile_result else {},
                 "url": mobile_result.url if mobile_result else url,
                 "strategy": mobile_result.strategy if mobile_result else "mobile",
                 "analysis_timestamp": mobile_result.analysis_timestamp if mobile_result else datetime.now().isoformat()
             } if mobile_result else {},
             "desktop_analysis": {
                 "core_web_vitals": desktop_result.core_web_vitals.dict() if desktop_result else {},
-                "lighthouse_result": desktop_result.lighthouse_result if desktop_result else {},
+                "lighthouse_result": trim_lighthouse_result(desktop_result.lighthouse_result) if desktop_result else {},
                 "url": desktop_result.url if desktop_result else url,
                 "strategy": desktop_result.strategy if desktop_result else "desktop",
                 "analysis_timestamp": desktop_result.analysis_timestamp if desktop_result else datetime.now().isoformat()
@@ -0,0 +1,203 @@
+"""
+PRP-004: Site Fetch Stage
+One landing page fetch per assessment, shared by security, technical and SEO checks
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+class SiteFetch(BaseModel):
+    """Landing page artifact: redirects, headers, cookies, TLS session and a capped body"""
+    requested_url: str
+    final_url: Optional[str] = None
+    status_code: Optional[int] = None
+    redirect_chain: List[Dict[str, Any]] = []
+    headers: Dict[str, str] = {}
+    cookies: List[Dict[str, Any]] = []
+    tls: Dict[str, Any] = {}
+    content_type: str = ""
+    body: str = ""
+    body_bytes: int = 0
+    body_truncated: bool = False
+    elapsed_ms: int = 0
+    fetched_at: Optional[str] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None  # connect, timeout or other
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def parse_set_cookie(header: str, url: str) -> Optional[Dict[str, Any]]:
+    """Cookie name and attributes from a Set-Cookie header (the value is not kept)"""
+    name_value, *attributes = [part.strip() for part in header.split(";")]
+    name, has_value, _ = name_value.partition("=")
+    if not has_value or not name.strip():
+        return None
+
+    attrs = {}
+    for attribute in attributes:
+        key, _, value = attribute.partition("=")
+        attrs[key.strip().lower()] = value.strip()
+    return {
+        'name': name.strip(),
+        'set_by': url,
+        'secure': 'secure' in attrs,
+        'httponly': 'httponly' in attrs,
+        'samesite': attrs.get('samesite') or None,
+        'domain': attrs.get('domain') or None,
+        'path': attrs.get('path') or None,
+        'expires': attrs.get('expires') or None,
+        'max_age': attrs.get('max-age') or None
+    }
+
+
+def _session_info(response: httpx.Response) -> Dict[str, Any]:
+    """Protocol and cipher negotiated on the connection that served the response"""
+    stream = response.extensions.get("network_stream")
+    ssl_object = stream.get_extra_info("ssl_object") if stream is not None else None
+    if ssl_object is None:
+        return {}
+    cipher_name, _, cipher_bits = ssl_object.cipher() or (None, None, None)
+    return {'protocol': ssl_object.version(), 'cipher': cipher_name, 'cipher_bits': cipher_bits}
+
+
+async def _certificate(hostname: Optional[str]) -> Optional[Dict[str, Any]]:
+    from src.assessments.security_analysis import analyze_ssl_certificate
+
+    return await analyze_ssl_certificate(hostname) if hostname else None
+
+
+@asynccontextmanager
+async def _follow_redirects(client: httpx.AsyncClient, url: str) -> AsyncIterator[httpx.Response]:
+    """Streamed GET whose redirect hops share a per-fetch cookie jar (history is on the response)"""
+    cookies = httpx.Cookies()
+    request = client.build_request("GET", url, timeout=settings.SITE_FETCH_TIMEOUT_SECONDS)
+    history: List[httpx.Response] = []
+    while True:
+        # Only this fetch's cookies, whatever the client's own jar holds
+        request.headers.pop("cookie", None)
+        cookies.set_cookie_header(request)
+        response = await client.send(request, stream=True, follow_redirects=False)
+        cookies.extract_cookies(response)
+        if response.next_request is None:
+            break
+        await response.aclose()
+        history.append(response)
+        if len(history) > client.max_redirects:
+            raise httpx.TooManyRedirects("Exceeded maximum allowed redirects", request=request)
+        request = response.next_request
+
+    response.history = history
+    try:
+        yield response
+    finally:
+        await response.aclose()
+
+
+async def fetch_site(url: str) -> SiteFetch:
+    """
+    Fetch the landing page once, following redirects (uncached).
+
+    Redirects are followed here with a cookie jar of this fetch's own, so
+    cookies set along the chain are replayed like a first-time visitor's
+    browser would, and nothing carries over to the next fetch. The
+    certificate is probed alongside the GET. The body is streamed and kept
+    up to SITE_FETCH_MAX_BODY_BYTES; failures are reported on the artifact
+    rather than raised.
+    """
+    started = time.monotonic()
+    site = SiteFetch(requested_url=url, fetched_at=datetime.now(timezone.utc).isoformat())
+    requested_host = urlparse(url).hostname
+    cert_task = asyncio.create_task(_certificate(requested_host)) if url.startswith("https://") else None
+
+    try:
+        client = get_http_client("site")
+        async with _follow_redirects(client, url) as response:
+            site.final_url = str(response.url)
+            site.status_code = response.status_code
+            site.redirect_chain = [
+                {'url': str(hop.url), 'status_code': hop.status_code, 'location': hop.headers.get("location")}
+                for hop in response.history
+            ]
+            site.headers = {name.lower(): value for name, value in response.headers.items() if name.lower() != "set-cookie"}
+            site.cookies = [
+                cookie
+                for hop in [*response.history, response]
+                for header in hop.headers.get_list("set-cookie")
+                if (cookie := parse_set_cookie(header, str(hop.url)))
+            ]
+            site.content_type = response.headers.get("content-type", "")
+            site.tls = _session_info(response)
+
+            chunks = []
+            async for chunk in response.aiter_bytes():
+                remaining = settings.SITE_FETCH_MAX_BODY_BYTES - site.body_bytes
+                if len(chunk) > remaining:
+                    chunks.append(chunk[:remaining])
+                    site.body_bytes += remaining
+                    site.body_truncated = True
+                    break
+                chunks.append(chunk)
+                site.body_bytes += len(chunk)
+            site.body = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+    except httpx.ConnectError as e:
+        site.error, site.error_type = str(e) or "Connection failed", "connect"
+    except httpx.TimeoutException as e:
+        site.error, site.error_type = str(e) or "Timed out", "timeout"
+    except Exception as e:
+        site.error, site.error_type = str(e) or type(e).__name__, "other"
+
+    if cert_task:
+        final_host = urlparse(site.final_url or url).hostname
+        if site.final_url and not site.final_url.startswith("https://"):
+            cert_task.cancel()
+        elif final_host != requested_host:
+            # Redirected to another host; its certificate is the one that matters
+            cert_task.cancel()
+            site.tls['certificate'] = await _certificate(final_host)
+        else:
+            site.tls['certificate'] = await cert_task
+    elif site.final_url and site.final_url.startswith("https://"):
+        site.tls['certificate'] = await _certificate(urlparse(site.final_url).hostname)
+
+    site.elapsed_ms = int((time.monotonic() - started) * 1000)
+    if site.error:
+        logger.warning(f"Site fetch failed for {url}: {site.error}")
+    return site
+
+
+async def get_site_fetch(url: str) -> SiteFetch:
+    """
+    Shared landing page artifact for url.
+
+    Goes through the component cache, so every component of an assessment
+    (and concurrent assessments of the same site, in any process) reuses a
+    single fetch. Failed fetches are shared while in flight but not cached.
+    """
+    from src.assessments.result_cache import component_cache, canonical_url
+
+    site, _ = await component_cache.get_or_compute(
+        "site_fetch",
+        canonical_url(url),
+        lambda: fetch_site(url),
+        serialize=lambda s: s.dict(),
+        deserialize=lambda data: SiteFetch(**data),
+        cacheable=lambda s: s.ok
+    )
+    return site
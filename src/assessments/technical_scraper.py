@@ -8,13 +8,15 @@ import time
 import logging
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
-from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 from celery import current_app
 from pydantic import BaseModel, Field
 
 from src.core.config import settings
+from src.core.browser_pool import get_browser_pool
+from src.assessments.seo_files import fetch_seo_files
+from src.assessments.site_fetch import get_site_fetch
 from src.models.assessment_cost import AssessmentCost
 
 logger = logging.getLogger(__name__)
@@ -90,95 +92,109 @@ async def scrape_technical_data_async(url: str, timeout: int = 15000) -> Dict[st
     """
     start_time = time.time()
     
-    # Memory-optimized browser configuration
-    browser_args = [
-        '--no-sandbox',
-        '--disable-dev-shm-usage', 
-        '--disable-gpu',
-        '--memory-pressure-off',
-        '--max_old_space_size=200',  # Limit to 200MB
-        '--disable-web-security',
-        '--disable-features=TranslateUI',
-        '--disable-extensions',
-        '--disable-plugins'
-    ]
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=browser_args
-        )
+    # Headers, TLS and robots.txt/sitemap.xml need no browser; the shared
+    # site fetch and SEO checks run while the page loads
+    site_task = asyncio.create_task(get_site_fetch(url))
+    seo_task = asyncio.create_task(_detect_seo_after_fetch(site_task, url))
+    try:
+        return await _scrape_page(url, timeout, start_time, site_task, seo_task)
+    finally:
+        for task in (site_task, seo_task):
+            if not task.done():
+                task.cancel()
+
+
+async def _detect_seo_after_fetch(site_task: asyncio.Task, url: str) -> Dict[str, Any]:
+    site = await site_task
+    return await detect_seo_signals(site.final_url or url)
+
+
+async def _playwright_tls(response) -> Dict[str, Any]:
+    """TLS details from the browser, for when the shared site fetch failed"""
+    try:
+        security_details = await response.security_details()
+    except (AttributeError, TypeError):
+        # Some responses don't have security_details method or it's not available
+        return {}
+    if not security_details:
+        return {}
+    return {'protocol': security_details.get('protocol', 'Unknown'), 'certificate': {'is_valid': True}}
+
+
+async def _scrape_page(
+    url: str, timeout: int, start_time: float, site_task: asyncio.Task, seo_task: asyncio.Task
+) -> Dict[str, Any]:
+    # Fresh isolated context on a pooled browser; launch cost is paid once per worker
+    async with get_browser_pool().context(
+        viewport={'width': 1280, 'height': 720},
+        user_agent='LeadFactory-Security-Scanner/1.0',
+        ignore_https_errors=True  # Allow SSL analysis even with invalid certs
+    ) as context:
+        page = await context.new_page()
         
-        context = await browser.new_context(
-            viewport={'width': 1280, 'height': 720},
-            user_agent='LeadFactory-Security-Scanner/1.0',
-            ignore_https_errors=True  # Allow SSL analysis even with invalid certs
-        )
+        # Set navigation timeout
+        page.set_default_timeout(timeout)
+        
+        # Resource optimization - block non-essential resources
+        await page.route('**/*.{png,jpg,jpeg,gif,webp,svg,mp4,mp3,pdf,woff,woff2}', 
+                        lambda route: route.abort())
+        
+        # JavaScript error collection
+        js_errors = []
+        def handle_console_message(msg):
+            if msg.type in ['error', 'warning'] and len(js_errors) < 10:  # Limit for memory
+                js_errors.append({
+                    'type': msg.type,
+                    'text': msg.text[:500],  # Limit message length
+                    'location': str(getattr(msg, 'location', 'unknown'))[:200],
+                    'timestamp': time.time()
+                })
         
+        page.on('console', handle_console_message)
+        
+        # Navigate to target URL
         try:
-            page = await context.new_page()
-            
-            # Set navigation timeout
-            page.set_default_timeout(timeout)
-            
-            # Resource optimization - block non-essential resources
-            await page.route('**/*.{png,jpg,jpeg,gif,webp,svg,mp4,mp3,pdf,woff,woff2}', 
-                            lambda route: route.abort())
-            
-            # JavaScript error collection
-            js_errors = []
-            def handle_console_message(msg):
-                if msg.type in ['error', 'warning'] and len(js_errors) < 10:  # Limit for memory
-                    js_errors.append({
-                        'type': msg.type,
-                        'text': msg.text[:500],  # Limit message length
-                        'location': str(getattr(msg, 'location', 'unknown'))[:200],
-                        'timestamp': time.time()
-                    })
-            
-            page.on('console', handle_console_message)
-            
-            # Navigate to target URL
-            try:
-                response = await page.goto(url, wait_until='domcontentloaded')
-                if not response:
-                    raise TechnicalScraperError(f"Failed to navigate to {url}")
-            except Exception as e:
-                # Try without wait condition for problematic sites
-                response = await page.goto(url, wait_until='networkidle')
-                if not response:
-                    raise TechnicalScraperError(f"Failed to navigate to {url}: {str(e)}")
-            
-            # Extract comprehensive technical data
-            technical_data = {
-                'security_headers': await extract_security_headers(response),
-                'https_enforcement': await analyze_https_enforcement(response, page.url),
-                'seo_signals': await detect_seo_signals(page, url),
-                'javascript_errors': {
-                    'error_count': len([e for e in js_errors if e['type'] == 'error']),
-                    'warning_count': len([e for e in js_errors if e['type'] == 'warning']),
-                    'details': js_errors
-                },
-                'performance_metrics': {
-                    'load_time_ms': int((time.time() - start_time) * 1000),
-                    'response_status': response.status if response else 0,
-                    'final_url': page.url
-                }
+            response = await page.goto(url, wait_until='domcontentloaded')
+            if not response:
+                raise TechnicalScraperError(f"Failed to navigate to {url}")
+        except Exception as e:
+            # Try without wait condition for problematic sites
+            response = await page.goto(url, wait_until='networkidle')
+            if not response:
+                raise TechnicalScraperError(f"Failed to navigate to {url}: {str(e)}")
+        
+        site = await site_task
+        if site.ok:
+            headers, final_url, tls = site.headers, site.final_url, site.tls
+        else:
+            headers, final_url, tls = response.headers, page.url, await _playwright_tls(response)
+        
+        # Extract comprehensive technical data
+        technical_data = {
+            'security_headers': await extract_security_headers(headers),
+            'https_enforcement': await analyze_https_enforcement(final_url, headers, tls),
+            'seo_signals': await seo_task,
+            'javascript_errors': {
+                'error_count': len([e for e in js_errors if e['type'] == 'error']),
+                'warning_count': len([e for e in js_errors if e['type'] == 'warning']),
+                'details': js_errors
+            },
+            'performance_metrics': {
+                'load_time_ms': int((time.time() - start_time) * 1000),
+                'response_status': response.status if response else 0,
+                'final_url': page.url
             }
-            
-            return technical_data
-            
-        finally:
-            await context.close()
-            await browser.close()
+        }
+        
+        return technical_data
 
 
-async def extract_security_headers(response) -> Dict[str, Optional[str]]:
+async def extract_security_headers(headers: Dict[str, str]) -> Dict[str, Optional[str]]:
     """
     Extract all OWASP-recommended security headers from HTTP response.
     
     Args:
-        response: Playwright response object
+        headers: Response headers of the landing page
         
     Returns:
         Dict mapping security header types to values
@@ -198,11 +214,10 @@ async def extract_security_headers(response) -> Dict[str, Optional[str]]:
     # Extract each security header with case-insensitive matching
     for header_name, key in SECURITY_HEADERS.items():
         try:
-            # Get all headers and search case-insensitively
-            all_headers = response.headers
+            # Search headers case-insensitively
             header_value = None
             
-            for header_key, header_val in all_headers.items():
+            for header_key, header_val in headers.items():
                 if header_key.lower() == header_name.lower():
                     header_value = header_val
                     break
@@ -215,13 +230,14 @@ async def extract_security_headers(response) -> Dict[str, Optional[str]]:
     return security_data
 
 
-async def analyze_https_enforcement(response, current_url: str) -> Dict[str, Any]:
+async def analyze_https_enforcement(current_url: str, headers: Dict[str, str], tls: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyze HTTPS enforcement and TLS configuration.
     
     Args:
-        response: Playwright response object
         current_url: Final URL after redirects
+        headers: Response headers of the final URL
+        tls: Negotiated TLS session and certificate details
         
     Returns:
         HTTPS enforcement analysis data
@@ -241,35 +257,27 @@ async def analyze_https_enforcement(response, current_url: str) -> Dict[str, Any
     https_data['enforced'] = current_url.startswith('https://')
     
     try:
-        # Extract TLS version from security details
-        try:
-            security_details = await response.security_details()
-            if security_details:
-                https_data['tls_version'] = security_details.get('protocol', 'Unknown')
-                https_data['certificate_valid'] = True
-                
-                # Validate TLS version (1.2+ required)
-                if https_data['tls_version'] and 'TLS' in https_data['tls_version']:
-                    try:
-                        # Extract version number (e.g., "TLS 1.3" -> 1.3)
-                        version_parts = https_data['tls_version'].split()
-                        if len(version_parts) >= 2:
-                            version_num = float(version_parts[-1])
-                            https_data['tls_version_secure'] = version_num >= 1.2
-                    except (ValueError, IndexError):
-                        https_data['tls_version_secure'] = False
-        except (AttributeError, TypeError):
-            # Some responses don't have security_details method or it's not available
-            pass
+        https_data['tls_version'] = tls.get('protocol')
+        https_data['certificate_valid'] = bool((tls.get('certificate') or {}).get('is_valid'))
+        
+        # Validate TLS version (1.2+ required)
+        if https_data['tls_version'] and 'TLS' in https_data['tls_version']:
+            try:
+                # Extract version number ("TLSv1.3" or "TLS 1.3" -> 1.3)
+                version_parts = https_data['tls_version'].replace('TLSv', 'TLS ').split()
+                if len(version_parts) >= 2:
+                    version_num = float(version_parts[-1])
+                    https_data['tls_version_secure'] = version_num >= 1.2
+            except (ValueError, IndexError):
+                https_data['tls_version_secure'] = False
     except Exception as e:
         logger.warning(f"Error analyzing security details: {e}")
     
     # Check HSTS header
     try:
-        all_headers = response.headers
         hsts_header = None
         
-        for header_key, header_val in all_headers.items():
+        for header_key, header_val in headers.items():
             if header_key.lower() == 'strict-transport-security':
                 hsts_header = header_val
                 break
@@ -291,85 +299,20 @@ async def analyze_https_enforcement(response, current_url: str) -> Dict[str, Any
     return https_data
 
 
-async def detect_seo_signals(page, base_url: str) -> Dict[str, Any]:
+async def detect_seo_signals(base_url: str) -> Dict[str, Any]:
     """
     Detect presence and analyze robots.txt and sitemap.xml files.
     
+    Both files are fetched directly over the pooled HTTP client rather than
+    through browser navigations, so this can run alongside the page load.
+    
     Args:
-        page: Playwright page object
-        base_url: Base URL of the website
+        base_url: Final URL of the landing page; its origin is checked
         
     Returns:
         SEO signals analysis data
     """
-    seo_signals = {}
-    
-    # Extract base URL (remove path, query, fragment)
-    try:
-        parsed_url = urlparse(base_url)
-        clean_base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-    except Exception as e:
-        logger.error(f"Error parsing base URL {base_url}: {e}")
-        return {
-            'robots_txt': {'present': False, 'error': f'URL parsing error: {e}'},
-            'sitemap_xml': {'present': False, 'error': f'URL parsing error: {e}'}
-        }
-    
-    # Check robots.txt
-    try:
-        robots_response = await page.goto(f"{clean_base_url}/robots.txt", timeout=10000)
-        if robots_response and robots_response.status == 200:
-            robots_content = await robots_response.text()
-            seo_signals['robots_txt'] = {
-                'present': True,
-                'status_code': robots_response.status,
-                'size_bytes': len(robots_content),
-                'has_sitemap_directive': 'sitemap:' in robots_content.lower()
-            }
-        else:
-            seo_signals['robots_txt'] = {
-                'present': False,
-                'status_code': robots_response.status if robots_response else 0,
-                'size_bytes': 0,
-                'has_sitemap_directive': False
-            }
-    except Exception as e:
-        seo_signals['robots_txt'] = {
-            'present': False,
-            'error': str(e)[:200],  # Limit error message length
-            'status_code': None,
-            'size_bytes': 0,
-            'has_sitemap_directive': False
-        }
-    
-    # Check sitemap.xml
-    try:
-        sitemap_response = await page.goto(f"{clean_base_url}/sitemap.xml", timeout=10000)
-        if sitemap_response and sitemap_response.status == 200:
-            sitemap_content = await sitemap_response.text()
-            seo_signals['sitemap_xml'] = {
-                'present': True,
-                'status_code': sitemap_response.status,
-                'size_bytes': len(sitemap_content),
-                'is_valid_xml': sitemap_content.strip().startswith('<?xml') or sitemap_content.strip().startswith('<urlset')
-            }
-        else:
-            seo_signals['sitemap_xml'] = {
-                'present': False,
-                'status_code': sitemap_response.status if sitemap_response else 0,
-                'size_bytes': 0,
-                'is_valid_xml': False
-            }
-    except Exception as e:
-        seo_signals['sitemap_xml'] = {
-            'present': False,
-            'error': str(e)[:200],  # Limit error message length
-            'status_code': None,
-            'size_bytes': 0,
-            'is_valid_xml': False
-        }
-    
-    return seo_signals
+    return await fetch_seo_files(base_url)
 
 
 async def assess_technical_security(url: str, company: str, lead_id: int) -> TechnicalAssessmentResult:
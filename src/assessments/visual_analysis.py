@@ -7,19 +7,28 @@ import asyncio
 import logging
 import time
 import json
-import base64
-import io
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import quote
 
 import httpx
-from PIL import Image
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.provider_limits import OPENAI
+from src.core.budget import BudgetExceededError, budget_reservation, charges_lead
+from src.core.circuit_breaker import CircuitOpenError, circuit_guard
+from src.core.rate_limiter import acquire_rate_limit
+from src.core.http_clients import get_http_client
+from src.core.bulk import BulkWriter
 from src.core.database import AsyncSessionLocal
+from src.assessments.llm_cache import cached_llm_call, llm_cache_key
+from src.assessments.result_cache import CacheProvenance, record_cache_hit_cost
+from src.assessments.image_processing import get_image_service, load_image_source, prepare_for_vision
+from src.assessments.screenshot_hashing import (
+    ImageHashes, NearDuplicate, find_near_duplicate, index_screenshots, record_near_duplicate
+)
 from src.models.assessment_cost import AssessmentCost
 from src.models.visual_analysis import VisualAnalysis, UXIssue, AnalysisStatus
 from src.models.assessment_results import AssessmentResults
@@ -47,6 +56,9 @@ class VisualAnalysisMetrics(BaseModel):
     analysis_timestamp: str = Field(..., description="When analysis was performed")
     api_cost_dollars: float = Field(0.0, description="OpenAI API cost for this analysis")
     processing_time_ms: int = Field(0, description="Analysis duration in milliseconds")
+    screenshot_hashes: Dict[str, str] = Field(default_factory=dict, description="Perceptual hashes of the analyzed screenshots by viewport")
+    reused_from: Optional[Dict[str, Any]] = Field(None, description="Prior analysis reused for near-duplicate screenshots")
+    cache_provenance: Optional[Dict[str, Any]] = Field(None, description="LLM response cache provenance")
     
     @validator('rubrics')
     def validate_rubric_count(cls, v):
@@ -80,6 +92,9 @@ class VisualAnalyzer:
     
     # OpenAI API Configuration
     MODEL = "gpt-4o-mini"  # Cost-optimized model
+    PROMPT_VERSION = "ux-v1"  # Bump when prompt or response parsing changes to invalidate cached responses
+    TEMPERATURE = 0.1  # Low temperature for consistent analysis
+    MAX_TOKENS = 2000
     COST_PER_ANALYSIS = 1.0  # $0.01 in cents (target cost optimization)
     TIMEOUT = 30  # 30 seconds
     MAX_RETRIES = 3
@@ -99,40 +114,28 @@ class VisualAnalyzer:
     
     def __init__(self):
         self.api_key = settings.OPENAI_API_KEY
-        self.client = httpx.AsyncClient(timeout=self.TIMEOUT)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client for the running event loop."""
+        return get_http_client("openai")
         
-    async def _download_and_validate_image(self, image_url: str, image_type: str) -> str:
-        """Download image and convert to base64 for API submission."""
+    async def _download_and_validate_image(self, image_url: str, image_type: str) -> Tuple[str, ImageHashes]:
+        """Load a screenshot (blob reference or URL) and convert to base64 for API submission."""
         
         if not image_url:
             raise VisualAnalysisError(f"Missing {image_type} image URL")
         
         try:
-            response = await self.client.get(image_url)
-            response.raise_for_status()
-            
-            # Validate image format and size
-            image = Image.open(io.BytesIO(response.content))
+            source = await load_image_source(image_url)
+            # Decode, fingerprint, downscale to 2048px and encode off the event loop
+            prepared = await get_image_service().run("vision_prep", prepare_for_vision, source, max_side=2048, quality=85)
             
-            # Optimize image for API if needed (max 2048x2048)
-            if image.size[0] > 2048 or image.size[1] > 2048:
-                image.thumbnail((2048, 2048), Image.Resampling.LANCZOS)
-                
-                # Convert back to bytes
-                img_buffer = io.BytesIO()
-                image.save(img_buffer, format='JPEG', quality=85)
-                image_bytes = img_buffer.getvalue()
-            else:
-                image_bytes = response.content
-            
-            # Convert to base64
-            base64_image = base64.b64encode(image_bytes).decode('utf-8')
-            
-            logger.info(f"Downloaded and processed {image_type} image: {len(image_bytes)} bytes")
-            return base64_image
+            logger.info(f"Loaded and processed {image_type} image: {prepared.size_bytes} bytes")
+            return prepared.base64, prepared.hashes
             
         except Exception as e:
-            logger.error(f"Failed to download {image_type} image from {image_url}: {e}")
+            logger.error(f"Failed to download {image_type} image from {image_url[:120]}: {e}")
             raise VisualAnalysisError(f"Failed to download {image_type} image: {str(e)}")
     
     def _create_ux_analysis_prompt(self) -> str:
@@ -246,41 +249,44 @@ Base your evaluation on Nielsen's 10 Usability Heuristics and modern UX best pra
         
         while retry_count < max_retries:
             try:
-                response = await self.client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.MODEL,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": [
-                                    {"type": "text", "text": prompt},
-                                    {
-                                        "type": "image_url",
-                                        "image_url": {
-                                            "url": f"data:image/jpeg;base64,{desktop_image}",
-                                            "detail": "high"
-                                        }
-                                    },
-                                    {
-                                        "type": "image_url", 
-                                        "image_url": {
-                                            "url": f"data:image/jpeg;base64,{mobile_image}",
-                                            "detail": "high"
+                await acquire_rate_limit(OPENAI)
+                async with budget_reservation(OPENAI, self.COST_PER_ANALYSIS), circuit_guard(OPENAI) as call:
+                    response = await self.client.post(
+                        "https://api.openai.com/v1/chat/completions",
+                        headers={
+                            "Authorization": f"Bearer {self.api_key}",
+                            "Content-Type": "application/json"
+                        },
+                        json={
+                            "model": self.MODEL,
+                            "messages": [
+                                {
+                                    "role": "user",
+                                    "content": [
+                                        {"type": "text", "text": prompt},
+                                        {
+                                            "type": "image_url",
+                                            "image_url": {
+                                                "url": f"data:image/jpeg;base64,{desktop_image}",
+                                                "detail": "high"
+                                            }
+                                        },
+                                        {
+                                            "type": "image_url", 
+                                            "image_url": {
+                                                "url": f"data:image/jpeg;base64,{mobile_image}",
+                                                "detail": "high"
+                                            }
                                         }
-                                    }
-                                ]
-                            }
-                        ],
-                        "max_tokens": 2000,
-                        "temperature": 0.1  # Low temperature for consistent analysis
-                    },
-                    timeout=self.TIMEOUT
-                )
+                                    ]
+                                }
+                            ],
+                            "max_tokens": self.MAX_TOKENS,
+                            "temperature": self.TEMPERATURE
+                        },
+                        timeout=self.TIMEOUT
+                    )
+                    call.check(response.status_code)
                 
                 if response.status_code == 200:
                     return response.json()
@@ -291,6 +297,10 @@ Base your evaluation on Nielsen's 10 Usability Heuristics and modern UX best pra
                     logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
                     raise VisualAnalysisError(f"API request failed: {response.status_code}")
                     
+            except (CircuitOpenError, BudgetExceededError):
+                # Retrying cannot help while the breaker is open or budget is exhausted
+                raise
+                    
             except httpx.TimeoutException:
                 retry_count += 1
                 if retry_count < max_retries:
@@ -390,8 +400,8 @@ Base your evaluation on Nielsen's 10 Usability Heuristics and modern UX best pra
         Analyze desktop and mobile screenshots for UX assessment.
         
         Args:
-            desktop_url: URL to desktop screenshot (1920x1080)
-            mobile_url: URL to mobile screenshot (390x844)
+            desktop_url: Blob reference or URL of the desktop screenshot (1920x1080)
+            mobile_url: Blob reference or URL of the mobile screenshot (390x844)
             
         Returns:
             VisualAnalysisMetrics: Complete UX analysis with structured rubric scoring
@@ -400,21 +410,46 @@ Base your evaluation on Nielsen's 10 Usability Heuristics and modern UX best pra
         
         try:
             # Download and validate screenshots
-            desktop_image = await self._download_and_validate_image(desktop_url, "desktop")
-            mobile_image = await self._download_and_validate_image(mobile_url, "mobile")
+            desktop_image, desktop_hashes = await self._download_and_validate_image(desktop_url, "desktop")
+            mobile_image, mobile_hashes = await self._download_and_validate_image(mobile_url, "mobile")
+            screenshot_hashes = {"desktop": desktop_hashes.hex(), "mobile": mobile_hashes.hex()}
             
             # Generate structured UX analysis prompt
             analysis_prompt = self._create_ux_analysis_prompt()
             
-            # Execute GPT-4 Vision analysis
-            response = await self._execute_vision_analysis(
-                prompt=analysis_prompt,
-                desktop_image=desktop_image,
-                mobile_image=mobile_image
+            async def run_analysis() -> VisualAnalysisMetrics:
+                # Re-assessments and template sites look the same; reuse their analysis
+                reused = await self._reuse_prior_analysis(desktop_hashes, mobile_hashes)
+                if reused:
+                    logger.info(f"Visual analysis reused from analysis {reused.reused_from['visual_analysis_id']}: {reused.overall_ux_score:.2f} UX score")
+                    return reused
+                
+                # Execute GPT-4 Vision analysis, then parse and validate the response
+                response = await self._execute_vision_analysis(
+                    prompt=analysis_prompt,
+                    desktop_image=desktop_image,
+                    mobile_image=mobile_image
+                )
+                return self._parse_vision_response(response)
+            
+            # Byte-identical screenshots with the same prompt get the same answer;
+            # checked before the near-duplicate lookup, which needs the database
+            metrics, provenance = await cached_llm_call(
+                "llm_vision",
+                llm_cache_key(
+                    self.MODEL, self.PROMPT_VERSION, self.TEMPERATURE, [analysis_prompt],
+                    images=[desktop_image, mobile_image], max_tokens=self.MAX_TOKENS
+                ),
+                run_analysis,
+                serialize=lambda m: m.dict(exclude={"cache_provenance"}),
+                deserialize=lambda data: VisualAnalysisMetrics(**data),
+                cost_of=lambda m: m.api_cost_dollars * 100,
+                cacheable=self._is_complete
             )
-            
-            # Parse and validate response
-            metrics = self._parse_vision_response(response)
+            if provenance and provenance.cache_hit:
+                metrics.api_cost_dollars = 0.0
+                metrics.cache_provenance = provenance.dict()
+            metrics.screenshot_hashes = screenshot_hashes
             
             # Set processing time
             processing_time_ms = int((time.time() - start_time) * 1000)
@@ -427,13 +462,51 @@ Base your evaluation on Nielsen's 10 Usability Heuristics and modern UX best pra
             logger.info(f"Visual analysis completed: {metrics.overall_ux_score:.2f} UX score, ${metrics.api_cost_dollars:.4f} cost, {processing_time_ms}ms")
             return metrics
             
+        except (CircuitOpenError, BudgetExceededError):
+            raise
         except Exception as e:
             logger.error(f"Visual analysis failed: {e}")
             raise VisualAnalysisError(f"Visual analysis failed: {str(e)}")
     
+    async def _reuse_prior_analysis(self, desktop: ImageHashes, mobile: ImageHashes) -> Optional[VisualAnalysisMetrics]:
+        """Metrics of a recent analysis of near-identical screenshots, if any (fails open)."""
+        
+        if not settings.VISUAL_REUSE_ENABLED:
+            return None
+        
+        try:
+            async with AsyncSessionLocal() as db:
+                match: Optional[NearDuplicate] = await find_near_duplicate(db, desktop, mobile)
+            if not match:
+                return None
+            
+            return VisualAnalysisMetrics(
+                **match.raw_analysis_data,
+                analysis_timestamp=match.analysis_timestamp.isoformat(),
+                api_cost_dollars=0.0,
+                reused_from={
+                    "visual_analysis_id": match.visual_analysis_id,
+                    "screenshot_id": match.screenshot_id,
+                    "distance": match.distance
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Near-duplicate lookup failed, running vision analysis: {e}")
+            return None
+    
+    @staticmethod
+    def _is_complete(metrics: VisualAnalysisMetrics) -> bool:
+        """Whether a fresh analysis is worth caching: not a reuse, and not filled in by parser defaults"""
+        return (
+            metrics.reused_from is None
+            and metrics.overall_ux_score > 0
+            and bool(metrics.desktop_analysis)
+            and bool(metrics.mobile_analysis)
+        )
+    
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Kept for callers; the shared HTTP client is closed at shutdown."""
+        pass
 
 async def save_visual_analysis_to_db(
     db: AsyncSession,
@@ -498,8 +571,6 @@ async def save_visual_analysis_to_db(
             # Store analysis insights
             strengths=metrics.positive_elements,
             weaknesses=metrics.critical_issues,
-            desktop_analysis=metrics.desktop_analysis,
-            mobile_analysis=metrics.mobile_analysis,
             
             # Store AI recommendations
             ai_recommendations=[
@@ -530,9 +601,13 @@ async def save_visual_analysis_to_db(
         db.add(visual_analysis)
         await db.flush()  # Get the ID for foreign key relationships
         
+        # Issue rows are written in bulk, one INSERT batch
+        rows = BulkWriter(db)
+        
         # Create UXIssue records for critical issues
         for idx, issue in enumerate(metrics.critical_issues):
-            ux_issue = UXIssue(
+            rows.add(
+                UXIssue,
                 visual_analysis_id=visual_analysis.id,
                 issue_type="critical",
                 issue_code=f"CRIT_{idx + 1}",
@@ -544,12 +619,12 @@ async def save_visual_analysis_to_db(
                 affects_desktop=True,
                 recommendation="Address this critical issue to improve user experience"
             )
-            db.add(ux_issue)
         
         # Create UXIssue records for low-scoring rubrics
         for rubric in metrics.rubrics:
             if rubric.score == 0:  # Poor score
-                ux_issue = UXIssue(
+                rows.add(
+                    UXIssue,
                     visual_analysis_id=visual_analysis.id,
                     issue_type=rubric.name,
                     issue_code=rubric.name.upper(),
@@ -561,9 +636,9 @@ async def save_visual_analysis_to_db(
                     affects_desktop=True,
                     recommendation="; ".join(rubric.recommendations) if rubric.recommendations else None
                 )
-                db.add(ux_issue)
             elif rubric.score == 1:  # Fair score
-                ux_issue = UXIssue(
+                rows.add(
+                    UXIssue,
                     visual_analysis_id=visual_analysis.id,
                     issue_type=rubric.name,
                     issue_code=rubric.name.upper(),
@@ -575,7 +650,8 @@ async def save_visual_analysis_to_db(
                     affects_desktop=True,
                     recommendation="; ".join(rubric.recommendations) if rubric.recommendations else None
                 )
-                db.add(ux_issue)
+        
+        await rows.flush()
         
         # Update AssessmentResults table with visual rubric scores
         from sqlalchemy import select
@@ -611,6 +687,7 @@ async def save_visual_analysis_to_db(
         await db.rollback()
         raise
 
+@charges_lead
 async def assess_visual_analysis(
     url: str, 
     desktop_screenshot_url: str, 
@@ -624,11 +701,12 @@ async def assess_visual_analysis(
     
     Args:
         url: Target website URL
-        desktop_screenshot_url: Desktop screenshot URL from PRP-006
-        mobile_screenshot_url: Mobile screenshot URL from PRP-006
+        desktop_screenshot_url: Desktop screenshot blob reference (or URL) from PRP-006
+        mobile_screenshot_url: Mobile screenshot blob reference (or URL) from PRP-006
         lead_id: Database ID of the lead
         assessment_id: Optional assessment ID for database persistence
-        screenshot_id: Optional screenshot ID for database persistence
+        screenshot_id: Optional screenshot ID for database persistence (looked up
+            from the assessment's desktop screenshot when omitted)
         
     Returns:
         Complete visual analysis assessment results with cost tracking
@@ -660,17 +738,45 @@ async def assess_visual_analysis(
             end_time = time.time()
             cost_record.response_status = "success"
             cost_record.response_time_ms = int((end_time - start_time) * 1000)
+            if metrics.reused_from:
+                cost_record.cost_cents = 0.0
+            elif metrics.cache_provenance:
+                cost_record.cost_cents = 0.0
+                await record_cache_hit_cost(lead_id, "openai_vision", CacheProvenance(**metrics.cache_provenance), assessment_id)
             
             # Save to database if assessment_id is provided
-            if assessment_id and screenshot_id:
-                async with AsyncSessionLocal() as db:
-                    await save_visual_analysis_to_db(
-                        db=db,
-                        assessment_id=assessment_id,
-                        screenshot_id=screenshot_id,
-                        metrics=metrics,
-                        url=url
-                    )
+            if assessment_id:
+                try:
+                    async with AsyncSessionLocal() as db:
+                        # Hashes on the screenshot rows make this analysis reusable later
+                        screenshot_ids = await index_screenshots(db, assessment_id, {
+                            ref: ImageHashes.from_hex(metrics.screenshot_hashes[viewport])
+                            for viewport, ref in (("desktop", desktop_screenshot_url), ("mobile", mobile_screenshot_url))
+                            if viewport in metrics.screenshot_hashes
+                        })
+                        screenshot_id = screenshot_id or screenshot_ids.get(desktop_screenshot_url)
+                        
+                        if screenshot_id:
+                            if metrics.reused_from:
+                                await record_near_duplicate(
+                                    db,
+                                    prior_screenshot_id=metrics.reused_from["screenshot_id"],
+                                    screenshot_id=screenshot_id,
+                                    distance=metrics.reused_from["distance"],
+                                    visual_analysis_id=metrics.reused_from["visual_analysis_id"]
+                                )
+                            await save_visual_analysis_to_db(
+                                db=db,
+                                assessment_id=assessment_id,
+                                screenshot_id=screenshot_id,
+                                metrics=metrics,
+                                url=url
+                            )
+                        else:
+                            await db.commit()
+                except Exception as e:
+                    # The analysis is already paid for; keep it even if it can't be stored
+                    logger.error(f"Failed to persist visual analysis for assessment {assessment_id}: {e}")
             
             logger.info(f"Visual analysis completed for {url}: {metrics.overall_ux_score:.2f} UX score, {len(metrics.rubrics)} rubrics")
             
@@ -685,6 +791,10 @@ async def assess_visual_analysis(
         finally:
             await visual_analyzer.close()
             
+    except (CircuitOpenError, BudgetExceededError):
+        # Orchestrators skip the component instead of recording a failed analysis
+        raise
+    
     except VisualAnalysisError as e:
         # Update cost record with error
         end_time = time.time()
@@ -0,0 +1,189 @@
+"""
+PRP-006: Screenshot Visual Diff
+SSIM, changed regions and a heatmap between two screenshots, in plain NumPy so it can run in worker processes
+"""
+
+import io
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+# Screenshots are compared at a fixed width; full-page captures keep their aspect ratio
+DIFF_WIDTH = 640
+SSIM_RADIUS = 3  # 7x7 window
+_C1 = (0.01 * 255) ** 2
+_C2 = (0.03 * 255) ** 2
+_LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float64)
+
+CHANGED_SSIM = 0.7  # Local SSIM below this marks a pixel as changed
+CHANGED_COLOR = 40.0  # Mean RGB difference (0-255) that marks a pixel as changed
+COLOR_ONLY_STRUCTURE = 0.9  # Regions whose edges still line up this well only changed color
+
+# Changed pixels are grouped on a coarse grid; sparse cells are treated as noise
+CELL_SIZE = 16
+CELL_CHANGED_FRACTION = 0.1
+
+
+@dataclass
+class VisualDiff:
+    """Comparison of a before and after screenshot (coordinates are after-image pixels)"""
+    similarity: float  # Mean per-pixel similarity (SSIM, or color distance where lower) as 0-100
+    changed_fraction: float  # Share of the page that changed, 0-1
+    regions: List[Dict[str, Any]] = field(default_factory=list)
+    layout_changes: int = 0
+    color_changes: int = 0
+    heatmap_png: bytes = field(default=b"", repr=False)
+
+    @classmethod
+    def identical(cls) -> "VisualDiff":
+        return cls(similarity=100.0, changed_fraction=0.0)
+
+    @property
+    def summary(self) -> str:
+        if not self.regions:
+            return f"No visible changes ({self.similarity:.1f}% similar)"
+        return (f"{self.layout_changes} layout and {self.color_changes} color changes covering "
+                f"{self.changed_fraction:.0%} of the page ({self.similarity:.1f}% similar)")
+
+
+def _load(data: Union[bytes, str], width: int) -> Tuple[np.ndarray, float]:
+    """RGB pixels scaled to width, and the scale factor applied (data may be a file path)"""
+    with Image.open(data if isinstance(data, str) else io.BytesIO(data)) as image:
+        image = image.convert("RGB")
+        scale = width / image.width
+        # Cheap integer downscale first; full-page captures can be many megapixels
+        factor = image.width // width
+        if factor > 1:
+            image = image.reduce(factor)
+        height = max(1, round(image.height * width / image.width))
+        pixels = np.asarray(image.resize((width, height), Image.Resampling.BILINEAR), dtype=np.float64)
+    return pixels, scale
+
+
+def _box_mean(values: np.ndarray, radius: int) -> np.ndarray:
+    """Mean over a (2r+1)^2 window around every pixel, via an integral image"""
+    size = 2 * radius + 1
+    padded = np.pad(values, radius, mode="edge")
+    integral = np.pad(padded.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    sums = integral[size:, size:] - integral[:-size, size:] - integral[size:, :-size] + integral[:-size, :-size]
+    return sums / (size * size)
+
+
+def ssim_maps(a: np.ndarray, b: np.ndarray, radius: int = SSIM_RADIUS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-pixel SSIM of two grayscale images and its contrast-structure term.
+
+    The structure term ignores brightness, so a region with a low SSIM but a
+    high structure score kept its shapes and only changed color.
+    """
+    mu_a, mu_b = _box_mean(a, radius), _box_mean(b, radius)
+    var_a = _box_mean(a * a, radius) - mu_a ** 2
+    var_b = _box_mean(b * b, radius) - mu_b ** 2
+    covar = _box_mean(a * b, radius) - mu_a * mu_b
+
+    structure = (2 * covar + _C2) / (var_a + var_b + _C2)
+    luminance = (2 * mu_a * mu_b + _C1) / (mu_a ** 2 + mu_b ** 2 + _C1)
+    return luminance * structure, structure
+
+
+def _label_cells(cells: np.ndarray) -> List[List[Tuple[int, int]]]:
+    """8-connected groups of changed grid cells"""
+    seen = np.zeros_like(cells, dtype=bool)
+    groups = []
+    rows, cols = cells.shape
+    for start in zip(*np.nonzero(cells)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        stack, group = [start], []
+        while stack:
+            r, c = stack.pop()
+            group.append((r, c))
+            for nr in range(max(r - 1, 0), min(r + 2, rows)):
+                for nc in range(max(c - 1, 0), min(c + 2, cols)):
+                    if cells[nr, nc] and not seen[nr, nc]:
+                        seen[nr, nc] = True
+                        stack.append((nr, nc))
+        groups.append(group)
+    return groups
+
+
+def _heatmap(after: np.ndarray, intensity: np.ndarray, boxes: List[Tuple[int, int, int, int]]) -> bytes:
+    """After image washed out, with change intensity in red and regions outlined"""
+    base = (after @ _LUMA) * 0.5 + 127.5
+    heat = np.clip(intensity, 0.0, 1.0)[..., np.newaxis]
+    rgb = base[..., np.newaxis] * (1 - heat) + np.array([255.0, 0.0, 0.0]) * heat
+    for top, left, bottom, right in boxes:
+        rgb[top:bottom, [left, right - 1]] = (255, 0, 0)
+        rgb[[top, bottom - 1], left:right] = (255, 0, 0)
+
+    buffer = io.BytesIO()
+    Image.fromarray(rgb.astype(np.uint8)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def compute_visual_diff(before: Union[bytes, str], after: Union[bytes, str], width: int = DIFF_WIDTH) -> VisualDiff:
+    """
+    Diff two encoded screenshots.
+
+    Both are scaled to width; when page heights differ the missing part of the
+    shorter one counts as changed. CPU-bound: run it through the image service.
+    """
+    before_px, _ = _load(before, width)
+    after_px, scale = _load(after, width)
+
+    height = max(len(before_px), len(after_px))
+    overlap = min(len(before_px), len(after_px))
+    if len(before_px) < height:
+        before_px = np.pad(before_px, ((0, height - len(before_px)), (0, 0), (0, 0)), constant_values=255)
+    if len(after_px) < height:
+        after_px = np.pad(after_px, ((0, height - len(after_px)), (0, 0), (0, 0)), constant_values=255)
+
+    ssim, structure = ssim_maps(before_px @ _LUMA, after_px @ _LUMA)
+    color_delta = _box_mean(np.abs(before_px - after_px).mean(axis=2), SSIM_RADIUS)
+    ssim[overlap:] = 0.0
+    changed = (ssim < CHANGED_SSIM) | (color_delta > CHANGED_COLOR)
+
+    # Coarse grid: fraction of changed pixels per cell
+    pad = -height % CELL_SIZE
+    grid = np.pad(changed, ((0, pad), (0, 0))).reshape(
+        (height + pad) // CELL_SIZE, CELL_SIZE, width // CELL_SIZE, CELL_SIZE
+    ).mean(axis=(1, 3)) > CELL_CHANGED_FRACTION
+
+    regions, boxes = [], []
+    layout_changes = color_changes = 0
+    for group in _label_cells(grid):
+        cell_rows, cell_cols = zip(*group)
+        top, left = min(cell_rows) * CELL_SIZE, min(cell_cols) * CELL_SIZE
+        bottom = min((max(cell_rows) + 1) * CELL_SIZE, height)
+        right = (max(cell_cols) + 1) * CELL_SIZE
+        boxes.append((top, left, bottom, right))
+
+        area = changed[top:bottom, left:right]
+        color_only = bottom <= overlap and structure[top:bottom, left:right][area].mean() >= COLOR_ONLY_STRUCTURE
+        if color_only:
+            color_changes += 1
+        else:
+            layout_changes += 1
+        regions.append({
+            "x": int(left / scale),
+            "y": int(top / scale),
+            "width": int((right - left) / scale),
+            "height": int((bottom - top) / scale),
+            "change": "color" if color_only else "layout",
+            "changed_fraction": round(float(area.mean()), 3),
+        })
+
+    # SSIM is computed on luminance, so recoloring alone would still score 100
+    similarity = np.clip(np.minimum(ssim, 1.0 - color_delta / 255.0), 0.0, 1.0)
+    intensity = np.maximum(1.0 - ssim, color_delta / 128.0)
+    return VisualDiff(
+        similarity=round(float(similarity.mean()) * 100, 1),
+        changed_fraction=round(float(grid.mean()), 3),
+        regions=regions,
+        layout_changes=layout_changes,
+        color_changes=color_changes,
+        heatmap_png=_heatmap(after_px, intensity, boxes),
+    )
@@ -0,0 +1,221 @@
+"""
+PRP-002: Browser Pool
+Long-lived Chromium instances per worker handing out fresh isolated contexts
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = get_logger(__name__)
+
+
+class BrowserPoolError(Exception):
+    """Raised when no browser can be leased"""
+    pass
+
+
+# Memory-optimized Chromium flags for headless scanning
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--memory-pressure-off',
+    '--max_old_space_size=200',  # Limit to 200MB
+    '--disable-web-security',
+    '--disable-features=TranslateUI',
+    '--disable-extensions',
+    '--disable-plugins'
+]
+
+
+def _chromium_pids() -> Set[int]:
+    """Chromium processes descended from this worker (empty without psutil)."""
+    if psutil is None:
+        return set()
+    try:
+        return {
+            child.pid for child in psutil.Process().children(recursive=True)
+            if "chrom" in child.name().lower() or "headless_shell" in child.name().lower()
+        }
+    except psutil.Error:
+        return set()
+
+
+def _tree_rss_mb(pid: Optional[int]) -> Optional[float]:
+    """Resident memory of a browser process and its renderers, in MB."""
+    if psutil is None or pid is None:
+        return None
+    try:
+        root = psutil.Process(pid)
+        processes = [root, *root.children(recursive=True)]
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+@dataclass
+class PooledBrowser:
+    """A launched browser and its usage since launch."""
+    browser: Any
+    pid: Optional[int] = None
+    launched_at: float = field(default_factory=time.monotonic)
+    contexts_served: int = 0
+
+    def recycle_reason(self) -> Optional[str]:
+        """Why this browser should be replaced before its next lease, if at all."""
+        if not self.browser.is_connected():
+            return "disconnected"
+        if self.contexts_served >= settings.BROWSER_POOL_MAX_PAGES_PER_BROWSER:
+            return "page limit"
+        rss_mb = _tree_rss_mb(self.pid)
+        if rss_mb is not None and rss_mb > settings.BROWSER_POOL_MAX_RSS_MB:
+            return f"memory {rss_mb:.0f}MB"
+        return None
+
+
+class BrowserPool:
+    """
+    Fixed-size pool of Chromium browsers bound to one event loop.
+
+    Each lease gets a new browser context (isolated cookies, storage and
+    cache) on an idle browser, so callers never share state while launch
+    cost is paid once per browser rather than once per site. Browsers are
+    relaunched after serving a configured number of contexts, when their
+    process tree grows past the memory limit, or when they disconnect.
+    """
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = size or settings.BROWSER_POOL_SIZE
+        self._playwright = None
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._launched = 0
+        self._launch_lock = asyncio.Lock()
+        self._closed = False
+
+    async def _launch(self) -> PooledBrowser:
+        from playwright.async_api import async_playwright
+
+        async with self._launch_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            before = _chromium_pids()
+            browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+            # The browser's main process is the oldest new Chromium process
+            new_pids = sorted(_chromium_pids() - before)
+            pooled = PooledBrowser(browser=browser, pid=new_pids[0] if new_pids else None)
+
+        logger.info("Browser launched", pid=pooled.pid, pool_size=self.size)
+        return pooled
+
+    async def _retire(self, pooled: PooledBrowser, reason: str) -> None:
+        logger.info("Recycling browser", reason=reason, contexts_served=pooled.contexts_served,
+                    age_seconds=int(time.monotonic() - pooled.launched_at))
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning("Failed to close browser", error=str(e))
+
+    async def _checkout(self, timeout: float) -> PooledBrowser:
+        # BaseException throughout: a cancelled lease must still give back its slot
+        if self._idle.empty() and self._launched < self.size:
+            self._launched += 1
+            try:
+                return await self._launch()
+            except BaseException:
+                self._launched -= 1
+                raise
+        try:
+            pooled = await asyncio.wait_for(self._idle.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise BrowserPoolError(f"No browser available within {timeout}s")
+
+        reason = pooled.recycle_reason()
+        if reason:
+            try:
+                await self._retire(pooled, reason)
+                pooled = await self._launch()
+            except BaseException:
+                self._launched -= 1
+                raise
+        return pooled
+
+    @asynccontextmanager
+    async def context(self, timeout: Optional[float] = None, **context_options: Any) -> AsyncIterator[Any]:
+        """
+        Lease a fresh browser context on a pooled browser.
+
+        Args:
+            timeout: Seconds to wait for an idle browser
+            **context_options: Passed to Browser.new_context()
+        """
+        if self._closed:
+            raise BrowserPoolError("Browser pool is closed")
+
+        pooled = await self._checkout(timeout or settings.BROWSER_POOL_ACQUIRE_TIMEOUT_SECONDS)
+        try:
+            browser_context = await pooled.browser.new_context(**context_options)
+        except BaseException:
+            # A browser that cannot open contexts is replaced on next checkout
+            await self._release(pooled)
+            raise
+
+        try:
+            yield browser_context
+        finally:
+            try:
+                await browser_context.close()
+            except Exception as e:
+                logger.warning("Failed to close browser context", error=str(e))
+            finally:
+                pooled.contexts_served += 1
+                await self._release(pooled)
+
+    async def _release(self, pooled: PooledBrowser) -> None:
+        if self._closed:
+            await self._retire(pooled, "pool closed")
+            return
+        self._idle.put_nowait(pooled)
+
+    async def close(self) -> None:
+        """Close idle browsers and stop Playwright; leased ones close on release."""
+        self._closed = True
+        while not self._idle.empty():
+            await self._retire(self._idle.get_nowait(), "pool closed")
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": self.size, "launched": self._launched, "idle": self._idle.qsize()}
+
+
+_pools: Dict[int, Tuple[asyncio.AbstractEventLoop, BrowserPool]] = {}
+
+
+def get_browser_pool() -> BrowserPool:
+    """Browser pool for the running event loop (one per worker loop)."""
+    loop = asyncio.get_running_loop()
+    entry = _pools.get(id(loop))
+    if entry is None or entry[0] is not loop or entry[1]._closed:
+        entry = _pools[id(loop)] = (loop, BrowserPool())
+    return entry[1]
+
+
+async def shutdown_browser_pool() -> None:
+    """Worker/loop shutdown hook: close the pool bound to this loop."""
+    loop = asyncio.get_running_loop()
+    entry = _pools.get(id(loop))
+    if entry is not None and entry[0] is loop:
+        del _pools[id(loop)]
+        await entry[1].close()
@@ -0,0 +1,317 @@
+"""
+PRP-002: Budget Admission Control
+Reserve estimated provider cost against daily, monthly and per-lead caps before paid calls
+"""
+
+import functools
+import inspect
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.core.cache import CacheKeys, get_redis
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BudgetExceededError(Exception):
+    """Raised when a paid call would push spend past a budget cap"""
+
+    def __init__(self, scope: str, service: str, estimate_cents: float):
+        self.scope = scope
+        self.service = service
+        self.estimate_cents = estimate_cents
+        super().__init__(f"{scope} budget exhausted, {service} call ({estimate_cents:.2f}c) rejected")
+
+
+# Expected spend per orchestrator component in cents, used for admission
+COMPONENT_COST_ESTIMATES: Dict[str, float] = {
+    "pagespeed": 0.5,
+    "gbp": 1.7,
+    "screenshots": 0.4,
+    "semrush": 10.0,
+    "visual_analysis": 1.0,
+    "content_generation": 2.0,
+}
+
+_SCOPES = ("daily", "monthly", "lead")
+
+# Lead whose budget paid calls in the current task are charged against
+_current_lead: ContextVar[Optional[int]] = ContextVar("budget_lead_id", default=None)
+
+# Counters are hashes with committed 'spent' and in-flight 'reserved' cents.
+# Either every cap admits the reservation and all counters move together, or
+# nothing changes and the index of the first exhausted scope is returned.
+_RESERVE_SCRIPT = """
+local amount = tonumber(ARGV[1])
+for i, key in ipairs(KEYS) do
+    local v = redis.call('HMGET', key, 'spent', 'reserved')
+    local used = (tonumber(v[1]) or 0) + (tonumber(v[2]) or 0)
+    if used + amount > tonumber(ARGV[1 + i]) then
+        return i
+    end
+end
+for i, key in ipairs(KEYS) do
+    redis.call('HINCRBYFLOAT', key, 'reserved', amount)
+    redis.call('EXPIRE', key, tonumber(ARGV[1 + #KEYS + i]))
+end
+return 0
+"""
+
+# Move a reservation into spend (actual may be 0 to release it)
+_SETTLE_SCRIPT = """
+local reserved = tonumber(ARGV[1])
+local actual = tonumber(ARGV[2])
+for _, key in ipairs(KEYS) do
+    local left = redis.call('HINCRBYFLOAT', key, 'reserved', -reserved)
+    if tonumber(left) < 0 then
+        redis.call('HSET', key, 'reserved', 0)
+    end
+    if actual > 0 then
+        redis.call('HINCRBYFLOAT', key, 'spent', actual)
+    end
+end
+return 1
+"""
+
+
+@dataclass
+class BudgetReservation:
+    """Estimated cost held against the budget counters for one paid call."""
+    service: str
+    amount_cents: float
+    keys: List[str]
+    lead_id: Optional[int] = None
+    settled: bool = False
+
+
+class BudgetAdmission:
+    """
+    Admission control for paid provider calls.
+
+    Spend is tracked in Redis counters per UTC day, month and lead, so the
+    hot path is a single script call with no SUM() over assessment_costs.
+    Lead counters are per day too: the per-lead cap bounds one round of
+    assessment, and a lead re-assessed later starts afresh. reconcile()
+    periodically raises counters that fell behind the database, e.g. after
+    a Redis flush. Not every paid call is persisted as an assessment_costs
+    row, so it never lowers them. Redis outages fail open.
+    """
+
+    def _caps_cents(self) -> Dict[str, float]:
+        return {
+            "daily": settings.DAILY_BUDGET_CAP * 100,
+            "monthly": settings.COST_BUDGET_USD * 100,
+            "lead": settings.PER_LEAD_CAP * 100,
+        }
+
+    def _ttls(self) -> Dict[str, int]:
+        return {"daily": 2 * 86400, "monthly": 32 * 86400, "lead": 2 * 86400}
+
+    def _keys(self, lead_id: Optional[int], now: Optional[datetime] = None) -> Dict[str, str]:
+        now = now or datetime.now(timezone.utc)
+        day = now.strftime("%Y-%m-%d")
+        keys = {
+            "daily": CacheKeys.budget_daily(day),
+            "monthly": CacheKeys.budget_monthly(now.strftime("%Y-%m")),
+        }
+        if lead_id:
+            keys["lead"] = CacheKeys.budget_lead(lead_id, day)
+        return keys
+
+    async def reserve(self, service: str, estimate_cents: float, lead_id: Optional[int] = None) -> Optional[BudgetReservation]:
+        """
+        Hold estimate_cents against every applicable cap.
+
+        Returns:
+            Reservation to commit or release, or None if admission is
+            disabled or Redis is unavailable
+
+        Raises:
+            BudgetExceededError: If any cap would be exceeded
+        """
+        if not settings.BUDGET_ADMISSION_ENABLED:
+            return None
+
+        keys = self._keys(lead_id)
+        scopes = list(keys)
+        caps, ttls = self._caps_cents(), self._ttls()
+        try:
+            redis_client = await get_redis()
+            rejected = await redis_client.eval(
+                _RESERVE_SCRIPT, len(scopes), *keys.values(),
+                estimate_cents, *[caps[s] for s in scopes], *[ttls[s] for s in scopes]
+            )
+        except Exception as e:
+            logger.warning("Budget admission unavailable, allowing call", service=service, error=str(e))
+            return None
+
+        if int(rejected):
+            scope = scopes[int(rejected) - 1]
+            logger.warning("Budget cap reached", scope=scope, service=service, lead_id=lead_id)
+            raise BudgetExceededError(scope, service, estimate_cents)
+
+        return BudgetReservation(service, estimate_cents, list(keys.values()), lead_id)
+
+    async def _settle(self, reservation: BudgetReservation, actual_cents: float) -> None:
+        if reservation.settled:
+            return
+        reservation.settled = True
+        try:
+            redis_client = await get_redis()
+            await redis_client.eval(
+                _SETTLE_SCRIPT, len(reservation.keys), *reservation.keys,
+                reservation.amount_cents, actual_cents
+            )
+        except Exception as e:
+            logger.warning("Failed to settle budget reservation", service=reservation.service, error=str(e))
+
+    async def commit(self, reservation: Optional[BudgetReservation], actual_cents: Optional[float] = None) -> None:
+        """Record the real cost of a completed call (defaults to the estimate)."""
+        if reservation is not None:
+            await self._settle(reservation, reservation.amount_cents if actual_cents is None else actual_cents)
+
+    async def release(self, reservation: Optional[BudgetReservation]) -> None:
+        """Return a reservation whose call never happened or was not billed."""
+        if reservation is not None:
+            await self._settle(reservation, 0.0)
+
+    async def can_afford(self, estimate_cents: float, lead_id: Optional[int] = None) -> bool:
+        """Read-only O(1) check used to skip work before any call is made."""
+        if not settings.BUDGET_ADMISSION_ENABLED:
+            return True
+        keys = self._keys(lead_id)
+        caps = self._caps_cents()
+        try:
+            redis_client = await get_redis()
+            for scope, key in keys.items():
+                spent, reserved = await redis_client.hmget(key, "spent", "reserved")
+                if float(spent or 0) + float(reserved or 0) + estimate_cents > caps[scope]:
+                    return False
+        except Exception:
+            return True
+        return True
+
+    async def usage(self, lead_id: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """Spent, reserved and cap in cents for each scope."""
+        keys = self._keys(lead_id)
+        caps = self._caps_cents()
+        redis_client = await get_redis()
+        usage = {}
+        for scope, key in keys.items():
+            spent, reserved = await redis_client.hmget(key, "spent", "reserved")
+            usage[scope] = {
+                "spent_cents": float(spent or 0),
+                "reserved_cents": float(reserved or 0),
+                "cap_cents": caps[scope],
+            }
+        return usage
+
+    async def reconcile(self) -> Dict[str, Any]:
+        """
+        Raise committed spend for today, this month and each lead's spend
+        today to at least the assessment_costs totals. Counters already
+        ahead of the database keep their value, and in-flight reservations
+        are left untouched.
+        """
+        from sqlalchemy import func, select
+        from src.core.database import AsyncSessionLocal
+        from src.models.assessment_cost import AssessmentCost
+
+        now = datetime.now(timezone.utc)
+        day, month = now.strftime("%Y-%m-%d"), now.strftime("%Y-%m")
+
+        async with AsyncSessionLocal() as db:
+            daily = (await db.execute(
+                select(func.coalesce(func.sum(AssessmentCost.cost_cents), 0.0))
+                .where(AssessmentCost.daily_budget_date == day)
+            )).scalar_one()
+            monthly = (await db.execute(
+                select(func.coalesce(func.sum(AssessmentCost.cost_cents), 0.0))
+                .where(AssessmentCost.monthly_budget_date == month)
+            )).scalar_one()
+            per_lead = (await db.execute(
+                select(AssessmentCost.lead_id, func.sum(AssessmentCost.cost_cents))
+                .where(AssessmentCost.daily_budget_date == day)
+                .group_by(AssessmentCost.lead_id)
+            )).all()
+
+        ttls = self._ttls()
+        counters = [
+            (CacheKeys.budget_daily(day), daily, ttls["daily"]),
+            (CacheKeys.budget_monthly(month), monthly, ttls["monthly"]),
+            *[(CacheKeys.budget_lead(lead_id, day), spent, ttls["lead"]) for lead_id, spent in per_lead],
+        ]
+        redis_client = await get_redis()
+        pipe = redis_client.pipeline()
+        for key, _, _ in counters:
+            pipe.hget(key, "spent")
+        current = await pipe.execute()
+
+        # Add only the shortfall: a commit landing meanwhile is kept, not overwritten
+        raised = 0
+        pipe = redis_client.pipeline()
+        for (key, spent, ttl), counted in zip(counters, current):
+            shortfall = float(spent or 0) - float(counted or 0)
+            if shortfall > 0:
+                pipe.hincrbyfloat(key, "spent", shortfall)
+                raised += 1
+            pipe.expire(key, ttl)
+        await pipe.execute()
+
+        logger.info("Budget counters reconciled", daily_cents=float(daily), monthly_cents=float(monthly),
+                    leads=len(per_lead), raised=raised)
+        return {
+            "daily_cents": float(daily),
+            "monthly_cents": float(monthly),
+            "leads_reconciled": len(per_lead),
+            "counters_raised": raised,
+            "timestamp": now.isoformat(),
+        }
+
+
+def current_budget_lead() -> Optional[int]:
+    """Lead that paid calls in this task are charged to, if any."""
+    return _current_lead.get()
+
+
+def charges_lead(func):
+    """
+    Charge paid provider calls made inside an async assessment function to
+    its lead_id argument (per-lead cap).
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind_partial(*args, **kwargs)
+        token = _current_lead.set(bound.arguments.get("lead_id"))
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _current_lead.reset(token)
+
+    return wrapper
+
+
+@asynccontextmanager
+async def budget_reservation(service: str, estimate_cents: float) -> AsyncIterator[Optional[BudgetReservation]]:
+    """
+    Reserve budget for one paid call. Commits the estimate when the block
+    completes and releases it if the call raised.
+    """
+    reservation = await budget.reserve(service, estimate_cents, current_budget_lead())
+    try:
+        yield reservation
+    except BaseException:
+        await budget.release(reservation)
+        raise
+    await budget.commit(reservation)
+
+
+# Global budget admission instance
+budget = BudgetAdmission()
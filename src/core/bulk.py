@@ -0,0 +1,57 @@
+"""
+PRP-002: Bulk Persistence
+Write child rows as plain dicts with one executemany INSERT per table
+"""
+
+from typing import Any, Dict, List, Type
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BulkWriter:
+    """
+    Collects row dicts per model and inserts them table by table.
+
+    Avoids building one ORM object per row (and the unit-of-work
+    bookkeeping that comes with it) for the hundreds of child rows an
+    assessment produces. Rows are written on the caller's session, so they
+    commit or roll back with the parent record. SQLAlchemy batches each
+    executemany into multi-row INSERT statements, so a table costs one
+    round trip per batch rather than per row.
+
+    Rows are not added to the session's identity map; relationships on an
+    already loaded parent will not see them until it is refreshed.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._rows: Dict[Type[Any], List[Dict[str, Any]]] = {}
+
+    def add(self, model: Type[Any], **values: Any) -> None:
+        """Queue one row, keyed by mapped attribute names."""
+        self._rows.setdefault(model, []).append(values)
+
+    def extend(self, model: Type[Any], rows: List[Dict[str, Any]]) -> None:
+        """Queue several rows for the same model."""
+        self._rows.setdefault(model, []).extend(rows)
+
+    async def flush(self) -> Dict[str, int]:
+        """
+        Insert every queued row in the order tables were first queued.
+
+        Returns:
+            Rows written per table
+        """
+        written = {}
+        for model, rows in self._rows.items():
+            if rows:
+                await self.db.execute(insert(model), rows)
+                written[model.__tablename__] = len(rows)
+        self._rows.clear()
+        logger.debug("Bulk rows written", tables=written)
+        return written
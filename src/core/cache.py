@@ -192,4 +192,64 @@ class CacheKeys:
     
     @staticmethod
     def rate_limit(service: str, identifier: str) -> str:
-        return f"ratelimit:{service}:{identifier}"
\ No newline at end of file
+        return f"ratelimit:{service}:{identifier}"
+    
+    @staticmethod
+    def component_result(component: str, subject: str) -> str:
+        return f"component:{component}:{subject}"
+    
+    @staticmethod
+    def budget_daily(date: str) -> str:
+        return f"budget:day:{date}"
+    
+    @staticmethod
+    def budget_monthly(month: str) -> str:
+        return f"budget:month:{month}"
+    
+    @staticmethod
+    def budget_lead(lead_id: int, date: str) -> str:
+        return f"budget:lead:{lead_id}:{date}"
+    
+    @staticmethod
+    def circuit_breaker(provider: str) -> str:
+        return f"circuit:{provider}"
+    
+    @staticmethod
+    def single_flight_lease(key: str) -> str:
+        return f"flight:{key}:lease"
+    
+    @staticmethod
+    def single_flight_result(key: str) -> str:
+        return f"flight:{key}:result"
+    
+    @staticmethod
+    def provider_slots(provider: str) -> str:
+        return f"slots:{provider}"
+    
+    @staticmethod
+    def batch_job(batch_id: str) -> str:
+        return f"batch:{batch_id}"
+    
+    @staticmethod
+    def batch_pending(batch_id: str) -> str:
+        return f"batch:{batch_id}:pending"
+    
+    @staticmethod
+    def batch_active() -> str:
+        return "batch:active"
+    
+    @staticmethod
+    def assessments_in_flight() -> str:
+        return "assessments:in_flight:leases"
+    
+    @staticmethod
+    def seo_file(url: str) -> str:
+        return f"seofile:{url}"
+    
+    @staticmethod
+    def tls_certificate(hostname: str, port: int = 443) -> str:
+        return f"tls:{hostname}:{port}"
+    
+    @staticmethod
+    def unreachable_host(host: str) -> str:
+        return f"unreachable:{host}"
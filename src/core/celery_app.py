@@ -42,6 +42,14 @@ try:
         monitor_assessment_queues
     )
     
+    # Batch assessment fan-out tasks
+    from src.assessment.batch import (
+        batch_assessment_task,
+        dispatch_batch_task,
+        batch_item_completed,
+        batch_item_failed
+    )
+    
     # Note: coordinate_assessment is registered when orchestrator module is imported
     
     # Log successful task registration
@@ -77,6 +85,18 @@ celery_app.conf.beat_schedule = {
         'schedule': crontab(minute='*'),  # Every minute
         'options': {'queue': 'high_priority'}
     },
+    # Correct budget counter drift against assessment_costs every 5 minutes
+    'reconcile-budget': {
+        'task': 'src.assessment.tasks.reconcile_budget_task',
+        'schedule': crontab(minute='*/5'),
+        'options': {'queue': 'default'}
+    },
+    # Refill batch slots in case a completion callback was lost
+    'dispatch-batches': {
+        'task': 'src.assessment.batch.dispatch_batch_task',
+        'schedule': crontab(minute='*'),  # Every minute
+        'options': {'queue': 'high_priority'}
+    },
 }
 
 # Configure task execution options
@@ -91,5 +111,12 @@ celery_app.conf.update(
     worker_max_memory_per_child=524288,  # 512MB
 )
 
+# One persistent event loop per worker process for async DB/HTTP resources
+from celery.signals import worker_process_init, worker_process_shutdown
+from src.core.worker_loop import init_worker_process, shutdown_worker_process
+
+worker_process_init.connect(init_worker_process, weak=False)
+worker_process_shutdown.connect(shutdown_worker_process, weak=False)
+
 if __name__ == '__main__':
     celery_app.start()
\ No newline at end of file
@@ -40,7 +40,14 @@ task_routes = {
     'src.assessment.tasks.aggregate_results': {'queue': 'high_priority'},
     'src.assessment.tasks.health_check': {'queue': 'high_priority'},
     'src.assessment.tasks.cleanup_expired_results': {'queue': 'default'},
+    'src.assessment.tasks.reconcile_budget_task': {'queue': 'default'},
+    'src.assessment.tasks.backfill_lighthouse_storage_task': {'queue': 'default'},
+    'src.assessment.tasks.bulk_security_scan_task': {'queue': 'default'},
     'src.assessment.tasks.monitor_assessment_queues': {'queue': 'high_priority'},
+    'src.assessment.batch.batch_assessment_task': {'queue': 'high_priority'},
+    'src.assessment.batch.dispatch_batch_task': {'queue': 'high_priority'},
+    'src.assessment.batch.batch_item_completed': {'queue': 'high_priority'},
+    'src.assessment.batch.batch_item_failed': {'queue': 'high_priority'},
 }
 
 # Queue definitions
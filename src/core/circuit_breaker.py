@@ -0,0 +1,267 @@
+"""
+PRP-002: Provider Circuit Breakers
+Fleet-wide closed/open/half-open breakers that fail fast when a provider degrades
+"""
+
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Dict, Optional
+
+from src.core.cache import CacheKeys, get_redis
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.core.provider_limits import OPENAI, PAGESPEED, PLACES, SCREENSHOTONE, SEMRUSH
+
+logger = get_logger(__name__)
+
+
+class CircuitState(Enum):
+    """Breaker state shared by every worker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose breaker is open"""
+
+    def __init__(self, provider: str, retry_after: float = 0.0):
+        self.provider = provider
+        self.retry_after = retry_after
+        super().__init__(f"{provider} circuit open, retry in {retry_after:.0f}s")
+
+
+# A call slower than this counts against the provider even if it succeeds
+SLOW_CALL_SECONDS: Dict[str, float] = {
+    PAGESPEED: 40.0,
+    PLACES: 5.0,
+    SEMRUSH: 10.0,
+    SCREENSHOTONE: 60.0,
+    OPENAI: 25.0,
+}
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Trip thresholds for one provider."""
+    window_seconds: int
+    min_calls: int
+    error_rate: float
+    slow_call_rate: float
+    slow_call_seconds: float
+    open_seconds: int
+
+
+def circuit_breaker_config(provider: str) -> CircuitBreakerConfig:
+    """Thresholds for a provider from settings."""
+    return CircuitBreakerConfig(
+        window_seconds=settings.CIRCUIT_BREAKER_WINDOW_SECONDS,
+        min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+        error_rate=settings.CIRCUIT_BREAKER_ERROR_RATE,
+        slow_call_rate=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+        slow_call_seconds=SLOW_CALL_SECONDS.get(provider, 30.0),
+        open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+    )
+
+
+# Open breakers turn half-open once their cool-down has passed; a half-open
+# breaker lets a single probe through at a time. Returns {allowed, wait_ms}.
+_BEFORE_CALL_SCRIPT = """
+local key = KEYS[1]
+local open_seconds = tonumber(ARGV[1])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local s = redis.call('HMGET', key, 'state', 'opened_at', 'probe_at')
+local state = s[1] or 'closed'
+if state == 'closed' then
+    return {1, 0}
+end
+if state == 'open' then
+    local elapsed = now - (tonumber(s[2]) or 0)
+    if elapsed < open_seconds then
+        return {0, math.ceil((open_seconds - elapsed) * 1000)}
+    end
+    redis.call('HSET', key, 'state', 'half_open', 'probe_at', now)
+    return {1, 0}
+end
+local probe_elapsed = now - (tonumber(s[3]) or 0)
+if probe_elapsed >= open_seconds then
+    redis.call('HSET', key, 'probe_at', now)
+    return {1, 0}
+end
+return {0, math.ceil((open_seconds - probe_elapsed) * 1000)}
+"""
+
+# Count the outcome in the current window and trip when the error or slow
+# call rate crosses its threshold. A half-open probe closes or re-opens the
+# breaker on its own. Returns the resulting state.
+_RECORD_SCRIPT = """
+local key = KEYS[1]
+local failed = tonumber(ARGV[1])
+local slow = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local min_calls = tonumber(ARGV[4])
+local error_rate = tonumber(ARGV[5])
+local slow_rate = tonumber(ARGV[6])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('EXPIRE', key, 86400)
+local state = redis.call('HGET', key, 'state') or 'closed'
+if state == 'half_open' then
+    if failed == 0 and slow == 0 then
+        redis.call('HSET', key, 'state', 'closed', 'win_start', now, 'calls', 0, 'failures', 0, 'slow', 0)
+        return 'closed'
+    end
+    redis.call('HSET', key, 'state', 'open', 'opened_at', now)
+    return 'open'
+end
+if state == 'open' then
+    return 'open'
+end
+local w = redis.call('HMGET', key, 'win_start', 'calls', 'failures', 'slow')
+local win_start = tonumber(w[1])
+local calls, failures, slows = tonumber(w[2]) or 0, tonumber(w[3]) or 0, tonumber(w[4]) or 0
+if win_start == nil or now - win_start >= window then
+    win_start, calls, failures, slows = now, 0, 0, 0
+end
+calls = calls + 1
+failures = failures + failed
+slows = slows + slow
+redis.call('HSET', key, 'state', 'closed', 'win_start', win_start, 'calls', calls, 'failures', failures, 'slow', slows)
+if calls >= min_calls and (failures / calls >= error_rate or slows / calls >= slow_rate) then
+    redis.call('HSET', key, 'state', 'open', 'opened_at', now)
+    return 'open'
+end
+return 'closed'
+"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one provider with its state in Redis.
+
+    Every process reads and writes the same counters, so one worker seeing a
+    provider fail protects the rest of the fleet. Redis problems fail open:
+    calls proceed as if the breaker were closed.
+    """
+
+    def __init__(self, provider: str, config: Optional[CircuitBreakerConfig] = None):
+        self.provider = provider
+        self.config = config or circuit_breaker_config(provider)
+        self.key = CacheKeys.circuit_breaker(provider)
+
+    async def state(self) -> CircuitState:
+        try:
+            redis_client = await get_redis()
+            raw = await redis_client.hget(self.key, "state")
+        except Exception:
+            return CircuitState.CLOSED
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return CircuitState(raw) if raw else CircuitState.CLOSED
+
+    async def is_open(self) -> bool:
+        """
+        True while the breaker is open and still cooling down. Read-only:
+        unlike before_call() it never claims the half-open probe.
+        """
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return False
+        try:
+            redis_client = await get_redis()
+            state, opened_at = await redis_client.hmget(self.key, "state", "opened_at")
+        except Exception:
+            return False
+        if isinstance(state, bytes):
+            state = state.decode()
+        if state != CircuitState.OPEN.value:
+            return False
+        return time.time() - float(opened_at or 0) < self.config.open_seconds
+
+    async def before_call(self) -> None:
+        """
+        Raises:
+            CircuitOpenError: If the provider should not be called right now
+        """
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return
+        try:
+            redis_client = await get_redis()
+            allowed, wait_ms = await redis_client.eval(
+                _BEFORE_CALL_SCRIPT, 1, self.key, self.config.open_seconds
+            )
+        except Exception as e:
+            logger.warning("Circuit breaker unavailable, allowing call",
+                           provider=self.provider, error=str(e))
+            return
+        if not int(allowed):
+            raise CircuitOpenError(self.provider, int(wait_ms) / 1000)
+
+    async def record(self, success: bool, duration_seconds: float) -> None:
+        """Record one call outcome and trip or reset the breaker as needed."""
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return
+        slow = duration_seconds >= self.config.slow_call_seconds
+        try:
+            redis_client = await get_redis()
+            state = await redis_client.eval(
+                _RECORD_SCRIPT, 1, self.key,
+                0 if success else 1, 1 if slow else 0,
+                self.config.window_seconds, self.config.min_calls,
+                self.config.error_rate, self.config.slow_call_rate
+            )
+        except Exception as e:
+            logger.warning("Failed to record circuit breaker outcome",
+                           provider=self.provider, error=str(e))
+            return
+        if isinstance(state, bytes):
+            state = state.decode()
+        if state == CircuitState.OPEN.value and (not success or slow):
+            logger.warning("Provider circuit open", provider=self.provider,
+                           duration_seconds=round(duration_seconds, 2), success=success)
+
+
+class GuardedCall:
+    """Outcome of one guarded provider request."""
+
+    def __init__(self):
+        self.failed = False
+
+    def check(self, status_code: int) -> None:
+        """Count server errors and throttling as provider failures."""
+        if status_code >= 500 or status_code == 429:
+            self.failed = True
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Breaker for a provider using the configured thresholds."""
+    return CircuitBreaker(provider)
+
+
+async def is_circuit_open(provider: Optional[str]) -> bool:
+    """Whether calls to provider are currently being short-circuited."""
+    if provider is None:
+        return False
+    return await get_circuit_breaker(provider).is_open()
+
+
+@asynccontextmanager
+async def circuit_guard(provider: str) -> AsyncIterator[GuardedCall]:
+    """
+    Wrap a single provider request: fail fast while the breaker is open and
+    record the outcome and latency afterwards. Exceptions and responses
+    flagged via GuardedCall.check() count as failures.
+    """
+    breaker = get_circuit_breaker(provider)
+    await breaker.before_call()
+
+    call = GuardedCall()
+    start = time.monotonic()
+    try:
+        yield call
+    except Exception:
+        await breaker.record(False, time.monotonic() - start)
+        raise
+    await breaker.record(not call.failed, time.monotonic() - start)
@@ -0,0 +1,49 @@
+"""
+PRP-002: Payload Compression
+Compact binary encoding for large JSON payloads kept out of hot columns
+"""
+
+import gzip
+import json
+from typing import Any, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class CompressionError(Exception):
+    """Raised when a stored payload cannot be decoded"""
+    pass
+
+
+ZSTD = "zstd"
+GZIP = "gzip"
+
+
+def compress_json(payload: Any) -> Tuple[bytes, str]:
+    """
+    Serialize payload as compact JSON and compress it, preferring zstd when
+    the zstandard package is installed.
+
+    Returns:
+        Compressed bytes and the encoding name to store alongside them
+    """
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(raw), ZSTD
+    return gzip.compress(raw, compresslevel=6), GZIP
+
+
+def decompress_json(data: bytes, encoding: str) -> Any:
+    """Inverse of compress_json."""
+    if encoding == GZIP:
+        raw = gzip.decompress(data)
+    elif encoding == ZSTD:
+        if zstandard is None:
+            raise CompressionError("zstd payload found but zstandard is not installed")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raise CompressionError(f"Unknown payload encoding: {encoding}")
+    return json.loads(raw)
@@ -31,6 +31,16 @@ class Settings(BaseSettings):
     # Redis Configuration
     REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis URL")
     CACHE_TTL: int = Field(default=3600, description="Default cache TTL in seconds")
+    COMPONENT_CACHE_ENABLED: bool = Field(default=True, description="Reuse provider results for recently assessed sites")
+    CACHE_TTL_PAGESPEED: int = Field(default=86400, description="PageSpeed result cache TTL in seconds (24h)")
+    CACHE_TTL_SEMRUSH: int = Field(default=604800, description="SEMrush result cache TTL in seconds (7d)")
+    CACHE_TTL_GBP: int = Field(default=259200, description="Google Business Profile search cache TTL in seconds (3d)")
+    CACHE_TTL_SECURITY: int = Field(default=21600, description="Security header result cache TTL in seconds (6h)")
+    CACHE_TTL_SCREENSHOTS: int = Field(default=86400, description="Screenshot capture cache TTL in seconds (24h)")
+    CACHE_TTL_SITE_FETCH: int = Field(default=900, description="Shared landing page fetch TTL in seconds, long enough to span one assessment (15m)")
+    CACHE_TTL_LLM: int = Field(default=604800, description="OpenAI vision/content response cache TTL in seconds (7d)")
+    SINGLE_FLIGHT_LEASE_SECONDS: int = Field(default=30, description="Lease held (and renewed) by the owner of an in-flight provider call")
+    SINGLE_FLIGHT_MAX_WAIT_SECONDS: int = Field(default=180, description="Longest a duplicate request waits for the in-flight owner")
     
     # Celery Configuration
     CELERY_BROKER_URL: str = Field(default="redis://localhost:6379/0", description="Celery broker URL")
@@ -51,6 +61,10 @@ class Settings(BaseSettings):
     AWS_DEFAULT_REGION: str = Field(default="us-east-1", description="AWS default region")
     AWS_S3_BUCKET_NAME: Optional[str] = Field(default=None, description="S3 bucket name for file storage")
     
+    # Blob storage for screenshots and other binary artifacts
+    BLOB_STORE_BACKEND: str = Field(default="local", description="Blob store backend: local or s3 (AWS_S3_BUCKET_NAME)")
+    BLOB_STORE_LOCAL_ROOT: str = Field(default="data/blobs", description="Root directory of the local blob store (shared by workers on one host)")
+    
     # Email Configuration
     SENDGRID_API_KEY: Optional[str] = Field(default=None, description="SendGrid API key")
     FROM_EMAIL: str = Field(default="noreply@leadfactory.com", description="Default from email")
@@ -61,11 +75,103 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_REQUESTS: int = Field(default=10, description="Max concurrent HTTP requests")
     REQUEST_TIMEOUT_SECONDS: int = Field(default=30, description="HTTP request timeout")
     MAX_LEADS_PER_BATCH: int = Field(default=100, description="Max leads per batch operation")
+    ASSESSMENT_COMPONENT_CONCURRENCY: int = Field(default=5, description="Max assessment components run concurrently per assessment")
+    MAX_LEADS_PER_BATCH_JOB: int = Field(default=10000, description="Max leads accepted by one batch assessment job")
+    BATCH_ASSESSMENT_LEASE_SECONDS: int = Field(default=2700, description="Lease after which a batch assessment with no result is counted failed and its slot reclaimed (covers the orchestrator task's retries)")
+    
+    # Per-provider concurrency caps (in-flight calls across all workers)
+    PAGESPEED_MAX_CONCURRENCY: int = Field(default=8, description="Max concurrent PageSpeed Insights calls")
+    PLACES_MAX_CONCURRENCY: int = Field(default=5, description="Max concurrent Google Places calls")
+    SEMRUSH_MAX_CONCURRENCY: int = Field(default=3, description="Max concurrent SEMrush calls")
+    SCREENSHOTONE_MAX_CONCURRENCY: int = Field(default=4, description="Max concurrent ScreenshotOne calls")
+    OPENAI_MAX_CONCURRENCY: int = Field(default=6, description="Max concurrent OpenAI calls")
+    PROVIDER_SLOT_LEASE_SECONDS: int = Field(default=300, description="Lease after which an unreleased provider slot is reclaimed")
+    PAGESPEED_RATE_PER_SECOND: float = Field(default=50.0, description="PageSpeed requests per second across all workers")
+    PLACES_RATE_PER_SECOND: float = Field(default=10.0, description="Google Places requests per second across all workers")
+    SEMRUSH_RATE_PER_SECOND: float = Field(default=10.0, description="SEMrush requests per second across all workers")
+    SCREENSHOTONE_RATE_PER_SECOND: float = Field(default=5.0, description="ScreenshotOne requests per second across all workers")
+    OPENAI_RATE_PER_SECOND: float = Field(default=8.0, description="OpenAI requests per second across all workers")
+    RATE_LIMIT_BURST_SECONDS: float = Field(default=1.0, description="Token bucket size as seconds of each provider's rate")
+    CIRCUIT_BREAKER_ENABLED: bool = Field(default=True, description="Short-circuit calls to providers that are failing")
+    CIRCUIT_BREAKER_WINDOW_SECONDS: int = Field(default=60, description="Window over which provider error and slow-call rates are measured")
+    CIRCUIT_BREAKER_MIN_CALLS: int = Field(default=10, description="Calls needed in a window before a breaker may trip")
+    CIRCUIT_BREAKER_ERROR_RATE: float = Field(default=0.5, description="Failure ratio that opens a provider breaker")
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = Field(default=0.8, description="Slow-call ratio that opens a provider breaker")
+    CIRCUIT_BREAKER_OPEN_SECONDS: int = Field(default=30, description="Cool-down before an open breaker lets a probe through")
+    PAGESPEED_HEDGE_ENABLED: bool = Field(default=False, description="Send a duplicate PageSpeed request when the first is slower than usual")
+    PAGESPEED_HEDGE_QUANTILE: float = Field(default=0.95, description="Observed latency quantile after which a PageSpeed request is hedged")
+    PAGESPEED_HEDGE_DEFAULT_DELAY_SECONDS: float = Field(default=30.0, description="Hedge delay used until enough latencies are recorded")
+    PAGESPEED_HEDGE_MIN_DELAY_SECONDS: float = Field(default=5.0, description="Lower bound on the PageSpeed hedge delay")
     
     # Cost Control
     COST_BUDGET_USD: float = Field(default=1000.0, description="Monthly cost budget in USD")
     DAILY_BUDGET_CAP: float = Field(default=100.0, description="Daily cost cap in USD")
     PER_LEAD_CAP: float = Field(default=2.50, description="Cost cap per lead assessment")
+    BUDGET_ADMISSION_ENABLED: bool = Field(default=True, description="Reserve estimated cost against budget caps before paid API calls")
+    
+    # Headless browser pool
+    BROWSER_POOL_SIZE: int = Field(default=2, description="Chromium browsers kept alive per worker process")
+    BROWSER_POOL_MAX_PAGES_PER_BROWSER: int = Field(default=100, description="Contexts a browser serves before it is relaunched")
+    BROWSER_POOL_MAX_RSS_MB: int = Field(default=768, description="Browser process tree memory that triggers a relaunch")
+    BROWSER_POOL_ACQUIRE_TIMEOUT_SECONDS: float = Field(default=60.0, description="Wait for an idle pooled browser before failing")
+    
+    # Outbound HTTP
+    HTTP2_ENABLED: bool = Field(default=True, description="Negotiate HTTP/2 with upstreams that support it (requires h2)")
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = Field(default=60.0, description="Idle time before pooled keep-alive connections are closed")
+    
+    # CPU-bound work
+    PROCESS_POOL_WORKERS: int = Field(default=0, description="Worker processes for image decoding and diffs (0 = CPU count - 1)")
+    IMAGE_SERVICE_MAX_QUEUE: int = Field(default=32, description="Image jobs allowed to wait for a worker before new ones are rejected")
+    
+    # Shared landing page fetch
+    SITE_FETCH_TIMEOUT_SECONDS: float = Field(default=15.0, description="Timeout for the shared landing page fetch")
+    SITE_FETCH_MAX_BODY_BYTES: int = Field(default=1024 * 1024, description="Landing page body bytes kept on the shared fetch")
+    
+    # Reachability pre-check
+    REACHABILITY_CHECK_ENABLED: bool = Field(default=True, description="Probe the site before running URL-dependent paid components")
+    REACHABILITY_DNS_TIMEOUT_SECONDS: float = Field(default=1.5, description="DNS resolution timeout for the pre-check")
+    REACHABILITY_CONNECT_TIMEOUT_SECONDS: float = Field(default=2.0, description="Connect timeout for the pre-check's HTTP probe")
+    REACHABILITY_NEGATIVE_TTL_SECONDS: int = Field(default=3600, description="How long a domain that failed the pre-check is treated as dead")
+    REACHABILITY_TRANSIENT_TTL_SECONDS: int = Field(default=60, description="How long a timeout or temporary DNS failure is remembered")
+    
+    # Near-duplicate screenshot reuse
+    VISUAL_REUSE_ENABLED: bool = Field(default=True, description="Reuse a prior visual analysis when both screenshots are perceptual near-duplicates")
+    VISUAL_REUSE_MAX_DISTANCE: int = Field(default=4, description="Max pHash/dHash bit distance (of 64) for screenshots to count as the same page")
+    VISUAL_REUSE_MAX_AGE_DAYS: int = Field(default=30, description="Only analyses newer than this are reused")
+    VISUAL_REUSE_MAX_CANDIDATES: int = Field(default=5000, description="Most recent analyses compared per lookup")
+    
+    # LLM response cache
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Reuse OpenAI responses for identical model, prompt and inputs")
+    LLM_CACHE_DISK_DIR: Optional[str] = Field(default=None, description="Directory for an on-disk response tier that outlives Redis eviction (disabled when unset)")
+    LLM_CACHE_DISK_SWEEP_INTERVAL_SECONDS: int = Field(default=3600, description="Minimum time between sweeps that delete expired on-disk responses")
+    
+    # Bulk security header triage
+    BULK_SCAN_CONCURRENCY: int = Field(default=500, description="Domains scanned concurrently by one bulk scan")
+    BULK_SCAN_PER_HOST_CONCURRENCY: int = Field(default=4, description="Concurrent requests to one resolved IP (shared hosting)")
+    BULK_SCAN_TIMEOUT_SECONDS: float = Field(default=10.0, description="Connect plus response-headers timeout per domain")
+    BULK_SCAN_BATCH_SIZE: int = Field(default=500, description="Results written to security_analysis per transaction")
+    BULK_SCAN_DNS_TTL_SECONDS: int = Field(default=300, description="How long resolved and failed DNS lookups are reused")
+    
+    # robots.txt / sitemap.xml fetching
+    SEO_FILE_TIMEOUT_SECONDS: float = Field(default=10.0, description="Per-request timeout for robots.txt and sitemap fetches")
+    SEO_ROBOTS_MAX_BYTES: int = Field(default=512 * 1024, description="robots.txt bytes read before truncating (crawlers ignore the rest)")
+    SEO_SITEMAP_MAX_BYTES: int = Field(default=10 * 1024 * 1024, description="Uncompressed sitemap bytes parsed before truncating")
+    SEO_SITEMAP_MAX_CHILDREN: int = Field(default=10, description="Child sitemaps of a sitemap index fetched to count URLs")
+    SEO_FILE_CACHE_TTL_SECONDS: int = Field(default=7 * 24 * 3600, description="How long ETag/Last-Modified validators and parsed results are kept")
+    
+    # Broken internal link check
+    SECURITY_SIGNALS_TIME_BUDGET_SECONDS: float = Field(default=6.0, description="Budget for robots/sitemap and link checks during security analysis, counted from its start; keep it inside the 10s security timeout")
+    LINK_CHECK_ENABLED: bool = Field(default=True, description="Check the landing page's internal links during security analysis")
+    LINK_CHECK_MAX_URLS: int = Field(default=100, description="Hard cap on links checked per site")
+    LINK_CHECK_PER_HOST_CONCURRENCY: int = Field(default=4, description="Concurrent link checks against one host")
+    LINK_CHECK_TIME_BUDGET_SECONDS: float = Field(default=15.0, description="Wall-clock budget for a site's link check; unfinished links are left unchecked")
+    LINK_CHECK_REQUEST_TIMEOUT_SECONDS: float = Field(default=5.0, description="Timeout for each link's HEAD/GET")
+    LINK_CHECK_SITEMAP_SAMPLE_SIZE: int = Field(default=20, description="Sitemap page URLs added to the landing page's links")
+    
+    # TLS certificate probe
+    TLS_PROBE_TIMEOUT_SECONDS: float = Field(default=10.0, description="Connect plus handshake timeout for the TLS probe")
+    TLS_CERT_CACHE_EXPIRY_MARGIN_SECONDS: int = Field(default=24 * 3600, description="Stop serving a cached certificate this long before it expires")
+    TLS_CERT_CACHE_MAX_TTL_SECONDS: int = Field(default=7 * 24 * 3600, description="Upper bound on certificate caching so early renewals are noticed")
     
     # Feature Flags
     ENABLE_ENRICHMENT: bool = Field(default=True, description="Enable lead enrichment")
@@ -0,0 +1,200 @@
+"""
+PRP-002: Shared HTTP Clients
+Process-wide pooled httpx clients per upstream with HTTP/2, keep-alive tuning and reuse metrics
+"""
+
+import asyncio
+import http.cookiejar
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import httpx
+from prometheus_client import Counter
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class HTTPClientRegistryError(Exception):
+    """Raised for unknown client profiles"""
+    pass
+
+
+@dataclass(frozen=True)
+class HTTPClientProfile:
+    """Connection settings for one upstream."""
+    timeout: float
+    http2: bool = False
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    follow_redirects: bool = False
+    verify: bool = True
+    persist_cookies: bool = True
+
+
+# Google and OpenAI front ends negotiate h2, so one multiplexed connection
+# per host replaces a pool of TLS handshakes. Site fetches go to arbitrary
+# origins and stay on HTTP/1.1, without a cookie jar: cookies from one
+# site must not be replayed on the next fetch or pile up across hosts.
+CLIENT_PROFILES: Dict[str, HTTPClientProfile] = {
+    "pagespeed": HTTPClientProfile(timeout=60.0, http2=True, max_connections=20, max_keepalive_connections=10),
+    "places": HTTPClientProfile(timeout=30.0, http2=True, max_connections=10, max_keepalive_connections=5),
+    "semrush": HTTPClientProfile(timeout=30.0, max_connections=10, max_keepalive_connections=5),
+    "screenshotone": HTTPClientProfile(timeout=120.0, max_connections=10, max_keepalive_connections=5),
+    "openai": HTTPClientProfile(timeout=30.0, http2=True, max_connections=20, max_keepalive_connections=10),
+    "site": HTTPClientProfile(timeout=30.0, max_connections=100, max_keepalive_connections=20,
+                              follow_redirects=True, verify=False, persist_cookies=False),
+    # Bulk triage touches each host once and drops the connection after the
+    # headers, so there is nothing worth keeping alive
+    "bulk_scan": HTTPClientProfile(timeout=10.0, max_connections=1000, max_keepalive_connections=0,
+                                   follow_redirects=True, verify=False, persist_cookies=False),
+}
+
+HTTP_REQUESTS = Counter(
+    "leadfactory_http_client_requests_total",
+    "Outbound requests sent through shared HTTP clients",
+    ["client"],
+)
+HTTP_CONNECTIONS_OPENED = Counter(
+    "leadfactory_http_client_connections_opened_total",
+    "New TCP connections opened by shared HTTP clients",
+    ["client"],
+)
+HTTP_TLS_HANDSHAKES = Counter(
+    "leadfactory_http_client_tls_handshakes_total",
+    "TLS handshakes performed by shared HTTP clients",
+    ["client"],
+)
+
+
+def _discarding_cookie_jar() -> http.cookiejar.CookieJar:
+    """Jar whose policy accepts no domain, so Set-Cookie is never stored or sent back"""
+    return http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HTTPClientRegistry:
+    """
+    Lazily built httpx.AsyncClient per (profile, event loop).
+
+    Clients are bound to the loop they were created on, so the API process
+    and each Celery worker loop get their own; a client whose loop has been
+    closed is discarded and rebuilt. Connection reuse is observed through
+    httpcore trace events and exported as Prometheus counters.
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, HTTPClientProfile]] = None):
+        self.profiles = profiles or CLIENT_PROFILES
+        self._clients: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, name: str, field: str) -> None:
+        stats = self._stats.setdefault(name, {"requests": 0, "connections_opened": 0, "tls_handshakes": 0})
+        stats[field] += 1
+
+    def _uses_http2(self, profile: HTTPClientProfile) -> bool:
+        return profile.http2 and settings.HTTP2_ENABLED and _http2_available()
+
+    def _build(self, name: str, profile: HTTPClientProfile) -> httpx.AsyncClient:
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                HTTP_CONNECTIONS_OPENED.labels(client=name).inc()
+                self._count(name, "connections_opened")
+            elif event_name == "connection.start_tls.complete":
+                HTTP_TLS_HANDSHAKES.labels(client=name).inc()
+                self._count(name, "tls_handshakes")
+
+        async def on_request(request: httpx.Request) -> None:
+            HTTP_REQUESTS.labels(client=name).inc()
+            self._count(name, "requests")
+            request.extensions["trace"] = trace
+
+        return httpx.AsyncClient(
+            http2=self._uses_http2(profile),
+            timeout=httpx.Timeout(profile.timeout),
+            limits=httpx.Limits(
+                max_connections=profile.max_connections,
+                max_keepalive_connections=profile.max_keepalive_connections,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            follow_redirects=profile.follow_redirects,
+            verify=profile.verify,
+            cookies=None if profile.persist_cookies else _discarding_cookie_jar(),
+            event_hooks={"request": [on_request]},
+        )
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """Shared client for a profile on the running event loop."""
+        profile = self.profiles.get(name)
+        if profile is None:
+            raise HTTPClientRegistryError(f"Unknown HTTP client profile: {name}")
+
+        loop = asyncio.get_running_loop()
+        key = (name, id(loop))
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry[0] is loop and not entry[1].is_closed:
+                return entry[1]
+
+            # Forget clients whose loops are gone (ids can be reused)
+            for stale_key, (stale_loop, _) in list(self._clients.items()):
+                if stale_loop.is_closed() or stale_key == key:
+                    del self._clients[stale_key]
+
+            client = self._build(name, profile)
+            self._clients[key] = (loop, client)
+            logger.info("HTTP client created", client=name, http2=self._uses_http2(profile))
+            return client
+
+    async def aclose_loop(self) -> int:
+        """Close every client bound to the running loop. Returns the number closed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = [(key, client) for key, (client_loop, client) in self._clients.items() if client_loop is loop]
+            for key, _ in owned:
+                del self._clients[key]
+
+        for _, client in owned:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Failed to close HTTP client", error=str(e))
+        return len(owned)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-client request, connection and TLS counts with the reuse ratio."""
+        report = {}
+        for name, stats in self._stats.items():
+            requests = stats["requests"]
+            report[name] = {
+                **stats,
+                "reuse_ratio": round(1 - stats["connections_opened"] / requests, 3) if requests else 0.0,
+            }
+        return report
+
+
+# Global registry instance
+http_clients = HTTPClientRegistry()
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Shared pooled client for a provider or for generic site fetches."""
+    return http_clients.get(name)
+
+
+async def shutdown_http_clients() -> None:
+    """Lifespan/worker shutdown hook: close clients owned by this loop."""
+    closed = await http_clients.aclose_loop()
+    logger.info("HTTP clients closed", count=closed, stats=http_clients.stats())
@@ -0,0 +1,62 @@
+"""
+PRP-002: Process Pool
+Executor for CPU-bound work (image decoding, diffs) so it never runs on the event loop
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+_executor: Optional[Executor] = None
+
+
+def pool_size() -> int:
+    return settings.PROCESS_POOL_WORKERS or max(1, (os.cpu_count() or 2) - 1)
+
+
+def get_process_pool() -> Executor:
+    """
+    Process-wide executor, created on first use.
+
+    Celery prefork children are daemonic and may not start processes of their
+    own, so there the pool is made of threads instead; NumPy and PIL release
+    the GIL for most of their work.
+    """
+    global _executor
+
+    if _executor is None:
+        workers = pool_size()
+        if multiprocessing.current_process().daemon:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cpu-pool")
+        else:
+            # spawn: forking a process that runs event loop threads is unsafe
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        logger.info("Process pool started", workers=workers, kind=type(_executor).__name__)
+
+    return _executor
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a picklable module-level function in the pool and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), partial(func, *args, **kwargs))
+
+
+async def shutdown_process_pool() -> None:
+    """Stop the pool's workers, dropping queued work"""
+    global _executor
+
+    executor, _executor = _executor, None
+    if executor is not None:
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+        logger.info("Process pool stopped")
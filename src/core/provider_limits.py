@@ -0,0 +1,160 @@
+"""
+PRP-002: Provider Concurrency Limits
+Cross-worker caps on in-flight calls to each paid provider
+"""
+
+import asyncio
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from src.core.cache import CacheKeys, get_redis
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# Provider identifiers used across limiters, caches and breakers
+PAGESPEED = "pagespeed"
+PLACES = "places"
+SEMRUSH = "semrush"
+SCREENSHOTONE = "screenshotone"
+OPENAI = "openai"
+
+# Which provider each orchestrator component spends its time on
+COMPONENT_PROVIDERS: Dict[str, str] = {
+    "pagespeed": PAGESPEED,
+    "gbp": PLACES,
+    "semrush": SEMRUSH,
+    "screenshots": SCREENSHOTONE,
+    "visual_analysis": OPENAI,
+    "content_generation": OPENAI,
+}
+
+
+def provider_limits() -> Dict[str, int]:
+    """Current per-provider concurrency caps from settings."""
+    return {
+        PAGESPEED: settings.PAGESPEED_MAX_CONCURRENCY,
+        PLACES: settings.PLACES_MAX_CONCURRENCY,
+        SEMRUSH: settings.SEMRUSH_MAX_CONCURRENCY,
+        SCREENSHOTONE: settings.SCREENSHOTONE_MAX_CONCURRENCY,
+        OPENAI: settings.OPENAI_MAX_CONCURRENCY,
+    }
+
+
+class ProviderLimitError(Exception):
+    """Raised when a provider slot cannot be acquired in time"""
+    pass
+
+
+# Holders live in a sorted set scored by lease expiry. Expired holders are
+# pruned before counting, so a crashed worker only blocks a slot until its
+# lease runs out.
+_ACQUIRE_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local expires = tonumber(ARGV[3])
+local holder = ARGV[4]
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, expires, holder)
+    redis.call('EXPIRE', key, math.ceil(expires - now) + 60)
+    return 1
+end
+return 0
+"""
+
+
+class ProviderSemaphore:
+    """Distributed counting semaphore for one provider, stored in Redis."""
+
+    POLL_INTERVAL_SECONDS = 0.25
+
+    def __init__(self, provider: str, limit: int, lease_seconds: Optional[int] = None):
+        self.provider = provider
+        self.limit = limit
+        self.lease_seconds = lease_seconds or settings.PROVIDER_SLOT_LEASE_SECONDS
+        self.key = CacheKeys.provider_slots(provider)
+
+    async def acquire(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for a free slot.
+
+        Returns:
+            Holder token to pass to release(), or None if Redis is unavailable
+            (limits fail open rather than stalling every assessment)
+        """
+        holder = uuid.uuid4().hex
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while True:
+            try:
+                redis_client = await get_redis()
+                now = time.time()
+                acquired = await redis_client.eval(
+                    _ACQUIRE_SCRIPT, 1, self.key,
+                    now, self.limit, now + self.lease_seconds, holder
+                )
+            except Exception as e:
+                logger.warning("Provider limiter unavailable, proceeding without slot",
+                               provider=self.provider, error=str(e))
+                return None
+
+            if acquired:
+                return holder
+
+            if deadline is not None and time.monotonic() >= deadline:
+                raise ProviderLimitError(
+                    f"Timed out waiting for {self.provider} slot (limit {self.limit})"
+                )
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS * (0.5 + random.random()))
+
+    async def release(self, holder: Optional[str]) -> None:
+        if holder is None:
+            return
+        try:
+            redis_client = await get_redis()
+            await redis_client.zrem(self.key, holder)
+        except Exception as e:
+            logger.warning("Failed to release provider slot", provider=self.provider, error=str(e))
+
+    async def in_flight(self) -> int:
+        try:
+            redis_client = await get_redis()
+            await redis_client.zremrangebyscore(self.key, "-inf", time.time())
+            return await redis_client.zcard(self.key)
+        except Exception:
+            return 0
+
+
+def get_provider_semaphore(provider: str) -> ProviderSemaphore:
+    """Semaphore for a provider using the configured cap."""
+    limits = provider_limits()
+    if provider not in limits:
+        raise ProviderLimitError(f"Unknown provider: {provider}")
+    return ProviderSemaphore(provider, limits[provider])
+
+
+@asynccontextmanager
+async def provider_slot(provider: Optional[str], timeout: Optional[float] = None) -> AsyncIterator[None]:
+    """
+    Hold one concurrency slot for a provider for the duration of the block.
+
+    A None provider (internal components such as security headers or score
+    calculation) is unlimited.
+    """
+    if provider is None:
+        yield
+        return
+
+    semaphore = get_provider_semaphore(provider)
+    holder = await semaphore.acquire(timeout=timeout)
+    try:
+        yield
+    finally:
+        await semaphore.release(holder)
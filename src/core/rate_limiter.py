@@ -0,0 +1,202 @@
+"""
+PRP-002: Provider Rate Limits
+Redis token buckets that hold every worker to each provider's request quota
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.core.cache import CacheKeys, get_redis
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.core.provider_limits import OPENAI, PAGESPEED, PLACES, SCREENSHOTONE, SEMRUSH
+
+logger = get_logger(__name__)
+
+
+class RateLimitError(Exception):
+    """Raised when a provider token cannot be obtained in time"""
+    pass
+
+
+@dataclass(frozen=True)
+class TokenBucketConfig:
+    """Refill rate and bucket size for one provider."""
+    rate_per_second: float
+    burst: int
+
+
+def rate_limit_configs() -> Dict[str, TokenBucketConfig]:
+    """Current per-provider request rates from settings."""
+    rates = {
+        PAGESPEED: settings.PAGESPEED_RATE_PER_SECOND,
+        PLACES: settings.PLACES_RATE_PER_SECOND,
+        SEMRUSH: settings.SEMRUSH_RATE_PER_SECOND,
+        SCREENSHOTONE: settings.SCREENSHOTONE_RATE_PER_SECOND,
+        OPENAI: settings.OPENAI_RATE_PER_SECOND,
+    }
+    return {
+        provider: TokenBucketConfig(rate, max(1, int(rate * settings.RATE_LIMIT_BURST_SECONDS)))
+        for provider, rate in rates.items()
+    }
+
+
+# Refill from elapsed server time, then grant up to ARGV[3] tokens. While
+# the bucket is at least half full the caller may take a small batch to
+# spend locally; under contention everyone gets one token per round trip.
+# Returns {granted, wait_ms}.
+_TAKE_SCRIPT = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+    tokens = burst
+    ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local granted = 0
+if tokens >= 1 then
+    if tokens >= burst / 2 then
+        granted = math.min(want, math.floor(tokens))
+    else
+        granted = 1
+    end
+    tokens = tokens - granted
+end
+redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', key, math.ceil(burst / rate) + 60)
+if granted > 0 then
+    return {granted, 0}
+end
+return {0, math.ceil((1 - tokens) / rate * 1000)}
+"""
+
+
+class TokenBucket:
+    """
+    Distributed token bucket for one provider.
+
+    Tokens live in Redis so the API process and every Celery worker share one
+    quota. When the bucket is uncontended a caller prefetches a few tokens and
+    spends them from a local reservoir without further round trips; prefetched
+    tokens go stale after LOCAL_TOKEN_TTL_SECONDS so an idle process cannot
+    hoard quota. Batches are capped at a quarter of the burst, so small
+    buckets (ScreenshotOne, OpenAI) are taken one token at a time and no
+    worker can drain them for others. If Redis is unreachable the bucket degrades to a
+    process-local limiter at the same rate.
+    """
+
+    LOCAL_BATCH_MAX = 5
+    LOCAL_TOKEN_TTL_SECONDS = 1.0
+
+    def __init__(self, provider: str, config: TokenBucketConfig):
+        self.provider = provider
+        self.config = config
+        self.key = CacheKeys.rate_limit(provider, "bucket")
+        self._lock = threading.Lock()
+        self._reservoir: List[float] = []  # expiry times of prefetched tokens
+        self._local_tokens = float(config.burst)
+        self._local_ts = time.monotonic()
+
+    def _take_local(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            while self._reservoir and self._reservoir[0] <= now:
+                self._reservoir.pop(0)
+            if self._reservoir:
+                self._reservoir.pop(0)
+                return True
+        return False
+
+    def _stash(self, count: int) -> None:
+        expires = time.monotonic() + self.LOCAL_TOKEN_TTL_SECONDS
+        with self._lock:
+            self._reservoir.extend([expires] * count)
+
+    def _take_fallback(self) -> float:
+        """Process-local bucket used while Redis is down. Returns seconds to wait."""
+        now = time.monotonic()
+        with self._lock:
+            self._local_tokens = min(
+                self.config.burst,
+                self._local_tokens + (now - self._local_ts) * self.config.rate_per_second
+            )
+            self._local_ts = now
+            if self._local_tokens >= 1:
+                self._local_tokens -= 1
+                return 0.0
+            return (1 - self._local_tokens) / self.config.rate_per_second
+
+    async def _take_remote(self) -> float:
+        """Take tokens from Redis. Returns seconds to wait, 0 when granted."""
+        want = max(1, min(self.LOCAL_BATCH_MAX, self.config.burst // 4))
+        try:
+            redis_client = await get_redis()
+            granted, wait_ms = await redis_client.eval(
+                _TAKE_SCRIPT, 1, self.key,
+                self.config.rate_per_second, self.config.burst, want
+            )
+        except Exception as e:
+            logger.warning("Rate limiter unavailable, using local bucket",
+                           provider=self.provider, error=str(e))
+            return self._take_fallback()
+
+        granted = int(granted)
+        if granted:
+            self._stash(granted - 1)
+            return 0.0
+        return max(int(wait_ms), 1) / 1000
+
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until one request may be sent to the provider.
+
+        Raises:
+            RateLimitError: If no token became available within timeout
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while True:
+            if self._take_local():
+                return
+
+            wait = await self._take_remote()
+            if wait == 0:
+                return
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitError(
+                    f"Timed out waiting for {self.provider} rate limit "
+                    f"({self.config.rate_per_second}/s)"
+                )
+            await asyncio.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> TokenBucket:
+    """Shared token bucket for a provider using the configured rate."""
+    with _buckets_lock:
+        bucket = _buckets.get(provider)
+        if bucket is None:
+            configs = rate_limit_configs()
+            if provider not in configs:
+                raise RateLimitError(f"Unknown provider: {provider}")
+            bucket = _buckets[provider] = TokenBucket(provider, configs[provider])
+        return bucket
+
+
+async def acquire_rate_limit(provider: str, timeout: Optional[float] = None) -> None:
+    """Block until a request to provider fits within its rate limit."""
+    await get_rate_limiter(provider).acquire(timeout=timeout)
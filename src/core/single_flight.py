@@ -0,0 +1,217 @@
+"""
+PRP-011: Single-Flight Coalescing
+Cross-process deduplication of identical in-flight provider calls via Redis
+"""
+
+import asyncio
+import json
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
+
+from src.core.budget import BudgetExceededError
+from src.core.cache import CacheKeys, get_redis
+from src.core.circuit_breaker import CircuitOpenError
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+class SingleFlightError(Exception):
+    """Raised to waiters when the owning call failed"""
+    pass
+
+
+# Owner failures re-raised to waiters as themselves, so orchestrators still
+# skip instead of fail; anything else reaches waiters as SingleFlightError
+_SHARED_ERRORS = {cls.__name__: cls for cls in (CircuitOpenError, BudgetExceededError)}
+
+
+# Only the current owner may extend or release a lease
+_EXTEND_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """
+    First caller for a key owns the work; concurrent callers anywhere in the
+    fleet wait for and share its outcome.
+
+    The owner holds a Redis lease that a heartbeat keeps extending while the
+    call runs. If the owner process dies the lease lapses and the next waiter
+    takes over. Outcomes are published under a short-lived result key; a
+    result that is not shareable is not published, so waiters take over and
+    make their own call instead of reusing it.
+    """
+
+    POLL_INTERVAL_SECONDS = 0.25
+    RESULT_TTL_SECONDS = 120
+
+    def __init__(self, lease_seconds: Optional[int] = None, max_wait_seconds: Optional[int] = None):
+        self.lease_seconds = lease_seconds or settings.SINGLE_FLIGHT_LEASE_SECONDS
+        self.max_wait_seconds = max_wait_seconds or settings.SINGLE_FLIGHT_MAX_WAIT_SECONDS
+
+    async def do(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        serialize: Callable[[T], Any],
+        deserialize: Callable[[Any], T],
+        shareable: Callable[[T], bool] = lambda _: True,
+    ) -> Tuple[T, bool]:
+        """
+        Run compute() once per key across all processes.
+
+        Args:
+            shareable: Whether a result may be handed to other callers
+
+        Returns:
+            Tuple of result and whether it was shared from another caller
+        """
+        lease_key = CacheKeys.single_flight_lease(key)
+        result_key = CacheKeys.single_flight_result(key)
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.max_wait_seconds
+
+        while True:
+            try:
+                redis_client = await get_redis()
+                acquired = await redis_client.set(lease_key, token, nx=True, ex=self.lease_seconds)
+            except Exception as e:
+                logger.warning("Single-flight unavailable, calling directly", key=key, error=str(e))
+                return await compute(), False
+
+            if acquired:
+                # A previous owner may have published while we were acquiring;
+                # reuse a success, but never replay an earlier failure
+                shared = await self._read_result(redis_client, result_key, deserialize, raise_errors=False)
+                if shared is not None:
+                    await self._release(redis_client, lease_key, token)
+                    return shared, True
+                await self._discard(redis_client, result_key)
+                return await self._run_as_owner(
+                    redis_client, key, lease_key, result_key, token, compute, serialize, shareable
+                ), False
+
+            shared = await self._wait_for_owner(redis_client, lease_key, result_key, deserialize, deadline)
+            if shared is not None:
+                return shared, True
+
+            if time.monotonic() >= deadline:
+                logger.warning("Gave up waiting for in-flight owner, calling directly", key=key)
+                return await compute(), False
+            # Lease lapsed without a result: owner crashed, try to take over
+
+    async def _run_as_owner(self, redis_client, key, lease_key, result_key, token, compute, serialize, shareable):
+        heartbeat = asyncio.create_task(self._heartbeat(redis_client, lease_key, token))
+        try:
+            result = await compute()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                await self._publish(redis_client, result_key, self._error_outcome(e))
+            raise
+        else:
+            try:
+                if shareable(result):
+                    await self._publish(redis_client, result_key, {"ok": True, "payload": serialize(result)})
+                else:
+                    logger.info("Not sharing single-flight result", key=key)
+            except Exception as e:
+                logger.warning("Failed to publish single-flight result", key=key, error=str(e))
+            return result
+        finally:
+            heartbeat.cancel()
+            await self._release(redis_client, lease_key, token)
+
+    async def _wait_for_owner(self, redis_client, lease_key, result_key, deserialize, deadline):
+        """Poll until the owner publishes, the lease lapses, or we time out."""
+        while time.monotonic() < deadline:
+            shared = await self._read_result(redis_client, result_key, deserialize)
+            if shared is not None:
+                return shared
+            try:
+                if not await redis_client.exists(lease_key):
+                    # Owner finished between polls or crashed; one last look
+                    return await self._read_result(redis_client, result_key, deserialize)
+            except Exception:
+                return None
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS * (0.5 + random.random()))
+        return None
+
+    async def _read_result(self, redis_client, result_key, deserialize, raise_errors: bool = True):
+        try:
+            raw = await redis_client.get(result_key)
+        except Exception:
+            return None
+        if not raw:
+            return None
+        outcome = json.loads(raw)
+        if not outcome.get("ok"):
+            if raise_errors:
+                raise self._owner_error(outcome)
+            return None
+        return deserialize(outcome["payload"])
+
+    @staticmethod
+    def _error_outcome(error: Exception) -> dict:
+        outcome = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+        if type(error).__name__ in _SHARED_ERRORS:
+            outcome.update(error_type=type(error).__name__, error_args=list(error.args), error_attrs=vars(error))
+        return outcome
+
+    @staticmethod
+    def _owner_error(outcome) -> Exception:
+        """Rebuild the owner's exception for a waiter"""
+        error_class = _SHARED_ERRORS.get(outcome.get("error_type"))
+        if error_class is None:
+            return SingleFlightError(outcome.get("error", "In-flight owner failed"))
+        error = error_class.__new__(error_class)
+        error.args = tuple(outcome.get("error_args", ()))
+        error.__dict__.update(outcome.get("error_attrs", {}))
+        return error
+
+    async def _discard(self, redis_client, result_key) -> None:
+        try:
+            await redis_client.delete(result_key)
+        except Exception:
+            pass
+
+    async def _publish(self, redis_client, result_key, outcome) -> None:
+        try:
+            await redis_client.set(result_key, json.dumps(outcome, default=str), ex=self.RESULT_TTL_SECONDS)
+        except Exception as e:
+            logger.warning("Failed to publish single-flight outcome", error=str(e))
+
+    async def _heartbeat(self, redis_client, lease_key, token) -> None:
+        interval = max(self.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await redis_client.eval(_EXTEND_SCRIPT, 1, lease_key, token, self.lease_seconds)
+            except Exception:
+                pass
+
+    async def _release(self, redis_client, lease_key, token) -> None:
+        try:
+            await redis_client.eval(_RELEASE_SCRIPT, 1, lease_key, token)
+        except Exception:
+            pass
+
+
+# Global single-flight instance
+single_flight = SingleFlight()
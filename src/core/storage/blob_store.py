@@ -0,0 +1,255 @@
+"""
+PRP-000: Blob Store
+Content-addressed binary storage so large artifacts travel as compact references
+"""
+
+import abc
+import asyncio
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, List, Optional, Union
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+BLOB_SCHEME = "blob://"
+
+
+class BlobStoreError(Exception):
+    """Raised when a blob cannot be stored or read"""
+    pass
+
+
+def is_blob_ref(value: Optional[str]) -> bool:
+    return bool(value) and value.startswith(BLOB_SCHEME)
+
+
+def blob_key(ref: str) -> str:
+    """Storage key of a blob reference"""
+    if not is_blob_ref(ref):
+        raise BlobStoreError(f"Not a blob reference: {ref!r}")
+    key = ref[len(BLOB_SCHEME):]
+    if not key or key.startswith("/") or ".." in key.split("/"):
+        raise BlobStoreError(f"Invalid blob reference: {ref!r}")
+    return key
+
+
+def content_key(data: Union[bytes, memoryview], prefix: str, extension: str) -> str:
+    """Key derived from the content, so identical bytes are stored once"""
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{prefix.strip('/')}/{digest[:2]}/{digest}.{extension.lstrip('.')}"
+
+
+class _ViewReader(io.RawIOBase):
+    """Seekable file object reading from a memoryview without copying it up front"""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._view[self._pos:self._pos + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class Blob:
+    """
+    Read-only view of stored bytes.
+
+    Backed by an mmap for local files and by the downloaded bytes otherwise.
+    view() never copies and stream() only copies what is read; neither may
+    be used after close().
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        self._buffer = buffer
+        self._views: List[memoryview] = []
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def view(self) -> memoryview:
+        view = memoryview(self._buffer)
+        self._views.append(view)
+        return view
+
+    def stream(self) -> BinaryIO:
+        """Seekable file object over the blob (for decoders such as PIL)"""
+        return _ViewReader(self.view())
+
+    def close(self) -> None:
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+class BlobStore(abc.ABC):
+    """Backend interface: write-once storage addressed by key"""
+
+    name = "base"
+
+    async def put(self, data: Union[bytes, memoryview], prefix: str, extension: str,
+                  content_type: str = "application/octet-stream") -> str:
+        """
+        Store data under its content hash and return its blob:// reference.
+
+        Writing bytes that are already stored is a no-op.
+        """
+        key = content_key(data, prefix, extension)
+        if not await self._exists(key):
+            await self._write(key, data, content_type)
+        return BLOB_SCHEME + key
+
+    @asynccontextmanager
+    async def open(self, ref: str) -> AsyncIterator[Blob]:
+        """Read a blob; its views are released when the block exits"""
+        blob = await self._read(blob_key(ref))
+        try:
+            yield blob
+        finally:
+            blob.close()
+
+    async def read_bytes(self, ref: str) -> bytes:
+        async with self.open(ref) as blob:
+            return bytes(blob.view())
+
+    @abc.abstractmethod
+    async def _exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def _write(self, key: str, data: Union[bytes, memoryview], content_type: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def _read(self, key: str) -> Blob:
+        raise NotImplementedError
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files under a root directory, read back through mmap"""
+
+    name = "local"
+
+    def __init__(self, root: Union[str, Path, None] = None):
+        self.root = Path(root or settings.BLOB_STORE_LOCAL_ROOT)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    def path_of(self, ref: str) -> Path:
+        """Filesystem path of a blob reference"""
+        return self._path(blob_key(ref))
+
+    async def _exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    async def _write(self, key: str, data: Union[bytes, memoryview], content_type: str) -> None:
+        await asyncio.to_thread(self._write_file, self._path(key), data)
+
+    @staticmethod
+    def _write_file(path: Path, data: Union[bytes, memoryview]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    async def _read(self, key: str) -> Blob:
+        try:
+            with open(self._path(key), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return Blob(b"")
+                return Blob(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except FileNotFoundError:
+            raise BlobStoreError(f"Blob not found: {key}")
+
+
+class S3BlobStore(BlobStore):
+    """Blobs as objects in the configured S3 bucket (boto3 calls run in a thread)"""
+
+    name = "s3"
+
+    def __init__(self, s3_client=None):
+        if s3_client is None:
+            from src.core.storage.s3_client import get_s3_client
+            s3_client = get_s3_client()
+        self.s3 = s3_client
+
+    async def _exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            await asyncio.to_thread(self.s3.s3_client.head_object, Bucket=self.s3.bucket_name, Key=key)
+            return True
+        except ClientError:
+            return False
+
+    async def _write(self, key: str, data: Union[bytes, memoryview], content_type: str) -> None:
+        await asyncio.to_thread(
+            self.s3.s3_client.put_object,
+            Bucket=self.s3.bucket_name, Key=key, Body=bytes(data), ContentType=content_type
+        )
+
+    async def _read(self, key: str) -> Blob:
+        from botocore.exceptions import ClientError
+
+        def download() -> bytes:
+            return self.s3.s3_client.get_object(Bucket=self.s3.bucket_name, Key=key)["Body"].read()
+
+        try:
+            return Blob(await asyncio.to_thread(download))
+        except ClientError as e:
+            raise BlobStoreError(f"Blob download failed for {key}: {e}")
+
+    def presigned_url(self, ref: str, expiration: int = 3600) -> str:
+        return self.s3.generate_presigned_url(blob_key(ref), expiration)
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Process-wide store for the backend selected by BLOB_STORE_BACKEND"""
+    global _blob_store
+
+    if _blob_store is None:
+        if settings.BLOB_STORE_BACKEND == "s3":
+            _blob_store = S3BlobStore()
+        elif settings.BLOB_STORE_BACKEND == "local":
+            _blob_store = LocalBlobStore()
+        else:
+            raise BlobStoreError(f"Unknown BLOB_STORE_BACKEND: {settings.BLOB_STORE_BACKEND}")
+        logger.info("Blob store initialized", backend=_blob_store.name)
+
+    return _blob_store
@@ -0,0 +1,162 @@
+"""
+PRP-002: Celery Worker Event Loop
+One long-lived asyncio event loop per Celery worker process
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class WorkerLoopError(Exception):
+    """Custom exception for worker event loop errors"""
+    pass
+
+
+class WorkerEventLoop:
+    """
+    Event loop running forever on a dedicated daemon thread.
+
+    Celery tasks are synchronous, so they hand coroutines to this loop and
+    block on the result. Because the loop outlives individual tasks, asyncpg
+    pools and httpx clients created on it stay valid and are reused across
+    tasks instead of being rebuilt per call.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._shutdown_callbacks: List[Callable[[], Awaitable[Any]]] = []
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def in_loop_thread(self) -> bool:
+        """True when called from the loop's own thread (blocking here would deadlock)."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if it is not already running."""
+        with self._lock:
+            if self.is_running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=run, name="celery-worker-loop", daemon=True)
+            thread.start()
+            started.wait()
+
+            self._loop = loop
+            self._thread = thread
+            logger.info("Worker event loop started")
+            return loop
+
+    def register_shutdown(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """Register an async cleanup callback run on the loop before it stops."""
+        self._shutdown_callbacks.append(callback)
+
+    def submit(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the worker loop and block until it finishes."""
+        if self.in_loop_thread():
+            coro.close()
+            raise WorkerLoopError("Cannot block on the worker loop from inside the worker loop")
+
+        loop = self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            # Timeouts and soft time limits interrupt the caller, not the coroutine
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Run shutdown callbacks, then stop and close the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None:
+                return
+
+            async def shutdown() -> None:
+                for callback in reversed(self._shutdown_callbacks):
+                    try:
+                        await callback()
+                    except Exception as e:
+                        logger.warning(f"Worker loop shutdown callback failed: {e}")
+
+                tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            if loop.is_running():
+                try:
+                    asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=timeout)
+                except Exception as e:
+                    logger.warning(f"Worker loop shutdown incomplete: {e}")
+                loop.call_soon_threadsafe(loop.stop)
+                if thread is not None:
+                    thread.join(timeout=timeout)
+
+            if not loop.is_running():
+                loop.close()
+            self._loop = None
+            self._thread = None
+            self._shutdown_callbacks.clear()
+            logger.info("Worker event loop stopped")
+
+
+# Global per-process instance
+worker_loop = WorkerEventLoop()
+
+
+async def _dispose_async_engine() -> None:
+    from src.core.database import engine
+    await engine.dispose()
+
+
+def init_worker_process(**kwargs) -> None:
+    """
+    worker_process_init handler.
+
+    Drops database connections inherited from the parent process across the
+    fork, then starts the loop that every async resource in this process
+    binds to.
+    """
+    from src.core.database import engine, sync_engine
+    from src.core.http_clients import shutdown_http_clients
+    from src.core.browser_pool import shutdown_browser_pool
+    from src.core.process_pool import shutdown_process_pool
+
+    # close=False leaves the parent's sockets alone and just forgets them here
+    engine.sync_engine.dispose(close=False)
+    sync_engine.dispose(close=False)
+
+    worker_loop.start()
+    worker_loop.register_shutdown(_dispose_async_engine)
+    worker_loop.register_shutdown(shutdown_http_clients)
+    worker_loop.register_shutdown(shutdown_browser_pool)
+    worker_loop.register_shutdown(shutdown_process_pool)
+
+
+def shutdown_worker_process(**kwargs) -> None:
+    """worker_process_shutdown handler."""
+    worker_loop.stop()
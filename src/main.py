@@ -16,6 +16,9 @@ from contextlib import asynccontextmanager
 from src.core.config import settings
 from src.core.database import engine, create_tables
 from src.core.logging import setup_logging
+from src.core.http_clients import shutdown_http_clients
+from src.core.browser_pool import shutdown_browser_pool
+from src.core.process_pool import shutdown_process_pool
 from src.api.v1.router import api_router
 
 # Setup logging
@@ -42,7 +45,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down LeadFactory...")
-    # Cleanup code here
+    await shutdown_http_clients()
+    await shutdown_browser_pool()
+    await shutdown_process_pool()
     logger.info("LeadFactory shutdown complete")
 
 
@@ -5,9 +5,10 @@ Comprehensive models for storing all PageSpeed API data elements
 
 from typing import Optional, List
 from datetime import datetime
-from sqlalchemy import String, Integer, Float, Boolean, Text, JSON, ForeignKey, DateTime, func, UniqueConstraint
+from sqlalchemy import String, Integer, Float, Boolean, Text, JSON, LargeBinary, ForeignKey, DateTime, func, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.core.compression import compress_json, decompress_json
 from src.core.database import Base
 
 
@@ -73,9 +74,13 @@ class PageSpeedAnalysis(Base):
     benchmark_index: Mapped[Optional[int]] = mapped_column(Integer)
     credits: Mapped[Optional[dict]] = mapped_column(JSON)  # Tool versions used
     
-    # Raw data storage for detailed analysis
-    raw_lighthouse_result: Mapped[Optional[dict]] = mapped_column(JSON)  # Complete Lighthouse result
-    i18n_strings: Mapped[Optional[dict]] = mapped_column(JSON)  # Internationalization strings
+    # Raw data storage for detailed analysis. The complete Lighthouse result
+    # (including i18n strings) is kept once, compressed, and only loaded on
+    # demand; the JSON columns are legacy and emptied by the backfill.
+    raw_lighthouse_compressed: Mapped[Optional[bytes]] = mapped_column(LargeBinary, deferred=True)
+    raw_lighthouse_encoding: Mapped[Optional[str]] = mapped_column(String(10))  # 'zstd' or 'gzip'
+    raw_lighthouse_result: Mapped[Optional[dict]] = mapped_column(JSON, deferred=True)  # Legacy uncompressed result
+    i18n_strings: Mapped[Optional[dict]] = mapped_column(JSON, deferred=True)  # Legacy internationalization strings
     
     # Relationships
     assessment: Mapped["Assessment"] = relationship("Assessment", backref="pagespeed_analyses")
@@ -105,6 +110,16 @@ class PageSpeedAnalysis(Base):
         cascade="all, delete-orphan"
     )
     
+    def store_raw_lighthouse(self, lighthouse_result: dict) -> None:
+        """Compress the complete Lighthouse result into the cold column"""
+        self.raw_lighthouse_compressed, self.raw_lighthouse_encoding = compress_json(lighthouse_result)
+    
+    def load_raw_lighthouse(self) -> Optional[dict]:
+        """Rehydrate the complete Lighthouse result (deferred columns load here)"""
+        if self.raw_lighthouse_compressed is not None:
+            return decompress_json(self.raw_lighthouse_compressed, self.raw_lighthouse_encoding)
+        return self.raw_lighthouse_result
+    
     def __repr__(self) -> str:
         return f"<PageSpeedAnalysis(id={self.id}, assessment_id={self.assessment_id}, strategy='{self.strategy}', score={self.performance_score})>"
 
@@ -5,7 +5,7 @@ Models for storing website screenshots and metadata for visual analysis
 
 from typing import Optional, List
 from datetime import datetime
-from sqlalchemy import String, Integer, Float, Boolean, Text, JSON, ForeignKey, DateTime, func, UniqueConstraint, Enum
+from sqlalchemy import String, Integer, BigInteger, Float, Boolean, Text, JSON, ForeignKey, DateTime, func, UniqueConstraint, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -73,6 +73,10 @@ class Screenshot(Base):
     image_height: Mapped[Optional[int]] = mapped_column(Integer)
     file_size_bytes: Mapped[Optional[int]] = mapped_column(Integer)
     
+    # Perceptual fingerprints (64-bit, stored signed) for near-duplicate lookup
+    perceptual_hash: Mapped[Optional[int]] = mapped_column(BigInteger, index=True)  # DCT pHash
+    difference_hash: Mapped[Optional[int]] = mapped_column(BigInteger)  # gradient dHash
+    
     # Capture metadata
     capture_timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -0,0 +1,106 @@
+"""
+Unit tests for the async assessment orchestrator
+Tests per-component timeouts, out-of-order completion and cancellation cleanup
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import patch
+
+from src.assessment.async_orchestrator import AsyncAssessmentOrchestrator
+
+LEAD = SimpleNamespace(id=1, url="https://example.com", company="Example", address=None)
+ASSESSMENT = SimpleNamespace(id=2)
+TIMEOUTS = {"pagespeed": 1, "security": 1, "semrush": 1, "gbp": 1, "screenshots": 1, "visual": 1}
+
+
+def components(delays, finished, cleaned_up=None):
+    """Fake assessment functions that finish after the given delays"""
+
+    def fake(name, result=None):
+        async def run(*args, **kwargs):
+            try:
+                await asyncio.sleep(delays.get(name, 0))
+                finished.append(name)
+                return result or f"{name}-result"
+            finally:
+                if cleaned_up is not None:
+                    cleaned_up.append(name)
+        return run
+
+    screenshots = SimpleNamespace(success=True, desktop_screenshot="d", mobile_screenshot="m")
+    return [
+        patch("src.assessment.async_orchestrator.assess_pagespeed", fake("pagespeed")),
+        patch("src.assessment.async_orchestrator.assess_security_headers", fake("security")),
+        patch("src.assessment.async_orchestrator.assess_semrush_domain", fake("semrush")),
+        patch("src.assessment.async_orchestrator.assess_google_business_profile", fake("gbp")),
+        patch("src.assessment.async_orchestrator.capture_website_screenshots", fake("screenshots", screenshots)),
+        patch("src.assessment.async_orchestrator.screenshot_ref", lambda ref: ref),
+        patch("src.assessment.async_orchestrator.assess_visual_analysis", fake("visual")),
+        patch.dict(AsyncAssessmentOrchestrator.COMPONENT_TIMEOUTS, TIMEOUTS),
+    ]
+
+
+async def run_all(orchestrator, patches, task_id=None):
+    for p in patches:
+        p.start()
+    try:
+        return await orchestrator._run_all_assessments(LEAD, ASSESSMENT, None, task_id)
+    finally:
+        for p in reversed(patches):
+            p.stop()
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = AsyncAssessmentOrchestrator()
+    orchestrator.running_assessments["task"] = {"components": {}, "progress": 0}
+    return orchestrator
+
+
+class TestRunAllAssessments:
+    """Test concurrent component execution"""
+
+    @pytest.mark.asyncio
+    async def test_one_component_timing_out(self, orchestrator):
+        finished = []
+        patches = components({"semrush": 5}, finished)
+        patches.append(patch.dict(TIMEOUTS, {"semrush": 0.05}))
+
+        results = await run_all(orchestrator, patches, "task")
+
+        assert results["semrush"] is None
+        assert results["pagespeed"] == "pagespeed-result" and results["visual"] == "visual-result"
+        tracking = orchestrator.running_assessments["task"]
+        assert tracking["components"]["semrush"] == "timeout"
+        assert tracking["components"]["gbp"] == "completed"
+        assert tracking["progress"] == 100
+        assert "semrush" not in finished
+
+    @pytest.mark.asyncio
+    async def test_results_handled_out_of_order(self, orchestrator):
+        finished = []
+        delays = {"pagespeed": 0.2, "security": 0.1, "semrush": 0.05, "gbp": 0.15, "screenshots": 0.01}
+
+        results = await run_all(orchestrator, components(delays, finished), "task")
+
+        # Visual starts as soon as screenshots land, not after the slowest component
+        assert finished == ["screenshots", "visual", "semrush", "security", "gbp", "pagespeed"]
+        assert results["screenshots"].success
+        assert all(results[name] == f"{name}-result" for name in TIMEOUTS if name != "screenshots")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_components_unwind_before_returning(self, orchestrator):
+        finished, cleaned_up = [], []
+        patches = components({"pagespeed": 5, "security": 5}, finished, cleaned_up)
+        run = asyncio.create_task(run_all(orchestrator, patches))
+
+        await asyncio.sleep(0.05)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        assert {"pagespeed", "security"} <= set(cleaned_up)
+        assert "pagespeed" not in finished
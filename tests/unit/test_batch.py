@@ -0,0 +1,209 @@
+"""
+Unit tests for PRP-002 Batch Assessment Jobs
+Tests slot leases, result counting, cancellation and CSV submission
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from src.api.v1.batch_assessment import router
+from src.assessment.batch import BatchJobTracker, batch_item_completed
+from src.core.cache import CacheKeys
+
+
+class FakeRedis:
+    """In-memory stand-in for the sync Redis commands the tracker uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+            def execute(self):
+                return [getattr(redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+        return Pipeline()
+
+    def expire(self, key, ttl):
+        return key in self.data
+
+    def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hincrby(self, key, field, amount):
+        hash_ = self.data.setdefault(key, {})
+        hash_[field] = str(int(hash_.get(field, 0)) + amount)
+        return int(hash_[field])
+
+    def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(str(v) for v in values)
+
+    def lpush(self, key, value):
+        self.data.setdefault(key, []).insert(0, str(value))
+
+    def lpop(self, key):
+        items = self.data.get(key)
+        return items.pop(0) if items else None
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.data.get(key, set()).discard(member)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        return int(self.data.get(key, {}).pop(member, None) is not None)
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def zrangebyscore(self, key, low, high):
+        return [m for m, score in sorted(self.data.get(key, {}).items(), key=lambda i: i[1]) if score <= high]
+
+
+@pytest.fixture
+def tracker():
+    return BatchJobTracker(redis_client=FakeRedis())
+
+
+class TestBatchJobTracker:
+    """Test slot leases and batch counters"""
+
+    def test_claim_and_record_update_counters(self, tracker):
+        batch_id = tracker.create([1, 2, 3])
+
+        assert tracker.claim_next(batch_id) == 1
+        assert tracker.claim_next(batch_id) == 2
+        tracker.record_result(batch_id, 1, success=True)
+        tracker.record_result(batch_id, 2, success=False)
+
+        status = tracker.get_status(batch_id)
+        assert (status["completed"], status["failed"], status["in_flight"], status["pending"]) == (1, 1, 0, 1)
+        assert tracker.redis.zcard(CacheKeys.assessments_in_flight()) == 0
+
+    def test_in_flight_cap_across_batches(self, tracker):
+        first, second = tracker.create([1, 2, 3]), tracker.create([4, 5])
+
+        with patch("src.assessment.batch.settings.MAX_CONCURRENT_ASSESSMENTS", 2):
+            claimed = [tracker.claim_next(first), tracker.claim_next(second), tracker.claim_next(first)]
+            assert claimed == [1, 4, None]
+
+            tracker.record_result(first, 1, success=True)
+            assert tracker.claim_next(second) == 5
+
+        assert tracker.get_status(first)["pending"] == 2
+
+    def test_expired_lease_counted_failed_and_freed(self, tracker):
+        batch_id = tracker.create([1])
+
+        with patch("src.assessment.batch.settings.MAX_CONCURRENT_ASSESSMENTS", 1), \
+             patch("src.assessment.batch.settings.BATCH_ASSESSMENT_LEASE_SECONDS", -1):
+            assert tracker.claim_next(batch_id) == 1
+            assert tracker.reap_expired() == 1
+
+        status = tracker.get_status(batch_id)
+        assert status["failed"] == 1 and status["status"] == "completed"
+        assert tracker.redis.zcard(CacheKeys.assessments_in_flight()) == 0
+
+        # A late success corrects the count without freeing a slot twice
+        tracker.record_result(batch_id, 1, success=True)
+        status = tracker.get_status(batch_id)
+        assert (status["completed"], status["failed"], status["in_flight"]) == (1, 0, 0)
+
+    def test_unclaim_returns_lead_to_front(self, tracker):
+        batch_id = tracker.create([1, 2])
+
+        tracker.unclaim(batch_id, tracker.claim_next(batch_id))
+
+        assert tracker.claim_next(batch_id) == 1
+        job = tracker.redis.hgetall(CacheKeys.batch_job(batch_id))
+        assert (job["dispatched"], job["in_flight"]) == ("1", "1")
+        assert tracker.redis.zcard(CacheKeys.assessments_in_flight()) == 1
+
+    def test_cancel_survives_late_results(self, tracker):
+        batch_id = tracker.create([1, 2, 3])
+        tracker.claim_next(batch_id)
+
+        assert tracker.cancel(batch_id) == 2
+        assert batch_id not in tracker.active_batches()
+
+        tracker.record_result(batch_id, 1, success=True)
+        status = tracker.get_status(batch_id)
+        assert status["status"] == "cancelled" and status["completed"] == 1 and status["total"] == 1
+
+    @pytest.mark.parametrize("assessment_status, success", [
+        ("completed", True), ("partial", True), ("failed", False),
+    ])
+    def test_link_callback_uses_assessment_status(self, tracker, assessment_status, success):
+        result = {"status": "completed", "assessment_status": assessment_status}
+
+        with patch("src.assessment.batch.BatchJobTracker", return_value=tracker), \
+             patch.object(tracker, "record_result") as record_result, \
+             patch("src.assessment.batch.dispatch_batches"):
+            batch_item_completed(result, "batch-abc", 7)
+
+        record_result.assert_called_once_with("batch-abc", 7, success)
+
+
+class TestBatchCsvSubmission:
+    """Test CSV validation before anything is queued"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+
+    def post_csv(self, client, content):
+        return client.post("/batch-assessment/submit-csv", files={"file": ("leads.csv", content, "text/csv")})
+
+    def test_row_without_url_or_lead_id(self, client):
+        response = self.post_csv(client, "url,company\nhttps://a.example,A\n,B\n")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Line 3 has neither url nor lead_id"
+
+    def test_invalid_lead_id(self, client):
+        response = self.post_csv(client, "lead_id\n12\nabc\n")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid lead_id on line 3"
+
+    def test_empty_csv(self, client):
+        response = self.post_csv(client, "url,company\n")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Batch contains no leads"
+
+    def test_lead_ids_submitted(self, client):
+        with patch("src.api.v1.batch_assessment.submit_batch", return_value="batch-abc") as submit:
+            response = self.post_csv(client, "\ufefflead_id\n12\n13\n".encode("utf-8"))
+
+        assert response.status_code == 202
+        assert response.json()["batch_id"] == "batch-abc" and response.json()["total"] == 2
+        submit.assert_called_once_with([12, 13], "csv")
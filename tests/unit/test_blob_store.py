@@ -0,0 +1,97 @@
+"""
+Unit tests for PRP-000 Blob Store
+Tests content-addressed writes, zero-copy reads and screenshot references
+"""
+
+import base64
+import io
+
+import pytest
+from PIL import Image
+from unittest.mock import AsyncMock, patch
+
+from src.core.storage.blob_store import BlobStore, BlobStoreError, LocalBlobStore
+from src.assessments.screenshot_capture import ScreenshotMetadata, screenshot_ref
+from src.assessments.visual_analysis import VisualAnalyzer
+
+
+def webp_bytes(size=(8, 8)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, format="WEBP")
+    return buffer.getvalue()
+
+
+class TestLocalBlobStore:
+    """Test the filesystem backend"""
+
+    @pytest.mark.asyncio
+    async def test_identical_content_stored_once(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        data = webp_bytes()
+
+        ref = await store.put(data, prefix="screenshots", extension="webp")
+        assert await store.put(data, prefix="screenshots", extension="webp") == ref
+
+        assert ref.startswith("blob://screenshots/") and ref.endswith(".webp")
+        assert [p for p in tmp_path.rglob("*") if p.is_file()] == [store.path_of(ref)]
+
+    @pytest.mark.asyncio
+    async def test_read_through_mmap(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        data = webp_bytes()
+        ref = await store.put(data, prefix="screenshots", extension="webp")
+
+        async with store.open(ref) as blob:
+            view = blob.view()
+            assert view == data
+            with Image.open(blob.stream()) as image:
+                assert image.size == (8, 8)
+
+        with pytest.raises(ValueError):
+            bytes(view)  # released on exit
+
+    @pytest.mark.asyncio
+    async def test_bad_references_rejected(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+
+        for ref in ("https://example.com/a.webp", "blob://../etc/passwd", "blob://screenshots/missing.webp"):
+            with pytest.raises(BlobStoreError):
+                async with store.open(ref):
+                    pass
+
+    def test_backend_must_implement_storage(self):
+        class PartialStore(BlobStore):
+            async def _exists(self, key):
+                return False
+
+        with pytest.raises(TypeError):
+            PartialStore()
+
+
+class TestScreenshotReferences:
+    """Test that consumers resolve screenshots by reference"""
+
+    def test_blob_ref_preferred(self):
+        metadata = ScreenshotMetadata(
+            viewport="desktop", width=8, height=8, file_size_bytes=10, format="webp", quality=75,
+            capture_timestamp="2025-01-01T00:00:00+00:00", blob_ref="blob://screenshots/ab/abc.webp",
+            signed_url="https://example.com/desktop.webp"
+        )
+
+        assert screenshot_ref(metadata) == "blob://screenshots/ab/abc.webp"
+        assert screenshot_ref(metadata.dict()) == "blob://screenshots/ab/abc.webp"
+        assert screenshot_ref({"s3_url": "https://bucket/desktop.webp"}) == "https://bucket/desktop.webp"
+        assert screenshot_ref(None) is None
+
+    @pytest.mark.asyncio
+    async def test_visual_analyzer_reads_blob(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        data = webp_bytes()
+        ref = await store.put(data, prefix="screenshots", extension="webp")
+
+        inline = AsyncMock(side_effect=lambda func, *args, **kwargs: func(*args, **kwargs))
+        with patch("src.assessments.image_processing.get_blob_store", return_value=store), \
+             patch("src.assessments.image_processing.run_in_process", inline):
+            encoded, _ = await VisualAnalyzer()._download_and_validate_image(ref, "desktop")
+
+        assert base64.b64decode(encoded) == data
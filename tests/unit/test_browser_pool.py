@@ -0,0 +1,108 @@
+"""
+Unit tests for PRP-002 Browser Pool
+Tests context isolation per lease, reuse and recycling of pooled browsers
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.browser_pool import BrowserPool, BrowserPoolError, PooledBrowser
+
+
+def fake_browser():
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.new_context = AsyncMock(side_effect=lambda **kwargs: MagicMock(close=AsyncMock()))
+    browser.close = AsyncMock()
+    return browser
+
+
+@pytest.fixture
+def pool():
+    pool = BrowserPool(size=1)
+    pool._launch = AsyncMock(side_effect=lambda: PooledBrowser(browser=fake_browser()))
+    return pool
+
+
+class TestBrowserPool:
+    """Test leasing contexts from long-lived browsers"""
+
+    @pytest.mark.asyncio
+    async def test_browser_reused_with_fresh_contexts(self, pool):
+        async with pool.context() as first:
+            pass
+        async with pool.context() as second:
+            pass
+
+        assert pool._launch.await_count == 1
+        assert first is not second
+        first.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_recycled_after_page_limit(self, pool):
+        with patch("src.core.browser_pool.settings.BROWSER_POOL_MAX_PAGES_PER_BROWSER", 2):
+            for _ in range(3):
+                async with pool.context():
+                    pass
+
+        assert pool._launch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_replaced(self, pool):
+        async with pool.context():
+            pass
+        pool._idle._queue[0].browser.is_connected.return_value = False
+
+        async with pool.context():
+            pass
+
+        assert pool._launch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lease_times_out_when_pool_busy(self, pool):
+        async with pool.context():
+            with pytest.raises(BrowserPoolError):
+                async with pool.context(timeout=0.01):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_cancelled_launch_gives_back_slot(self, pool):
+        launched = asyncio.Event()
+
+        async def slow_launch():
+            launched.set()
+            await asyncio.sleep(10)
+
+        pool._launch = AsyncMock(side_effect=slow_launch)
+        lease = asyncio.create_task(pool.context().__aenter__())
+        await launched.wait()
+        lease.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lease
+
+        assert pool.stats()["launched"] == 0
+        pool._launch = AsyncMock(side_effect=lambda: PooledBrowser(browser=fake_browser()))
+        async with pool.context(timeout=0.5):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_cancelled_new_context_releases_browser(self, pool):
+        async with pool.context():
+            pass
+        browser = pool._idle._queue[0].browser
+        opening = asyncio.Event()
+
+        async def slow_new_context(**kwargs):
+            opening.set()
+            await asyncio.sleep(10)
+
+        browser.new_context = AsyncMock(side_effect=slow_new_context)
+        lease = asyncio.create_task(pool.context().__aenter__())
+        await opening.wait()
+        lease.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lease
+
+        assert pool.stats() == {"size": 1, "launched": 1, "idle": 1}
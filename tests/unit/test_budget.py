@@ -0,0 +1,291 @@
+"""
+Unit tests for PRP-002 Budget Admission Control
+Tests reservation, settlement, lead attribution and orchestrator skips
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.budget import (
+    BudgetAdmission,
+    BudgetExceededError,
+    budget_reservation,
+    charges_lead,
+    current_budget_lead,
+)
+from src.core.cache import CacheKeys
+
+
+def mock_redis(reserve_result=0):
+    redis = MagicMock()
+
+    async def fake_eval(script, numkeys, *args):
+        return reserve_result if "HMGET" in script else 1
+
+    redis.eval = AsyncMock(side_effect=fake_eval)
+    return redis
+
+
+class TestBudgetAdmission:
+    """Test reserve/commit/release against scripted Redis"""
+
+    @pytest.mark.asyncio
+    async def test_reserve_covers_lead_scope(self):
+        redis = mock_redis()
+        with patch("src.core.budget.get_redis", AsyncMock(return_value=redis)):
+            reservation = await BudgetAdmission().reserve("semrush", 2.5, lead_id=7)
+
+        assert reservation.amount_cents == 2.5
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        assert reservation.keys[-1] == CacheKeys.budget_lead(7, day)
+        assert redis.eval.await_args.args[1] == 3
+
+    def test_lead_scope_is_per_day(self):
+        admission = BudgetAdmission()
+        today = datetime(2026, 3, 1, 23, 0, tzinfo=timezone.utc)
+
+        assert admission._keys(7, today)["lead"] != admission._keys(7, today + timedelta(hours=2))["lead"]
+
+    @pytest.mark.asyncio
+    async def test_rejection_names_exhausted_scope(self):
+        with patch("src.core.budget.get_redis", AsyncMock(return_value=mock_redis(reserve_result=3))):
+            with pytest.raises(BudgetExceededError) as exc_info:
+                await BudgetAdmission().reserve("openai", 2.0, lead_id=7)
+
+        assert exc_info.value.scope == "lead"
+
+    @pytest.mark.asyncio
+    async def test_failed_call_releases_reservation(self):
+        redis = mock_redis()
+        with patch("src.core.budget.get_redis", AsyncMock(return_value=redis)):
+            with pytest.raises(RuntimeError):
+                async with budget_reservation("pagespeed", 0.25):
+                    raise RuntimeError("boom")
+
+        reserved, actual = redis.eval.await_args.args[-2:]
+        assert (reserved, actual) == (0.25, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_successful_call_commits_estimate(self):
+        redis = mock_redis()
+        with patch("src.core.budget.get_redis", AsyncMock(return_value=redis)):
+            async with budget_reservation("places", 1.7):
+                pass
+
+        assert redis.eval.await_args.args[-2:] == (1.7, 1.7)
+
+    @pytest.mark.asyncio
+    async def test_charges_lead_scopes_context(self):
+        @charges_lead
+        async def assess(url, lead_id=None):
+            return current_budget_lead()
+
+        assert await assess("https://example.com", lead_id=42) == 42
+        assert await assess("https://example.com", 43) == 43
+        assert current_budget_lead() is None
+
+
+class TestReconcile:
+    """Test raising Redis counters from assessment_costs"""
+
+    @pytest.mark.asyncio
+    async def test_counters_only_move_up(self):
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        month = day[:7]
+        hashes = {
+            # Redis ahead of the database (spend with no cost row), and behind it
+            CacheKeys.budget_daily(day): {"spent": "500.0", "reserved": "20"},
+            CacheKeys.budget_lead(7, day): {"spent": "1.0"},
+        }
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def hget(self, key, field):
+                self.calls.append(lambda: hashes.get(key, {}).get(field))
+
+            def hincrbyfloat(self, key, field, amount):
+                def incr():
+                    counter = hashes.setdefault(key, {})
+                    counter[field] = str(float(counter.get(field, 0)) + amount)
+                self.calls.append(incr)
+
+            def expire(self, key, ttl):
+                self.calls.append(lambda: True)
+
+            async def execute(self):
+                return [call() for call in self.calls]
+
+        redis = MagicMock()
+        redis.pipeline = Pipeline
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            MagicMock(scalar_one=MagicMock(return_value=120.0)),
+            MagicMock(scalar_one=MagicMock(return_value=800.0)),
+            MagicMock(all=MagicMock(return_value=[(7, 4.5), (8, 2.0)])),
+        ])
+        session = MagicMock()
+        session.return_value.__aenter__ = AsyncMock(return_value=db)
+        session.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("src.core.database.AsyncSessionLocal", session), \
+             patch("src.core.budget.get_redis", AsyncMock(return_value=redis)):
+            summary = await BudgetAdmission().reconcile()
+
+        assert hashes[CacheKeys.budget_daily(day)] == {"spent": "500.0", "reserved": "20"}
+        assert float(hashes[CacheKeys.budget_monthly(month)]["spent"]) == 800.0
+        assert float(hashes[CacheKeys.budget_lead(7, day)]["spent"]) == 4.5
+        assert float(hashes[CacheKeys.budget_lead(8, day)]["spent"]) == 2.0
+        assert summary["counters_raised"] == 3
+
+class TestOrchestratorBudgetSkip:
+    """Test that unaffordable components are skipped up front"""
+
+    @pytest.mark.asyncio
+    async def test_unaffordable_component_skipped(self):
+        from src.assessments.assessment_orchestrator import AssessmentOrchestrator, ComponentStatus
+
+        orchestrator = AssessmentOrchestrator()
+        call = AsyncMock()
+
+        with patch("src.assessments.assessment_orchestrator.budget.can_afford",
+                   AsyncMock(side_effect=lambda estimate, lead_id: estimate < 5)), \
+             patch("src.assessments.assessment_orchestrator.is_circuit_open", AsyncMock(return_value=False)), \
+             patch("src.assessments.assessment_orchestrator.precheck_site", AsyncMock(return_value=None)), \
+             patch.object(orchestrator, "_call_component_function", call):
+            execution = await orchestrator.execute_complete_assessment(
+                1, {"url": "https://example.com", "company": "Example"}
+            )
+
+        assert execution.semrush_result.status == ComponentStatus.SKIPPED
+        assert "semrush skipped: budget exhausted" in execution.error_summary
+        assert "semrush" not in {c.args[0] for c in call.await_args_list}
+
+    @pytest.mark.asyncio
+    async def test_cap_hit_mid_call_reported_as_budget_blocked(self):
+        from contextlib import asynccontextmanager
+        from src.assessments.assessment_orchestrator import AssessmentOrchestrator, ComponentStatus
+
+        @asynccontextmanager
+        async def denied(service, estimate_cents):
+            raise BudgetExceededError("daily", service, estimate_cents)
+            yield
+
+        orchestrator = AssessmentOrchestrator()
+        real_call = orchestrator._call_component_function
+
+        async def call(component_name, *args):
+            return await real_call(component_name, *args) if component_name == "semrush" else {}
+
+        with patch("src.assessments.assessment_orchestrator.budget.can_afford", AsyncMock(return_value=True)), \
+             patch("src.assessments.assessment_orchestrator.is_circuit_open", AsyncMock(return_value=False)), \
+             patch("src.assessments.assessment_orchestrator.precheck_site", AsyncMock(return_value=None)), \
+             patch("src.assessments.semrush_integration.settings.SEMRUSH_API_KEY", "key"), \
+             patch("src.assessments.semrush_integration.SEMrushClient._check_api_balance", AsyncMock(return_value=1000)), \
+             patch("src.assessments.semrush_integration.acquire_rate_limit", AsyncMock()), \
+             patch("src.assessments.semrush_integration.budget_reservation", denied), \
+             patch("src.assessments.result_cache.cache") as mock_cache, \
+             patch.object(orchestrator, "_call_component_function", side_effect=call):
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+            execution = await orchestrator.execute_complete_assessment(
+                1, {"url": "https://example.com", "company": "Example"}
+            )
+
+        assert execution.semrush_result.status == ComponentStatus.SKIPPED
+        assert any(reason.startswith("semrush skipped: daily budget exhausted") for reason in execution.error_summary)
+        mock_cache.set.assert_not_called()
+
+    @staticmethod
+    async def _run_with_cap_hit_mid_call(component_name, module, *patches, upstream=None):
+        """Run one component for real against a budget that rejects its paid calls"""
+        from contextlib import ExitStack, asynccontextmanager
+        from src.assessments.assessment_orchestrator import AssessmentOrchestrator
+        from src.core.config import settings
+
+        @asynccontextmanager
+        async def denied(service, estimate_cents):
+            raise BudgetExceededError("lead", service, estimate_cents)
+            yield
+
+        orchestrator = AssessmentOrchestrator()
+        real_call = orchestrator._call_component_function
+
+        async def call(name, *args):
+            if name == component_name:
+                return await real_call(name, *args)
+            return (upstream or {}).get(name, {})
+
+        with ExitStack() as stack:
+            for p in (
+                patch("src.assessments.assessment_orchestrator.budget.can_afford", AsyncMock(return_value=True)),
+                patch("src.assessments.assessment_orchestrator.is_circuit_open", AsyncMock(return_value=False)),
+                patch("src.assessments.assessment_orchestrator.precheck_site", AsyncMock(return_value=None)),
+                patch.object(settings, "COMPONENT_CACHE_ENABLED", False),
+                patch.object(settings, "LLM_CACHE_ENABLED", False),
+                patch(f"{module}.acquire_rate_limit", AsyncMock()),
+                patch(f"{module}.budget_reservation", denied),
+                patch.object(orchestrator, "_call_component_function", side_effect=call),
+                *patches,
+            ):
+                stack.enter_context(p)
+            return await orchestrator.execute_complete_assessment(
+                1, {"url": "https://example.com", "company": "Example"}
+            )
+
+    @staticmethod
+    def _assert_budget_skipped(execution, component_name):
+        from src.assessments.assessment_orchestrator import ComponentStatus
+
+        result = getattr(execution, f"{component_name}_result")
+        assert result.status == ComponentStatus.SKIPPED
+        assert any(
+            reason.startswith(f"{component_name} skipped: lead budget exhausted")
+            for reason in execution.error_summary
+        )
+
+    @pytest.mark.asyncio
+    async def test_pagespeed_cap_hit_mid_call_skipped(self):
+        execution = await self._run_with_cap_hit_mid_call(
+            "pagespeed", "src.assessments.pagespeed",
+            patch("src.assessments.pagespeed.settings.GOOGLE_PAGESPEED_API_KEY", "key"),
+            patch("src.assessments.pagespeed._pagespeed_client", None),
+        )
+        self._assert_budget_skipped(execution, "pagespeed")
+
+    @pytest.mark.asyncio
+    async def test_screenshots_cap_hit_mid_call_skipped(self):
+        execution = await self._run_with_cap_hit_mid_call(
+            "screenshots", "src.assessments.screenshot_capture",
+            patch("src.assessments.screenshot_capture.settings.SCREENSHOTONE_API_KEY", "key"),
+        )
+        self._assert_budget_skipped(execution, "screenshots")
+
+    @pytest.mark.asyncio
+    async def test_visual_analysis_cap_hit_mid_call_skipped(self):
+        from src.assessments.visual_analysis import VisualAnalyzer
+
+        hashes = MagicMock()
+        hashes.hex.return_value = "00"
+        execution = await self._run_with_cap_hit_mid_call(
+            "visual_analysis", "src.assessments.visual_analysis",
+            patch("src.assessments.visual_analysis.settings.OPENAI_API_KEY", "key"),
+            patch.object(VisualAnalyzer, "_download_and_validate_image", AsyncMock(return_value=("aW1n", hashes))),
+            patch.object(VisualAnalyzer, "_reuse_prior_analysis", AsyncMock(return_value=None)),
+            upstream={"screenshots": {
+                "desktop_screenshot": {"blob_ref": "blob://desktop"},
+                "mobile_screenshot": {"blob_ref": "blob://mobile"},
+            }},
+        )
+        self._assert_budget_skipped(execution, "visual_analysis")
+
+    @pytest.mark.asyncio
+    async def test_content_generation_cap_hit_mid_call_skipped(self):
+        execution = await self._run_with_cap_hit_mid_call(
+            "content_generation", "src.assessments.content_generator",
+            patch("src.assessments.content_generator.settings.OPENAI_API_KEY", "key"),
+        )
+        self._assert_budget_skipped(execution, "content_generation")
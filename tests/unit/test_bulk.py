@@ -0,0 +1,40 @@
+"""
+Unit tests for PRP-002 Bulk Persistence
+Tests that child rows are written with one executemany per table
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.bulk import BulkWriter
+from src.models.pagespeed import PageSpeedAudit, PageSpeedEntity
+
+
+class TestBulkWriter:
+    """Test per-table batching of row dicts"""
+
+    @pytest.mark.asyncio
+    async def test_one_insert_per_table(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        rows = BulkWriter(db)
+
+        for i in range(150):
+            rows.add(PageSpeedAudit, pagespeed_analysis_id=1, audit_id=f"audit-{i}", score=0.5)
+        rows.add(PageSpeedEntity, pagespeed_analysis_id=1, name="Google Fonts")
+
+        written = await rows.flush()
+
+        assert written == {"pagespeed_audits": 150, "pagespeed_entities": 1}
+        assert db.execute.await_count == 2
+        statement, params = db.execute.await_args_list[0].args
+        assert statement.table.name == "pagespeed_audits"
+        assert len(params) == 150
+
+    @pytest.mark.asyncio
+    async def test_flush_without_rows_is_noop(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        assert await BulkWriter(db).flush() == {}
+        db.execute.assert_not_awaited()
@@ -0,0 +1,96 @@
+"""
+Unit tests for PRP-004 Bulk Security Header Scan
+Tests header-only scoring, DNS caching and batched writes
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.assessments.bulk_security_scan import BulkSecurityScanner, DNSCache, bulk_scan_security_headers
+
+
+def handler(request):
+    if request.headers["host"] == "plain.example":
+        if request.url.scheme == "https":
+            raise httpx.ConnectError("no TLS", request=request)
+        return httpx.Response(200, headers={"server": "nginx/1.18"})
+    return httpx.Response(200, headers={
+        "strict-transport-security": "max-age=31536000",
+        "content-security-policy": "default-src 'self'",
+    })
+
+
+async def resolve(host):
+    return None if host == "dead.example" else "10.0.0.1"
+
+
+class TestBulkScan:
+    """Test the bounded scan pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_results_scored_and_written_in_batches(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+        batches = []
+
+        async def write_batch(batch):
+            batches.append(batch)
+            return len(batch)
+
+        targets = [(1, "secure.example"), (2, "plain.example"), (3, "dead.example")] * 3
+        with patch("src.assessments.bulk_security_scan.get_http_client", return_value=client), \
+             patch("src.assessments.bulk_security_scan.DNSCache.resolve", side_effect=resolve):
+            stats = await bulk_scan_security_headers(targets, concurrency=4, batch_size=4, write_batch=write_batch)
+
+        assert stats.scanned == 9 and stats.written == 9 and stats.unreachable == 3
+        assert [len(batch) for batch in batches] == [4, 4, 1]
+        by_id = {assessment_id: metrics for batch in batches for assessment_id, metrics in batch}
+        assert by_id[1].has_https and by_id[1].security_score > by_id[2].security_score
+        assert not by_id[2].has_https
+        assert "Server version exposed in headers" in by_id[2].vulnerabilities
+        assert by_id[3].vulnerabilities == ["Failed to connect to website"]
+
+    @pytest.mark.asyncio
+    async def test_hops_connect_to_cached_address(self):
+        requests = []
+
+        def redirecting(request):
+            requests.append(request)
+            if request.headers["host"] == "example.com":
+                return httpx.Response(301, headers=[
+                    ("location", "https://www.example.com/"), ("set-cookie", "visit=1; Path=/"),
+                ])
+            return httpx.Response(200, headers={"strict-transport-security": "max-age=31536000"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(redirecting), follow_redirects=True)
+        dns = DNSCache(ttl_seconds=60)
+        lookup = AsyncMock(return_value=[(2, 1, 6, "", ("203.0.113.7", 443))])
+
+        with patch("src.assessments.bulk_security_scan.get_http_client", return_value=client), \
+             patch("asyncio.base_events.BaseEventLoop.getaddrinfo", lookup):
+            scanner = BulkSecurityScanner()
+            scanner.dns = dns
+            metrics = await scanner.scan("example.com")
+
+        assert metrics.security_headers["Strict-Transport-Security"]["present"]
+        assert [(r.url.host, r.headers["host"], r.extensions["sni_hostname"]) for r in requests] == [
+            ("203.0.113.7", "example.com", "example.com"),
+            ("203.0.113.7", "www.example.com", "www.example.com"),
+        ]
+        # One lookup per host, shared by the precheck and the request
+        assert [c.args[0] for c in lookup.call_args_list] == ["example.com", "www.example.com"]
+
+
+class TestDNSCache:
+    """Test lookup reuse"""
+
+    @pytest.mark.asyncio
+    async def test_failures_cached(self):
+        dns = DNSCache(ttl_seconds=60)
+        lookup = AsyncMock(side_effect=OSError("NXDOMAIN"))
+
+        with patch("asyncio.base_events.BaseEventLoop.getaddrinfo", lookup):
+            assert await dns.resolve("dead.example") is None
+            assert await dns.resolve("dead.example") is None
+
+        assert lookup.call_count == 1
@@ -0,0 +1,147 @@
+"""
+Unit tests for PRP-002 Provider Circuit Breakers
+Tests fail-fast behaviour, outcome recording and orchestrator skips
+"""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.circuit_breaker import CircuitBreaker, CircuitOpenError, circuit_guard
+
+
+def mock_redis(before_call=(1, 0), state="closed"):
+    redis = MagicMock()
+
+    async def fake_eval(script, numkeys, key, *args):
+        return list(before_call) if len(args) == 1 else state
+
+    redis.eval = AsyncMock(side_effect=fake_eval)
+    return redis
+
+
+class TestCircuitGuard:
+    """Test the per-request guard used by provider clients"""
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self):
+        redis = mock_redis(before_call=(0, 12000))
+        with patch("src.core.circuit_breaker.get_redis", AsyncMock(return_value=redis)):
+            with pytest.raises(CircuitOpenError) as exc_info:
+                async with circuit_guard("semrush"):
+                    pytest.fail("provider should not be called")
+
+        assert exc_info.value.retry_after == 12
+
+    @pytest.mark.asyncio
+    async def test_server_error_recorded_as_failure(self):
+        redis = mock_redis()
+        with patch("src.core.circuit_breaker.get_redis", AsyncMock(return_value=redis)):
+            async with circuit_guard("screenshotone") as call:
+                call.check(503)
+
+        record_args = redis.eval.await_args_list[-1].args
+        assert record_args[3] == 1  # failed
+        assert record_args[4] == 0  # not slow
+
+    @pytest.mark.asyncio
+    async def test_exception_recorded_and_reraised(self):
+        redis = mock_redis()
+        with patch("src.core.circuit_breaker.get_redis", AsyncMock(return_value=redis)):
+            with pytest.raises(TimeoutError):
+                async with circuit_guard("openai"):
+                    raise TimeoutError()
+
+        assert redis.eval.await_args_list[-1].args[3] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_allows_calls(self):
+        with patch("src.core.circuit_breaker.get_redis", AsyncMock(side_effect=ConnectionError("down"))):
+            async with circuit_guard("pagespeed") as call:
+                call.check(200)
+
+
+class TestIsOpen:
+    """Test the read-only check used by orchestrators"""
+
+    @pytest.mark.asyncio
+    async def test_open_until_cooldown_passes(self):
+        breaker = CircuitBreaker("semrush")
+        redis = MagicMock()
+
+        redis.hmget = AsyncMock(return_value=["open", str(time.time())])
+        with patch("src.core.circuit_breaker.get_redis", AsyncMock(return_value=redis)):
+            assert await breaker.is_open() is True
+
+        redis.hmget = AsyncMock(return_value=["open", str(time.time() - breaker.config.open_seconds - 1)])
+        with patch("src.core.circuit_breaker.get_redis", AsyncMock(return_value=redis)):
+            assert await breaker.is_open() is False
+
+
+class TestOrchestratorSkip:
+    """Test that open breakers skip components instead of timing out"""
+
+    @pytest.mark.asyncio
+    async def test_component_skipped_and_recorded(self):
+        from src.assessments.assessment_orchestrator import AssessmentOrchestrator, ComponentStatus
+
+        orchestrator = AssessmentOrchestrator()
+        call = AsyncMock()
+
+        with patch("src.assessments.assessment_orchestrator.is_circuit_open",
+                   AsyncMock(side_effect=lambda provider: provider == "semrush")), \
+             patch("src.assessments.assessment_orchestrator.precheck_site", AsyncMock(return_value=None)), \
+             patch.object(orchestrator, "_call_component_function", call):
+            execution = await orchestrator.execute_complete_assessment(
+                1, {"url": "https://example.com", "company": "Example"}
+            )
+
+        assert execution.semrush_result.status == ComponentStatus.SKIPPED
+        assert "semrush skipped: semrush circuit open" in execution.error_summary
+        called = {c.args[0] for c in call.await_args_list}
+        assert "semrush" not in called
+        assert "pagespeed" in called
+
+    @pytest.mark.asyncio
+    async def test_breaker_opening_mid_call_skips_integrations(self):
+        """SEMrush and GBP surface CircuitOpenError instead of zeroed metrics or a failure"""
+        from contextlib import asynccontextmanager
+        from src.assessments.assessment_orchestrator import AssessmentOrchestrator, ComponentStatus
+
+        @asynccontextmanager
+        async def open_guard(provider):
+            raise CircuitOpenError(provider, retry_after=30)
+            yield
+
+        @asynccontextmanager
+        async def no_reservation(service, estimate_cents):
+            yield None
+
+        orchestrator = AssessmentOrchestrator()
+        real_call = orchestrator._call_component_function
+
+        async def call(component_name, *args):
+            if component_name in ("semrush", "gbp"):
+                return await real_call(component_name, *args)
+            return {}
+
+        with patch("src.assessments.assessment_orchestrator.is_circuit_open", AsyncMock(return_value=False)), \
+             patch("src.assessments.assessment_orchestrator.precheck_site", AsyncMock(return_value=None)), \
+             patch("src.assessments.semrush_integration.settings.SEMRUSH_API_KEY", "key"), \
+             patch("src.assessments.gbp_integration.settings.GOOGLE_PLACES_API_KEY", "key"), \
+             patch("src.assessments.semrush_integration.circuit_guard", open_guard), \
+             patch("src.assessments.gbp_integration.circuit_guard", open_guard), \
+             patch("src.assessments.semrush_integration.budget_reservation", no_reservation), \
+             patch("src.assessments.gbp_integration.budget_reservation", no_reservation), \
+             patch("src.assessments.semrush_integration.acquire_rate_limit", AsyncMock()), \
+             patch("src.assessments.gbp_integration.acquire_rate_limit", AsyncMock()), \
+             patch("src.assessments.result_cache.cache") as mock_cache, \
+             patch.object(orchestrator, "_call_component_function", side_effect=call):
+            mock_cache.get = AsyncMock(return_value=None)
+            execution = await orchestrator.execute_complete_assessment(
+                1, {"url": "https://example.com", "company": "Example"}
+            )
+
+        assert execution.semrush_result.status == ComponentStatus.SKIPPED
+        assert execution.gbp_result.status == ComponentStatus.SKIPPED
+        assert "semrush skipped: semrush circuit open, retry in 30s" in execution.error_summary
@@ -0,0 +1,129 @@
+"""
+Unit tests for PRP-011 Assessment DAG Scheduler
+Tests dependency ordering, bounded concurrency and graph validation
+"""
+
+import asyncio
+import pytest
+
+from src.assessments.dag_scheduler import DAGNode, DAGScheduler, DAGSchedulerError
+
+
+class TestDAGScheduler:
+    """Test dependency-graph execution"""
+
+    @pytest.mark.asyncio
+    async def test_independent_nodes_run_concurrently(self):
+        """Nodes without dependencies overlap instead of running serially"""
+        active = 0
+        peak = 0
+
+        async def work():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+
+        nodes = [DAGNode(name=f"n{i}", func=work) for i in range(4)]
+        outcomes = await DAGScheduler(nodes, max_concurrency=4).run()
+
+        assert peak == 4
+        assert all(exc is None for exc in outcomes.values())
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_respected(self):
+        """No more than max_concurrency nodes execute at once"""
+        active = 0
+        peak = 0
+
+        async def work():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        nodes = [DAGNode(name=f"n{i}", func=work) for i in range(6)]
+        await DAGScheduler(nodes, max_concurrency=2).run()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_for_upstream(self):
+        """A node starts only after every dependency has finished"""
+        order = []
+
+        def record(name, delay):
+            async def work():
+                await asyncio.sleep(delay)
+                order.append(name)
+            return work
+
+        nodes = [
+            DAGNode(name="content", func=record("content", 0), depends_on=["score"]),
+            DAGNode(name="score", func=record("score", 0), depends_on=["screens", "speed"]),
+            DAGNode(name="screens", func=record("screens", 0.02)),
+            DAGNode(name="speed", func=record("speed", 0.01)),
+        ]
+        await DAGScheduler(nodes).run()
+
+        assert order == ["speed", "screens", "score", "content"]
+
+    @pytest.mark.asyncio
+    async def test_failed_dependency_does_not_block_downstream(self):
+        """Failures are collected and dependents still execute"""
+        ran = []
+
+        async def boom():
+            raise ValueError("upstream failed")
+
+        async def downstream():
+            ran.append("downstream")
+
+        nodes = [
+            DAGNode(name="upstream", func=boom),
+            DAGNode(name="downstream", func=downstream, depends_on=["upstream"]),
+        ]
+        outcomes = await DAGScheduler(nodes).run()
+
+        assert isinstance(outcomes["upstream"], ValueError)
+        assert outcomes["downstream"] is None
+        assert ran == ["downstream"]
+
+    def test_cycle_rejected(self):
+        """Cyclic graphs fail validation"""
+        async def noop():
+            return None
+
+        with pytest.raises(DAGSchedulerError):
+            DAGScheduler([
+                DAGNode(name="a", func=noop, depends_on=["b"]),
+                DAGNode(name="b", func=noop, depends_on=["a"]),
+            ])
+
+    def test_unknown_dependency_rejected(self):
+        """Dependencies must reference declared nodes"""
+        async def noop():
+            return None
+
+        with pytest.raises(DAGSchedulerError):
+            DAGScheduler([DAGNode(name="a", func=noop, depends_on=["missing"])])
+
+    def test_orchestrator_critical_path_shorter_than_serial(self):
+        """Worst-case orchestrator wall time follows the longest chain"""
+        from src.assessments.assessment_orchestrator import AssessmentOrchestrator
+
+        async def noop():
+            return None
+
+        nodes = [
+            DAGNode(name=name, func=noop, depends_on=deps)
+            for name, deps in AssessmentOrchestrator.COMPONENT_DEPENDENCIES.items()
+        ]
+        scheduler = DAGScheduler(nodes)
+        timeouts = AssessmentOrchestrator.COMPONENT_TIMEOUTS
+
+        critical = scheduler.critical_path_length(timeouts)
+        assert critical == timeouts["screenshots"] + timeouts["visual_analysis"] + timeouts["score_calculation"] + timeouts["content_generation"]
+        assert critical < sum(timeouts.values())
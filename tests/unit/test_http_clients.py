@@ -0,0 +1,58 @@
+"""
+Unit tests for PRP-002 Shared HTTP Clients
+Tests per-loop client reuse, rebuild after loop shutdown and profile lookup
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.core.http_clients import HTTPClientRegistry, HTTPClientRegistryError
+
+
+class TestHTTPClientRegistry:
+    """Test lifecycle of pooled clients"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_on_same_loop(self):
+        registry = HTTPClientRegistry()
+
+        first = registry.get("pagespeed")
+        second = registry.get("pagespeed")
+
+        assert first is second
+        assert registry.get("semrush") is not first
+        assert await registry.aclose_loop() == 2
+        assert first.is_closed
+
+    def test_new_loop_gets_new_client(self):
+        registry = HTTPClientRegistry()
+
+        async def get_client():
+            return registry.get("site")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+        assert len(registry._clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_profile_rejected(self):
+        with pytest.raises(HTTPClientRegistryError):
+            HTTPClientRegistry().get("nope")
+
+    @pytest.mark.asyncio
+    async def test_site_clients_keep_no_cookies(self):
+        registry = HTTPClientRegistry()
+        response = httpx.Response(
+            200, headers=[("set-cookie", "session=abc; Path=/")], request=httpx.Request("GET", "https://example.com/")
+        )
+
+        for name, kept in (("site", 0), ("bulk_scan", 0), ("semrush", 1)):
+            client = registry.get(name)
+            client.cookies.extract_cookies(response)
+            assert len(client.cookies.jar) == kept, name
+
+        await registry.aclose_loop()
@@ -0,0 +1,88 @@
+"""
+Unit tests for PRP-006 Image Processing Service
+Tests image jobs, bounded queueing and per-job timing
+"""
+
+import asyncio
+import base64
+import io
+
+import pytest
+from PIL import Image
+from unittest.mock import patch
+
+from src.assessments.image_processing import (
+    ImageService, ImageServiceBusyError, ImageServiceError, prepare_for_vision, probe_image, transcode_image
+)
+from src.assessments.screenshot_hashing import ImageHashes
+
+
+def png_bytes(width, height, mode="RGBA"):
+    buffer = io.BytesIO()
+    Image.new(mode, (width, height), (40, 120, 200, 255)[:len(mode)]).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def run_inline(func, *args, **kwargs):
+    await asyncio.sleep(0.01)
+    return func(*args, **kwargs)
+
+
+class TestImageJobs:
+    """Test the job functions run by workers"""
+
+    def test_prepare_for_vision_downscales_large_screenshots(self, tmp_path):
+        path = tmp_path / "page.png"
+        path.write_bytes(png_bytes(1920, 6000))
+
+        prepared = prepare_for_vision(str(path), max_side=2048)
+
+        with Image.open(io.BytesIO(base64.b64decode(prepared.base64))) as image:
+            assert image.format == "JPEG" and max(image.size) == 2048
+        with Image.open(path) as original:
+            assert prepared.hashes == ImageHashes.of(original)
+
+    def test_small_screenshot_sent_as_is(self):
+        data = png_bytes(390, 844)
+
+        prepared = prepare_for_vision(data)
+
+        assert base64.b64decode(prepared.base64) == data and prepared.size_bytes == len(data)
+
+    def test_transcode_and_probe(self):
+        webp = transcode_image(png_bytes(1000, 500), format="WEBP", quality=75, max_side=500)
+
+        info = probe_image(webp)
+        assert (info.width, info.height, info.format) == (500, 250, "webp")
+
+
+class TestImageService:
+    """Test queue bounds and timing"""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_new_jobs(self):
+        service = ImageService(workers=1, max_queue=1)
+
+        with patch("src.assessments.image_processing.run_in_process", run_inline):
+            first = asyncio.create_task(service.run("probe", probe_image, png_bytes(10, 10)))
+            second = asyncio.create_task(service.run("probe", probe_image, png_bytes(10, 10)))
+            await asyncio.sleep(0)
+            assert service.queued == 1
+
+            with pytest.raises(ImageServiceBusyError):
+                await service.run("probe", probe_image, png_bytes(10, 10))
+            await asyncio.gather(first, second)
+
+        stats = service.stats()["jobs"]["probe"]
+        assert stats["ok"] == 2 and stats["rejected"] == 1
+        assert stats["queued_ms"] > 0 and service.stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_job_failure_wrapped(self):
+        service = ImageService(workers=1, max_queue=0)
+
+        with patch("src.assessments.image_processing.run_in_process", run_inline):
+            with pytest.raises(ImageServiceError):
+                await service.run("probe", probe_image, b"not an image")
+
+        assert service.stats()["jobs"]["probe"]["error"] == 1
@@ -0,0 +1,60 @@
+"""
+Unit tests for compressed Lighthouse result storage
+Tests round-tripping raw results and trimming hot JSON copies
+"""
+
+from unittest.mock import patch
+
+from src.assessments.pagespeed import _trim_pagespeed_data, trim_lighthouse_result
+from src.core.compression import GZIP, compress_json, decompress_json
+from src.models.pagespeed import PageSpeedAnalysis
+
+
+LIGHTHOUSE = {
+    "lighthouseVersion": "12.0.0",
+    "finalUrl": "https://example.com/",
+    "i18n": {"rendererFormattedStrings": {"passedAuditsGroupTitle": "Passed audits"}},
+    "categories": {"performance": {"score": 0.91, "auditRefs": [{"id": "speed-index"}]}},
+    "audits": {
+        "speed-index": {"score": 0.8, "numericValue": 3120.5, "details": {"type": "debugdata"}},
+        "final-screenshot": {"score": None, "details": {"data": "data:image/jpeg;base64,AAAA"}},
+    },
+}
+
+
+class TestRawLighthouseStorage:
+    """Test compressed cold storage on PageSpeedAnalysis"""
+
+    def test_round_trip(self):
+        analysis = PageSpeedAnalysis()
+        analysis.store_raw_lighthouse(LIGHTHOUSE)
+
+        assert analysis.raw_lighthouse_encoding in ("zstd", GZIP)
+        assert analysis.load_raw_lighthouse() == LIGHTHOUSE
+
+    def test_gzip_fallback_without_zstandard(self):
+        with patch("src.core.compression.zstandard", None):
+            data, encoding = compress_json(LIGHTHOUSE)
+
+        assert encoding == GZIP
+        assert decompress_json(data, encoding) == LIGHTHOUSE
+
+
+class TestTrimming:
+    """Test hot-column summaries of Lighthouse results"""
+
+    def test_details_and_i18n_dropped(self):
+        summary = trim_lighthouse_result(LIGHTHOUSE)
+
+        assert "i18n" not in summary
+        assert summary["categories"] == {"performance": {"score": 0.91}}
+        assert summary["audits"]["speed-index"] == {"score": 0.8, "numericValue": 3120.5}
+        assert trim_lighthouse_result(summary) == summary
+
+    def test_embedded_pagespeed_data_trimmed(self):
+        data = {"mobile_analysis": {"core_web_vitals": {}, "lighthouse_result": LIGHTHOUSE}, "desktop_analysis": None}
+
+        trimmed = _trim_pagespeed_data(data)
+
+        assert "details" not in trimmed["mobile_analysis"]["lighthouse_result"]["audits"]["speed-index"]
+        assert _trim_pagespeed_data(trimmed) == trimmed
@@ -0,0 +1,103 @@
+"""
+Unit tests for PRP-004 Broken Link Checker
+Tests link extraction, HEAD fallback, robots filtering and the time budget
+"""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+
+from src.assessments.link_checker import check_internal_links, extract_internal_links
+
+PAGE = """
+<html><body>
+  <a href="/about">About</a>
+  <a href="/about#team">Team</a>
+  <a href="https://www.example.com/contact">Contact</a>
+  <a href="/gone">Old page</a>
+  <a href="/admin/login">Admin</a>
+  <a href="https://other.com/">Partner</a>
+  <a href="mailto:hi@example.com">Email</a>
+</body></html>
+"""
+
+
+def serve(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestExtractInternalLinks:
+    """Test link discovery"""
+
+    def test_same_site_links_deduplicated(self):
+        links = extract_internal_links("https://example.com/", PAGE)
+
+        assert links == [
+            "https://example.com/about",
+            "https://www.example.com/contact",
+            "https://example.com/gone",
+            "https://example.com/admin/login",
+        ]
+
+    def test_malformed_href_skipped(self):
+        page = '<a href="http://[bad">Broken</a><a href="/about">About</a>'
+
+        assert extract_internal_links("https://example.com/", page) == ["https://example.com/about"]
+
+
+class TestCheckInternalLinks:
+    """Test checking over the shared client"""
+
+    @pytest.mark.asyncio
+    async def test_broken_links_counted(self):
+        def handler(request):
+            if request.method == "HEAD" and request.url.path == "/contact":
+                return httpx.Response(405)
+            if request.url.path == "/gone":
+                return httpx.Response(404)
+            return httpx.Response(200)
+
+        with patch("src.assessments.link_checker.get_http_client", return_value=serve(handler)):
+            result = await check_internal_links(
+                "https://example.com/", PAGE,
+                sitemap_urls=["https://example.com/services"],
+                robots_rules=["Disallow: /admin"]
+            )
+
+        assert result.links_found == 5
+        assert result.skipped_robots == 1
+        assert result.checked == 4
+        assert result.broken == [{"url": "https://example.com/gone", "status": 404}]
+
+    @pytest.mark.asyncio
+    async def test_time_budget_leaves_slow_links_unchecked(self):
+        async def handler(request):
+            if request.url.path == "/gone":
+                await asyncio.sleep(10)
+            return httpx.Response(200)
+
+        with patch("src.assessments.link_checker.get_http_client", return_value=serve(handler)), \
+             patch("src.assessments.link_checker.settings.LINK_CHECK_TIME_BUDGET_SECONDS", 0.2):
+            result = await check_internal_links("https://example.com/", PAGE)
+
+        assert result.checked == 3
+        assert result.unchecked == 1
+        assert result.broken_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_stops_checks(self):
+        finished = []
+
+        async def handler(request):
+            await asyncio.sleep(10)
+            finished.append(request.url.path)
+            return httpx.Response(200)
+
+        with patch("src.assessments.link_checker.get_http_client", return_value=serve(handler)):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(check_internal_links("https://example.com/", PAGE), timeout=0.2)
+            await asyncio.sleep(0)
+
+        assert finished == []
+        assert not [t for t in asyncio.all_tasks() if t.get_coro().__name__ == "_check_url"]
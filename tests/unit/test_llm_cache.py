@@ -0,0 +1,151 @@
+"""
+Unit tests for PRP-011 LLM Response Cache
+Tests cache keys, the disk tier and disk hits served without an API call
+"""
+
+import os
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.assessments.llm_cache import DiskCacheTier, cached_llm_call, llm_cache_key
+
+
+class TestLlmCacheKey:
+    """Test content addressing"""
+
+    def test_same_inputs_same_key(self):
+        assert llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"], images=["aGk="]) == \
+            llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"], images=["aGk="])
+
+    def test_every_input_changes_key(self):
+        base = llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"], images=["aGk="], max_tokens=2000)
+        variants = [
+            llm_cache_key("gpt-4o", "v1", 0.1, ["prompt"], images=["aGk="], max_tokens=2000),
+            llm_cache_key("gpt-4o-mini", "v2", 0.1, ["prompt"], images=["aGk="], max_tokens=2000),
+            llm_cache_key("gpt-4o-mini", "v1", 0.3, ["prompt"], images=["aGk="], max_tokens=2000),
+            llm_cache_key("gpt-4o-mini", "v1", 0.1, ["edited prompt"], images=["aGk="], max_tokens=2000),
+            llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"], images=["aGk/"], max_tokens=2000),
+            llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"], images=["aGk="], max_tokens=1500),
+        ]
+        assert base not in variants and len(set(variants)) == len(variants)
+
+    def test_message_boundaries_matter(self):
+        assert llm_cache_key("m", "v1", 0, ["ab", "c"]) != llm_cache_key("m", "v1", 0, ["a", "bc"])
+
+
+class TestDiskCacheTier:
+    """Test the on-disk tier"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_expiry(self, tmp_path):
+        tier = DiskCacheTier(str(tmp_path))
+        await tier.set("llm_vision", "abcdef", {"score": 1.5})
+
+        assert await tier.get("llm_vision", "abcdef", ttl=60) == {"score": 1.5}
+
+        path = tmp_path / "llm_vision" / "ab" / "abcdef.json"
+        os.utime(path, (time.time() - 120, time.time() - 120))
+        assert await tier.get("llm_vision", "abcdef", ttl=60) is None
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_delete(self, tmp_path):
+        tier = DiskCacheTier(str(tmp_path))
+        await tier.set("llm_content", "abcdef", {"subject_line": "Hi"})
+        await tier.delete("llm_content", "abcdef")
+
+        assert await tier.get("llm_content", "abcdef", ttl=60) is None
+
+    @pytest.mark.asyncio
+    async def test_write_sweeps_expired_files(self, tmp_path):
+        tier = DiskCacheTier(str(tmp_path))
+        await tier.set("llm_vision", "abcdef", {"score": 1.5})
+        stale = tmp_path / "llm_vision" / "ab" / "abcdef.json"
+        os.utime(stale, (time.time() - 120, time.time() - 120))
+
+        await tier.set("llm_vision", "123456", {"score": 0.5}, ttl=60)
+
+        assert not stale.exists()
+        assert (tmp_path / "llm_vision" / "12" / "123456.json").exists()
+
+        # Throttled: a second write inside the interval doesn't rescan
+        os.utime(tmp_path / "llm_vision" / "12" / "123456.json", (time.time() - 120, time.time() - 120))
+        await tier.set("llm_vision", "abcdef", {"score": 1.5}, ttl=60)
+        assert await tier.sweep("llm_vision", ttl=60) == 0
+        assert await tier.sweep("llm_vision", ttl=60, force=True) == 1
+
+
+class TestCachedLlmCall:
+    """Test tier ordering and provenance"""
+
+    @pytest.mark.asyncio
+    async def test_disk_hit_skips_api_call(self, tmp_path):
+        key = llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"])
+        await DiskCacheTier(str(tmp_path)).set("llm_content", key, {"text": "cached"})
+        compute = AsyncMock(return_value={"text": "live"})
+
+        with patch("src.assessments.llm_cache.settings.LLM_CACHE_DISK_DIR", str(tmp_path)), \
+             patch("src.assessments.result_cache.cache") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock(return_value=True)
+
+            payload, provenance = await cached_llm_call(
+                "llm_content", key, compute, serialize=dict, deserialize=dict
+            )
+
+        assert payload == {"text": "cached"}
+        assert provenance.cache_hit is True
+        compute.assert_not_called()
+        # Promoted back into Redis
+        mock_cache.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_miss_writes_disk_tier(self, tmp_path):
+        key = llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"])
+        compute = AsyncMock(return_value={"text": "live"})
+
+        with patch("src.assessments.llm_cache.settings.LLM_CACHE_DISK_DIR", str(tmp_path)), \
+             patch("src.assessments.result_cache.cache") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock(return_value=True)
+
+            payload, provenance = await cached_llm_call(
+                "llm_content", key, compute, serialize=dict, deserialize=dict,
+                cost_of=lambda _: 0.8
+            )
+
+        assert payload == {"text": "live"} and provenance.cache_hit is False
+        assert provenance.source_cost_cents == 0.8
+        assert await DiskCacheTier(str(tmp_path)).get("llm_content", key, ttl=60) == {"text": "live"}
+
+    @pytest.mark.asyncio
+    async def test_disabled_calls_api_without_provenance(self):
+        compute = AsyncMock(return_value={"text": "live"})
+
+        with patch("src.assessments.llm_cache.settings.LLM_CACHE_ENABLED", False):
+            payload, provenance = await cached_llm_call(
+                "llm_content", "key", compute, serialize=dict, deserialize=dict
+            )
+
+        assert payload == {"text": "live"} and provenance is None
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_response_stored_nowhere(self, tmp_path):
+        key = llm_cache_key("gpt-4o-mini", "v1", 0.1, ["prompt"])
+        compute = AsyncMock(return_value={"text": ""})
+
+        with patch("src.assessments.llm_cache.settings.LLM_CACHE_DISK_DIR", str(tmp_path)), \
+             patch("src.assessments.result_cache.cache") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock(return_value=True)
+
+            payload, provenance = await cached_llm_call(
+                "llm_content", key, compute, serialize=dict, deserialize=dict,
+                cacheable=lambda p: bool(p["text"])
+            )
+
+        assert payload == {"text": ""} and provenance.cache_hit is False
+        mock_cache.set.assert_not_awaited()
+        assert await DiskCacheTier(str(tmp_path)).get("llm_content", key, ttl=60) is None
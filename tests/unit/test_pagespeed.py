@@ -257,6 +257,32 @@ class TestPageSpeedAssessment:
             
             with pytest.raises(PageSpeedError):
                 await assess_pagespeed("https://example.com", lead_id=123)
+    
+    @pytest.mark.asyncio
+    async def test_mobile_only_result_not_cached(self):
+        """A result missing its desktop analysis is returned but not stored"""
+        mobile_result = PageSpeedResult(
+            url="https://example.com",
+            strategy="mobile",
+            core_web_vitals=CoreWebVitals(performance_score=85),
+            lighthouse_result={},
+            analysis_timestamp=datetime.now(timezone.utc).isoformat(),
+            analysis_duration_ms=5000,
+            cost_cents=0.25
+        )
+        
+        with patch('src.assessments.pagespeed.get_pagespeed_client') as mock_get_client, \
+             patch('src.assessments.result_cache.cache') as mock_cache:
+            mock_client = AsyncMock()
+            mock_client.analyze_mobile_first.return_value = {"mobile": mobile_result}
+            mock_get_client.return_value = mock_client
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+            
+            result = await assess_pagespeed("https://example.com", lead_id=123)
+            
+            assert result["desktop_analysis"] is None
+            mock_cache.set.assert_not_called()
 
 
 class TestCoreWebVitals:
@@ -0,0 +1,206 @@
+"""
+Unit tests for PRP-003 concurrent PageSpeed strategies
+Tests concurrent mobile/desktop runs and hedged requests
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.assessments.pagespeed import LatencyTracker, PageSpeedClient, PageSpeedError
+
+
+def ok_response():
+    response = MagicMock()
+    response.status_code = 200
+    return response
+
+
+class TestConcurrentStrategies:
+    """Test mobile and desktop running side by side"""
+
+    @pytest.mark.asyncio
+    async def test_strategies_overlap(self):
+        client = PageSpeedClient(api_key="test-key")
+        started = []
+
+        async def analyze(url, strategy="mobile"):
+            started.append(strategy)
+            await asyncio.sleep(0.05)
+            assert set(started) == {"mobile", "desktop"}
+            return strategy
+
+        with patch.object(client, "analyze_url", side_effect=analyze):
+            results = await client.analyze_mobile_first("https://example.com")
+
+        assert results == {"mobile": "mobile", "desktop": "desktop"}
+
+    @pytest.mark.asyncio
+    async def test_mobile_failure_cancels_desktop(self):
+        client = PageSpeedClient(api_key="test-key")
+        desktop_cancelled = asyncio.Event()
+
+        async def analyze(url, strategy="mobile"):
+            if strategy == "mobile":
+                await asyncio.sleep(0.01)
+                raise PageSpeedError("mobile down")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # Cleanup that awaits, like settling the budget reservation
+                await asyncio.sleep(0)
+                desktop_cancelled.set()
+                raise
+
+        with patch.object(client, "analyze_url", side_effect=analyze):
+            with pytest.raises(PageSpeedError):
+                await client.analyze_mobile_first("https://example.com")
+
+        # Settled before the mobile failure propagated
+        assert desktop_cancelled.is_set()
+
+
+class TestHedging:
+    """Test duplicate requests for slow PageSpeed calls"""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_over_stalled_request(self):
+        client = PageSpeedClient(api_key="test-key")
+        hedge_response = ok_response()
+        calls = []
+
+        async def send(params, strategy, sent=None, hedge=False):
+            calls.append(strategy)
+            if len(calls) == 1:
+                await asyncio.sleep(10)
+            sent.set()
+            return hedge_response
+
+        with patch.object(client, "_send", side_effect=send), \
+             patch("src.assessments.pagespeed.settings.PAGESPEED_HEDGE_ENABLED", True), \
+             patch("src.assessments.pagespeed.latency_tracker.hedge_delay", return_value=0.01):
+            response, hedged = await client._send_hedged({"url": "https://example.com"}, "mobile")
+
+        assert response is hedge_response
+        assert hedged == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_hedge_that_was_sent_is_charged(self):
+        client = PageSpeedClient(api_key="test-key")
+        sent = asyncio.Event()
+
+        async def stalled_get(*args, **kwargs):
+            sent.set()
+            await asyncio.sleep(10)
+
+        reservation = MagicMock(settled=False)
+        commit, release = AsyncMock(), AsyncMock()
+        with patch("src.assessments.pagespeed.acquire_rate_limit", AsyncMock()), \
+             patch("src.core.budget.budget.reserve", AsyncMock(return_value=reservation)), \
+             patch("src.core.budget.budget.commit", commit), \
+             patch("src.core.budget.budget.release", release), \
+             patch.object(type(client), "client", MagicMock(get=AsyncMock(side_effect=stalled_get))):
+            task = asyncio.create_task(client._send({"url": "https://example.com"}, "mobile"))
+            await sent.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        commit.assert_awaited_once_with(reservation)
+
+    @pytest.mark.asyncio
+    async def test_losing_request_settled_before_return(self):
+        client = PageSpeedClient(api_key="test-key")
+        hedge_response = ok_response()
+        original, hedge = MagicMock(settled=False), MagicMock(settled=False)
+
+        async def get(*args, **kwargs):
+            if get.calls == 0:
+                get.calls += 1
+                await asyncio.sleep(10)
+            return hedge_response
+        get.calls = 0
+
+        @asynccontextmanager
+        async def guard(provider):
+            yield MagicMock()
+
+        commit = AsyncMock()
+        with patch("src.assessments.pagespeed.acquire_rate_limit", AsyncMock()), \
+             patch("src.assessments.pagespeed.circuit_guard", guard), \
+             patch("src.core.budget.budget.reserve", AsyncMock(side_effect=[original, hedge])), \
+             patch("src.core.budget.budget.commit", commit), \
+             patch("src.core.budget.budget.release", AsyncMock()), \
+             patch("src.assessments.pagespeed.settings.PAGESPEED_HEDGE_ENABLED", True), \
+             patch("src.assessments.pagespeed.latency_tracker.hedge_delay", return_value=0.01), \
+             patch.object(type(client), "client", MagicMock(get=AsyncMock(side_effect=get))):
+            response, hedged = await client._send_hedged({"url": "https://example.com"}, "mobile")
+            committed = [c.args[0] for c in commit.await_args_list]
+
+        assert response is hedge_response
+        assert hedged == 1
+        # The cancelled original was sent, so it is billed before the result is returned
+        assert original in committed
+        assert hedge in committed
+
+    @pytest.mark.asyncio
+    async def test_hedge_cancelled_before_sending_not_counted(self):
+        client = PageSpeedClient(api_key="test-key")
+        original_response = ok_response()
+        calls = []
+
+        async def send(params, strategy, sent=None, hedge=False):
+            calls.append(strategy)
+            # The original lands while the hedge still waits for a rate limit token
+            await asyncio.sleep(0.05 if hedge else 0.02)
+            return original_response
+
+        with patch.object(client, "_send", side_effect=send), \
+             patch("src.assessments.pagespeed.settings.PAGESPEED_HEDGE_ENABLED", True), \
+             patch("src.assessments.pagespeed.latency_tracker.hedge_delay", return_value=0.01):
+            response, hedged = await client._send_hedged({"url": "https://example.com"}, "mobile")
+
+        assert response is original_response
+        assert len(calls) == 2 and hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_original_recorded_as_lower_bound(self):
+        client = PageSpeedClient(api_key="test-key")
+        tracker = LatencyTracker()
+        requests = []
+
+        async def get(*args, **kwargs):
+            requests.append(args)
+            if len(requests) == 1:
+                await asyncio.sleep(10)
+            return ok_response()
+
+        @asynccontextmanager
+        async def guard(provider):
+            yield MagicMock()
+
+        with patch("src.assessments.pagespeed.acquire_rate_limit", AsyncMock()), \
+             patch("src.core.budget.budget.reserve", AsyncMock(return_value=None)), \
+             patch("src.assessments.pagespeed.circuit_guard", guard), \
+             patch("src.assessments.pagespeed.latency_tracker", tracker), \
+             patch("src.assessments.pagespeed.settings.PAGESPEED_HEDGE_ENABLED", True), \
+             patch.object(tracker, "hedge_delay", return_value=0.05), \
+             patch.object(type(client), "client", MagicMock(get=AsyncMock(side_effect=get))):
+            response, hedged = await client._send_hedged({"url": "https://example.com"}, "mobile")
+            await asyncio.sleep(0.01)
+
+        assert hedged == 1
+        # The hedge's own latency, plus the stalled original's elapsed time when cancelled
+        fast, stalled = sorted(tracker._samples["mobile"])
+        assert stalled >= 0.05 > fast
+
+    def test_delay_follows_observed_quantile(self):
+        tracker = LatencyTracker()
+        with patch("src.assessments.pagespeed.settings.PAGESPEED_HEDGE_MIN_DELAY_SECONDS", 1.0):
+            assert tracker.quantile("mobile", 0.95) is None
+            for seconds in range(1, 101):
+                tracker.record("mobile", float(seconds))
+
+            assert tracker.hedge_delay("mobile") == 96.0
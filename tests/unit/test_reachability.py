@@ -0,0 +1,132 @@
+"""
+Unit tests for PRP-011 Reachability Pre-check
+Tests the DNS/HTTP probe, negative caching and orchestrator short-circuit
+"""
+
+import socket
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.assessments.reachability import ReachabilityResult, check_reachability
+
+
+ADDRESSES = [(2, 1, 6, "", ("10.0.0.1", 443))]
+
+
+class TestCheckReachability:
+    """Test the pre-flight probe"""
+
+    @pytest.mark.asyncio
+    async def test_dns_failure_negatively_cached(self):
+        cache_set = AsyncMock()
+        with patch("asyncio.base_events.BaseEventLoop.getaddrinfo", AsyncMock(side_effect=OSError("NXDOMAIN"))), \
+             patch("src.assessments.reachability.cache.get", AsyncMock(return_value=None)), \
+             patch("src.assessments.reachability.cache.set", cache_set):
+            result = await check_reachability("https://dead.example/page")
+
+        assert not result.reachable and result.reason == "dns"
+        key, value = cache_set.call_args.args
+        assert key == "unreachable:dead.example" and value["reason"] == "dns"
+        assert cache_set.call_args.kwargs["ttl"] == 3600
+
+    @pytest.mark.asyncio
+    async def test_temporary_dns_failure_cached_briefly(self):
+        cache_set = AsyncMock()
+        failure = socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+        with patch("asyncio.base_events.BaseEventLoop.getaddrinfo", AsyncMock(side_effect=failure)), \
+             patch("src.assessments.reachability.cache.get", AsyncMock(return_value=None)), \
+             patch("src.assessments.reachability.cache.set", cache_set):
+            result = await check_reachability("https://flaky.example")
+
+        assert not result.reachable and result.transient
+        assert cache_set.call_args.kwargs["ttl"] == 60
+
+    @pytest.mark.asyncio
+    async def test_cached_failure_skips_probe(self):
+        cached = {"url": "https://dead.example", "host": "dead.example", "reachable": False, "reason": "connect"}
+        lookup = AsyncMock()
+        with patch("asyncio.base_events.BaseEventLoop.getaddrinfo", lookup), \
+             patch("src.assessments.reachability.cache.get", AsyncMock(return_value=cached)):
+            result = await check_reachability("dead.example")
+
+        assert not result.reachable and result.cached and result.url == "dead.example"
+        lookup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_http_and_ignores_status(self):
+        def handler(request):
+            if request.url.scheme == "https":
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(503)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache_set = AsyncMock()
+        with patch("asyncio.base_events.BaseEventLoop.getaddrinfo", AsyncMock(return_value=ADDRESSES)), \
+             patch("src.assessments.reachability.cache.get", AsyncMock(return_value=None)), \
+             patch("src.assessments.reachability.cache.set", cache_set), \
+             patch("src.assessments.reachability.get_http_client", return_value=client):
+            result = await check_reachability("https://example.com")
+
+        assert result.reachable and result.status_code == 503
+        cache_set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_filtered_https_falls_back_to_http(self):
+        def handler(request):
+            if request.url.scheme == "https":
+                raise httpx.ConnectTimeout("timed out", request=request)
+            return httpx.Response(200)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("asyncio.base_events.BaseEventLoop.getaddrinfo", AsyncMock(return_value=ADDRESSES)), \
+             patch("src.assessments.reachability.cache.get", AsyncMock(return_value=None)), \
+             patch("src.assessments.reachability.get_http_client", return_value=client):
+            result = await check_reachability("https://example.com")
+
+        assert result.reachable and result.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_connect_timeout_is_unreachable_briefly(self):
+        def handler(request):
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache_set = AsyncMock()
+        with patch("asyncio.base_events.BaseEventLoop.getaddrinfo", AsyncMock(return_value=ADDRESSES)), \
+             patch("src.assessments.reachability.cache.get", AsyncMock(return_value=None)), \
+             patch("src.assessments.reachability.cache.set", cache_set), \
+             patch("src.assessments.reachability.get_http_client", return_value=client):
+            result = await check_reachability("https://example.com")
+
+        assert not result.reachable and result.reason == "timeout" and result.transient
+        assert cache_set.call_args.kwargs["ttl"] == 60
+
+
+class TestOrchestratorShortCircuit:
+    """Test that a dead site skips URL-dependent components"""
+
+    @pytest.mark.asyncio
+    async def test_site_components_skipped(self):
+        from src.assessments.assessment_orchestrator import AssessmentOrchestrator, AssessmentStatus, ComponentStatus
+
+        orchestrator = AssessmentOrchestrator()
+        call = AsyncMock(return_value={})
+        dead = ReachabilityResult(
+            url="https://dead.example", host="dead.example", reachable=False, reason="dns", detail="NXDOMAIN"
+        )
+
+        with patch("src.assessments.assessment_orchestrator.precheck_site", AsyncMock(return_value=dead)), \
+             patch("src.assessments.assessment_orchestrator.budget.can_afford", AsyncMock(return_value=True)), \
+             patch("src.assessments.assessment_orchestrator.is_circuit_open", AsyncMock(return_value=False)), \
+             patch.object(orchestrator, "_call_component_function", call):
+            execution = await orchestrator.execute_complete_assessment(
+                1, {"url": "https://dead.example", "company": "Example"}
+            )
+
+        assert execution.status == AssessmentStatus.UNREACHABLE
+        assert execution.pagespeed_result.status == ComponentStatus.SKIPPED
+        assert "pagespeed skipped: site unreachable (dns): NXDOMAIN" in execution.error_summary
+        called = {c.args[0] for c in call.await_args_list}
+        assert called == {"gbp", "score_calculation", "content_generation"}
@@ -0,0 +1,106 @@
+"""
+Unit tests for PRP-011 Component Result Cache
+Tests URL canonicalization, cache hits and provenance
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.assessments.result_cache import (
+    ComponentResultCache,
+    canonical_domain,
+    canonical_url,
+)
+
+
+class TestCanonicalUrl:
+    """Test cache key normalization"""
+
+    def test_cosmetic_variants_collapse(self):
+        """Scheme/host case, www, default port, fragment and tracking params are ignored"""
+        variants = [
+            "https://example.com",
+            "https://www.example.com/",
+            "HTTPS://Example.com:443/#top",
+            "example.com",
+            "https://example.com/?utm_source=mail&gclid=abc",
+        ]
+        assert {canonical_url(v) for v in variants} == {"https://example.com"}
+
+    def test_meaningful_query_kept_and_sorted(self):
+        assert canonical_url("https://example.com/p?b=2&a=1") == "https://example.com/p?a=1&b=2"
+
+    def test_domain(self):
+        assert canonical_domain("https://www.Example.com/path") == "example.com"
+        assert canonical_domain("example.com") == "example.com"
+
+
+class TestComponentResultCache:
+    """Test get_or_compute behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_miss_computes_and_stores(self):
+        store = {}
+
+        async def fake_set(key, value, ttl=None):
+            store[key] = (value, ttl)
+            return True
+
+        compute = AsyncMock(return_value={"score": 90})
+        with patch("src.assessments.result_cache.cache") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock(side_effect=fake_set)
+
+            payload, provenance = await ComponentResultCache().get_or_compute(
+                "pagespeed", "https://example.com", compute,
+                serialize=lambda p: p, deserialize=lambda p: p, cost_of=lambda _: 0.5
+            )
+
+        assert payload == {"score": 90}
+        assert provenance.cache_hit is False
+        assert provenance.source_cost_cents == 0.5
+        (entry, ttl), = store.values()
+        assert entry["payload"] == {"score": 90}
+        assert ttl == 86400
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_compute(self):
+        entry = {
+            "payload": {"score": 90},
+            "provenance": {
+                "component": "semrush",
+                "cache_key": "component:semrush:example.com",
+                "cache_hit": False,
+                "cached_at": "2024-01-01T00:00:00+00:00",
+                "ttl_seconds": 604800,
+                "source_cost_cents": 10.0,
+            },
+            "stored_ts": 0,
+        }
+        compute = AsyncMock()
+        with patch("src.assessments.result_cache.cache") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=entry)
+
+            payload, provenance = await ComponentResultCache().get_or_compute(
+                "semrush", "example.com", compute,
+                serialize=lambda p: p, deserialize=lambda p: p
+            )
+
+        compute.assert_not_called()
+        assert payload == {"score": 90}
+        assert provenance.cache_hit is True
+        assert provenance.source_cost_cents == 10.0
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_result_not_stored(self):
+        compute = AsyncMock(return_value=(None, None))
+        with patch("src.assessments.result_cache.cache") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+
+            await ComponentResultCache().get_or_compute(
+                "screenshots", "https://example.com", compute,
+                serialize=lambda p: p, deserialize=lambda p: p, cacheable=lambda pair: all(pair)
+            )
+
+        mock_cache.set.assert_not_called()
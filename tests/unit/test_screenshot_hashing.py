@@ -0,0 +1,119 @@
+"""
+Unit tests for PRP-006 Screenshot Perceptual Hashing
+Tests hash stability, vectorized distances and visual analysis reuse
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from PIL import Image, ImageDraw
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.assessments.screenshot_hashing import ImageHashes, find_near_duplicate, hamming_distances, to_db_hash
+
+
+def page(banner=(30, 90, 200), offset=0, text="Welcome"):
+    image = Image.new("RGB", (1920, 3000), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, 0, 1920, 200], fill=banner)
+    draw.rectangle([200, 400 + offset, 1700, 1200 + offset], fill=(220, 220, 220))
+    draw.rectangle([300, 1500, 900, 2500], fill=(10, 10, 10))
+    draw.text((100, 100), text, fill="black")
+    return image
+
+
+def stored(hashes):
+    return [to_db_hash(hashes.phash), to_db_hash(hashes.dhash)]
+
+
+def mock_db(rows, analysis=None):
+    db = MagicMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    db.execute = AsyncMock(return_value=result)
+    db.get = AsyncMock(return_value=analysis)
+    return db
+
+
+class TestImageHashes:
+    """Test fingerprints of rendered pages"""
+
+    def test_small_edits_stay_close_and_layout_changes_do_not(self):
+        original = ImageHashes.of(page())
+
+        assert original.distance(ImageHashes.of(page(text="Welcome!"))) <= 2
+        assert original.distance(ImageHashes.of(page(banner=(200, 30, 30), offset=500))) > 4
+        assert ImageHashes.from_hex(original.hex()) == original
+
+    def test_vectorized_distances_match_scalar(self):
+        hashes = [ImageHashes.of(page(offset=offset)) for offset in (0, 300, 600)]
+        target = ImageHashes.of(page(offset=20))
+
+        distances = hamming_distances([stored(h) for h in hashes], stored(target))
+
+        assert distances.shape == (3, 2)
+        assert distances.max(axis=1).tolist() == [h.distance(target) for h in hashes]
+
+
+class TestNearDuplicateLookup:
+    """Test candidate scoring against the screenshot index"""
+
+    @pytest.mark.asyncio
+    async def test_closest_candidate_within_threshold_returned(self):
+        desktop, mobile = ImageHashes.of(page()), ImageHashes.of(page(offset=100))
+        other = ImageHashes.of(page(banner=(200, 30, 30), offset=500))
+        analysis = MagicMock(
+            id=7, analysis_timestamp=datetime(2026, 10, 1, tzinfo=timezone.utc),
+            raw_analysis_data={"overall_ux_score": 1.5}
+        )
+        db = mock_db([
+            (3, 30, *stored(other), *stored(mobile)),
+            (7, 70, *stored(desktop), *stored(mobile)),
+        ], analysis)
+
+        match = await find_near_duplicate(db, desktop, mobile, max_distance=4)
+
+        assert match.visual_analysis_id == 7 and match.screenshot_id == 70 and match.distance == 0
+        db.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_match_beyond_threshold(self):
+        desktop, mobile = ImageHashes.of(page()), ImageHashes.of(page(offset=100))
+        other = ImageHashes.of(page(banner=(200, 30, 30), offset=500))
+        db = mock_db([(3, 30, *stored(other), *stored(mobile))])
+
+        assert await find_near_duplicate(db, desktop, mobile, max_distance=4) is None
+        db.get.assert_not_awaited()
+
+
+class TestVisualAnalysisReuse:
+    """Test that a near-duplicate skips the vision call"""
+
+    @pytest.mark.asyncio
+    async def test_prior_analysis_reused_without_api_call(self):
+        from src.assessments.screenshot_hashing import NearDuplicate
+        from src.assessments.visual_analysis import VisualAnalyzer
+
+        rubrics = [
+            {"name": name, "score": 2, "explanation": "Clear and well executed element", "recommendations": []}
+            for name in VisualAnalyzer.UX_RUBRICS
+        ]
+        match = NearDuplicate(
+            visual_analysis_id=7, screenshot_id=70, distance=1,
+            analysis_timestamp=datetime(2026, 10, 1, tzinfo=timezone.utc),
+            raw_analysis_data={"rubrics": rubrics, "overall_ux_score": 2.0, "critical_issues": []}
+        )
+        hashes = ImageHashes.of(page())
+        analyzer = VisualAnalyzer()
+        vision = AsyncMock()
+
+        with patch.object(analyzer, "_download_and_validate_image", AsyncMock(return_value=("aW1n", hashes))), \
+             patch.object(analyzer, "_execute_vision_analysis", vision), \
+             patch("src.assessments.visual_analysis.AsyncSessionLocal", MagicMock()), \
+             patch("src.assessments.visual_analysis.find_near_duplicate", AsyncMock(return_value=match)):
+            metrics = await analyzer.analyze_screenshots("blob://desktop.webp", "blob://mobile.webp")
+
+        vision.assert_not_awaited()
+        assert metrics.api_cost_dollars == 0.0 and metrics.overall_ux_score == 2.0
+        assert metrics.reused_from == {"visual_analysis_id": 7, "screenshot_id": 70, "distance": 1}
+        assert metrics.screenshot_hashes["desktop"] == hashes.hex()
@@ -0,0 +1,59 @@
+"""
+Unit tests for PRP-007 SEMrush Integration
+Tests which domain analyses are reused from the result cache
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.assessments.semrush_integration import SEMrushClient, SEMrushIntegrationError, assess_semrush_domain
+
+DOMAIN_RANKS = "Database;Domain;Rank;Organic Keywords;Organic Traffic;Organic Cost;Adwords Keywords;Adwords Traffic;Adwords Cost;PLA uniques;PLA keywords\nus;example.com;5000;1200;30000;0;0;0;0;0;0"
+
+
+async def assess(api_request):
+    with patch("src.assessments.semrush_integration.settings.SEMRUSH_API_KEY", "key"), \
+         patch.object(SEMrushClient, "_check_api_balance", AsyncMock(return_value=1000)), \
+         patch.object(SEMrushClient, "_make_api_request", AsyncMock(side_effect=api_request)), \
+         patch("src.assessments.result_cache.cache") as mock_cache:
+        mock_cache.get = AsyncMock(return_value=None)
+        mock_cache.set = AsyncMock(return_value=True)
+        results = await assess_semrush_domain("example.com", lead_id=1)
+    return results, mock_cache.set
+
+
+class TestSemrushResultCache:
+    """Test that only complete analyses are cached"""
+
+    @pytest.mark.asyncio
+    async def test_complete_analysis_cached(self):
+        results, cache_set = await assess(lambda *args, **kwargs: DOMAIN_RANKS)
+
+        assert results.success and results.metrics.organic_traffic_estimate == 30000
+        assert results.metrics.errors == []
+        cache_set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_partial_analysis_not_cached(self):
+        calls = []
+
+        def fail_second(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                raise SEMrushIntegrationError("API request failed: 500")
+            return DOMAIN_RANKS
+
+        results, cache_set = await assess(fail_second)
+
+        assert results.success and results.metrics.errors == ["API request failed: 500"]
+        cache_set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_zeroed_analysis_not_cached(self):
+        def time_out(*args, **kwargs):
+            raise SEMrushIntegrationError("API request timed out")
+
+        results, cache_set = await assess(time_out)
+
+        assert results.metrics.authority_score == 0 and results.metrics.api_cost_units == 0
+        cache_set.assert_not_awaited()
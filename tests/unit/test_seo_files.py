@@ -0,0 +1,105 @@
+"""
+Unit tests for PRP-004 SEO File Fetcher
+Tests streamed sitemap counting, index expansion and conditional requests
+"""
+
+import gzip
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.assessments.seo_files import SitemapCounter, fetch_seo_files
+
+URLSET = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    + b"".join(b"<url><loc>https://example.com/p%d</loc></url>" % i for i in range(250))
+    + b"</urlset>"
+)
+INDEX = (
+    b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    b"<sitemap><loc>https://example.com/a.xml</loc></sitemap>"
+    b"<sitemap><loc>https://example.com/b.xml.gz</loc></sitemap>"
+    b"</sitemapindex>"
+)
+
+
+def serve(routes, seen=None):
+    def handler(request):
+        if seen is not None:
+            seen.append(request)
+        status, body, headers = routes.get(request.url.path, (404, b"", {}))
+        return httpx.Response(status, content=body, headers=headers)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestSitemapCounter:
+    """Test incremental parsing"""
+
+    def test_counts_urls_across_chunks(self):
+        counter = SitemapCounter()
+        for i in range(0, len(URLSET), 97):
+            counter.feed(URLSET[i:i + 97])
+        counter.close()
+
+        summary = counter.summary()
+        assert summary["url_count"] == 250
+        assert summary["is_valid_xml"] and not summary["is_index"]
+
+    def test_html_is_not_a_sitemap(self):
+        counter = SitemapCounter()
+        counter.feed(b"<html><body>Not found</body></html>")
+        counter.close()
+
+        assert counter.summary()["is_valid_xml"] is False
+
+
+class TestFetchSeoFiles:
+    """Test fetching over the shared client"""
+
+    @pytest.mark.asyncio
+    async def test_index_children_summed(self):
+        client = serve({
+            "/robots.txt": (200, b"User-agent: *\nSitemap: https://example.com/sitemap.xml\n", {}),
+            "/sitemap.xml": (200, INDEX, {}),
+            "/a.xml": (200, URLSET, {}),
+            "/b.xml.gz": (200, gzip.compress(URLSET), {"content-type": "application/x-gzip"}),
+        })
+        with patch("src.assessments.seo_files.get_http_client", return_value=client), \
+             patch("src.assessments.seo_files.cache.get", AsyncMock(return_value=None)):
+            signals = await fetch_seo_files("https://example.com/about")
+
+        assert signals["robots_txt"]["present"] and signals["robots_txt"]["has_sitemap_directive"]
+        sitemap = signals["sitemap_xml"]
+        assert sitemap["is_index"] and sitemap["url_count"] == 500
+        assert sitemap["url_count_complete"]
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_result(self):
+        seen = []
+        client = serve({"/robots.txt": (304, b"", {}), "/sitemap.xml": (404, b"", {})}, seen)
+        cached = {"etag": '"v1"', "last_modified": None, "result": {"present": True, "has_sitemap_directive": False}}
+
+        async def cache_get(key):
+            return cached if key.endswith("/robots.txt") else None
+
+        with patch("src.assessments.seo_files.get_http_client", return_value=client), \
+             patch("src.assessments.seo_files.cache.get", side_effect=cache_get):
+            signals = await fetch_seo_files("https://example.com")
+
+        robots_request = next(r for r in seen if r.url.path == "/robots.txt")
+        assert robots_request.headers["if-none-match"] == '"v1"'
+        assert signals["robots_txt"]["present"] and signals["robots_txt"]["not_modified"]
+        assert signals["sitemap_xml"]["present"] is False
+
+    @pytest.mark.asyncio
+    async def test_oversized_sitemap_truncated(self):
+        client = serve({"/sitemap.xml": (200, URLSET, {})})
+        with patch("src.assessments.seo_files.get_http_client", return_value=client), \
+             patch("src.assessments.seo_files.cache.get", AsyncMock(return_value=None)), \
+             patch("src.assessments.seo_files.settings.SEO_SITEMAP_MAX_BYTES", 1000):
+            signals = await fetch_seo_files("https://example.com")
+
+        sitemap = signals["sitemap_xml"]
+        assert sitemap["truncated"] and sitemap["size_bytes"] == 1000
+        assert 0 < sitemap["url_count"] < 250 and not sitemap["url_count_complete"]
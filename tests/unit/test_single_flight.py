@@ -0,0 +1,163 @@
+"""
+Unit tests for PRP-011 Single-Flight Coalescing
+Tests ownership, result sharing, failure propagation and lease takeover
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.core.circuit_breaker import CircuitOpenError
+from src.core.single_flight import SingleFlight, SingleFlightError
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the commands SingleFlight uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if self.data.get(key) != token:
+            return 0
+        if "DEL" in script:
+            del self.data[key]
+        return 1
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch("src.core.single_flight.get_redis", AsyncMock(return_value=redis)):
+        yield redis
+
+
+def identity(value):
+    return value
+
+
+class TestSingleFlight:
+    """Test cross-caller coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self, fake_redis):
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"score": 90}
+
+        flight = SingleFlight(lease_seconds=5, max_wait_seconds=5)
+        flight.POLL_INTERVAL_SECONDS = 0.01
+        outcomes = await asyncio.gather(*[
+            flight.do("component:pagespeed:https://example.com", compute, identity, identity)
+            for _ in range(5)
+        ])
+
+        assert calls == 1
+        assert all(result == {"score": 90} for result, _ in outcomes)
+        assert sorted(shared for _, shared in outcomes) == [False, True, True, True, True]
+        assert not any(key.endswith(":lease") for key in fake_redis.data)
+
+    @pytest.mark.asyncio
+    async def test_owner_failure_is_shared(self, fake_redis):
+        async def compute():
+            await asyncio.sleep(0.05)
+            raise RuntimeError("quota exceeded")
+
+        flight = SingleFlight(lease_seconds=5, max_wait_seconds=5)
+        flight.POLL_INTERVAL_SECONDS = 0.01
+        owner, waiter = await asyncio.gather(
+            flight.do("k", compute, identity, identity),
+            flight.do("k", compute, identity, identity),
+            return_exceptions=True
+        )
+
+        assert isinstance(owner, RuntimeError)
+        assert isinstance(waiter, SingleFlightError)
+        assert "quota exceeded" in str(waiter)
+
+    @pytest.mark.asyncio
+    async def test_breaker_error_reaches_waiter_unwrapped(self, fake_redis):
+        async def compute():
+            await asyncio.sleep(0.05)
+            raise CircuitOpenError("semrush", retry_after=30)
+
+        flight = SingleFlight(lease_seconds=5, max_wait_seconds=5)
+        flight.POLL_INTERVAL_SECONDS = 0.01
+        owner, waiter = await asyncio.gather(
+            flight.do("k", compute, identity, identity),
+            flight.do("k", compute, identity, identity),
+            return_exceptions=True
+        )
+
+        assert isinstance(waiter, CircuitOpenError)
+        assert (waiter.provider, waiter.retry_after) == ("semrush", 30)
+        assert str(waiter) == str(owner)
+
+    @pytest.mark.asyncio
+    async def test_unshareable_result_not_reused(self, fake_redis):
+        results = iter(["degraded", "complete"])
+
+        async def compute():
+            await asyncio.sleep(0.05)
+            return next(results)
+
+        flight = SingleFlight(lease_seconds=5, max_wait_seconds=5)
+        flight.POLL_INTERVAL_SECONDS = 0.01
+        shareable = lambda result: result == "complete"
+        outcomes = await asyncio.gather(
+            flight.do("k", compute, identity, identity, shareable=shareable),
+            flight.do("k", compute, identity, identity, shareable=shareable),
+        )
+
+        # The waiter made its own call instead of reusing the degraded result
+        assert sorted(outcomes) == [("complete", False), ("degraded", False)]
+        assert fake_redis.data == {"flight:k:result": '{"ok": true, "payload": "complete"}'}
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_lapsed_lease(self, fake_redis):
+        # A crashed owner left a lease behind that then expires
+        fake_redis.data["flight:k:lease"] = "dead-owner"
+
+        async def expire_lease():
+            await asyncio.sleep(0.05)
+            del fake_redis.data["flight:k:lease"]
+
+        flight = SingleFlight(lease_seconds=5, max_wait_seconds=5)
+        flight.POLL_INTERVAL_SECONDS = 0.01
+        compute = AsyncMock(return_value="fresh")
+        (result, shared), _ = await asyncio.gather(
+            flight.do("k", compute, identity, identity),
+            expire_lease()
+        )
+
+        assert result == "fresh"
+        assert shared is False
+        compute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_calls_directly(self):
+        compute = AsyncMock(return_value="direct")
+        with patch("src.core.single_flight.get_redis", AsyncMock(side_effect=ConnectionError("down"))):
+            result, shared = await SingleFlight().do("k", compute, identity, identity)
+
+        assert result == "direct"
+        assert shared is False
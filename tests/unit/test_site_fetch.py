@@ -0,0 +1,144 @@
+"""
+Unit tests for PRP-004 Site Fetch Stage
+Tests the shared landing page artifact and its consumers
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.assessments.security_analysis import _analyze_security_headers
+from src.assessments.site_fetch import SiteFetch, fetch_site, parse_set_cookie
+
+
+def handler(request):
+    if request.url.scheme == "http":
+        return httpx.Response(
+            301, headers=[("location", "https://example.com/"), ("set-cookie", "visit=1")]
+        )
+    return httpx.Response(200, content=b"<html>" + b"x" * 5000 + b"</html>", headers=[
+        ("content-type", "text/html; charset=utf-8"),
+        ("strict-transport-security", "max-age=31536000"),
+        ("set-cookie", "session=abc; Secure; HttpOnly; SameSite=Lax; Path=/"),
+    ])
+
+
+class TestFetchSite:
+    """Test capturing the artifact"""
+
+    @pytest.mark.asyncio
+    async def test_redirects_cookies_and_capped_body(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+        certificate = {"is_valid": True, "protocol": "TLSv1.3"}
+
+        with patch("src.assessments.site_fetch.get_http_client", return_value=client), \
+             patch("src.assessments.site_fetch._certificate", AsyncMock(return_value=certificate)), \
+             patch("src.assessments.site_fetch.settings.SITE_FETCH_MAX_BODY_BYTES", 1000):
+            site = await fetch_site("http://example.com")
+
+        assert site.ok and site.final_url == "https://example.com/"
+        assert site.redirect_chain == [
+            {"url": "http://example.com", "status_code": 301, "location": "https://example.com/"}
+        ]
+        assert site.headers["strict-transport-security"] == "max-age=31536000"
+        assert [(c["name"], c["secure"], c["httponly"]) for c in site.cookies] == [
+            ("visit", False, False), ("session", True, True)
+        ]
+        assert site.body_truncated and len(site.body) == 1000
+        assert site.tls["certificate"] is certificate
+
+    @pytest.mark.asyncio
+    async def test_repeat_fetch_still_sees_cookies(self):
+        def returning_visitor_aware(request):
+            # Like most servers: only set cookies the client doesn't send back
+            sent = request.headers.get("cookie", "")
+            if request.url.path == "/":
+                headers = [("location", "https://example.com/home")]
+                if "visit=1" not in sent:
+                    headers.append(("set-cookie", "visit=1; Path=/"))
+                return httpx.Response(302, headers=headers)
+            headers = [("content-type", "text/html"), ("x-saw-visit", str("visit=1" in sent))]
+            if "session=" not in sent:
+                headers.append(("set-cookie", "session=abc; Secure; HttpOnly; Path=/"))
+            return httpx.Response(200, content=b"<html></html>", headers=headers)
+
+        # A client that keeps cookies, to show fetches don't depend on its jar
+        client = httpx.AsyncClient(transport=httpx.MockTransport(returning_visitor_aware))
+        with patch("src.assessments.site_fetch.get_http_client", return_value=client), \
+             patch("src.assessments.site_fetch._certificate", AsyncMock(return_value=None)):
+            first = await fetch_site("https://example.com/")
+            second = await fetch_site("https://example.com/")
+
+        for site in (first, second):
+            assert [c["name"] for c in site.cookies] == ["visit", "session"]
+            # Cookies set on a redirect hop are replayed within the same fetch
+            assert site.headers["x-saw-visit"] == "True"
+            assert len(site.redirect_chain) == 1
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_reported_on_artifact(self):
+        def refuse(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+        with patch("src.assessments.site_fetch.get_http_client", return_value=client):
+            site = await fetch_site("http://example.com")
+
+        assert not site.ok and site.error_type == "connect"
+
+    def test_cookie_without_value_ignored(self):
+        assert parse_set_cookie("; Secure", "https://example.com") is None
+
+
+class TestSecurityAnalysisConsumer:
+    """Test security scoring from the shared artifact"""
+
+    @pytest.mark.asyncio
+    async def test_only_unflagged_cookies_flagged(self):
+        site = SiteFetch(
+            requested_url="https://example.com",
+            final_url="https://example.com/",
+            status_code=200,
+            headers={"x-frame-options": "DENY"},
+            cookies=[
+                parse_set_cookie("session=abc; Secure; HttpOnly", "https://example.com/"),
+                parse_set_cookie("tracker=1", "https://example.com/"),
+            ],
+        )
+
+        with patch("src.assessments.security_analysis.get_site_fetch", AsyncMock(return_value=site)), \
+             patch("src.assessments.security_analysis.fetch_seo_files", AsyncMock(return_value={})):
+            metrics = await _analyze_security_headers("https://example.com")
+
+        assert metrics.security_headers["X-Frame-Options"]["present"]
+        cookie_recommendations = [r for r in metrics.recommendations if "cookie" in r]
+        assert cookie_recommendations == ["Ensure cookie 'tracker' has Secure and HttpOnly flags"]
+
+    @pytest.mark.asyncio
+    async def test_slow_seo_and_failed_link_check_keep_score(self):
+        site = SiteFetch(
+            requested_url="https://example.com",
+            final_url="https://example.com/",
+            status_code=200,
+            headers={"x-frame-options": "DENY"},
+            content_type="text/html",
+            body="<a href='/about'>About</a>",
+        )
+
+        async def slow_seo_files(url):
+            await asyncio.sleep(5)
+
+        with patch("src.assessments.security_analysis.get_site_fetch", AsyncMock(return_value=site)), \
+             patch("src.assessments.security_analysis.fetch_seo_files", slow_seo_files), \
+             patch("src.assessments.security_analysis.check_internal_links", AsyncMock(side_effect=RuntimeError("boom"))), \
+             patch("src.assessments.security_analysis.settings.SECURITY_SIGNALS_TIME_BUDGET_SECONDS", 0.2):
+            started = time.monotonic()
+            metrics = await _analyze_security_headers("https://example.com")
+
+        assert time.monotonic() - started < 1
+        assert metrics.security_score > 0
+        assert "error" in metrics.seo_signals
+        assert "error" in metrics.broken_links
@@ -0,0 +1,66 @@
+"""
+Unit tests for the non-blocking TLS certificate probe
+Tests session capture, expiry-bounded caching and timeouts
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.assessments.security_analysis import analyze_ssl_certificate
+
+
+def fake_connection(days_left: float):
+    not_after = time.strftime("%b %d %H:%M:%S %Y GMT", time.gmtime(time.time() + days_left * 86400))
+    ssl_object = MagicMock(spec=["getpeercert", "cipher", "version"])
+    ssl_object.getpeercert.return_value = {
+        "issuer": ((("organizationName", "Test CA"),),),
+        "subject": ((("commonName", "example.com"),),),
+        "notAfter": not_after,
+    }
+    ssl_object.cipher.return_value = ("TLS_AES_256_GCM_SHA384", "TLSv1.3", 256)
+    ssl_object.version.return_value = "TLSv1.3"
+    writer = MagicMock()
+    writer.get_extra_info.return_value = ssl_object
+    return AsyncMock(return_value=(MagicMock(), writer))
+
+
+class TestAnalyzeSslCertificate:
+    """Test the asyncio TLS probe"""
+
+    @pytest.mark.asyncio
+    async def test_session_captured_and_cached_until_cap(self):
+        cache_set = AsyncMock()
+        with patch("asyncio.open_connection", fake_connection(days_left=60)), \
+             patch("src.core.cache.cache.get", AsyncMock(return_value=None)), \
+             patch("src.core.cache.cache.set", cache_set):
+            result = await analyze_ssl_certificate("example.com")
+
+        assert result["is_valid"] and result["protocol"] == "TLSv1.3"
+        assert result["cipher"] == "TLS_AES_256_GCM_SHA384"
+        assert result["issuer"] == {"organizationName": "Test CA"}
+        assert cache_set.call_args.kwargs["ttl"] == 7 * 24 * 3600
+
+    @pytest.mark.asyncio
+    async def test_expiring_certificate_not_cached(self):
+        cache_set = AsyncMock()
+        with patch("asyncio.open_connection", fake_connection(days_left=0.5)), \
+             patch("src.core.cache.cache.get", AsyncMock(return_value=None)), \
+             patch("src.core.cache.cache.set", cache_set):
+            result = await analyze_ssl_certificate("example.com")
+
+        assert result["is_valid"]
+        cache_set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_handshake_times_out(self):
+        async def stalled(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        with patch("asyncio.open_connection", stalled), \
+             patch("src.core.cache.cache.get", AsyncMock(return_value=None)), \
+             patch("src.assessments.security_analysis.settings.TLS_PROBE_TIMEOUT_SECONDS", 0.05):
+            result = await analyze_ssl_certificate("example.com")
+
+        assert result == {"is_valid": False, "error": "TimeoutError"}
@@ -0,0 +1,92 @@
+"""
+Unit tests for PRP-006 Screenshot Visual Diff
+Tests SSIM scoring, changed-region detection and process pool execution
+"""
+
+import io
+
+import pytest
+from PIL import Image, ImageDraw
+from unittest.mock import MagicMock, patch
+
+from src.assessments.visual_diff import compute_visual_diff
+
+
+def page(banner=(30, 90, 200), panel=False, height=3000):
+    image = Image.new("RGB", (1920, height), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, 0, 1920, 200], fill=banner)
+    draw.rectangle([200, 400, 1700, 1200], fill=(220, 220, 220))
+    for y in range(1300, 2800, 40):
+        draw.line([(300, y), (1500, y)], fill=(60, 60, 60), width=3)
+    if panel:
+        draw.rectangle([1000, 1500, 1800, 2000], fill=(10, 150, 10))
+    buffer = io.BytesIO()
+    image.save(buffer, format="WEBP", quality=75)
+    return buffer.getvalue()
+
+
+class TestComputeVisualDiff:
+    """Test the pixel comparison"""
+
+    def test_unchanged_page(self):
+        diff = compute_visual_diff(page(), page())
+
+        assert diff.similarity == 100.0 and diff.regions == []
+
+    def test_new_element_is_a_layout_change(self):
+        diff = compute_visual_diff(page(), page(panel=True))
+
+        assert diff.layout_changes == 1 and diff.color_changes == 0
+        region = diff.regions[0]
+        # Reported in full-size pixels, covering the added panel
+        assert region["x"] <= 1000 and region["x"] + region["width"] >= 1800
+        assert region["y"] <= 1500 and region["y"] + region["height"] >= 2000
+        assert diff.similarity < 100
+        assert Image.open(io.BytesIO(diff.heatmap_png)).width == 640
+
+    def test_recolor_is_a_color_change(self):
+        diff = compute_visual_diff(page(), page(banner=(200, 30, 30)))
+
+        assert diff.color_changes == 1 and diff.layout_changes == 0
+        assert diff.regions[0]["y"] == 0 and diff.similarity < 100
+
+    def test_longer_page_counts_added_height(self):
+        diff = compute_visual_diff(page(), page(height=3600))
+
+        assert diff.layout_changes == 1
+        assert diff.regions[-1]["y"] + diff.regions[-1]["height"] >= 3590
+
+
+class TestDiffScreenshots:
+    """Test loading stored screenshots and offloading the diff"""
+
+    @pytest.mark.asyncio
+    async def test_same_blob_is_identical_without_diffing(self):
+        from src.assessments.screenshot_comparison import diff_screenshots
+
+        service = MagicMock()
+        with patch("src.assessments.screenshot_comparison.get_image_service", return_value=service):
+            diff = await diff_screenshots("blob://screenshots/ab/abc.webp", "blob://screenshots/ab/abc.webp")
+
+        assert diff.similarity == 100.0
+        service.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_diff_runs_in_process_pool(self, tmp_path):
+        from src.assessments.screenshot_comparison import diff_screenshots
+        from src.core.process_pool import shutdown_process_pool
+        from src.core.storage.blob_store import LocalBlobStore
+
+        store = LocalBlobStore(tmp_path)
+        before = await store.put(page(), prefix="screenshots", extension="webp")
+        after = await store.put(page(panel=True), prefix="screenshots", extension="webp")
+
+        try:
+            with patch("src.assessments.image_processing.get_blob_store", return_value=store), \
+                 patch("src.core.process_pool.settings.PROCESS_POOL_WORKERS", 1):
+                diff = await diff_screenshots(before, after)
+        finally:
+            await shutdown_process_pool()
+
+        assert diff.layout_changes == 1
@@ -0,0 +1,71 @@
+"""
+Unit tests for the PRP-002 Celery worker event loop
+Tests loop persistence across submissions and shutdown callbacks
+"""
+
+import asyncio
+import pytest
+
+from src.core.worker_loop import WorkerEventLoop, WorkerLoopError
+
+
+class TestWorkerEventLoop:
+    """Test persistent per-process event loop"""
+
+    @pytest.fixture
+    def worker_loop(self):
+        loop = WorkerEventLoop()
+        yield loop
+        loop.stop()
+
+    def test_submissions_share_one_loop(self, worker_loop):
+        """Every submitted coroutine runs on the same long-lived loop"""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = worker_loop.submit(current_loop())
+        second = worker_loop.submit(current_loop())
+
+        assert first is second
+        assert worker_loop.is_running
+
+    def test_exceptions_propagate(self, worker_loop):
+        """Coroutine exceptions reach the synchronous caller"""
+        async def boom():
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError):
+            worker_loop.submit(boom())
+
+        # The loop survives a failing coroutine
+        async def ok():
+            return 42
+
+        assert worker_loop.submit(ok()) == 42
+
+    def test_nested_submit_rejected(self, worker_loop):
+        """Blocking on the loop from inside the loop raises instead of deadlocking"""
+        async def inner():
+            return 1
+
+        async def outer():
+            with pytest.raises(WorkerLoopError):
+                worker_loop.submit(inner())
+            return True
+
+        assert worker_loop.submit(outer()) is True
+
+    def test_shutdown_callbacks_run(self):
+        """Registered async cleanup runs on stop"""
+        worker_loop = WorkerEventLoop()
+        closed = []
+
+        async def close_resource():
+            closed.append(True)
+
+        worker_loop.start()
+        worker_loop.register_shutdown(close_resource)
+        worker_loop.stop()
+
+        assert closed == [True]
+        assert not worker_loop.is_running